@@ -0,0 +1,527 @@
+"""
+Asyncio-native client for the Gemini 2.0 Flash REST API.
+
+Keeps many requests in flight over a single pooled HTTP session, bounded by a
+global concurrency limit and a per-key limit. The synchronous GeminiClient
+sends its requests through this client too, so both share one retry and key
+rotation policy.
+"""
+import asyncio
+import json
+import random
+import threading
+from typing import Any, AsyncGenerator, AsyncIterator, Coroutine, Dict, Iterator, List, Optional, Set
+
+import aiohttp
+
+from src.core.exceptions import (
+    create_api_rate_limit_error, create_network_timeout_error
+)
+from src.core.gemini_client import MODEL, is_rate_limit_error, load_api_keys
+from src.core.key_scheduler import APIKeyScheduler
+from src.utils.error_handler import handle_error
+
+# Base URL of the Gemini REST API
+API_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
+
+
+class _LoopResources:
+    """HTTP session and semaphores bound to a single event loop."""
+
+    def __init__(self, api_keys: List[str], max_concurrency: int, per_key_concurrency: int):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.session_guard: Optional[AsyncGenerator[None, None]] = None
+        self.global_semaphore = asyncio.Semaphore(max_concurrency)
+        self.key_semaphores = {key: asyncio.Semaphore(per_key_concurrency) for key in api_keys}
+
+
+class AsyncGeminiClient:
+    """
+    Asynchronous Gemini client with bounded concurrency and API key rotation.
+
+    One aiohttp session (and its connection pool) is shared by every request
+    issued from the same event loop. Synchronous callers go through a private
+    background loop so that connections are reused across calls as well.
+
+    The session of any other loop is closed, and its resources released, when
+    that loop shuts down its async generators, which asyncio.run does before
+    closing the loop. Loops driven by hand should await aclose() before they
+    are closed.
+    """
+
+    def __init__(
+        self,
+        api_keys: Optional[List[str]] = None,
+        max_concurrency: int = 8,
+        per_key_concurrency: int = 2,
+        request_timeout: float = 300.0,
+        api_base_url: str = API_BASE_URL,
+        key_usage_count: Optional[Dict[str, int]] = None,
+        rate_limited_keys: Optional[Set[str]] = None,
+        key_scheduler: Optional[APIKeyScheduler] = None
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            api_keys: API keys to rotate through (loaded from the environment if omitted)
+            max_concurrency: Maximum number of requests in flight across all keys
+            per_key_concurrency: Maximum number of requests in flight per API key
+            request_timeout: Total timeout for a single HTTP request in seconds
+            api_base_url: Base URL of the Gemini REST API
+            key_usage_count: Usage counter shared with a synchronous client
+            rate_limited_keys: Rate-limited key set shared with a synchronous client
+            key_scheduler: Per-key RPM/TPM scheduler shared with a synchronous client
+        """
+        self.api_keys = api_keys if api_keys is not None else load_api_keys()
+        if not self.api_keys:
+            raise ValueError("No valid Gemini API keys found in environment variables")
+
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_key_concurrency = max(1, per_key_concurrency)
+        self.request_timeout = request_timeout
+        self.api_base_url = api_base_url.rstrip("/")
+
+        # Key rotation state (shared with GeminiClient when passed in)
+        self.key_usage_count = key_usage_count if key_usage_count is not None else {key: 0 for key in self.api_keys}
+        self.rate_limited_keys = rate_limited_keys if rate_limited_keys is not None else set()
+        self.key_scheduler = key_scheduler if key_scheduler is not None else APIKeyScheduler(self.api_keys)
+        self._key_lock = threading.Lock()
+
+        # Per-loop sessions and semaphores, released when their loop shuts down
+        self._loop_resources: Dict[asyncio.AbstractEventLoop, _LoopResources] = {}
+        self._resources_lock = threading.Lock()
+
+        # Background loop used by the synchronous wrappers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    async def _get_loop_resources(self) -> _LoopResources:
+        """Get (or create) the session and semaphores for the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._resources_lock:
+            # Loops closed without shutting down (so never released) cannot be used again
+            for closed_loop in [other for other in self._loop_resources if other.is_closed()]:
+                del self._loop_resources[closed_loop]
+
+            resources = self._loop_resources.get(loop)
+            if resources is None:
+                resources = _LoopResources(self.api_keys, self.max_concurrency, self.per_key_concurrency)
+                self._loop_resources[loop] = resources
+
+        if resources.session is None or resources.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=60)
+            resources.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+            # Advance the guard to its yield so the loop closes it (and the session) on shutdown
+            resources.session_guard = self._release_on_loop_shutdown(loop, resources)
+            await resources.session_guard.asend(None)
+        return resources
+
+    async def _release_on_loop_shutdown(self, loop: asyncio.AbstractEventLoop,
+                                        resources: _LoopResources) -> AsyncGenerator[None, None]:
+        """
+        Keep a loop's session open until the loop shuts down, then close and release it.
+
+        The loop tracks this generator once it has started, and
+        loop.shutdown_asyncgens (called by asyncio.run before the loop is
+        closed) finalizes it while the loop can still run the cleanup.
+
+        Args:
+            loop: Loop the resources belong to
+            resources: The loop's session and semaphores
+        """
+        session = resources.session
+        try:
+            yield
+        finally:
+            with self._resources_lock:
+                # A replaced (already closed) session leaves the loop's resources in place
+                if self._loop_resources.get(loop) is resources and resources.session is session:
+                    del self._loop_resources[loop]
+            if not session.closed:
+                await session.close()
+
+    async def _acquire_key(self, reserved_tokens: int, pinned_key: Optional[str] = None) -> str:
+        """
+        Reserve quota on the key with the most headroom, waiting while all keys are saturated.
+
+        Args:
+            reserved_tokens: Estimated token cost of the request
+            pinned_key: Use this key without reserving anything in the scheduler
+
+        Returns:
+            The API key to use for the next request
+        """
+        key = pinned_key if pinned_key is not None else await self.key_scheduler.aacquire(reserved_tokens)
+        with self._key_lock:
+            self.key_usage_count[key] = self.key_usage_count.get(key, 0) + 1
+        return key
+
+    def _mark_rate_limited(self, key: str) -> None:
+        """
+        Mark a key as rate limited and bench it in the scheduler.
+
+        Args:
+            key: The API key that hit its rate limit
+        """
+        self.key_scheduler.report_rate_limited(key)
+        with self._key_lock:
+            self.rate_limited_keys.add(key)
+            # If all keys are rate limited, reset and let the scheduler cooldowns pace retries
+            if len(self.rate_limited_keys) >= len(self.api_keys):
+                print("All API keys have been rate limited. Resetting and trying again.")
+                self.rate_limited_keys.clear()
+
+    @staticmethod
+    def _context_contents(context: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Convert conversation history to REST contents.
+
+        Args:
+            context: Messages with a role and either "content" text or SDK-style "parts"
+
+        Returns:
+            Contents entries in conversation order
+        """
+        contents = []
+        for message in context:
+            role = "model" if message.get("role") in ("model", "assistant") else "user"
+            parts = message.get("parts", message.get("content", ""))
+            if not isinstance(parts, list):
+                parts = [parts]
+            contents.append({
+                "role": role,
+                "parts": [part if isinstance(part, dict) else {"text": str(part)} for part in parts]
+            })
+        return contents
+
+    def _build_request_body(self, prompt: str, temperature: float, max_tokens: int,
+                            context: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Build the generateContent request body, preceded by any conversation context."""
+        contents = self._context_contents(context) if context else []
+        contents.append({"role": "user", "parts": [{"text": prompt}]})
+        return {
+            "contents": contents,
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": max_tokens,
+                "topP": 0.95,
+                "topK": 40,
+            },
+        }
+
+    @staticmethod
+    def _extract_text(payload: Dict[str, Any]) -> str:
+        """
+        Extract the generated text from a generateContent response.
+
+        Args:
+            payload: Decoded JSON response
+
+        Returns:
+            The generated text
+        """
+        candidates = payload.get("candidates") or []
+        if not candidates:
+            feedback = payload.get("promptFeedback", {})
+            raise ValueError(f"No candidates returned by the API: {feedback}")
+
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+
+    @staticmethod
+    async def _raise_for_error(response: aiohttp.ClientResponse) -> None:
+        """
+        Raise the API error carried by a rejected response.
+
+        Raises:
+            RuntimeError: With the API error message if the request was rejected
+        """
+        if response.status == 200:
+            return
+        payload = await response.json(content_type=None)
+        error = payload.get("error", {}) if isinstance(payload, dict) else {}
+        message = error.get("message", str(payload))
+        if response.status == 429:
+            message = f"Rate limit: {message}"
+        raise RuntimeError(f"{response.status} {error.get('status', '')}: {message}")
+
+    async def _post(self, session: aiohttp.ClientSession, key: str, body: Dict[str, Any]) -> str:
+        """
+        Send a single generateContent request.
+
+        Raises:
+            RuntimeError: With the API error message if the request was rejected
+        """
+        url = f"{self.api_base_url}/models/{MODEL}:generateContent"
+        async with session.post(url, json=body, headers={"x-goog-api-key": key}) as response:
+            await self._raise_for_error(response)
+            return self._extract_text(await response.json(content_type=None))
+
+    async def _post_stream(self, session: aiohttp.ClientSession, key: str,
+                           body: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Send a single streamGenerateContent request and yield its text as it arrives.
+
+        Raises:
+            RuntimeError: With the API error message if the request was rejected
+        """
+        url = f"{self.api_base_url}/models/{MODEL}:streamGenerateContent"
+        async with session.post(url, json=body, params={"alt": "sse"},
+                                headers={"x-goog-api-key": key}) as response:
+            await self._raise_for_error(response)
+            async for line in response.content:
+                if not line.startswith(b"data:"):
+                    continue
+                candidates = json.loads(line[len(b"data:"):]).get("candidates") or []
+                # Events without text parts (e.g. a final safety verdict) are skipped
+                parts = candidates[0].get("content", {}).get("parts", []) if candidates else []
+                text = "".join(part.get("text", "") for part in parts)
+                if text:
+                    yield text
+
+    async def agenerate_content(
+        self, prompt: str, temperature: float = 0.7, max_tokens: int = 16000,
+        max_retries: int = 5, initial_retry_delay: float = 2.0,
+        context: Optional[List[Dict[str, Any]]] = None, pinned_key: Optional[str] = None
+    ) -> str:
+        """
+        Generate content asynchronously with retry logic and API key rotation.
+
+        Args:
+            prompt: The prompt to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate
+            max_retries: Maximum number of retry attempts for network errors
+            initial_retry_delay: Initial delay between retries in seconds (will be exponentially increased)
+            context: Previous messages in the conversation
+            pinned_key: Send every attempt on this key, bypassing the scheduler and key rotation
+
+        Returns:
+            The generated content as a string
+        """
+        resources = await self._get_loop_resources()
+        body = self._build_request_body(prompt, temperature, max_tokens, context)
+        reserved_tokens = self.key_scheduler.estimate_tokens(prompt, max_tokens)
+
+        retry_count = 0
+        retry_delay = initial_retry_delay
+        last_error = None
+        key_rotation_attempts = 0
+        max_key_rotations = len(self.api_keys) * 2  # Allow cycling through keys twice
+
+        while retry_count <= max_retries:
+            key = await self._acquire_key(reserved_tokens, pinned_key)
+            text = ""
+            try:
+                # Hold the concurrency slots for this attempt only, never across a backoff
+                async with resources.global_semaphore, resources.key_semaphores[key]:
+                    text = await self._post(resources.session, key, body)
+                return text
+
+            except (aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
+                # Network-related errors that are worth retrying
+                last_error = e
+                retry_count += 1
+                sleep_time = None
+
+                if retry_count <= max_retries:
+                    jitter = random.uniform(0.1, 0.3) * retry_delay
+                    sleep_time = retry_delay + jitter
+                    print(f"🌐 Network error ({type(e).__name__}). Retrying in {sleep_time:.1f} seconds... (attempt {retry_count}/{max_retries})")
+                    retry_delay = min(retry_delay * 2, 300)  # Cap at 5 minutes
+                else:
+                    timeout_error = create_network_timeout_error(retry_delay * max_retries)
+                    timeout_error.user_message = f"Network request failed after {max_retries} retries"
+                    timeout_error.details.update({
+                        'max_retries': max_retries,
+                        'last_error': str(e),
+                        'error_type': type(e).__name__
+                    })
+                    handle_error(timeout_error, "Async content generation network failure")
+                    return f"Error generating content after {max_retries} retries. Network issues detected. Please check your internet connection and try again. Details: {str(e)}"
+
+            except Exception as e:
+                error_str = str(e)
+                print(f"Error generating content: {error_str}")
+
+                # Check if this is a rate limit error (a pinned key is never rotated away from)
+                if is_rate_limit_error(error_str) and pinned_key is None:
+                    if key_rotation_attempts < max_key_rotations:
+                        key_rotation_attempts += 1
+
+                        rate_limit_error = create_api_rate_limit_error("Gemini")
+                        handle_error(rate_limit_error, "API key rotation", show_suggestions=False)
+
+                        # Bench the key; the scheduler routes the retry to another key
+                        # or waits for a cooldown instead of failing straight away
+                        self._mark_rate_limited(key)
+                        continue
+
+                    all_keys_error = create_api_rate_limit_error("Gemini")
+                    all_keys_error.user_message = "All API keys have reached their rate limits"
+                    handle_error(all_keys_error, "All API keys rate limited")
+                    return f"Error: All API keys have reached their rate limits. Please try again later."
+
+                # For non-rate-limit errors, return the error message
+                return f"Error generating content. Please try again. Details: {error_str}"
+
+            finally:
+                # Settle the reservation whether the attempt succeeded, failed or was cancelled
+                if pinned_key is None:
+                    self.key_scheduler.release(key, reserved_tokens, (len(prompt) + len(text)) // 4)
+
+            # Back off outside the semaphores so other requests can use the slots meanwhile
+            await asyncio.sleep(sleep_time)
+
+        return f"Error generating content after {max_retries} retries. Last error: {str(last_error)}"
+
+    async def astream_content(
+        self, prompt: str, temperature: float = 0.7, max_tokens: int = 16000
+    ) -> AsyncIterator[str]:
+        """
+        Stream the reply to one prompt as it is generated.
+
+        Makes a single attempt; callers decide how to recover from a stream
+        that fails or breaks off. The key's concurrency slots are held until
+        the stream ends or is closed.
+
+        Args:
+            prompt: The prompt to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate
+
+        Yields:
+            Text chunks
+
+        Raises:
+            RuntimeError: If the request was rejected
+        """
+        resources = await self._get_loop_resources()
+        body = self._build_request_body(prompt, temperature, max_tokens)
+        reserved_tokens = self.key_scheduler.estimate_tokens(prompt, max_tokens)
+
+        key = await self._acquire_key(reserved_tokens)
+        received = 0
+        try:
+            async with resources.global_semaphore, resources.key_semaphores[key]:
+                async for text in self._post_stream(resources.session, key, body):
+                    received += len(text)
+                    yield text
+        except Exception as e:
+            if is_rate_limit_error(str(e)):
+                self._mark_rate_limited(key)
+            raise
+        finally:
+            self.key_scheduler.release(key, reserved_tokens, (len(prompt) + received) // 4)
+
+    async def agenerate_batch(
+        self, prompts: List[str], temperature: float = 0.7, max_tokens: int = 16000,
+        max_retries: int = 5, initial_retry_delay: float = 2.0
+    ) -> List[str]:
+        """
+        Generate content for several prompts concurrently.
+
+        Concurrency is bounded by max_concurrency and per_key_concurrency.
+
+        Args:
+            prompts: The prompts to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate per prompt
+            max_retries: Maximum number of retry attempts for network errors
+            initial_retry_delay: Initial delay between retries in seconds
+
+        Returns:
+            Generated content for each prompt, in the same order as the prompts
+        """
+        return list(await asyncio.gather(*(
+            self.agenerate_content(prompt, temperature, max_tokens, max_retries, initial_retry_delay)
+            for prompt in prompts
+        )))
+
+    def _ensure_background_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop used by the synchronous wrappers."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, daemon=True, name="AsyncGeminiClientLoop"
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def run_sync(self, coroutine: Coroutine) -> Any:
+        """
+        Run a coroutine on the background loop and wait for its result.
+
+        Args:
+            coroutine: The coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        loop = self._ensure_background_loop()
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def generate_content(
+        self, prompt: str, temperature: float = 0.7, max_tokens: int = 16000,
+        max_retries: int = 5, initial_retry_delay: float = 2.0,
+        context: Optional[List[Dict[str, Any]]] = None, pinned_key: Optional[str] = None
+    ) -> str:
+        """Synchronous wrapper around agenerate_content."""
+        return self.run_sync(self.agenerate_content(
+            prompt, temperature, max_tokens, max_retries, initial_retry_delay, context, pinned_key
+        ))
+
+    def generate_batch(
+        self, prompts: List[str], temperature: float = 0.7, max_tokens: int = 16000,
+        max_retries: int = 5, initial_retry_delay: float = 2.0
+    ) -> List[str]:
+        """Synchronous wrapper around agenerate_batch."""
+        return self.run_sync(self.agenerate_batch(
+            prompts, temperature, max_tokens, max_retries, initial_retry_delay
+        ))
+
+    def stream_content(self, prompt: str, temperature: float = 0.7, max_tokens: int = 16000) -> Iterator[str]:
+        """Synchronous wrapper around astream_content; closing it closes the stream."""
+        stream = self.astream_content(prompt, temperature, max_tokens)
+
+        async def next_chunk() -> str:
+            return await stream.__anext__()
+
+        async def close_stream() -> None:
+            await stream.aclose()
+
+        try:
+            while True:
+                try:
+                    yield self.run_sync(next_chunk())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run_sync(close_stream())
+
+    async def aclose(self) -> None:
+        """Close the HTTP session bound to the running loop."""
+        with self._resources_lock:
+            resources = self._loop_resources.get(asyncio.get_running_loop())
+        if resources and resources.session_guard:
+            await resources.session_guard.aclose()
+
+    def close(self) -> None:
+        """Close the background loop's session and stop the loop."""
+        with self._loop_lock:
+            loop = self._loop
+            self._loop = None
+        if loop is None or loop.is_closed():
+            return
+
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if self._loop_thread:
+            self._loop_thread.join(timeout=5)
+        loop.close()
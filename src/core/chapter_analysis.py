@@ -0,0 +1,241 @@
+"""
+Combined chapter analysis: the memory summary and every narrative-tracking
+field from a single structured model call.
+
+Each chapter used to be uploaded twice, once for a 2-3 sentence summary (with a
+possible retry) and once for narrative extraction, and the extraction reply was
+parsed loosely with no guarantee that its keys matched what MemoryManager
+tracks. Here one prompt spells out the exact JSON shape, the reply is parsed
+in one place and validated against CHAPTER_ANALYSIS_SCHEMA, and anything that
+does not fit the schema is dropped or coerced before it reaches memory.
+"""
+
+import json
+from typing import Dict, List, Any, Tuple
+
+from src.core.exceptions import GenerationError
+from src.utils.logger import log_warning
+
+# Characters of chapter text sent for analysis
+ANALYSIS_TEXT_CHARS = 10000
+
+# Replies that fail to parse or validate are retried once with a stricter instruction
+ANALYSIS_ATTEMPTS = 2
+
+# Field kinds:
+#   "text"       - a string
+#   "list"       - a list of strings
+#   "text_map"   - an object mapping a name to a string
+#   "entity_map" - an object mapping a name to an object with the listed string fields;
+#                  entries without the required fields are dropped
+CHAPTER_ANALYSIS_SCHEMA: Dict[str, Dict[str, Any]] = {
+    "summary": {"kind": "text", "description": "2-3 sentences on what actually happens in the chapter (not the title)"},
+    "character_updates": {"kind": "entity_map", "fields": ("development", "emotions", "knowledge", "location"),
+                          "description": "character name -> how they develop, feel, what they learn, where they are"},
+    "relationship_updates": {"kind": "entity_map", "fields": ("status", "development"), "required_fields": ("status",),
+                             "description": "\"Name-Name\" -> current status and how it changed"},
+    "plot_updates": {"kind": "entity_map", "fields": ("status", "progression"), "required_fields": ("status",),
+                     "description": "plot thread -> status (active, resolved, ...) and progression"},
+    "unresolved_questions": {"kind": "list", "description": "questions raised and not yet answered"},
+    "foreshadowing": {"kind": "list", "description": "foreshadowing introduced"},
+    "callbacks": {"kind": "list", "description": "callbacks to earlier events"},
+    "world_building": {"kind": "text_map", "description": "world-building element -> details"},
+    "locations": {"kind": "list", "description": "locations visited"},
+    "objects": {"kind": "text_map", "description": "significant object -> how it matters"},
+    "timeline_events": {"kind": "list", "description": "events in the order they happen"},
+    "pov": {"kind": "text", "description": "name of the point-of-view character"},
+    "connections": {"kind": "list", "description": "connections to other chapters"},
+    "scene_transitions": {"kind": "list", "description": "scene transitions within the chapter"},
+    "themes": {"kind": "text_map", "description": "theme or motif -> how it appears"},
+    "symbols": {"kind": "text_map", "description": "symbol -> how it is used"},
+    "tone": {"kind": "text", "description": "overall tone"},
+    "continuity": {"kind": "text_map", "description": "detail that must stay consistent -> its state"},
+    "time_of_day": {"kind": "text", "description": "time of day"},
+    "weather": {"kind": "text", "description": "weather conditions"},
+    "appearance": {"kind": "text_map", "description": "character name -> clothing and appearance"},
+}
+
+
+def _as_text(value: Any) -> str:
+    """Coerce a scalar or structured value to prompt-friendly text."""
+    if isinstance(value, str):
+        return value.strip()
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _schema_example() -> str:
+    """Render the schema as a JSON skeleton followed by a description of each key."""
+    skeleton = {}
+    for name, spec in CHAPTER_ANALYSIS_SCHEMA.items():
+        kind = spec["kind"]
+        if kind == "text":
+            skeleton[name] = "..."
+        elif kind == "list":
+            skeleton[name] = ["..."]
+        elif kind == "text_map":
+            skeleton[name] = {"name": "..."}
+        else:
+            skeleton[name] = {"name": {field: "..." for field in spec["fields"]}}
+
+    descriptions = "\n".join(f"- {name}: {spec['description']}" for name, spec in CHAPTER_ANALYSIS_SCHEMA.items())
+    return f"{json.dumps(skeleton, indent=2)}\n\nKeys:\n{descriptions}"
+
+
+def build_chapter_analysis_prompt(chapter_text: str, chapter_num: int, chapter_title: str,
+                                  strict: bool = False) -> str:
+    """
+    Create the combined summary and narrative extraction prompt.
+
+    Args:
+        chapter_text: The chapter text
+        chapter_num: Chapter number
+        chapter_title: Chapter title
+        strict: Add a stricter output instruction (used when retrying a bad reply)
+
+    Returns:
+        Prompt string
+    """
+    excerpt = chapter_text[:ANALYSIS_TEXT_CHARS]
+    if len(chapter_text) > ANALYSIS_TEXT_CHARS:
+        excerpt += "... [chapter continues]"
+
+    strict_note = ""
+    if strict:
+        strict_note = "\nYour previous reply could not be parsed. Output the JSON object only, with no extra text.\n"
+
+    return f"""
+        CHAPTER ANALYSIS
+        Analyze Chapter {chapter_num}: {chapter_title} for the novel's continuity memory.
+
+        Return a single JSON object with exactly the keys below. Use empty strings, lists
+        or objects for anything the chapter does not contain. The summary must describe what actually
+        happens, not repeat the chapter title or number.
+
+        {_schema_example()}
+        {strict_note}
+        CHAPTER TEXT:
+        ```
+        {excerpt}
+        ```
+
+        JSON RESPONSE:
+        """
+
+
+def parse_chapter_analysis(response: str) -> Dict[str, Any]:
+    """
+    Parse the model reply into a JSON object.
+
+    Args:
+        response: Raw model reply
+
+    Returns:
+        Parsed JSON object
+
+    Raises:
+        GenerationError: If the reply does not contain a JSON object
+    """
+    start_idx = response.find('{') if response else -1
+    end_idx = response.rfind('}') + 1 if response else 0
+    if start_idx < 0 or end_idx <= start_idx:
+        raise GenerationError("Chapter analysis reply contains no JSON object", generation_type="chapter analysis")
+
+    try:
+        data = json.loads(response[start_idx:end_idx])
+    except json.JSONDecodeError as e:
+        raise GenerationError(f"Chapter analysis reply is not valid JSON: {e}", generation_type="chapter analysis")
+
+    if not isinstance(data, dict):
+        raise GenerationError("Chapter analysis reply is not a JSON object", generation_type="chapter analysis")
+    return data
+
+
+def validate_chapter_analysis(data: Dict[str, Any], chapter_num: int) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Validate a parsed reply against the schema, keeping only well-formed fields.
+
+    Args:
+        data: Parsed JSON object
+        chapter_num: Chapter number (to reject summaries that only repeat the heading)
+
+    Returns:
+        Tuple of (cleaned analysis, list of problems found)
+    """
+    analysis: Dict[str, Any] = {}
+    problems: List[str] = []
+
+    for name, spec in CHAPTER_ANALYSIS_SCHEMA.items():
+        if name not in data or data[name] in (None, "", [], {}):
+            continue
+        value = data[name]
+        kind = spec["kind"]
+
+        if kind == "text":
+            analysis[name] = _as_text(value)
+        elif kind == "list":
+            items = value if isinstance(value, list) else [value]
+            analysis[name] = [_as_text(item) for item in items if _as_text(item)]
+        elif not isinstance(value, dict):
+            problems.append(f"{name} is not an object")
+        elif kind == "text_map":
+            analysis[name] = {str(key): _as_text(item) for key, item in value.items()}
+        else:
+            entities = {}
+            for key, entry in value.items():
+                if not isinstance(entry, dict):
+                    # A bare string is taken as the first field (e.g. the status)
+                    entry = {spec["fields"][0]: entry}
+                cleaned = {field: _as_text(entry[field]) for field in spec["fields"]
+                           if field in entry and _as_text(entry[field])}
+                if all(field in cleaned for field in spec.get("required_fields", ())):
+                    entities[str(key)] = cleaned
+                else:
+                    problems.append(f"{name}.{key} is missing {', '.join(spec['required_fields'])}")
+            analysis[name] = entities
+
+    summary = analysis.get("summary", "")
+    if len(summary) < 20 or summary.lower().rstrip(".:") in (f"chapter {chapter_num}", f"chapter {chapter_num}: chapter"):
+        analysis.pop("summary", None)
+        problems.append("summary is missing or only repeats the chapter heading")
+
+    return analysis, problems
+
+
+def analyze_chapter(gemini_client, chapter_text: str, chapter_num: int, chapter_title: str) -> Dict[str, Any]:
+    """
+    Summarize a chapter and extract its narrative elements in one model call.
+
+    Args:
+        gemini_client: Client used to call the model
+        chapter_text: The chapter text
+        chapter_num: Chapter number
+        chapter_title: Chapter title
+
+    Returns:
+        Validated analysis; "summary" is always present
+
+    Raises:
+        GenerationError: If no attempt produced a usable summary
+    """
+    last_error = None
+    for attempt in range(ANALYSIS_ATTEMPTS):
+        prompt = build_chapter_analysis_prompt(chapter_text, chapter_num, chapter_title, strict=attempt > 0)
+        response = gemini_client.generate_content(prompt, temperature=0.3, max_tokens=4000, use_cache=True)
+
+        try:
+            analysis, problems = validate_chapter_analysis(parse_chapter_analysis(response), chapter_num)
+        except GenerationError as e:
+            last_error = e
+            continue
+
+        if problems:
+            log_warning("Chapter analysis reply had schema problems", chapter=chapter_num, problems=problems)
+        if "summary" in analysis:
+            return analysis
+        last_error = GenerationError("Chapter analysis reply has no usable summary", generation_type="chapter analysis")
+
+    raise last_error
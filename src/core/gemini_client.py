@@ -3,19 +3,13 @@ Client for interacting with the Gemini 2.0 Flash API.
 Enhanced with network resilience capabilities and standardized error handling.
 """
 import os
-import time
-import random
-import socket
 import google.generativeai as genai
 from dotenv import load_dotenv
-from typing import Dict, List, Any
-from requests.exceptions import RequestException, Timeout, ConnectionError
+from typing import Callable, Dict, Iterator, List, Any, Optional
 
-# Import standardized error handling
-from src.core.exceptions import (
-    create_api_rate_limit_error, create_network_timeout_error
-)
-from src.utils.error_handler import handle_error
+from src.core.key_scheduler import APIKeyScheduler
+from src.core.generation_stream import GenerationStream
+from src.database.response_cache_manager import get_response_cache_manager
 
 # Load environment variables
 load_dotenv()
@@ -34,6 +28,70 @@ RATE_LIMIT_ERROR_MESSAGES = [
 ]
 
 
+def load_api_keys() -> List[str]:
+    """
+    Load API keys from environment variables.
+
+    Dynamically discovers all GEMINI_API_KEY and GEMINI_API_KEY_* variables.
+    No arbitrary limits - supports unlimited API keys.
+
+    Returns:
+        List of valid API keys
+    """
+    api_keys = []
+
+    # Try to get the main API key
+    main_key = os.getenv("GEMINI_API_KEY")
+    if main_key and main_key.strip():
+        api_keys.append(main_key.strip())
+
+    # Dynamically discover all numbered API keys
+    # Check environment variables for GEMINI_API_KEY_* pattern
+    discovered_keys = {}
+
+    for env_var in os.environ:
+        if env_var.startswith("GEMINI_API_KEY_") and env_var != "GEMINI_API_KEY":
+            try:
+                # Extract the number from the variable name
+                number_part = env_var.split("GEMINI_API_KEY_")[1]
+                key_number = int(number_part)
+
+                # Get the key value
+                key_value = os.getenv(env_var)
+                if key_value and key_value.strip():
+                    discovered_keys[key_number] = key_value.strip()
+
+            except (ValueError, IndexError):
+                # Skip invalid variable names
+                continue
+
+    # Add discovered keys in numerical order
+    for key_number in sorted(discovered_keys.keys()):
+        api_keys.append(discovered_keys[key_number])
+
+    # Log the number of keys loaded
+    if len(api_keys) > 11:
+        print(f"INFO: Loaded {len(api_keys)} API keys (unlimited support enabled)")
+    elif len(api_keys) > 1:
+        print(f"INFO: Loaded {len(api_keys)} API keys for rotation")
+
+    return api_keys
+
+
+def is_rate_limit_error(error_message: str) -> bool:
+    """
+    Check if an error message indicates a rate limit issue.
+
+    Args:
+        error_message: The error message to check
+
+    Returns:
+        True if the error appears to be rate limit related
+    """
+    error_lower = error_message.lower()
+    return any(limit_msg in error_lower for limit_msg in RATE_LIMIT_ERROR_MESSAGES)
+
+
 class GeminiClient:
     """Client for interacting with the Gemini API with support for multiple API keys."""
 
@@ -49,61 +107,29 @@ class GeminiClient:
         self.key_usage_count = {key: 0 for key in self.api_keys}
         self.rate_limited_keys = set()
 
+        # Per-key RPM/TPM buckets used to route each request to the key with the most headroom
+        self.key_scheduler = APIKeyScheduler(self.api_keys)
+
         # Configure the initial API key
         self._configure_current_api_key()
 
-        # Initialize model and history
-        self.model = genai.GenerativeModel(MODEL)
+        # Initialize history
         self.history = []
 
+        # Async client sharing this client's key rotation state (created on first use)
+        self._async_client = None
+
+        # Persistent prompt -> response cache shared with ResilientGeminiClient
+        self.response_cache = get_response_cache_manager()
+
     def _load_api_keys(self) -> List[str]:
         """
         Load API keys from environment variables.
 
-        Dynamically discovers all GEMINI_API_KEY and GEMINI_API_KEY_* variables.
-        No arbitrary limits - supports unlimited API keys.
-
         Returns:
             List of valid API keys
         """
-        api_keys = []
-
-        # Try to get the main API key
-        main_key = os.getenv("GEMINI_API_KEY")
-        if main_key and main_key.strip():
-            api_keys.append(main_key.strip())
-
-        # Dynamically discover all numbered API keys
-        # Check environment variables for GEMINI_API_KEY_* pattern
-        discovered_keys = {}
-
-        for env_var in os.environ:
-            if env_var.startswith("GEMINI_API_KEY_") and env_var != "GEMINI_API_KEY":
-                try:
-                    # Extract the number from the variable name
-                    number_part = env_var.split("GEMINI_API_KEY_")[1]
-                    key_number = int(number_part)
-
-                    # Get the key value
-                    key_value = os.getenv(env_var)
-                    if key_value and key_value.strip():
-                        discovered_keys[key_number] = key_value.strip()
-
-                except (ValueError, IndexError):
-                    # Skip invalid variable names
-                    continue
-
-        # Add discovered keys in numerical order
-        for key_number in sorted(discovered_keys.keys()):
-            api_keys.append(discovered_keys[key_number])
-
-        # Log the number of keys loaded
-        if len(api_keys) > 11:
-            print(f"INFO: Loaded {len(api_keys)} API keys (unlimited support enabled)")
-        elif len(api_keys) > 1:
-            print(f"INFO: Loaded {len(api_keys)} API keys for rotation")
-
-        return api_keys
+        return load_api_keys()
 
     def _configure_current_api_key(self) -> None:
         """Configure the Gemini API with the current API key."""
@@ -161,8 +187,7 @@ class GeminiClient:
         Returns:
             True if the error appears to be rate limit related
         """
-        error_lower = error_message.lower()
-        return any(limit_msg in error_lower for limit_msg in RATE_LIMIT_ERROR_MESSAGES)
+        return is_rate_limit_error(error_message)
 
     def check_api_connection(self, check_all_keys: bool = False) -> Dict[str, Any]:
         """
@@ -183,7 +208,8 @@ class GeminiClient:
                     temperature=0.1,
                     max_tokens=10,
                     max_retries=1,
-                    initial_retry_delay=1.0
+                    initial_retry_delay=1.0,
+                    use_cache=False
                 )
                 success = "Error generating content" not in response
                 return {
@@ -208,18 +234,17 @@ class GeminiClient:
             for i, key in enumerate(self.api_keys):
                 # Switch to this key
                 self.current_key_index = i
-                self._configure_current_api_key()
-                self.model = genai.GenerativeModel(MODEL)
 
                 # Test the key
                 try:
                     print(f"Testing API key {i+1}/{len(self.api_keys)}...")
-                    response = self.generate_content(
+                    response = self._generate_content_uncached(
                         "Hello, this is a connection test.",
                         temperature=0.1,
                         max_tokens=10,
                         max_retries=1,
-                        initial_retry_delay=1.0
+                        initial_retry_delay=1.0,
+                        pinned_key=key
                     )
                     success = "Error generating content" not in response
 
@@ -256,8 +281,6 @@ class GeminiClient:
             # If no working key found, restore original key index
             if working_keys == 0:
                 self.current_key_index = original_key_index
-                self._configure_current_api_key()
-                self.model = genai.GenerativeModel(MODEL)
             # If we found a working key, we're already using it (no need to restore)
 
             return {
@@ -267,157 +290,283 @@ class GeminiClient:
                 "key_statuses": key_statuses
             }
 
+    def response_cache_key(self, prompt: str, temperature: float, max_tokens: int) -> str:
+        """
+        Build the persistent cache key for a generate_content request.
+
+        Args:
+            prompt: The prompt to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate
+
+        Returns:
+            Content-addressed cache key
+        """
+        return self.response_cache.make_key(MODEL, prompt, {
+            "temperature": temperature,
+            "max_output_tokens": max_tokens,
+            "top_p": 0.95,
+            "top_k": 40,
+        })
+
     def generate_content(
         self, prompt: str, temperature: float = 0.7, max_tokens: int = 16000,
-        max_retries: int = 5, initial_retry_delay: float = 2.0
+        max_retries: int = 5, initial_retry_delay: float = 2.0, use_cache: bool = False
+    ) -> str:
+        """
+        Generate content, optionally serving repeated prompts from the persistent response cache.
+
+        Only deterministic prompt types (outlines, characters, summaries) should
+        use the cache; creative prompts must not be served the same text again
+        when a chapter or blurb is regenerated.
+
+        Args:
+            prompt: The prompt to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate
+            max_retries: Maximum number of retry attempts for network errors
+            initial_retry_delay: Initial delay between retries in seconds
+            use_cache: Whether to read from and write to the response cache
+
+        Returns:
+            The generated content as a string
+        """
+        if not use_cache:
+            return self._generate_content_uncached(prompt, temperature, max_tokens, max_retries, initial_retry_delay)
+
+        cache_key = self.response_cache_key(prompt, temperature, max_tokens)
+        cached_response = self.response_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        response = self._generate_content_uncached(prompt, temperature, max_tokens, max_retries, initial_retry_delay)
+        if response and not response.startswith("Error"):
+            self.response_cache.put(cache_key, response, model=MODEL)
+        return response
+
+    def _generate_content_uncached(
+        self, prompt: str, temperature: float = 0.7, max_tokens: int = 16000,
+        max_retries: int = 5, initial_retry_delay: float = 2.0, pinned_key: Optional[str] = None
     ) -> str:
         """
         Generate content using the Gemini API with retry logic for network errors and API key rotation.
 
+        Requests go through the async client, so blocking and async callers share
+        one connection pool, one retry policy and one set of concurrency limits.
+
         Args:
             prompt: The prompt to send to the model
             temperature: Controls randomness (0.0 to 1.0)
             max_tokens: Maximum number of tokens to generate (default increased to 16000 for longer chapters)
             max_retries: Maximum number of retry attempts for network errors
             initial_retry_delay: Initial delay between retries in seconds (will be exponentially increased)
+            pinned_key: Send every attempt on this key, bypassing the scheduler and key rotation
 
         Returns:
             The generated content as a string
         """
-        retry_count = 0
-        retry_delay = initial_retry_delay
-        last_error = None
-        key_rotation_attempts = 0
-        max_key_rotations = len(self.api_keys) * 2  # Allow cycling through keys twice
+        return self.async_client.generate_content(
+            prompt, temperature, max_tokens, max_retries, initial_retry_delay, pinned_key=pinned_key
+        )
 
-        while retry_count <= max_retries:
-            try:
-                # If this is a retry, log the attempt
-                if retry_count > 0:
-                    print(f"Retry attempt {retry_count}/{max_retries} after {retry_delay:.1f}s delay...")
-
-                # For socket errors, we'll use a small delay to allow DNS to refresh
-                # This helps with "socket is null" errors
-                if retry_count > 0:
-                    # Clear DNS cache by forcing a new connection
-                    socket.setdefaulttimeout(60)  # Increase socket timeout
-
-                # Track API key usage
-                current_key = self.api_keys[self.current_key_index]
-                self.key_usage_count[current_key] = self.key_usage_count.get(current_key, 0) + 1
-
-                # Make the API call
-                response = self.model.generate_content(
-                    prompt,
-                    generation_config={
-                        "temperature": temperature,
-                        "max_output_tokens": max_tokens,
-                        "top_p": 0.95,
-                        "top_k": 40,
-                    },
-                )
+    def generate_content_stream(
+        self, prompt: str, temperature: float = 0.7, max_tokens: int = 16000,
+        max_words: Optional[int] = None, max_seconds: Optional[float] = None,
+        on_chunk: Optional[Callable[[str, GenerationStream], None]] = None, use_cache: bool = False
+    ) -> GenerationStream:
+        """
+        Generate content as a stream of chunks with a running word count.
 
-                # Extract the text from the response
-                if hasattr(response, "text"):
-                    return response.text
-                elif hasattr(response, "parts"):
-                    # Handle response with parts
-                    parts = []
-                    for part in response.parts:
-                        if hasattr(part, "text"):
-                            parts.append(part.text)
-                        else:
-                            parts.append(str(part))
-                    return "\n".join(parts)
-                else:
-                    # Handle different response formats
-                    return str(response)
-
-            except (ConnectionError, Timeout, RequestException, socket.error) as e:
-                # Network-related errors that are worth retrying
-                last_error = e
-                retry_count += 1
-
-                if retry_count <= max_retries:
-                    # Enhanced error messaging for different network issues
-                    error_type = type(e).__name__
-                    if "timeout" in str(e).lower():
-                        error_msg = "Request timed out - your connection may be slow"
-                    elif "connection" in str(e).lower():
-                        error_msg = "Connection failed - check your internet connection"
-                    elif "dns" in str(e).lower() or "name resolution" in str(e).lower():
-                        error_msg = "DNS resolution failed - check your network settings"
-                    else:
-                        error_msg = f"Network error ({error_type})"
+        Args:
+            prompt: The prompt to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate
+            max_words: Stop once the text reaches this many words
+            max_seconds: Stop once a request has been streaming this long
+            on_chunk: Called with each chunk and the stream
+            use_cache: Whether to read from and write to the response cache
 
-                    # Add jitter to retry delay to prevent thundering herd problem
-                    jitter = random.uniform(0.1, 0.3) * retry_delay
-                    sleep_time = retry_delay + jitter
+        Returns:
+            GenerationStream; iterate it for chunks or call result() for the full text
+        """
+        def chunk_source(request_prompt: str, request_max_tokens: int) -> Iterator[str]:
+            return self.stream_chunks(request_prompt, temperature, request_max_tokens, use_cache)
 
-                    print(f"🌐 {error_msg}. Retrying in {sleep_time:.1f} seconds... (attempt {retry_count}/{max_retries})")
+        return GenerationStream(chunk_source, prompt, max_tokens, max_words=max_words,
+                                max_seconds=max_seconds, on_chunk=on_chunk)
 
-                    # Show progress indicator for longer waits
-                    if sleep_time > 10:
-                        print(f"⏳ Waiting {sleep_time:.0f}s for network recovery...")
-                        for i in range(int(sleep_time)):
-                            time.sleep(1)
-                            if i % 5 == 0 and i > 0:
-                                print(f"   Still waiting... {int(sleep_time) - i}s remaining")
-                    else:
-                        time.sleep(sleep_time)
-
-                    # Exponential backoff with cap
-                    retry_delay = min(retry_delay * 2, 300)  # Cap at 5 minutes
-                else:
-                    # Create standardized network timeout error
-                    timeout_error = create_network_timeout_error(retry_delay * max_retries)
-                    timeout_error.user_message = f"Network request failed after {max_retries} retries"
-                    timeout_error.details.update({
-                        'max_retries': max_retries,
-                        'last_error': str(e),
-                        'error_type': type(e).__name__
-                    })
-                    handle_error(timeout_error, "Content generation network failure")
-                    return f"Error generating content after {max_retries} retries. Network issues detected. Please check your internet connection and try again. Details: {str(e)}"
+    def stream_chunks(self, prompt: str, temperature: float, max_tokens: int,
+                      use_cache: bool = False) -> Iterator[str]:
+        """
+        Stream the reply to one prompt.
 
-            except Exception as e:
-                error_str = str(e)
-                print(f"Error generating content: {error_str}")
+        Cached replies are yielded whole. A reply is cached only once it is
+        complete. If the request fails before any text arrives, the blocking
+        path (with its retries and key rotation) is used instead; if it fails
+        part way through, the rest of the reply is requested with a
+        continuation prompt built from the text received so far.
 
-                # Check if this is a rate limit error
-                if self.is_rate_limit_error(error_str) and key_rotation_attempts < max_key_rotations:
-                    key_rotation_attempts += 1
+        Args:
+            prompt: The prompt to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate
+            use_cache: Whether to read from and write to the response cache
 
-                    # Create standardized rate limit error
-                    rate_limit_error = create_api_rate_limit_error("Gemini")
-                    handle_error(rate_limit_error, "API key rotation", show_suggestions=False)
+        Yields:
+            Text chunks
 
-                    # Rotate to the next API key
-                    if self.rotate_api_key():
-                        # Reset the model with the new API key
-                        self.model = genai.GenerativeModel(MODEL)
-                        print(f"Switched to API key {self.current_key_index + 1}/{len(self.api_keys)}. Retrying...")
+        Raises:
+            RuntimeError: If the stream broke off and the continuation request failed
+        """
+        cache_key = self.response_cache_key(prompt, temperature, max_tokens) if use_cache else None
+        if cache_key:
+            cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                yield cached_response
+                return
+
+        parts = []
+        try:
+            # Each request streams on the key the async client reserved for it
+            for text in self.async_client.stream_content(prompt, temperature, max_tokens):
+                parts.append(text)
+                yield text
+        except Exception as e:
+            if parts:
+                print(f"Streaming stopped after {len(parts)} chunks, continuing from the received text: {e}")
+                continuation = self._continue_interrupted_stream(prompt, "".join(parts), temperature, max_tokens)
+                parts.append(continuation)
+                yield continuation
+            else:
+                print(f"Streaming request failed, retrying without streaming: {e}")
+                text = self._generate_content_uncached(prompt, temperature, max_tokens)
+                if cache_key and text and not text.startswith("Error"):
+                    self.response_cache.put(cache_key, text, model=MODEL)
+                yield text
+                return
+
+        if cache_key and parts:
+            self.response_cache.put(cache_key, "".join(parts), model=MODEL)
+
+    def _continue_interrupted_stream(self, prompt: str, partial_text: str, temperature: float,
+                                     max_tokens: int) -> str:
+        """
+        Request the rest of a reply whose stream broke off.
 
-                        # Don't count this as a retry, just switch keys and try again
-                        continue
-                    else:
-                        # If we couldn't rotate to a new key, all keys are rate limited
-                        all_keys_error = create_api_rate_limit_error("Gemini")
-                        all_keys_error.user_message = "All API keys have reached their rate limits"
-                        all_keys_error.recovery_suggestions = [
-                            "Wait for rate limits to reset (usually 1 minute)",
-                            "Add more API keys to your configuration",
-                            "Reduce the frequency of requests",
-                            "Try again later"
-                        ]
-                        handle_error(all_keys_error, "All API keys rate limited")
-                        return f"Error: All API keys have reached their rate limits. Please try again later."
-
-                # For non-rate-limit errors, return the error message
-                return f"Error generating content. Please try again. Details: {error_str}"
-
-        # This should not be reached, but just in case
-        return f"Error generating content after {max_retries} retries. Last error: {str(last_error)}"
+        Args:
+            prompt: The original prompt
+            partial_text: Text streamed before the failure
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Token budget of the original request
+
+        Returns:
+            Text that continues the partial reply
+
+        Raises:
+            RuntimeError: If the continuation request failed
+        """
+        continuation_prompt = f"""{prompt}
+
+## Response So Far
+The response to the request above was interrupted. It currently ends with:
+
+{partial_text[-2000:]}
+
+## Output Format
+Continue the response exactly where it stops. Do not repeat any of the text above and do not add comments or explanations.
+"""
+        # Roughly four characters per token have already been spent
+        remaining_tokens = max(max_tokens - len(partial_text) // 4, 1024)
+        text = self._generate_content_uncached(continuation_prompt, temperature, remaining_tokens)
+        if not text or text.startswith("Error"):
+            raise RuntimeError(f"Streaming stopped after {len(partial_text)} characters and could not be continued: {text}")
+        return text
+
+    @property
+    def async_client(self):
+        """Async client that shares this client's API keys and rate limit state."""
+        if self._async_client is None:
+            from src.core.async_gemini_client import AsyncGeminiClient
+            self._async_client = AsyncGeminiClient(
+                api_keys=self.api_keys,
+                key_usage_count=self.key_usage_count,
+                rate_limited_keys=self.rate_limited_keys,
+                key_scheduler=self.key_scheduler
+            )
+        return self._async_client
+
+    async def agenerate_content(
+        self, prompt: str, temperature: float = 0.7, max_tokens: int = 16000,
+        max_retries: int = 5, initial_retry_delay: float = 2.0, use_cache: bool = False
+    ) -> str:
+        """
+        Generate content without blocking the event loop.
+
+        Args:
+            prompt: The prompt to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate
+            max_retries: Maximum number of retry attempts for network errors
+            initial_retry_delay: Initial delay between retries in seconds
+            use_cache: Whether to read from and write to the response cache
+
+        Returns:
+            The generated content as a string
+        """
+        cache_key = self.response_cache_key(prompt, temperature, max_tokens) if use_cache else None
+        if cache_key:
+            cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+
+        response = await self.async_client.agenerate_content(
+            prompt, temperature, max_tokens, max_retries, initial_retry_delay
+        )
+        if cache_key and response and not response.startswith("Error"):
+            self.response_cache.put(cache_key, response, model=MODEL)
+        return response
+
+    async def agenerate_batch(
+        self, prompts: List[str], temperature: float = 0.7, max_tokens: int = 16000,
+        max_retries: int = 5, initial_retry_delay: float = 2.0
+    ) -> List[str]:
+        """
+        Generate content for several prompts concurrently.
+
+        Args:
+            prompts: The prompts to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate per prompt
+            max_retries: Maximum number of retry attempts for network errors
+            initial_retry_delay: Initial delay between retries in seconds
+
+        Returns:
+            Generated content for each prompt, in prompt order
+        """
+        return await self.async_client.agenerate_batch(
+            prompts, temperature, max_tokens, max_retries, initial_retry_delay
+        )
+
+    def generate_batch(
+        self, prompts: List[str], temperature: float = 0.7, max_tokens: int = 16000,
+        max_retries: int = 5, initial_retry_delay: float = 2.0
+    ) -> List[str]:
+        """
+        Generate content for several prompts concurrently from synchronous code.
+
+        Args:
+            prompts: The prompts to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate per prompt
+            max_retries: Maximum number of retry attempts for network errors
+            initial_retry_delay: Initial delay between retries in seconds
+
+        Returns:
+            Generated content for each prompt, in prompt order
+        """
+        return self.async_client.generate_batch(
+            prompts, temperature, max_tokens, max_retries, initial_retry_delay
+        )
 
     def generate_with_context(
         self,
@@ -442,125 +591,9 @@ class GeminiClient:
         Returns:
             The generated content as a string
         """
-        retry_count = 0
-        retry_delay = initial_retry_delay
-        last_error = None
-        key_rotation_attempts = 0
-        max_key_rotations = len(self.api_keys) * 2  # Allow cycling through keys twice
-
-        while retry_count <= max_retries:
-            try:
-                # If this is a retry, log the attempt
-                if retry_count > 0:
-                    print(f"Retry attempt {retry_count}/{max_retries} after {retry_delay:.1f}s delay...")
-
-                # For socket errors, we'll use a small delay to allow DNS to refresh
-                if retry_count > 0:
-                    # Clear DNS cache by forcing a new connection
-                    socket.setdefaulttimeout(60)  # Increase socket timeout
-
-                # Track API key usage
-                current_key = self.api_keys[self.current_key_index]
-                self.key_usage_count[current_key] = self.key_usage_count.get(current_key, 0) + 1
-
-                # Make the API call
-                chat = self.model.start_chat(history=context)
-                response = chat.send_message(
-                    prompt,
-                    generation_config={
-                        "temperature": temperature,
-                        "max_output_tokens": max_tokens,
-                        "top_p": 0.95,
-                        "top_k": 40,
-                    },
-                )
-
-                # Extract the text from the response
-                if hasattr(response, "text"):
-                    return response.text
-                elif hasattr(response, "parts"):
-                    # Handle response with parts
-                    parts = []
-                    for part in response.parts:
-                        if hasattr(part, "text"):
-                            parts.append(part.text)
-                        else:
-                            parts.append(str(part))
-                    return "\n".join(parts)
-                else:
-                    # Handle different response formats
-                    return str(response)
-
-            except (ConnectionError, Timeout, RequestException, socket.error) as e:
-                # Network-related errors that are worth retrying
-                last_error = e
-                retry_count += 1
-
-                if retry_count <= max_retries:
-                    # Enhanced error messaging for different network issues
-                    error_type = type(e).__name__
-                    if "timeout" in str(e).lower():
-                        error_msg = "Request timed out - your connection may be slow"
-                    elif "connection" in str(e).lower():
-                        error_msg = "Connection failed - check your internet connection"
-                    elif "dns" in str(e).lower() or "name resolution" in str(e).lower():
-                        error_msg = "DNS resolution failed - check your network settings"
-                    else:
-                        error_msg = f"Network error ({error_type})"
-
-                    # Add jitter to retry delay to prevent thundering herd problem
-                    jitter = random.uniform(0.1, 0.3) * retry_delay
-                    sleep_time = retry_delay + jitter
-
-                    print(f"🌐 {error_msg}. Retrying context generation in {sleep_time:.1f} seconds... (attempt {retry_count}/{max_retries})")
-
-                    # Show progress indicator for longer waits
-                    if sleep_time > 10:
-                        print(f"⏳ Waiting {sleep_time:.0f}s for network recovery...")
-                        for i in range(int(sleep_time)):
-                            time.sleep(1)
-                            if i % 5 == 0 and i > 0:
-                                print(f"   Still waiting... {int(sleep_time) - i}s remaining")
-                    else:
-                        time.sleep(sleep_time)
-
-                    # Exponential backoff with cap
-                    retry_delay = min(retry_delay * 2, 300)  # Cap at 5 minutes
-                else:
-                    print(f"❌ Maximum retries ({max_retries}) exceeded. Last error: {e}")
-                    print("💡 Troubleshooting tips:")
-                    print("   • Check your WiFi connection")
-                    print("   • Try moving closer to your router")
-                    print("   • Restart your network connection")
-                    print("   • Wait a few minutes and try again")
-                    return f"Error generating content with context after {max_retries} retries. Network issues detected. Please check your internet connection and try again. Details: {str(e)}"
-
-            except Exception as e:
-                error_str = str(e)
-                print(f"Error generating content with context: {error_str}")
-
-                # Check if this is a rate limit error
-                if self.is_rate_limit_error(error_str) and key_rotation_attempts < max_key_rotations:
-                    key_rotation_attempts += 1
-                    print(f"Rate limit detected. Rotating API key...")
-
-                    # Rotate to the next API key
-                    if self.rotate_api_key():
-                        # Reset the model with the new API key
-                        self.model = genai.GenerativeModel(MODEL)
-                        print(f"Switched to API key {self.current_key_index + 1}/{len(self.api_keys)}. Retrying...")
-
-                        # Don't count this as a retry, just switch keys and try again
-                        continue
-                    else:
-                        # If we couldn't rotate to a new key, all keys are rate limited
-                        return f"Error: All API keys have reached their rate limits. Please try again later."
-
-                # For non-rate-limit errors, return the error message
-                return f"Error generating content with context. Please try again. Details: {error_str}"
-
-        # This should not be reached, but just in case
-        return f"Error generating content with context after {max_retries} retries. Last error: {str(last_error)}"
+        return self.async_client.generate_content(
+            prompt, temperature, max_tokens, max_retries, initial_retry_delay, context=context
+        )
 
     def clean_response(self, response: str) -> str:
         """
@@ -614,5 +647,6 @@ class GeminiClient:
             "current_key_index": self.current_key_index + 1,  # 1-based for display
             "current_key": masked_current_key,
             "rate_limited_keys": len(self.rate_limited_keys),
+            "saturated_keys": self.key_scheduler.get_status()["saturated_keys"],
             "usage_by_key": usage_percentages
         }
@@ -0,0 +1,206 @@
+"""
+Durable checkpoints for long-running novel generation.
+
+Every completed stage (writer profile, outline, characters) and every finished
+chapter is appended to a JSONL journal next to the memory file, together with
+the memory changes made since the previous record. Memory itself is written
+once, when the checkpoint starts; loading replays that snapshot plus the
+changes, so each record stays the size of one chapter. A crashed run can then
+be resumed from the first missing chapter without regenerating paid-for
+content.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from rich.console import Console
+
+from src.utils.file_handler import sanitize_filename
+
+console = Console()
+
+CHECKPOINT_PREFIX = "checkpoint_"
+
+
+class GenerationCheckpoint:
+    """
+    Append-only chapter checkpoint journal for a single novel.
+    """
+
+    def __init__(self, memory_manager):
+        """
+        Initialize the checkpoint for a novel.
+
+        Args:
+            memory_manager: MemoryManager of the novel being generated
+        """
+        self.memory_manager = memory_manager
+
+        base_dir = os.path.dirname(memory_manager.memory_file)
+        base_name = f"{CHECKPOINT_PREFIX}{sanitize_filename(memory_manager.novel_title)}"
+        self.journal_file = os.path.join(base_dir, f"{base_name}.jsonl").replace('\\', '/')
+        self.memory_snapshot_file = os.path.join(base_dir, f"{base_name}_memory.json").replace('\\', '/')
+
+        # Memory changes made since the last record
+        self._memory_changes: List[Dict[str, Any]] = []
+
+    def exists(self) -> bool:
+        """Check whether a checkpoint journal exists for this novel."""
+        return os.path.exists(self.journal_file)
+
+    @staticmethod
+    def find(title: str, search_dir: str = "output") -> List[str]:
+        """
+        Find output directories holding an interrupted generation of a novel.
+
+        Args:
+            title: Novel title
+            search_dir: Directory searched recursively for checkpoint journals
+
+        Returns:
+            Output directories with a checkpoint for the title, newest first
+        """
+        journal_name = f"{CHECKPOINT_PREFIX}{sanitize_filename(title)}.jsonl"
+        journals = [os.path.join(root, journal_name)
+                    for root, _, files in os.walk(search_dir) if journal_name in files]
+        journals.sort(key=os.path.getmtime, reverse=True)
+        return [os.path.dirname(journal).replace('\\', '/') for journal in journals]
+
+    def start(self, generation_options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Begin a new journal and snapshot the memory it starts from.
+
+        Args:
+            generation_options: Options the novel is generated with, restored on resume
+
+        Raises:
+            FileExistsError: If a checkpoint already exists; resume it or clear() it first
+        """
+        if self.exists():
+            raise FileExistsError(f"A checkpoint already exists for '{self.memory_manager.novel_title}': "
+                                  f"{self.journal_file}")
+        self._snapshot_memory()
+        self._track_memory_changes()
+        self._append({"type": "start", "generation_options": generation_options or {}})
+
+    def save_stage(self, stage: str, data: Any) -> None:
+        """
+        Record a completed pre-chapter stage.
+
+        Args:
+            stage: Stage name (writer_profile, outline or characters)
+            data: Stage output
+        """
+        self._append({"type": "stage", "stage": stage, "data": data})
+
+    def save_chapter(self, chapter: Dict[str, Any]) -> None:
+        """
+        Record a completed (enhanced) chapter.
+
+        The chapter and the memory changes made for it are one journal record,
+        so on load memory and chapters never disagree.
+
+        Args:
+            chapter: Chapter dictionary with number, title and content
+        """
+        self._append({"type": "chapter", "chapter": chapter})
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the checkpointed state and keep recording from it.
+
+        Returns:
+            Dictionary with generation_options, stages, chapters (in order,
+            contiguous from 1), the memory snapshot and the memory changes to
+            replay onto it, or None if no checkpoint exists
+        """
+        if not self.exists():
+            return None
+
+        generation_options: Dict[str, Any] = {}
+        stages: Dict[str, Any] = {}
+        chapters: List[Dict[str, Any]] = []
+        memory_changes: List[Dict[str, Any]] = []
+
+        with open(self.journal_file, 'rb') as f:
+            journal = f.read()
+
+        valid_bytes = 0
+        for line in journal.splitlines(keepends=True):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("unterminated record")
+                record = json.loads(line.decode('utf-8'))
+            except ValueError:
+                # A torn final record from a crash mid-write; cut it off so new
+                # records are not appended onto it
+                console.print("[yellow]Warning: Discarding incomplete checkpoint record[/yellow]")
+                with open(self.journal_file, 'r+b') as f:
+                    f.truncate(valid_bytes)
+                break
+
+            # Only chapters without gaps can be resumed from
+            if record.get("type") == "chapter" and record["chapter"]["number"] != len(chapters) + 1:
+                break
+
+            valid_bytes += len(line)
+            memory_changes.extend(record.get("memory_changes", []))
+            if record.get("type") == "start":
+                generation_options = record.get("generation_options") or {}
+            elif record.get("type") == "stage":
+                stages[record["stage"]] = record["data"]
+            elif record.get("type") == "chapter":
+                chapters.append(record["chapter"])
+
+        memory_data = None
+        if os.path.exists(self.memory_snapshot_file):
+            with open(self.memory_snapshot_file, 'r', encoding='utf-8') as f:
+                memory_data = json.load(f)["memory"]
+        else:
+            stages = {}
+            chapters = []
+            memory_changes = []
+
+        self._track_memory_changes()
+
+        return {
+            "generation_options": generation_options,
+            "stages": stages,
+            "chapters": chapters,
+            "memory": memory_data,
+            "memory_changes": memory_changes
+        }
+
+    def clear(self) -> None:
+        """Remove the checkpoint files and stop recording memory changes."""
+        if self.memory_manager.change_log is self._memory_changes:
+            self.memory_manager.change_log = None
+        for path in (self.journal_file, self.memory_snapshot_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _track_memory_changes(self) -> None:
+        """Collect the memory manager's changes for the next record."""
+        self._memory_changes = []
+        self.memory_manager.change_log = self._memory_changes
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append one record, with the memory changes made since the last one, and flush it to disk."""
+        record["memory_changes"] = list(self._memory_changes)
+        record["timestamp"] = datetime.now().isoformat()
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._memory_changes.clear()
+
+    def _snapshot_memory(self) -> None:
+        """Atomically write the memory state the journal starts from."""
+        temp_path = f"{self.memory_snapshot_file}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"memory": self.memory_manager.get_memory_data()}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.memory_snapshot_file)
@@ -0,0 +1,172 @@
+"""
+Streaming generation with a live word count.
+
+A GenerationStream yields text chunks as the model produces them, keeps a
+running word count, records time-to-first-token for each request, and can be
+stopped early (by a word ceiling, a time limit, or the caller). A finished
+stream can be continued with a short follow-up prompt built from its own tail,
+so extending a draft does not re-send the original prompt and the word count
+carries on without recounting.
+"""
+
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional
+
+from src.utils.word_counter import IncrementalWordCounter
+
+# Produces the chunks for one request: (prompt, max_tokens) -> chunks
+ChunkSource = Callable[[str, int], Iterable[str]]
+
+
+class GenerationStream:
+    """
+    Text generated by one or more chained streaming requests.
+    """
+
+    def __init__(self, chunk_source: ChunkSource, prompt: str, max_tokens: int,
+                 max_words: Optional[int] = None, max_seconds: Optional[float] = None,
+                 on_chunk: Optional[Callable[[str, "GenerationStream"], None]] = None):
+        """
+        Initialize a stream; nothing is requested until it is iterated.
+
+        Args:
+            chunk_source: Callable that streams the reply to a prompt
+            prompt: The prompt to send to the model
+            max_tokens: Maximum number of tokens to generate
+            max_words: Stop once the text reaches this many words
+            max_seconds: Stop once a request has been streaming this long
+            on_chunk: Called with each chunk and the stream, e.g. to update a progress display
+        """
+        self.chunk_source = chunk_source
+        self.max_words = max_words
+        self.max_seconds = max_seconds
+        self.on_chunk = on_chunk
+
+        self.chunks: List[str] = []
+        self.counter = IncrementalWordCounter()
+        self.segments: List[Dict[str, Any]] = []
+        self.stop_reason: Optional[str] = None
+        self._pending = [(prompt, max_tokens, "")]
+        self._stop_requested = False
+
+    @property
+    def text(self) -> str:
+        """Text received so far."""
+        return "".join(self.chunks)
+
+    @property
+    def word_count(self) -> int:
+        """Running word count of the text received so far."""
+        return self.counter.count
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """Seconds until the first chunk of the first request arrived."""
+        return self.segments[0]["time_to_first_token"] if self.segments else None
+
+    @property
+    def elapsed(self) -> float:
+        """Total seconds spent streaming across all requests."""
+        return sum(segment["elapsed"] for segment in self.segments)
+
+    @property
+    def stopped(self) -> bool:
+        """Whether generation was cut off before the model finished."""
+        return self.stop_reason is not None
+
+    def stop(self, reason: str = "stopped") -> None:
+        """
+        Ask the stream to stop after the current chunk.
+
+        Args:
+            reason: Recorded as stop_reason
+        """
+        self._stop_requested = True
+        self.stop_reason = reason
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield chunks from every queued request as they arrive."""
+        while self._pending and not self._stop_requested:
+            prompt, max_tokens, separator = self._pending.pop(0)
+            yield from self._stream_segment(prompt, max_tokens, separator)
+
+    def _stream_segment(self, prompt: str, max_tokens: int, separator: str) -> Iterator[str]:
+        """Stream one request into the shared text and word count."""
+        segment = {"prompt_chars": len(prompt), "time_to_first_token": None,
+                   "elapsed": 0.0, "words": 0, "chunks": 0}
+        self.segments.append(segment)
+        words_before = self.counter.count
+        start_time = time.monotonic()
+
+        source = iter(self.chunk_source(prompt, max_tokens))
+        try:
+            for chunk in source:
+                if not chunk:
+                    continue
+                if segment["time_to_first_token"] is None:
+                    segment["time_to_first_token"] = time.monotonic() - start_time
+                    if separator and self.chunks:
+                        chunk = separator + chunk
+
+                self.chunks.append(chunk)
+                self.counter.feed(chunk)
+                segment["chunks"] += 1
+                segment["words"] = self.counter.count - words_before
+                segment["elapsed"] = time.monotonic() - start_time
+
+                if self.on_chunk:
+                    self.on_chunk(chunk, self)
+                yield chunk
+
+                if self.max_words and self.counter.count >= self.max_words:
+                    self.stop("max_words")
+                elif self.max_seconds and segment["elapsed"] >= self.max_seconds:
+                    self.stop("max_seconds")
+                if self._stop_requested:
+                    break
+        finally:
+            # Closing the source ends the underlying HTTP stream early
+            if hasattr(source, "close"):
+                source.close()
+            segment["elapsed"] = time.monotonic() - start_time
+
+    def result(self) -> str:
+        """
+        Consume any remaining chunks.
+
+        Returns:
+            The full text
+        """
+        for _ in self:
+            pass
+        return self.text
+
+    def tail(self, chars: int = 2000) -> str:
+        """Get the end of the text, e.g. to build a continuation prompt."""
+        return self.text[-chars:]
+
+    def continue_with(self, prompt: str, max_tokens: int, separator: str = "\n\n",
+                      max_words: Optional[int] = None) -> "GenerationStream":
+        """
+        Queue a follow-up request whose reply is appended to this stream.
+
+        The follow-up prompt is sent on its own, so it should carry whatever
+        context the model needs (usually the tail of the text). Iterate the
+        stream again, or call result(), to receive the continuation.
+
+        Args:
+            prompt: Continuation prompt
+            max_tokens: Maximum number of tokens for the continuation
+            separator: Text placed between the existing text and the continuation
+            max_words: New word ceiling for the whole text (None keeps the current one)
+
+        Returns:
+            This stream
+        """
+        self.result()
+        if max_words is not None:
+            self.max_words = max_words
+        self._stop_requested = False
+        self.stop_reason = None
+        self._pending.append((prompt, max_tokens, separator))
+        return self
@@ -0,0 +1,317 @@
+"""
+Per-API-key request scheduling based on token buckets.
+
+Each Gemini API key gets a requests-per-minute bucket and a tokens-per-minute
+bucket. Requests are routed to the key with the most headroom and wait up
+front when every key is saturated, instead of spending a call on a 429.
+"""
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Default per-key quotas (Gemini 2.0 Flash free tier), overridable via environment
+DEFAULT_REQUESTS_PER_MINUTE = 15
+DEFAULT_TOKENS_PER_MINUTE = 1_000_000
+
+# How long a key is benched after the API reports it as rate limited
+RATE_LIMIT_COOLDOWN_SECONDS = 60.0
+
+
+class TokenBucket:
+    """Token bucket that refills continuously up to its capacity."""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            capacity: Maximum number of tokens the bucket can hold
+            refill_per_second: Tokens added back per second
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+            self.last_refill = now
+
+    def available(self, now: float) -> float:
+        """Tokens currently available."""
+        self._refill(now)
+        return self.tokens
+
+    def time_until(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens will be available."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.tokens
+        if missing <= 0:
+            return 0.0
+        return missing / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Remove tokens from the bucket (may go negative when over-reserved)."""
+        self.tokens -= amount
+
+    def refund(self, amount: float) -> None:
+        """Return unused tokens to the bucket."""
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def drain(self, now: float) -> None:
+        """Empty the bucket."""
+        self._refill(now)
+        self.tokens = 0.0
+
+
+class _KeyState:
+    """Buckets and cooldown for a single API key."""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self.cooldown_until = 0.0
+        self.rate_limit_hits = 0
+        self.total_waited = 0.0
+
+    def wait_time(self, token_cost: float, now: float) -> float:
+        """Seconds until this key can accept a request of `token_cost` tokens."""
+        return max(
+            self.cooldown_until - now,
+            self.requests.time_until(1, now),
+            self.tokens.time_until(token_cost, now),
+            0.0
+        )
+
+    def headroom(self, now: float) -> float:
+        """Fraction of the tighter quota that is still available (0.0 to 1.0)."""
+        return min(
+            self.requests.available(now) / self.requests.capacity,
+            self.tokens.available(now) / self.tokens.capacity
+        )
+
+
+class APIKeyScheduler:
+    """
+    Routes requests across API keys using per-key RPM and TPM token buckets.
+
+    Thread-safe for synchronous callers; `aacquire` offers the same behaviour
+    without blocking an event loop.
+    """
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            api_keys: API keys to schedule across
+            requests_per_minute: Per-key request quota (GEMINI_RPM_PER_KEY or 15 by default)
+            tokens_per_minute: Per-key token quota (GEMINI_TPM_PER_KEY or 1,000,000 by default)
+        """
+        if requests_per_minute is None:
+            requests_per_minute = int(os.getenv("GEMINI_RPM_PER_KEY", DEFAULT_REQUESTS_PER_MINUTE))
+        if tokens_per_minute is None:
+            tokens_per_minute = int(os.getenv("GEMINI_TPM_PER_KEY", DEFAULT_TOKENS_PER_MINUTE))
+
+        self.api_keys = list(api_keys)
+        self.requests_per_minute = max(1, requests_per_minute)
+        self.tokens_per_minute = max(1, tokens_per_minute)
+        self._states: Dict[str, _KeyState] = {
+            key: _KeyState(self.requests_per_minute, self.tokens_per_minute) for key in self.api_keys
+        }
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def estimate_tokens(prompt: str, max_tokens: int) -> int:
+        """
+        Estimate the tokens a request will count against the TPM quota.
+
+        Uses the common ~4 characters per token approximation for the prompt
+        and reserves the full output budget; the difference is refunded by
+        `release` once the real response is known.
+
+        Args:
+            prompt: The prompt text
+            max_tokens: Maximum number of output tokens requested
+
+        Returns:
+            Estimated token cost
+        """
+        return len(prompt) // 4 + max_tokens
+
+    def _try_reserve(self, token_cost: float) -> Tuple[Optional[str], float]:
+        """
+        Reserve capacity on the key with the most headroom.
+
+        Must be called with the condition lock held.
+
+        Returns:
+            Tuple of (reserved key or None, seconds to wait before retrying)
+        """
+        now = time.monotonic()
+        token_cost = min(token_cost, self.tokens_per_minute)
+
+        best_key = None
+        best_headroom = -1.0
+        shortest_wait = float("inf")
+
+        for key in self.api_keys:
+            state = self._states[key]
+            wait = state.wait_time(token_cost, now)
+            if wait > 0:
+                shortest_wait = min(shortest_wait, wait)
+                continue
+
+            headroom = state.headroom(now)
+            if headroom > best_headroom:
+                best_key = key
+                best_headroom = headroom
+
+        if best_key is None:
+            return None, shortest_wait
+
+        state = self._states[best_key]
+        state.requests.consume(1)
+        state.tokens.consume(token_cost)
+        return best_key, 0.0
+
+    def acquire(self, token_cost: float, timeout: Optional[float] = None) -> str:
+        """
+        Reserve capacity for one request, waiting while every key is saturated.
+
+        Args:
+            token_cost: Estimated tokens for the request (see estimate_tokens)
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            The API key to use for the request
+
+        Raises:
+            TimeoutError: If no key had capacity within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waited = 0.0
+
+        with self._condition:
+            while True:
+                key, wait = self._try_reserve(token_cost)
+                if key is not None:
+                    self._states[key].total_waited += waited
+                    return key
+
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("All API keys are saturated")
+                    wait = min(wait, remaining)
+
+                self._condition.wait(wait)
+                waited += wait
+
+    async def aacquire(self, token_cost: float) -> str:
+        """
+        Reserve capacity for one request without blocking the event loop.
+
+        Args:
+            token_cost: Estimated tokens for the request (see estimate_tokens)
+
+        Returns:
+            The API key to use for the request
+        """
+        waited = 0.0
+        while True:
+            with self._condition:
+                key, wait = self._try_reserve(token_cost)
+                if key is not None:
+                    self._states[key].total_waited += waited
+                    return key
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def release(self, key: str, reserved_tokens: float, used_tokens: float) -> None:
+        """
+        Refund the part of a reservation that the request did not use.
+
+        Args:
+            key: The key the reservation was made on
+            reserved_tokens: Tokens reserved by acquire
+            used_tokens: Tokens the request actually consumed
+        """
+        unused = min(reserved_tokens, self.tokens_per_minute) - used_tokens
+        if unused <= 0 or key not in self._states:
+            return
+
+        with self._condition:
+            self._states[key].tokens.refund(unused)
+            self._condition.notify_all()
+
+    def report_rate_limited(self, key: str, cooldown: float = RATE_LIMIT_COOLDOWN_SECONDS) -> None:
+        """
+        Bench a key after the API rejected it with a rate limit error.
+
+        Args:
+            key: The rate-limited key
+            cooldown: Seconds before the key is scheduled again
+        """
+        if key not in self._states:
+            return
+
+        with self._condition:
+            now = time.monotonic()
+            state = self._states[key]
+            state.cooldown_until = now + cooldown
+            state.rate_limit_hits += 1
+            state.requests.drain(now)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get per-key headroom and the number of saturated keys.
+
+        Returns:
+            Dictionary with scheduler configuration and per-key status
+        """
+        with self._condition:
+            now = time.monotonic()
+            keys = {}
+            saturated = 0
+            cooling_down = 0
+
+            for i, key in enumerate(self.api_keys):
+                state = self._states[key]
+                requests_available = state.requests.available(now)
+                tokens_available = state.tokens.available(now)
+                is_cooling_down = state.cooldown_until > now
+                is_saturated = is_cooling_down or requests_available < 1
+
+                saturated += 1 if is_saturated else 0
+                cooling_down += 1 if is_cooling_down else 0
+
+                # Mask the API key for security
+                masked_key = f"{key[:4]}...{key[-4:]}" if len(key) > 8 else "****"
+                keys[masked_key] = {
+                    "index": i + 1,  # 1-based for display
+                    "requests_available": int(max(requests_available, 0)),
+                    "tokens_available": int(max(tokens_available, 0)),
+                    "saturated": is_saturated,
+                    "cooldown_remaining": round(max(state.cooldown_until - now, 0.0), 1),
+                    "rate_limit_hits": state.rate_limit_hits,
+                    "total_wait_seconds": round(state.total_waited, 1)
+                }
+
+            return {
+                "requests_per_minute_per_key": self.requests_per_minute,
+                "tokens_per_minute_per_key": self.tokens_per_minute,
+                "total_keys": len(self.api_keys),
+                "saturated_keys": saturated,
+                "cooling_down_keys": cooling_down,
+                "keys": keys
+            }
@@ -1,9 +1,15 @@
 """
 Memory manager for maintaining context and coherence across novel generation.
+
+Memory is persisted as a snapshot file (memory_<title>.json) plus an
+append-only journal of changes made since the snapshot. Each change appends one
+small record; the journal is folded into a new snapshot once it grows as large
+as the snapshot itself, so total write volume stays linear in the book length.
 """
 import json
 import os
-from typing import Dict, List, Any
+import shutil
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 # Import SeriesManager conditionally to avoid circular imports
@@ -14,6 +20,24 @@ except ImportError:
 
 # Import limited collections to prevent memory leaks
 from src.utils.limited_dict import LimitedDict, LimitedList
+from src.utils.versioned_timeline import VersionedTimeline
+from src.utils.summary_tree import SummaryTree
+from src.core.chapter_analysis import analyze_chapter
+
+# Tracking categories that map each entity to its states by chapter
+TIMELINE_CATEGORIES = (
+    "character_arcs", "character_emotions", "character_knowledge", "character_locations",
+    "relationships", "relationship_development", "plot_threads", "plot_progression",
+    "world_building", "objects_of_significance", "themes_and_motifs", "symbols",
+    "continuity_elements", "clothing_and_appearance",
+)
+
+# Chapter history in prompts: summaries roll up into arcs of CHAPTERS_PER_ARC chapters;
+# context carries at least RECENT_CHAPTER_SUMMARIES full summaries, MAX_ARC_SUMMARIES
+# arc summaries before those, and a synopsis of anything older
+CHAPTERS_PER_ARC = 5
+RECENT_CHAPTER_SUMMARIES = 5
+MAX_ARC_SUMMARIES = 4
 
 
 class MemoryManager:
@@ -21,6 +45,10 @@ class MemoryManager:
     Manages the memory and context for novel generation to ensure coherence.
     """
 
+    # The journal is compacted once it is at least this large and at least as
+    # large as the snapshot
+    JOURNAL_MIN_COMPACTION_BYTES = 256 * 1024
+
     def __init__(self, novel_title: str, output_dir: str = None, series_manager=None, book_number: int = None,
                  max_memory_items: int = 1000):
         """
@@ -50,6 +78,19 @@ class MemoryManager:
         else:
             self.memory_file = memory_filename
 
+        # Journal state: sequence number of the last recorded change and sizes
+        # used to decide when to compact
+        self._journal_seq = 0
+        self._journal_bytes = 0
+        self._snapshot_bytes = 0
+
+        # When set, every recorded change is also appended here (used by generation checkpoints)
+        self.change_log: Optional[List[Dict[str, Any]]] = None
+
+        # Assembled chapter contexts, valid until the next change bumps the generation
+        self._context_generation = 0
+        self._context_cache: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
         # Core novel information
         self.metadata = {
             "title": novel_title,
@@ -86,6 +127,9 @@ class MemoryManager:
         # Chapter summaries
         self.chapter_summaries = []
 
+        # Chapter summaries rolled up into arc summaries and a synopsis
+        self.summary_tree = SummaryTree(arc_size=CHAPTERS_PER_ARC)
+
         # Enhanced narrative tracking system with memory leak prevention
         self.narrative_tracking = {
             # Character development tracking (using LimitedDict to prevent memory leaks)
@@ -203,11 +247,13 @@ class MemoryManager:
             filename = filename.replace(char, '_')
         return filename
 
-    def save_memory(self) -> None:
-        """Save the current memory state to a file."""
-        # Update the last_updated timestamp
-        self.metadata["last_updated"] = datetime.now().isoformat()
+    def get_memory_data(self) -> Dict[str, Any]:
+        """
+        Build a JSON-serializable snapshot of the current memory state.
 
+        Returns:
+            Dictionary in the same format as the memory file
+        """
         # Convert LimitedDict and LimitedList objects to regular containers for JSON serialization
         serializable_narrative_tracking = {}
         for key, container in self.narrative_tracking.items():
@@ -228,7 +274,7 @@ class MemoryManager:
                 serializable_narrative_tracking[key] = container
 
         # Prepare the memory data
-        memory_data = {
+        return {
             "metadata": self.metadata,
             "structure": self.structure,
             "characters": self.characters,
@@ -242,9 +288,146 @@ class MemoryManager:
             }
         }
 
-        # Save to file
-        with open(self.memory_file, 'w', encoding='utf-8') as f:
-            json.dump(memory_data, f, indent=2, ensure_ascii=False)
+    @property
+    def journal_file(self) -> str:
+        """Path of the append-only change journal next to the memory snapshot."""
+        return f"{os.path.splitext(self.memory_file)[0]}.journal.jsonl"
+
+    def save_memory(self) -> None:
+        """
+        Write a full snapshot of the current memory state and empty the journal.
+
+        The snapshot is written to a temporary file and renamed into place, so a
+        crash leaves either the old or the new snapshot, never a partial one.
+        """
+        # Update the last_updated timestamp
+        self.metadata["last_updated"] = datetime.now().isoformat()
+
+        memory_data = self.get_memory_data()
+        # Journal records up to this sequence number are part of the snapshot
+        memory_data["journal_seq"] = self._journal_seq
+
+        temp_path = f"{self.memory_file}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(memory_data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.memory_file)
+
+        # Records in the journal are now covered by the snapshot
+        with open(self.journal_file, 'w', encoding='utf-8'):
+            pass
+
+        self._snapshot_bytes = os.path.getsize(self.memory_file)
+        self._journal_bytes = 0
+
+    def _record_change(self, op: str, args: Dict[str, Any]) -> None:
+        """
+        Append one applied change to the journal, compacting when it grows too large.
+
+        Args:
+            op: Name of the change (see _apply_change)
+            args: JSON-serializable arguments of the change
+        """
+        self.metadata["last_updated"] = datetime.now().isoformat()
+        self._journal_seq += 1
+        self._invalidate_context_cache()
+
+        if self.change_log is not None:
+            self.change_log.append({"seq": self._journal_seq, "op": op, "args": args})
+
+        # Without a snapshot there is nothing to replay the journal onto
+        if not os.path.exists(self.memory_file):
+            self.save_memory()
+            return
+
+        record = json.dumps({
+            "seq": self._journal_seq,
+            "op": op,
+            "args": args,
+            "timestamp": self.metadata["last_updated"]
+        }, ensure_ascii=False) + "\n"
+
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(record)
+
+        self._journal_bytes += len(record.encode('utf-8'))
+        if self._journal_bytes >= max(self._snapshot_bytes, self.JOURNAL_MIN_COMPACTION_BYTES):
+            self.save_memory()
+
+    def _replay_journal(self, snapshot_seq: int) -> int:
+        """
+        Re-apply journaled changes that are newer than the loaded snapshot.
+
+        Args:
+            snapshot_seq: Sequence number of the last change in the snapshot
+
+        Returns:
+            Number of changes replayed
+        """
+        self._journal_seq = snapshot_seq
+        self._journal_bytes = 0
+
+        if not os.path.exists(self.journal_file):
+            return 0
+
+        replayed = 0
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final record from an interrupted write
+                    break
+
+                self._journal_bytes += len(line.encode('utf-8'))
+                if record["seq"] <= snapshot_seq:
+                    continue
+
+                self._apply_change(record["op"], record["args"])
+                self.metadata["last_updated"] = record.get("timestamp", self.metadata["last_updated"])
+                self._journal_seq = record["seq"]
+                replayed += 1
+
+        return replayed
+
+    def apply_changes(self, changes: List[Dict[str, Any]]) -> None:
+        """
+        Re-apply changes captured in a change log.
+
+        The changes are not journaled again; call save_memory to persist them.
+
+        Args:
+            changes: Records with op and args, in the order they were made
+        """
+        for change in changes:
+            self._apply_change(change["op"], change["args"])
+
+    def _apply_change(self, op: str, args: Dict[str, Any]) -> None:
+        """
+        Apply a change to the in-memory state.
+
+        Args:
+            op: Name of the change
+            args: Arguments of the change
+        """
+        self._invalidate_context_cache()
+        if op == "update_metadata":
+            self._apply_metadata_update(args["updates"])
+        elif op == "set_novel_structure":
+            self._apply_novel_structure(args["total_chapters"], args["target_word_count"], args["outline"])
+        elif op == "add_character":
+            self.characters.append(args["character"])
+        elif op == "add_setting":
+            self.settings.append(args["setting"])
+        elif op == "add_plot_point":
+            self.plot_points.append(args["plot_point"])
+        elif op == "add_chapter_summary":
+            self._apply_chapter_summary(args["chapter_num"], args["summary"], args["word_count"])
+        elif op == "update_narrative_tracking":
+            self._apply_narrative_tracking(args["chapter_num"], args["chapter_data"])
+        else:
+            print(f"Skipping unknown memory journal entry: {op}")
 
     def set_output_directory(self, output_dir: str) -> None:
         """
@@ -271,27 +454,19 @@ class MemoryManager:
         self.output_dir = normalized_output_dir
         self.memory_file = new_memory_file
 
-        # If the old file exists and is different from the new path, move it
-        if os.path.exists(old_memory_file) and old_memory_file != new_memory_file:
-            try:
-                # Read the old file
-                with open(old_memory_file, 'r', encoding='utf-8') as f:
-                    memory_data = json.load(f)
-
-                # Write to the new location
-                with open(new_memory_file, 'w', encoding='utf-8') as f:
-                    json.dump(memory_data, f, indent=2, ensure_ascii=False)
+        # Save memory to the new location; the in-memory state already includes
+        # everything in the old snapshot and journal
+        self.save_memory()
 
-                # Optionally remove the old file
+        # If the old files exist and are different from the new path, remove them
+        if os.path.exists(old_memory_file) and old_memory_file != new_memory_file:
+            old_journal_file = f"{os.path.splitext(old_memory_file)[0]}.journal.jsonl"
+            for old_file in (old_memory_file, old_journal_file):
                 try:
-                    os.remove(old_memory_file)
+                    if os.path.exists(old_file):
+                        os.remove(old_file)
                 except:
                     pass  # Ignore errors when removing old file
-            except Exception as e:
-                print(f"Error moving memory file: {e}")
-
-        # Save memory to the new location
-        self.save_memory()
 
     def load_memory(self) -> bool:
         """
@@ -307,22 +482,15 @@ class MemoryManager:
             # Try to find a memory file in the root directory with the same name
             root_memory_file = os.path.basename(normalized_memory_file)
             if os.path.exists(root_memory_file) and self.output_dir:
-                # Move the file to the output directory
+                # Move the snapshot and its journal to the output directory
                 try:
-                    with open(root_memory_file, 'r', encoding='utf-8') as f:
-                        memory_data = json.load(f)
-
                     # Ensure directory exists
                     os.makedirs(os.path.dirname(normalized_memory_file), exist_ok=True)
 
-                    with open(normalized_memory_file, 'w', encoding='utf-8') as f:
-                        json.dump(memory_data, f, indent=2, ensure_ascii=False)
-
-                    # Try to remove the old file
-                    try:
-                        os.remove(root_memory_file)
-                    except:
-                        pass  # Ignore errors when removing old file
+                    root_journal_file = f"{os.path.splitext(root_memory_file)[0]}.journal.jsonl"
+                    if os.path.exists(root_journal_file):
+                        shutil.move(root_journal_file, f"{os.path.splitext(normalized_memory_file)[0]}.journal.jsonl")
+                    shutil.move(root_memory_file, normalized_memory_file)
 
                 except Exception as e:
                     print(f"Error moving memory file: {e}")
@@ -337,37 +505,11 @@ class MemoryManager:
             with open(self.memory_file, 'r', encoding='utf-8') as f:
                 memory_data = json.load(f)
 
-            # Update attributes
-            self.metadata = memory_data.get("metadata", self.metadata)
-            self.structure = memory_data.get("structure", self.structure)
-            self.characters = memory_data.get("characters", self.characters)
-            self.settings = memory_data.get("settings", self.settings)
-            self.plot_points = memory_data.get("plot_points", self.plot_points)
-            self.chapter_summaries = memory_data.get("chapter_summaries", self.chapter_summaries)
-
-            # Load narrative tracking and restore LimitedDict/LimitedList objects
-            loaded_narrative_tracking = memory_data.get("narrative_tracking", {})
-
-            # Restore limited containers with loaded data
-            for key, container in self.narrative_tracking.items():
-                loaded_data = loaded_narrative_tracking.get(key, {})
-
-                if isinstance(container, LimitedDict):
-                    # Restore LimitedDict
-                    container.clear()
-                    if isinstance(loaded_data, dict):
-                        for k, v in loaded_data.items():
-                            container[k] = v
-                elif isinstance(container, LimitedList):
-                    # Restore LimitedList
-                    container.clear()
-                    if isinstance(loaded_data, list):
-                        for item in loaded_data:
-                            container.append(item)
-                else:
-                    # Regular container - direct assignment
-                    self.narrative_tracking[key] = loaded_data
+            self.restore_memory_data(memory_data)
+            self._snapshot_bytes = os.path.getsize(self.memory_file)
 
+            # Bring the snapshot up to date with changes recorded since
+            self._replay_journal(memory_data.get("journal_seq", 0))
             return True
         except Exception as e:
             print(f"Error loading memory: {e}")
@@ -375,6 +517,47 @@ class MemoryManager:
             self.save_memory()
             return False
 
+    def restore_memory_data(self, memory_data: Dict[str, Any]) -> None:
+        """
+        Replace the in-memory state with a snapshot from get_memory_data.
+
+        Args:
+            memory_data: Dictionary in the memory file format
+        """
+        self._invalidate_context_cache()
+        # Update attributes
+        self.metadata = memory_data.get("metadata", self.metadata)
+        self.structure = memory_data.get("structure", self.structure)
+        self.characters = memory_data.get("characters", self.characters)
+        self.settings = memory_data.get("settings", self.settings)
+        self.plot_points = memory_data.get("plot_points", self.plot_points)
+        self.chapter_summaries = memory_data.get("chapter_summaries", self.chapter_summaries)
+        self.summary_tree.rebuild({c["chapter_num"]: c.get("summary", "") for c in self.chapter_summaries})
+
+        # Load narrative tracking and restore LimitedDict/LimitedList objects
+        loaded_narrative_tracking = memory_data.get("narrative_tracking", {})
+
+        # Restore limited containers with loaded data
+        for key, container in self.narrative_tracking.items():
+            loaded_data = loaded_narrative_tracking.get(key, {})
+
+            if isinstance(container, LimitedDict):
+                # Restore LimitedDict
+                container.clear()
+                if isinstance(loaded_data, dict):
+                    for k, v in loaded_data.items():
+                        # Per-entity chapter states get a sorted version index
+                        container[k] = VersionedTimeline.from_data(v) if key in TIMELINE_CATEGORIES else v
+            elif isinstance(container, LimitedList):
+                # Restore LimitedList
+                container.clear()
+                if isinstance(loaded_data, list):
+                    for item in loaded_data:
+                        container.append(item)
+            else:
+                # Regular container - direct assignment
+                self.narrative_tracking[key] = loaded_data
+
     def update_metadata(self, **kwargs) -> None:
         """
         Update novel metadata.
@@ -382,10 +565,14 @@ class MemoryManager:
         Args:
             **kwargs: Key-value pairs to update in metadata
         """
-        for key, value in kwargs.items():
+        self._apply_metadata_update(kwargs)
+        self._record_change("update_metadata", {"updates": kwargs})
+
+    def _apply_metadata_update(self, updates: Dict[str, Any]) -> None:
+        """Apply metadata updates, ignoring unknown keys."""
+        for key, value in updates.items():
             if key in self.metadata:
                 self.metadata[key] = value
-        self.save_memory()
 
     def set_novel_structure(self, total_chapters: int, target_word_count: int, outline: List[str]) -> None:
         """
@@ -396,10 +583,18 @@ class MemoryManager:
             target_word_count: Target word count for the novel
             outline: List of chapter titles or brief descriptions
         """
+        self._apply_novel_structure(total_chapters, target_word_count, outline)
+        self._record_change("set_novel_structure", {
+            "total_chapters": total_chapters,
+            "target_word_count": target_word_count,
+            "outline": outline
+        })
+
+    def _apply_novel_structure(self, total_chapters: int, target_word_count: int, outline: List[str]) -> None:
+        """Apply a novel structure change."""
         self.structure["total_chapters"] = total_chapters
         self.structure["target_word_count"] = target_word_count
         self.structure["outline"] = outline
-        self.save_memory()
 
     def add_character(self, character: Dict[str, Any]) -> None:
         """
@@ -409,7 +604,7 @@ class MemoryManager:
             character: Dictionary containing character details
         """
         self.characters.append(character)
-        self.save_memory()
+        self._record_change("add_character", {"character": character})
 
     def add_setting(self, setting: Dict[str, Any]) -> None:
         """
@@ -419,7 +614,7 @@ class MemoryManager:
             setting: Dictionary containing setting details
         """
         self.settings.append(setting)
-        self.save_memory()
+        self._record_change("add_setting", {"setting": setting})
 
     def add_plot_point(self, plot_point: Dict[str, Any]) -> None:
         """
@@ -429,7 +624,7 @@ class MemoryManager:
             plot_point: Dictionary containing plot point details
         """
         self.plot_points.append(plot_point)
-        self.save_memory()
+        self._record_change("add_plot_point", {"plot_point": plot_point})
 
     def add_chapter_summary(self, chapter_num: int, summary: str, word_count: int) -> None:
         """
@@ -440,6 +635,15 @@ class MemoryManager:
             summary: Brief summary of the chapter
             word_count: Word count of the chapter
         """
+        self._apply_chapter_summary(chapter_num, summary, word_count)
+        self._record_change("add_chapter_summary", {
+            "chapter_num": chapter_num,
+            "summary": summary,
+            "word_count": word_count
+        })
+
+    def _apply_chapter_summary(self, chapter_num: int, summary: str, word_count: int) -> None:
+        """Apply a new chapter summary."""
         # Update current word count
         self.structure["current_word_count"] += word_count
 
@@ -449,8 +653,7 @@ class MemoryManager:
             "summary": summary,
             "word_count": word_count,
         })
-
-        self.save_memory()
+        self.summary_tree.set_summary(chapter_num, summary)
 
     def update_narrative_tracking(self, chapter_num: int, chapter_data: Dict[str, Any]) -> None:
         """
@@ -462,18 +665,35 @@ class MemoryManager:
         """
         # Ensure chapter_num is an integer
         chapter_num = int(chapter_num)
+
+        # Only this chapter's extracted elements are journaled, not the whole tracking state
+        self._apply_narrative_tracking(chapter_num, chapter_data)
+        self._record_change("update_narrative_tracking", {
+            "chapter_num": chapter_num,
+            "chapter_data": chapter_data
+        })
+
+    def _apply_narrative_tracking(self, chapter_num: int, chapter_data: Dict[str, Any]) -> None:
+        """
+        Merge a chapter's extracted narrative elements into the tracking state.
+
+        Args:
+            chapter_num: The chapter number
+            chapter_data: Dictionary containing extracted narrative elements
+        """
+        chapter_num = int(chapter_num)
         # Update character arcs and emotions
         if "character_updates" in chapter_data:
             for char_name, updates in chapter_data["character_updates"].items():
                 # Initialize character entry if it doesn't exist
                 if char_name not in self.narrative_tracking["character_arcs"]:
-                    self.narrative_tracking["character_arcs"][char_name] = {}
+                    self.narrative_tracking["character_arcs"][char_name] = VersionedTimeline()
                 if char_name not in self.narrative_tracking["character_emotions"]:
-                    self.narrative_tracking["character_emotions"][char_name] = {}
+                    self.narrative_tracking["character_emotions"][char_name] = VersionedTimeline()
                 if char_name not in self.narrative_tracking["character_knowledge"]:
-                    self.narrative_tracking["character_knowledge"][char_name] = {}
+                    self.narrative_tracking["character_knowledge"][char_name] = VersionedTimeline()
                 if char_name not in self.narrative_tracking["character_locations"]:
-                    self.narrative_tracking["character_locations"][char_name] = {}
+                    self.narrative_tracking["character_locations"][char_name] = VersionedTimeline()
 
                 # Update character arc
                 if "development" in updates:
@@ -496,9 +716,9 @@ class MemoryManager:
             for rel_key, updates in chapter_data["relationship_updates"].items():
                 # Initialize relationship entry if it doesn't exist
                 if rel_key not in self.narrative_tracking["relationships"]:
-                    self.narrative_tracking["relationships"][rel_key] = {}
+                    self.narrative_tracking["relationships"][rel_key] = VersionedTimeline()
                 if rel_key not in self.narrative_tracking["relationship_development"]:
-                    self.narrative_tracking["relationship_development"][rel_key] = {}
+                    self.narrative_tracking["relationship_development"][rel_key] = VersionedTimeline()
 
                 # Update relationship status
                 self.narrative_tracking["relationships"][rel_key][str(chapter_num)] = updates["status"]
@@ -512,9 +732,9 @@ class MemoryManager:
             for thread_name, updates in chapter_data["plot_updates"].items():
                 # Initialize plot thread if it doesn't exist
                 if thread_name not in self.narrative_tracking["plot_threads"]:
-                    self.narrative_tracking["plot_threads"][thread_name] = {}
+                    self.narrative_tracking["plot_threads"][thread_name] = VersionedTimeline()
                 if thread_name not in self.narrative_tracking["plot_progression"]:
-                    self.narrative_tracking["plot_progression"][thread_name] = {}
+                    self.narrative_tracking["plot_progression"][thread_name] = VersionedTimeline()
 
                 # Update plot thread
                 self.narrative_tracking["plot_threads"][thread_name][str(chapter_num)] = updates["status"]
@@ -545,7 +765,7 @@ class MemoryManager:
         if "world_building" in chapter_data:
             for element, details in chapter_data["world_building"].items():
                 if element not in self.narrative_tracking["world_building"]:
-                    self.narrative_tracking["world_building"][element] = {}
+                    self.narrative_tracking["world_building"][element] = VersionedTimeline()
                 self.narrative_tracking["world_building"][element][str(chapter_num)] = details
 
         # Update locations visited
@@ -556,7 +776,7 @@ class MemoryManager:
         if "objects" in chapter_data:
             for obj, details in chapter_data["objects"].items():
                 if obj not in self.narrative_tracking["objects_of_significance"]:
-                    self.narrative_tracking["objects_of_significance"][obj] = {}
+                    self.narrative_tracking["objects_of_significance"][obj] = VersionedTimeline()
                 self.narrative_tracking["objects_of_significance"][obj][str(chapter_num)] = details
 
         # Update timeline
@@ -583,14 +803,14 @@ class MemoryManager:
         if "themes" in chapter_data:
             for theme, details in chapter_data["themes"].items():
                 if theme not in self.narrative_tracking["themes_and_motifs"]:
-                    self.narrative_tracking["themes_and_motifs"][theme] = {}
+                    self.narrative_tracking["themes_and_motifs"][theme] = VersionedTimeline()
                 self.narrative_tracking["themes_and_motifs"][theme][str(chapter_num)] = details
 
         # Update symbols
         if "symbols" in chapter_data:
             for symbol, details in chapter_data["symbols"].items():
                 if symbol not in self.narrative_tracking["symbols"]:
-                    self.narrative_tracking["symbols"][symbol] = {}
+                    self.narrative_tracking["symbols"][symbol] = VersionedTimeline()
                 self.narrative_tracking["symbols"][symbol][str(chapter_num)] = details
 
         # Update tone shifts
@@ -601,7 +821,7 @@ class MemoryManager:
         if "continuity" in chapter_data:
             for element, details in chapter_data["continuity"].items():
                 if element not in self.narrative_tracking["continuity_elements"]:
-                    self.narrative_tracking["continuity_elements"][element] = {}
+                    self.narrative_tracking["continuity_elements"][element] = VersionedTimeline()
                 self.narrative_tracking["continuity_elements"][element][str(chapter_num)] = details
 
         # Update time of day
@@ -616,113 +836,58 @@ class MemoryManager:
         if "appearance" in chapter_data:
             for char, details in chapter_data["appearance"].items():
                 if char not in self.narrative_tracking["clothing_and_appearance"]:
-                    self.narrative_tracking["clothing_and_appearance"][char] = {}
+                    self.narrative_tracking["clothing_and_appearance"][char] = VersionedTimeline()
                 self.narrative_tracking["clothing_and_appearance"][char][str(chapter_num)] = details
 
-        # Save the updated narrative tracking
-        self.save_memory()
-
-    def extract_narrative_elements(self, chapter_text: str, chapter_num: int, gemini_client=None) -> Dict[str, Any]:
+    def analyze_chapter(self, chapter_text: str, chapter_num: int, chapter_title: str, word_count: int,
+                        gemini_client=None) -> Tuple[str, Dict[str, Any]]:
         """
-        Extract narrative elements from a chapter for tracking using Gemini.
+        Summarize a chapter and extract its narrative elements with one Gemini call.
 
         Args:
             chapter_text: The text of the chapter
             chapter_num: The chapter number
+            chapter_title: The chapter title
+            word_count: Word count of the chapter
             gemini_client: Optional GeminiClient instance
 
         Returns:
-            Dictionary containing extracted narrative elements
+            Tuple of (summary, narrative elements for update_narrative_tracking)
         """
+        fallback_summary = f"Chapter {chapter_num} continues the story with {word_count} words of content."
         if not gemini_client:
-            # If no Gemini client is provided, return an empty dictionary
-            return {}
-
-        # Create a prompt for Gemini to extract narrative elements
-        extraction_prompt = f"""
-        Analyze the following chapter (Chapter {chapter_num}) and extract key narrative elements for tracking.
-
-        Extract the following information in a structured JSON format:
-
-        1. Character updates:
-           - For each character mentioned, track their development, emotions, knowledge gained, and current location
-
-        2. Relationship updates:
-           - For each relationship between characters, track the current status and development
-
-        3. Plot updates:
-           - For each plot thread, track its current status and progression
-
-        4. Unresolved questions introduced in this chapter
-
-        5. Foreshadowing elements introduced in this chapter
-
-        6. Callbacks to earlier events
-
-        7. World building elements introduced or expanded
-
-        8. Locations visited in this chapter
-
-        9. Objects of significance introduced or used
-
-        10. Timeline events that occurred
-
-        11. POV character for this chapter
-
-        12. Connections to other chapters
-
-        13. Scene transitions within the chapter
-
-        14. Themes and motifs present
-
-        15. Symbols used
-
-        16. Overall tone of the chapter
-
-        17. Continuity elements to track (things that need to remain consistent)
-
-        18. Time of day during the chapter
-
-        19. Weather conditions
+            return fallback_summary, self._fallback_extraction(chapter_text, chapter_num)
 
-        20. Character clothing and appearance details
-
-        Format your response as a JSON object with these categories as keys. Be thorough but concise.
+        try:
+            analysis = analyze_chapter(gemini_client, chapter_text, chapter_num, chapter_title)
+        except Exception as e:
+            print(f"Error analyzing chapter {chapter_num}: {e}")
+            return fallback_summary, self._fallback_extraction(chapter_text, chapter_num)
 
-        CHAPTER TEXT:
-        ```
-        {chapter_text[:10000]}... [chapter continues]
-        ```
+        summary = analysis.pop("summary")
+        return summary, analysis
 
-        JSON RESPONSE:
+    def extract_narrative_elements(self, chapter_text: str, chapter_num: int, gemini_client=None) -> Dict[str, Any]:
         """
+        Extract narrative elements from a chapter for tracking using Gemini.
 
-        try:
-            # Generate the extraction using Gemini
-            response = gemini_client.generate_content(extraction_prompt, temperature=0.2, max_tokens=4000)
-
-            # Try to parse the response as JSON
-            try:
-                # Find JSON content in the response
-                start_idx = response.find('{')
-                end_idx = response.rfind('}') + 1
-
-                if start_idx >= 0 and end_idx > start_idx:
-                    json_str = response[start_idx:end_idx]
-                    extracted_data = json.loads(json_str)
-                    return extracted_data
-                else:
-                    # If JSON parsing fails, return a basic structure
-                    return self._fallback_extraction(chapter_text, chapter_num)
+        Prefer analyze_chapter, which returns the chapter summary from the same call.
 
-            except json.JSONDecodeError:
-                # If JSON parsing fails, return a basic structure
-                return self._fallback_extraction(chapter_text, chapter_num)
+        Args:
+            chapter_text: The text of the chapter
+            chapter_num: The chapter number
+            gemini_client: Optional GeminiClient instance
 
-        except Exception as e:
-            print(f"Error extracting narrative elements: {e}")
+        Returns:
+            Dictionary containing extracted narrative elements
+        """
+        if not gemini_client:
+            # If no Gemini client is provided, return an empty dictionary
             return {}
 
+        _, elements = self.analyze_chapter(chapter_text, chapter_num, f"Chapter {chapter_num}", 0, gemini_client)
+        return elements
+
     def _fallback_extraction(self, chapter_text: str, chapter_num: int) -> Dict[str, Any]:
         """
         Fallback method for basic narrative element extraction when Gemini fails.
@@ -778,10 +943,18 @@ class MemoryManager:
             "weather": "Unknown"
         }
 
+    def _invalidate_context_cache(self) -> None:
+        """Start a new context generation; call whenever memory contents change."""
+        self._context_generation += 1
+        self._context_cache.clear()
+
     def get_context_for_chapter(self, chapter_num: int) -> Dict[str, Any]:
         """
         Get the context needed for generating a specific chapter.
 
+        The book's own context is assembled once per chapter and memory generation;
+        series context comes from the series manager's own cache.
+
         Args:
             chapter_num: The chapter number to generate
 
@@ -790,30 +963,13 @@ class MemoryManager:
         """
         # Ensure chapter_num is an integer
         chapter_num = int(chapter_num)
-        # Get previous chapter summaries
-        previous_chapters = [
-            summary for summary in self.chapter_summaries
-            if summary["chapter_num"] < chapter_num
-        ]
 
-        # Get relevant plot points for this chapter
-        relevant_plot_points = self.plot_points
+        cache_key = (chapter_num, self._context_generation)
+        if cache_key not in self._context_cache:
+            self._context_cache[cache_key] = self._build_context_for_chapter(chapter_num)
 
-        # Get narrative tracking information relevant to this chapter
-        narrative_context = self._get_narrative_context_for_chapter(chapter_num)
-
-        # Create base context
-        context = {
-            "metadata": self.metadata,
-            "structure": self.structure,
-            "characters": self.characters,
-            "settings": self.settings,
-            "previous_chapters": previous_chapters,
-            "relevant_plot_points": relevant_plot_points,
-            "chapter_to_generate": chapter_num,
-            "chapter_title": self.structure["outline"][chapter_num - 1] if chapter_num <= len(self.structure["outline"]) else f"Chapter {chapter_num}",
-            "narrative_context": narrative_context,
-        }
+        # Callers may add keys, so hand out a copy of the cached context
+        context = dict(self._context_cache[cache_key])
 
         # Add series context if this book is part of a series
         if self.series_manager and self.book_number:
@@ -837,6 +993,56 @@ class MemoryManager:
 
         return context
 
+    def get_book_synopsis(self) -> str:
+        """
+        Get a synopsis of the whole book from its rolled-up chapter summaries.
+
+        Returns:
+            Synopsis text (empty if no chapters are summarized yet)
+        """
+        return self.summary_tree.synopsis
+
+    def _build_context_for_chapter(self, chapter_num: int) -> Dict[str, Any]:
+        """
+        Assemble the book's own context for a chapter.
+
+        Args:
+            chapter_num: The chapter number to generate
+
+        Returns:
+            Dictionary containing context information
+        """
+        # Recent chapters in full, earlier ones as arc summaries and a synopsis
+        history = self.summary_tree.get_view(chapter_num, RECENT_CHAPTER_SUMMARIES, MAX_ARC_SUMMARIES)
+        recent_chapters = set(history["recent_units"])
+        previous_chapters = [
+            summary for summary in self.chapter_summaries
+            if summary["chapter_num"] in recent_chapters
+        ]
+
+        # Get relevant plot points for this chapter
+        relevant_plot_points = self.plot_points
+
+        # Get narrative tracking information relevant to this chapter
+        narrative_context = self._get_narrative_context_for_chapter(chapter_num)
+
+        # Create base context
+        return {
+            "metadata": self.metadata,
+            "structure": self.structure,
+            "characters": self.characters,
+            "settings": self.settings,
+            "previous_chapters": previous_chapters,
+            "arc_summaries": [
+                {"chapters": arc["units"], "summary": arc["summary"]} for arc in history["arcs"]
+            ],
+            "book_synopsis": history["synopsis"],
+            "relevant_plot_points": relevant_plot_points,
+            "chapter_to_generate": chapter_num,
+            "chapter_title": self.structure["outline"][chapter_num - 1] if chapter_num <= len(self.structure["outline"]) else f"Chapter {chapter_num}",
+            "narrative_context": narrative_context,
+        }
+
     def _get_narrative_context_for_chapter(self, chapter_num: int) -> Dict[str, Any]:
         """
         Get narrative tracking information relevant to a specific chapter.
@@ -849,10 +1055,15 @@ class MemoryManager:
         """
         # Ensure chapter_num is an integer
         chapter_num = int(chapter_num)
+        tracking = self.narrative_tracking
+
+        # Chapter-keyed tracking is stored under string keys
+        previous_chapter = str(chapter_num - 1)
+
         # Determine which character's POV this chapter should use
         pov_character = None
-        if chapter_num in self.narrative_tracking["pov_shifts"]:
-            pov_character = self.narrative_tracking["pov_shifts"][chapter_num]
+        if str(chapter_num) in tracking["pov_shifts"]:
+            pov_character = tracking["pov_shifts"][str(chapter_num)]
         else:
             # Default POV assignment based on chapter number (odd/even)
             pov_characters = []
@@ -872,135 +1083,90 @@ class MemoryManager:
                     # If only one POV character, use that one
                     pov_character = pov_characters[0].get("name")
 
-        # Get character arcs and emotions for relevant characters
-        character_arcs = {}
-        character_emotions = {}
-        character_knowledge = {}
-        character_locations = {}
-
-        for char in self.characters:
-            char_name = char.get("name")
-            if char_name:
-                # Get character arc
-                if char_name in self.narrative_tracking["character_arcs"]:
-                    # Get the most recent character arc update
-                    char_arc_chapters = sorted([int(c) for c in self.narrative_tracking["character_arcs"][char_name].keys() if int(c) < chapter_num], reverse=True)
-                    if char_arc_chapters:
-                        character_arcs[char_name] = self.narrative_tracking["character_arcs"][char_name][char_arc_chapters[0]]
-
-                # Get character emotions
-                if char_name in self.narrative_tracking["character_emotions"]:
-                    # Get the most recent emotions update
-                    char_emotion_chapters = sorted([int(c) for c in self.narrative_tracking["character_emotions"][char_name].keys() if int(c) < chapter_num], reverse=True)
-                    if char_emotion_chapters:
-                        character_emotions[char_name] = self.narrative_tracking["character_emotions"][char_name][char_emotion_chapters[0]]
-
-                # Get character knowledge
-                if char_name in self.narrative_tracking["character_knowledge"]:
-                    # Get the most recent knowledge update
-                    char_knowledge_chapters = sorted([int(c) for c in self.narrative_tracking["character_knowledge"][char_name].keys() if int(c) < chapter_num], reverse=True)
-                    if char_knowledge_chapters:
-                        character_knowledge[char_name] = self.narrative_tracking["character_knowledge"][char_name][char_knowledge_chapters[0]]
-
-                # Get character location
-                if char_name in self.narrative_tracking["character_locations"]:
-                    # Get the most recent location update
-                    char_location_chapters = sorted([int(c) for c in self.narrative_tracking["character_locations"][char_name].keys() if int(c) < chapter_num], reverse=True)
-                    if char_location_chapters:
-                        character_locations[char_name] = self.narrative_tracking["character_locations"][char_name][char_location_chapters[0]]
-
-        # Get relationship status for relevant relationships
-        relationships = {}
-        for rel_key in self.narrative_tracking["relationships"]:
-            # Get the most recent relationship update
-            rel_chapters = sorted([int(c) for c in self.narrative_tracking["relationships"][rel_key].keys() if int(c) < chapter_num], reverse=True)
-            if rel_chapters:
-                relationships[rel_key] = self.narrative_tracking["relationships"][rel_key][rel_chapters[0]]
-
-        # Get plot thread status for relevant plot threads
-        plot_threads = {}
-        for thread_name in self.narrative_tracking["plot_threads"]:
-            # Get the most recent plot thread update
-            thread_chapters = sorted([int(c) for c in self.narrative_tracking["plot_threads"][thread_name].keys() if int(c) < chapter_num], reverse=True)
-            if thread_chapters:
-                plot_threads[thread_name] = self.narrative_tracking["plot_threads"][thread_name][thread_chapters[0]]
+        def latest_states(category: str, names=None) -> Dict[str, Any]:
+            """Most recent state before this chapter of each entity in a category."""
+            container = tracking[category]
+            if names is None:
+                names = list(container.keys())
+
+            states = {}
+            for name in names:
+                if name not in container:
+                    continue
+                timeline = container[name]
+                if not isinstance(timeline, VersionedTimeline):
+                    timeline = VersionedTimeline.from_data(timeline)
+                latest = timeline.latest_version_before(chapter_num)
+                if latest is not None:
+                    states[name] = timeline[latest]
+            return states
+
+        def all_states(category: str) -> Dict[str, List[Any]]:
+            """Every state before this chapter of each entity in a category, oldest first."""
+            states = {}
+            for name, timeline in tracking[category].items():
+                if not isinstance(timeline, VersionedTimeline):
+                    timeline = VersionedTimeline.from_data(timeline)
+                values = timeline.values_before(chapter_num)
+                if values:
+                    states[name] = values
+            return states
+
+        # Get character arcs, emotions, knowledge and locations for the novel's characters
+        character_names = [char.get("name") for char in self.characters if char.get("name")]
+        character_arcs = latest_states("character_arcs", character_names)
+        character_emotions = latest_states("character_emotions", character_names)
+        character_knowledge = latest_states("character_knowledge", character_names)
+        character_locations = latest_states("character_locations", character_names)
+
+        # Get relationship status and plot thread status
+        relationships = latest_states("relationships")
+        plot_threads = latest_states("plot_threads")
 
         # Get unresolved questions
-        unresolved_questions = self.narrative_tracking["unresolved_questions"]
+        unresolved_questions = tracking["unresolved_questions"]
 
         # Get foreshadowing elements
-        foreshadowing = self.narrative_tracking["foreshadowing"]
+        foreshadowing = tracking["foreshadowing"]
 
         # Get callbacks
-        callbacks = self.narrative_tracking["callbacks"]
+        callbacks = tracking["callbacks"]
 
         # Get world building elements
-        world_building = {}
-        for element in self.narrative_tracking["world_building"]:
-            # Get the most recent world building update
-            element_chapters = sorted([int(c) for c in self.narrative_tracking["world_building"][element].keys() if int(c) < chapter_num], reverse=True)
-            if element_chapters:
-                world_building[element] = self.narrative_tracking["world_building"][element][element_chapters[0]]
+        world_building = latest_states("world_building")
 
         # Get locations visited in previous chapter
         locations_visited = {}
-        if chapter_num - 1 in self.narrative_tracking["locations_visited"]:
-            locations_visited = self.narrative_tracking["locations_visited"][chapter_num - 1]
+        if previous_chapter in tracking["locations_visited"]:
+            locations_visited = tracking["locations_visited"][previous_chapter]
 
         # Get objects of significance
-        objects = {}
-        for obj in self.narrative_tracking["objects_of_significance"]:
-            # Get the most recent object update
-            obj_chapters = sorted([int(c) for c in self.narrative_tracking["objects_of_significance"][obj].keys() if int(c) < chapter_num], reverse=True)
-            if obj_chapters:
-                objects[obj] = self.narrative_tracking["objects_of_significance"][obj][obj_chapters[0]]
-
-        # Get themes and motifs
-        themes = {}
-        for theme in self.narrative_tracking["themes_and_motifs"]:
-            # Get all theme occurrences
-            theme_chapters = sorted([int(c) for c in self.narrative_tracking["themes_and_motifs"][theme].keys() if int(c) < chapter_num])
-            if theme_chapters:
-                themes[theme] = [self.narrative_tracking["themes_and_motifs"][theme][c] for c in theme_chapters]
-
-        # Get symbols
-        symbols = {}
-        for symbol in self.narrative_tracking["symbols"]:
-            # Get all symbol occurrences
-            symbol_chapters = sorted([int(c) for c in self.narrative_tracking["symbols"][symbol].keys() if int(c) < chapter_num])
-            if symbol_chapters:
-                symbols[symbol] = [self.narrative_tracking["symbols"][symbol][c] for c in symbol_chapters]
+        objects = latest_states("objects_of_significance")
+
+        # Get all occurrences of themes, motifs and symbols
+        themes = all_states("themes_and_motifs")
+        symbols = all_states("symbols")
 
         # Get tone from previous chapter
         tone = None
-        if chapter_num - 1 in self.narrative_tracking["tone_shifts"]:
-            tone = self.narrative_tracking["tone_shifts"][chapter_num - 1]
+        if previous_chapter in tracking["tone_shifts"]:
+            tone = tracking["tone_shifts"][previous_chapter]
 
         # Get continuity elements
-        continuity = {}
-        for element in self.narrative_tracking["continuity_elements"]:
-            # Get the most recent continuity update
-            element_chapters = sorted([int(c) for c in self.narrative_tracking["continuity_elements"][element].keys() if int(c) < chapter_num], reverse=True)
-            if element_chapters:
-                continuity[element] = self.narrative_tracking["continuity_elements"][element][element_chapters[0]]
+        continuity = latest_states("continuity_elements")
 
         # Get time of day from previous chapter
         time_of_day = None
-        if chapter_num - 1 in self.narrative_tracking["time_of_day"]:
-            time_of_day = self.narrative_tracking["time_of_day"][chapter_num - 1]
+        if previous_chapter in tracking["time_of_day"]:
+            time_of_day = tracking["time_of_day"][previous_chapter]
 
         # Get weather conditions from previous chapter
         weather = None
-        if chapter_num - 1 in self.narrative_tracking["weather_conditions"]:
-            weather = self.narrative_tracking["weather_conditions"][chapter_num - 1]
+        if previous_chapter in tracking["weather_conditions"]:
+            weather = tracking["weather_conditions"][previous_chapter]
 
         # Get character appearance
-        appearance = {}
-        for char in self.narrative_tracking["clothing_and_appearance"]:
-            # Get the most recent appearance update
-            appearance_chapters = sorted([int(c) for c in self.narrative_tracking["clothing_and_appearance"][char].keys() if int(c) < chapter_num], reverse=True)
-            if appearance_chapters:
-                appearance[char] = self.narrative_tracking["clothing_and_appearance"][char][appearance_chapters[0]]
+        appearance = latest_states("clothing_and_appearance")
 
         return {
             "pov_character": pov_character,
@@ -3,16 +3,21 @@ Core novel generation functionality.
 """
 import os
 import json
-from typing import Dict, List, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from rich.console import Console
 from rich.progress import Progress
 
 from src.core.resilient_gemini_client import ResilientGeminiClient
 from src.core.memory_manager import MemoryManager
+from src.core.generation_checkpoint import GenerationCheckpoint
+from src.core.stage_executor import StageExecutor
 from src.utils.word_counter import count_words
+from src.utils.chapter_length_model import ChapterLengthPlan, get_chapter_length_model
 from src.utils.genre_defaults import create_flexible_pov_structure, determine_character_gender, assign_chapter_pov
 from src.utils.logger import log_info, log_error, log_debug, log_warning
+from src.utils.context_builder import build_chapter_context, DEFAULT_CONTEXT_TOKEN_BUDGET
 from src.prompts import get_prompt
 
 # Import standardized error handling
@@ -33,6 +38,10 @@ class NovelGenerator:
     Core novel generation functionality.
     """
 
+    # Optional hook called as (chapter_num, chunk, stream) while a chapter streams in,
+    # e.g. to show live output in a progress display
+    chapter_chunk_callback = None
+
     def __init__(self):
         """Initialize the novel generator."""
         self.gemini = ResilientGeminiClient()
@@ -387,7 +396,7 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
                  genre=genre,
                  target_length=target_length)
         try:
-            response = self.gemini.generate_content(prompt, temperature=0.7)
+            response = self.gemini.generate_content(prompt, temperature=0.7, use_cache=True)
             log_info("Novel outline API response received",
                     response_length=len(response) if response else 0,
                     genre=genre)
@@ -847,7 +856,7 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
         """
 
         # Generate with reduced token count
-        response = self.gemini.generate_content(prompt, temperature=0.7, max_tokens=4000)
+        response = self.gemini.generate_content(prompt, temperature=0.7, max_tokens=4000, use_cache=True)
 
         # Try to parse the response as JSON
         try:
@@ -1085,7 +1094,7 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
 
         try:
             # Get response from Gemini
-            response = self.gemini.generate_content(prompt, temperature=0.7)
+            response = self.gemini.generate_content(prompt, temperature=0.7, use_cache=True)
 
             # Check if response is empty or None
             if not response or not response.strip():
@@ -1451,7 +1460,7 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
         """
 
         # Generate with reduced token count
-        response = self.gemini.generate_content(prompt, temperature=0.7, max_tokens=4000)
+        response = self.gemini.generate_content(prompt, temperature=0.7, max_tokens=4000, use_cache=True)
 
         # Try to parse the response as JSON
         try:
@@ -1536,6 +1545,29 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
         if not self.memory_manager:
             raise ValueError("Novel not initialized. Call initialize_novel first.")
 
+        chapter_text, chapter_title, word_count = self._draft_chapter(chapter_num)
+
+        # Summarize the chapter and extract narrative elements in one call
+        summary, narrative_elements = self.memory_manager.analyze_chapter(
+            chapter_text, chapter_num, chapter_title, word_count, self.gemini
+        )
+
+        # Add to memory and update tracking
+        self.memory_manager.add_chapter_summary(chapter_num, summary, word_count)
+        self.memory_manager.update_narrative_tracking(chapter_num, narrative_elements)
+
+        return chapter_text
+
+    def _draft_chapter(self, chapter_num: int) -> Tuple[str, str, int]:
+        """
+        Draft a chapter (including any length extension) without touching memory.
+
+        Args:
+            chapter_num: Chapter number to draft
+
+        Returns:
+            Tuple of (chapter text, chapter title, word count)
+        """
         # Get context for this chapter
         context = self.memory_manager.get_context_for_chapter(chapter_num)
 
@@ -1565,16 +1597,11 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
                 # Fallback to default if there's any issue
                 pass
 
-        # Create a prompt for chapter generation
-        prompt = self._create_chapter_prompt(chapter_num, chapter_title, context)
-
-        # No need to add additional word count requirements here
-        # They are now included directly in the _create_chapter_prompt method
-
         # Generate the chapter with increased max_tokens for longer chapters
         # Use appropriate max_tokens based on genre and minimum chapter length
+        temperature = 0.7
         if genre.lower() == "test":
-            chapter_text = self.gemini.generate_content(prompt, temperature=0.7, max_tokens=24000)
+            max_tokens = 24000
         else:
             # Calculate max_tokens based on minimum chapter length
             # Use a multiplier to ensure we have enough tokens (approx 4 tokens per word + buffer)
@@ -1591,19 +1618,44 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
             # Improved generation settings for better length consistency across all genres
             if genre.lower() in ['romance', 'contemporary romance', 'paranormal romance']:
                 # Even lower temperature for Romance to encourage following word count instructions more precisely
-                chapter_text = self.gemini.generate_content(prompt, temperature=0.6, max_tokens=max_tokens)
+                temperature = 0.6
             elif 'poetry' in genre.lower():
                 # Higher temperature for poetry collections to encourage creativity and poetic expression
-                chapter_text = self.gemini.generate_content(prompt, temperature=0.8, max_tokens=max_tokens)
-            else:
-                # Slightly lower temperature for all other genres to improve instruction following
-                chapter_text = self.gemini.generate_content(prompt, temperature=0.7, max_tokens=max_tokens)
-
-        # Clean up the response
-        chapter_text = self.gemini.clean_response(chapter_text)
+                temperature = 0.8
+
+        # Size the request from recorded chapter lengths when this genre (or writer) has
+        # enough history; the test genre uses a fixed prompt, so there is nothing to learn
+        writer = self.memory_manager.metadata.get('author', '')
+        length_model = None
+        length_plan = ChapterLengthPlan(self._chapter_length_target(genre)[0], max_tokens)
+        if genre.lower() != "test":
+            try:
+                length_model = get_chapter_length_model()
+                length_plan = length_model.plan(genre, writer, min_chapter_length,
+                                                length_plan.requested_words, max_tokens)
+                max_tokens = length_plan.max_tokens
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not load chapter length history: {str(e)}[/yellow]")
+
+        # Create a prompt for chapter generation (word count requirements are included in it)
+        prompt = self._create_chapter_prompt(chapter_num, chapter_title, context,
+                                             length_plan.requested_words if length_plan.learned else None)
+
+        # Stream the chapter so the word count is kept as it arrives and progress
+        # displays can show it live; an optional ceiling cuts off runaway drafts
+        on_chunk = None
+        if self.chapter_chunk_callback:
+            on_chunk = lambda chunk, stream: self.chapter_chunk_callback(chapter_num, chunk, stream)
+        max_chapter_words = self.generation_options.get('max_chapter_words') if self.generation_options else None
+        stream = self.gemini.generate_content_stream(
+            prompt, temperature=temperature, max_tokens=max_tokens, max_words=max_chapter_words, on_chunk=on_chunk
+        )
 
-        # Count words
-        word_count = count_words(chapter_text)
+        # Clean up the response (only surrounding blank lines, so the streamed word count still holds)
+        chapter_text = self.gemini.clean_response(stream.result())
+        word_count = stream.word_count
+        first_draft, first_draft_words = chapter_text, word_count
+        extended = False
 
         # Check for chapters with very little actual content (just title/header)
         content_without_title = chapter_text.replace(f"Chapter {chapter_num}", "").replace(chapter_title, "").strip()
@@ -1645,20 +1697,17 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
 
             Here's the current end of the chapter:
 
-            {chapter_text[-2000:]}
+            {stream.tail(2000)}
 
             Continue from here:
             """
 
-            # Generate the extension
-            extension = self.gemini.generate_content(extension_prompt, temperature=0.7, max_tokens=8000)
-            extension = self.gemini.clean_response(extension)
-
-            # Combine the original text with the extension
-            chapter_text = chapter_text + "\n\n" + extension
-
-            # Recount words
-            word_count = count_words(chapter_text)
+            # Continue the same stream; only the short extension prompt is sent and
+            # the running word count carries on
+            stream.continue_with(extension_prompt, max_tokens=8000)
+            extended = True
+            chapter_text = self.gemini.clean_response(stream.result())
+            word_count = stream.word_count
             console.print(f"[green]Chapter extended to {word_count} words[/green]")
         else:
             # Chapter meets effective minimum - show acceptance message for all genres
@@ -1667,72 +1716,54 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
             else:
                 console.print(f"[green]Chapter {chapter_num} meets requirements with {word_count} words[/green]")
 
-        # Create a summary for memory
-        # Use more content for summary if chapter is short, or if first 2000 chars don't contain much content
-        summary_text = chapter_text[:4000] if len(chapter_text) > 2000 else chapter_text
-
-        # Check if the summary text contains meaningful content (not just title)
-        meaningful_content = summary_text.replace(f"Chapter {chapter_num}", "").replace(chapter_title, "").strip()
-
-        if len(meaningful_content) < 100:
-            # If there's very little meaningful content, use the entire chapter for summary
-            summary_text = chapter_text
-
-        summary_prompt = f"""
-        Summarize the following chapter content in 2-3 sentences, capturing the key events and developments.
-        Focus on what actually happens in the chapter, not just the chapter title.
-
-        Chapter {chapter_num}: {chapter_title}
-
-        Content:
-        {summary_text}
-
-        Provide a meaningful summary of the actual events and developments in this chapter.
-        Do NOT just repeat the chapter title or number.
+        if length_model:
+            try:
+                length_model.record(genre, writer, min_chapter_length, length_plan.requested_words, max_tokens,
+                                    first_draft, first_draft_words, extended, word_count)
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not record chapter length: {str(e)}[/yellow]")
+
+        log_info("Chapter draft streamed",
+                 chapter=chapter_num,
+                 words=word_count,
+                 time_to_first_token=round(stream.time_to_first_token or 0.0, 2),
+                 elapsed=round(stream.elapsed, 2),
+                 requests=len(stream.segments),
+                 requested_words=length_plan.requested_words,
+                 max_tokens=max_tokens,
+                 length_plan=length_plan.source,
+                 stop_reason=stream.stop_reason)
+
+        return chapter_text, chapter_title, word_count
+
+    def _chapter_length_target(self, genre: str) -> Tuple[int, int]:
         """
+        Get the default chapter length range (in words) asked for in chapter prompts.
 
-        summary = self.gemini.generate_content(summary_prompt, temperature=0.5, max_tokens=300)
-        summary = self.gemini.clean_response(summary)
-
-        # Validate the summary - if it's just repeating the chapter title, try again with different prompt
-        if (summary.lower().strip() == f"chapter {chapter_num}: chapter" or
-            summary.lower().strip() == f"chapter {chapter_num}" or
-            len(summary.strip()) < 20):
-
-            # Try a more specific prompt
-            fallback_prompt = f"""
-            Read this chapter content and describe what happens in it using 2-3 sentences.
-            Ignore the chapter title and focus on the actual story events, character actions, and plot developments.
-
-            {chapter_text}
-
-            What actually happens in this chapter? Describe the events, not the title.
-            """
-
-            summary = self.gemini.generate_content(fallback_prompt, temperature=0.7, max_tokens=300)
-            summary = self.gemini.clean_response(summary)
-
-            # If still getting bad summary, create a basic one
-            if len(summary.strip()) < 20:
-                summary = f"Chapter {chapter_num} continues the story with {word_count} words of content."
-
-        # Log summary generation for debugging
-        log_debug(f"Generated summary for Chapter {chapter_num}",
-                 chapter_title=chapter_title,
-                 summary_length=len(summary),
-                 chapter_word_count=word_count,
-                 summary_preview=summary[:100] + "..." if len(summary) > 100 else summary)
+        Args:
+            genre: Novel genre
 
-        # Add to memory
-        self.memory_manager.add_chapter_summary(chapter_num, summary, word_count)
+        Returns:
+            Tuple of (lower, upper) word counts
+        """
+        target_range = (3500, 4500)  # Default target range
 
-        # Extract narrative elements and update tracking
-        narrative_elements = self.memory_manager.extract_narrative_elements(chapter_text, chapter_num, self.gemini)
-        self.memory_manager.update_narrative_tracking(chapter_num, narrative_elements)
+        if self.generation_options and 'chapter_length' in self.generation_options:
+            chapter_length = self.generation_options['chapter_length']
+            # For Romance and similar genres, use a much wider upper range to encourage longer chapters
+            if genre.lower() in ['romance', 'contemporary romance', 'paranormal romance']:
+                # ULTRA-AGGRESSIVE Romance: aim much higher to ensure we hit 4,000+ words minimum
+                # Target 5,500-7,000 words to consistently hit 4,000+ on first try
+                target_range = (chapter_length + 500, chapter_length + 2000)  # e.g., 5,500-7,000
+            else:
+                # Improved target range for all other genres to reduce extensions
+                # Aim higher than minimum to account for tolerance system
+                target_range = (chapter_length, chapter_length + 1000)  # e.g., 3,500-4,500
 
-        return chapter_text
+        return target_range
 
-    def _create_chapter_prompt(self, chapter_num: int, chapter_title: str, context: Dict[str, Any]) -> str:
+    def _create_chapter_prompt(self, chapter_num: int, chapter_title: str, context: Dict[str, Any],
+                               requested_words: Optional[int] = None) -> str:
         """
         Create a detailed prompt for chapter generation.
 
@@ -1740,6 +1771,7 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
             chapter_num: Chapter number
             chapter_title: Chapter title
             context: Context information from memory manager
+            requested_words: Lower bound of the requested length (defaults to the genre target)
 
         Returns:
             Prompt string for Gemini
@@ -1747,32 +1779,12 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
         # Extract relevant information from context
         metadata = context["metadata"]
         characters = context["characters"]
-        previous_chapters = context["previous_chapters"]
         genre = metadata["genre"]
 
         # Check if this is the Test genre for optimized processing
         if genre.lower() == "test":
             return self._create_test_genre_prompt(chapter_num, chapter_title, context)
 
-        # Create character information (handle empty character lists for non-fiction/special formats)
-        character_info = ""
-        if characters:
-            for char in characters:
-                name = char.get("name", "")
-                role = char.get("role", "")
-                traits = char.get("personality_traits", char.get("personality", ""))
-                character_info += f"- {name} ({role}): {traits}\n"
-        else:
-            # For non-fiction and special formats that don't use characters
-            character_info = "No characters (this is informational/artistic content)\n"
-
-        # Create previous chapter summaries
-        previous_chapter_info = ""
-        for prev_chapter in previous_chapters:
-            prev_num = prev_chapter.get("chapter_num", "")
-            prev_summary = prev_chapter.get("summary", "")
-            previous_chapter_info += f"- Chapter {prev_num}: {prev_summary}\n"
-
         # Get writing style and POV from generation options
         writing_style = "appropriate for the genre"
         pov = "third person limited"
@@ -1838,24 +1850,15 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
                             pov_character = pov_characters[0]
 
         # Calculate target chapter length
-        target_chapter_length = "3,500-4,500"  # Default target range
+        target_low, target_high = self._chapter_length_target(genre)
+        if requested_words:
+            # Learned request size; keep the width of the default range
+            target_low, target_high = requested_words, requested_words + (target_high - target_low)
+        target_chapter_length = f"{target_low:,}-{target_high:,}"
         min_chapter_length = 3500  # Default minimum words per chapter
 
-        if self.generation_options:
-            if 'chapter_length' in self.generation_options:
-                chapter_length = self.generation_options['chapter_length']
-                # For Romance and similar genres, use a much wider upper range to encourage longer chapters
-                if genre.lower() in ['romance', 'contemporary romance', 'paranormal romance']:
-                    # ULTRA-AGGRESSIVE Romance: aim much higher to ensure we hit 4,000+ words minimum
-                    # Target 5,500-7,000 words to consistently hit 4,000+ on first try
-                    target_chapter_length = f"{chapter_length+500:,}-{chapter_length+2000:,}"  # e.g., 5,500-7,000
-                else:
-                    # Improved target range for all other genres to reduce extensions
-                    # Aim higher than minimum to account for tolerance system
-                    target_chapter_length = f"{chapter_length:,}-{chapter_length+1000:,}"  # e.g., 3,500-4,500
-
-            if 'min_chapter_length' in self.generation_options:
-                min_chapter_length = self.generation_options['min_chapter_length']
+        if self.generation_options and 'min_chapter_length' in self.generation_options:
+            min_chapter_length = self.generation_options['min_chapter_length']
 
         # Get narrative context if available
         narrative_context = context.get("narrative_context", {})
@@ -1885,64 +1888,6 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
             # Update the POV setting to be character-specific
             pov = f"{pov} (from {pov_name}'s perspective)"
 
-        # Get character emotions and knowledge from narrative context
-        character_emotions = narrative_context.get("character_emotions", {})
-        character_knowledge = narrative_context.get("character_knowledge", {})
-        character_locations = narrative_context.get("character_locations", {})
-
-        # Create character state information
-        character_state_info = ""
-        for char_name, emotions in character_emotions.items():
-            character_state_info += f"- {char_name}'s emotional state: {emotions}\n"
-
-        for char_name, knowledge in character_knowledge.items():
-            character_state_info += f"- {char_name} knows: {knowledge}\n"
-
-        for char_name, location in character_locations.items():
-            character_state_info += f"- {char_name}'s current location: {location}\n"
-
-        # Get relationship information
-        relationships = narrative_context.get("relationships", {})
-        relationship_info = ""
-        for rel_key, status in relationships.items():
-            relationship_info += f"- Relationship between {rel_key}: {status}\n"
-
-        # Get plot thread information
-        plot_threads = narrative_context.get("plot_threads", {})
-        plot_thread_info = ""
-        for thread_name, status in plot_threads.items():
-            plot_thread_info += f"- Plot thread '{thread_name}': {status}\n"
-
-        # Get unresolved questions
-        unresolved_questions = narrative_context.get("unresolved_questions", [])
-        unresolved_info = ""
-        for question in unresolved_questions:
-            unresolved_info += f"- Unresolved question: {question}\n"
-
-        # Get continuity elements
-        continuity = narrative_context.get("continuity", {})
-        continuity_info = ""
-        for element, details in continuity.items():
-            continuity_info += f"- Continuity element '{element}': {details}\n"
-
-        # Get time and weather
-        time_of_day = narrative_context.get("time_of_day")
-        weather = narrative_context.get("weather")
-        setting_info = ""
-        if time_of_day:
-            setting_info += f"- Current time of day: {time_of_day}\n"
-        if weather:
-            setting_info += f"- Current weather conditions: {weather}\n"
-
-        # Get themes and symbols
-        themes = narrative_context.get("themes", {})
-        symbols = narrative_context.get("symbols", {})
-        thematic_info = ""
-        for theme, occurrences in themes.items():
-            thematic_info += f"- Theme '{theme}': Continue developing this theme\n"
-        for symbol, occurrences in symbols.items():
-            thematic_info += f"- Symbol '{symbol}': Consider using this symbol again\n"
-
         # Check if this is part of a series
         series_info = ""
         if "series_context" in context and context["series_context"]:
@@ -1957,6 +1902,19 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
             This book is part of the "{series_title}" series (Book {book_number}).
             """
 
+            # Add the story so far: a synopsis of the earliest books, arc summaries, then recent books
+            previous_books_info = ""
+            if series_context.get("series_synopsis"):
+                previous_books_info += f"- Earlier books (synopsis): {series_context['series_synopsis']}\n"
+            for arc in series_context.get("earlier_books", []):
+                start, end = arc["books"]
+                previous_books_info += f"- Books {start}-{end}: {arc['summary']}\n"
+            for book in series_context.get("previous_books", []):
+                book_summary = book.get("summary") or book.get("description", "")
+                previous_books_info += f"- Book {book.get('book_number', '?')} ({book.get('title', 'Untitled')}): {book_summary}\n"
+            if previous_books_info:
+                series_info += "\n## Previous Books\n" + previous_books_info
+
             # Add recurring characters if available
             if "recurring_characters" in context:
                 recurring_chars = context["recurring_characters"]
@@ -1984,6 +1942,33 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
                     for element, details in universe["world_building"].items():
                         series_info += f"- {element}: {details}\n"
 
+        # Select the most relevant context that fits the prompt token budget
+        token_budget = DEFAULT_CONTEXT_TOKEN_BUDGET
+        if self.generation_options and self.generation_options.get('context_token_budget'):
+            token_budget = int(self.generation_options['context_token_budget'])
+
+        budgeted = build_chapter_context(
+            context, chapter_num,
+            pov_name=pov_character.get("name") if pov_character else None,
+            token_budget=token_budget,
+            fixed_text=series_info
+        )
+        log_info("Chapter prompt context selected", chapter=chapter_num, total_tokens=budgeted.total_tokens,
+                 token_budget=budgeted.token_budget, section_tokens=budgeted.token_usage,
+                 dropped_items=budgeted.dropped_items)
+
+        sections = budgeted.sections
+        # Non-fiction and special formats don't use characters
+        character_info = sections["character_info"] if characters else "No characters (this is informational/artistic content)\n"
+        previous_chapter_info = sections["previous_chapters"]
+        character_state_info = sections["character_state_info"]
+        relationship_info = sections["relationship_info"]
+        plot_thread_info = sections["plot_thread_info"]
+        unresolved_info = sections["unresolved_info"]
+        continuity_info = sections["continuity_info"]
+        setting_info = sections["setting_info"]
+        thematic_info = sections["thematic_info"]
+
         # Try to get genre-specific chapter prompt
         prompt = get_prompt(
             genre=metadata['genre'],
@@ -2117,6 +2102,13 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
             Your entire response should be at least {min_chapter_length} words.
             """
 
+        # Most genre templates leave the length out; a learned request size only helps if it is asked for
+        if requested_words and target_chapter_length not in prompt:
+            prompt += f"""
+## Chapter Length
+Aim for approximately {target_chapter_length} words. The chapter must be at least {min_chapter_length} words long.
+"""
+
         return prompt
 
 
@@ -2409,6 +2401,10 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
 
         Returns:
             Dictionary containing the complete novel information
+
+        Raises:
+            FileExistsError: If an interrupted run of this novel left a checkpoint;
+                call resume_novel or clear the checkpoint first
         """
         if not self.memory_manager:
             raise ValueError("Novel not initialized. Call initialize_novel first.")
@@ -2429,58 +2425,191 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
         if api_status['active_keys'] > 1:
             console.print("[bold green]Multiple API keys detected - will automatically rotate keys if rate limits are encountered.[/bold green]")
 
-        console.print("[bold green]Generating writer profile...[/bold green]")
-        writer_profile = self.generate_writer_profile()
+        # Checkpoint every stage and chapter so a crashed run can be resumed
+        checkpoint = GenerationCheckpoint(self.memory_manager)
+        checkpoint.start(self.generation_options)
 
-        console.print("[bold green]Generating novel outline...[/bold green]")
-        chapter_outlines, chapter_count = self.generate_novel_outline(writer_profile)
+        results = self._create_setup_stages(checkpoint).run()
+        outline = results["outline"]
 
-        console.print("[bold green]Generating characters...[/bold green]")
-        characters = self.generate_characters()
+        return self._complete_novel(results["writer_profile"], outline["chapter_outlines"], outline["chapter_count"],
+                                    results["characters"], [], checkpoint)
 
-        # Generate chapters
-        chapters = []
+    def resume_novel(self, finish_book: bool = True) -> Dict[str, Any]:
+        """
+        Resume an interrupted generate_complete_novel run from its checkpoint.
 
-        # Process one chapter at a time (generate, enhance, then move to next)
-        console.print("[bold green]Generating and enhancing chapters sequentially...[/bold green]")
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Processing chapters...", total=chapter_count)
+        Call initialize_novel with the same title and output directory first.
+        Memory and generation options are restored to the state of the last
+        checkpoint, finished stages and chapters are reused, and generation
+        continues from the first missing chapter.
 
+        Args:
+            finish_book: Whether to save the novel and clear the checkpoint; callers
+                that finish the book themselves call finish_novel afterwards
 
+        Returns:
+            Dictionary containing the complete novel information
+        """
+        if not self.memory_manager:
+            raise ValueError("Novel not initialized. Call initialize_novel first.")
 
-            for chapter_num in range(1, chapter_count + 1):
-                # Get chapter title
-                chapter_title = f"Chapter {chapter_num}"
-                if chapter_num <= len(chapter_outlines):
-                    outline = chapter_outlines[chapter_num - 1]
-                    if " - " in outline:
-                        chapter_title = outline.split(" - ")[0]
-                    else:
-                        chapter_title = outline
+        checkpoint = GenerationCheckpoint(self.memory_manager)
+        state = checkpoint.load()
+        if state is None:
+            raise ValueError(f"No checkpoint found for '{self.memory_manager.novel_title}'")
 
-                # Generate current chapter
-                console.print(f"[bold blue]Generating Chapter {chapter_num}: {chapter_title}...[/bold blue]")
-                current_chapter_text = self.generate_chapter(chapter_num)
+        if state["memory"]:
+            self.memory_manager.restore_memory_data(state["memory"])
+            self.memory_manager.apply_changes(state["memory_changes"])
+            self.memory_manager.save_memory()
 
-                # Enhance the current chapter
-                console.print(f"[bold blue]Enhancing Chapter {chapter_num}: {chapter_title}...[/bold blue]")
-                enhanced_text = self.enhance_chapter(
-                    current_chapter_text,
-                    chapter_num,
-                    chapter_title
-                )
+        # Finish the book with the options it was started with
+        if state["generation_options"]:
+            self.generation_options = state["generation_options"]
 
-                # Add enhanced chapter to list
-                chapters.append({
-                    "number": chapter_num,
-                    "title": chapter_title,
-                    "content": enhanced_text
-                })
+        stages = state["stages"]
+        completed_chapters = state["chapters"]
+        console.print(f"[bold cyan]Resuming '{self.memory_manager.novel_title}' "
+                      f"({len(completed_chapters)} chapters already completed)...[/bold cyan]")
 
-                # Update progress
-                progress.update(task, advance=1)
+        # Stages finished before the crash are passed in and skipped
+        finished_stages = {name: data for name, data in stages.items() if data is not None}
+        results = self._create_setup_stages(checkpoint).run(finished_stages)
+        outline = results["outline"]
 
-                console.print(f"[bold green]✓[/bold green] Chapter {chapter_num} completed")
+        return self._complete_novel(results["writer_profile"], outline["chapter_outlines"], outline["chapter_count"],
+                                    results["characters"], completed_chapters, checkpoint, finish_book)
+
+    def _create_stage_executor(self, name: str) -> StageExecutor:
+        """
+        Create a stage executor sized to the API concurrency limit.
+
+        Args:
+            name: Label for the stage group (used in logs)
+
+        Returns:
+            Empty StageExecutor
+        """
+        max_concurrent = 3
+        if self.generation_options:
+            max_concurrent = max(1, int(self.generation_options.get('max_concurrent_api_calls', 3)))
+
+        # Concurrent calls would still run one at a time through a single queue worker
+        network_manager = getattr(self.gemini, "network_manager", None)
+        if network_manager and max_concurrent > 1:
+            network_manager.set_queue_workers(max_concurrent)
+
+        return StageExecutor(max_workers=max_concurrent, name=name)
+
+    def _create_setup_stages(self, checkpoint: GenerationCheckpoint) -> StageExecutor:
+        """
+        Declare the stages that run before the chapters.
+
+        The outline prompt is built from the writer profile and the characters
+        are built from the outline, so these stages form a chain; each one is
+        checkpointed as soon as it finishes.
+
+        Args:
+            checkpoint: Checkpoint that records each finished stage
+
+        Returns:
+            StageExecutor producing writer_profile, outline and characters
+        """
+        stages = self._create_stage_executor("setup")
+
+        def writer_profile_stage():
+            console.print("[bold green]Generating writer profile...[/bold green]")
+            writer_profile = self.generate_writer_profile()
+            checkpoint.save_stage("writer_profile", writer_profile)
+            return writer_profile
+
+        def outline_stage(writer_profile):
+            console.print("[bold green]Generating novel outline...[/bold green]")
+            chapter_outlines, chapter_count = self.generate_novel_outline(writer_profile)
+            outline = {"chapter_outlines": chapter_outlines, "chapter_count": chapter_count}
+            checkpoint.save_stage("outline", outline)
+            return outline
+
+        def characters_stage(outline):
+            console.print("[bold green]Generating characters...[/bold green]")
+            characters = self.generate_characters()
+            checkpoint.save_stage("characters", characters)
+            return characters
+
+        stages.add_stage("writer_profile", writer_profile_stage)
+        stages.add_stage("outline", outline_stage, inputs=("writer_profile",))
+        stages.add_stage("characters", characters_stage, inputs=("outline",))
+        return stages
+
+    def _create_completion_stages(self, novel: Dict[str, Any]) -> StageExecutor:
+        """
+        Declare the stages that run once the manuscript is finished.
+
+        Saving the book (followed by its descriptions and back cover), the cover
+        prompt and the series summary only read the finished novel, so they run
+        concurrently.
+
+        Args:
+            novel: Complete novel data
+
+        Returns:
+            StageExecutor producing save_book, series_summary and cover_prompt
+        """
+        stages = self._create_stage_executor("completion")
+
+        stages.add_stage("save_book", lambda: self._save_completed_novel(novel))
+
+        # Roll this book's synopsis into the series history for later books
+        if self.memory_manager.series_manager and self.memory_manager.book_number:
+            stages.add_stage("series_summary", lambda: self.memory_manager.series_manager.set_book_summary(
+                self.memory_manager.book_number, self.memory_manager.get_book_synopsis()
+            ))
+
+        # Generate cover prompt after novel completion
+        stages.add_stage("cover_prompt", lambda: self._generate_cover_prompt_after_completion(novel))
+        return stages
+
+    def _complete_novel(self, writer_profile: Dict[str, Any], chapter_outlines: List[str], chapter_count: int,
+                        characters: List[Dict[str, Any]], completed_chapters: List[Dict[str, Any]],
+                        checkpoint: GenerationCheckpoint, finish_book: bool = True) -> Dict[str, Any]:
+        """
+        Generate the remaining chapters and save the finished novel.
+
+        Args:
+            writer_profile: Writer profile for the novel
+            chapter_outlines: List of chapter outline entries
+            chapter_count: Number of chapters in the novel
+            characters: Generated characters
+            completed_chapters: Chapters already finished (from a checkpoint)
+            checkpoint: Checkpoint that records each finished chapter
+            finish_book: Whether to save the novel and clear the checkpoint (see finish_novel)
+
+        Returns:
+            Dictionary containing the complete novel information
+        """
+        start_chapter = len(completed_chapters) + 1
+
+        # Generate chapters
+        pipelined = bool(self.generation_options and self.generation_options.get('pipelined_generation'))
+
+        if pipelined:
+            console.print("[bold green]Generating chapters with pipelined summaries and narrative extraction...[/bold green]")
+        else:
+            # Process one chapter at a time (generate, enhance, then move to next)
+            console.print("[bold green]Generating and enhancing chapters sequentially...[/bold green]")
+
+        with Progress() as progress:
+            task = progress.add_task("[cyan]Processing chapters...", total=chapter_count, completed=start_chapter - 1)
+
+            if pipelined:
+                new_chapters = self._generate_chapters_pipelined(chapter_outlines, chapter_count, progress, task,
+                                                                 start_chapter, checkpoint)
+            else:
+                new_chapters = self._generate_chapters_sequential(chapter_outlines, chapter_count, progress, task,
+                                                                  start_chapter, checkpoint)
+
+        chapters = completed_chapters + new_chapters
 
         # Display final word count information
         current_word_count = self.memory_manager.structure["current_word_count"]
@@ -2499,6 +2628,38 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
             "word_count": self.memory_manager.structure["current_word_count"]
         }
 
+        if finish_book:
+            self.finish_novel(novel, checkpoint)
+
+        return novel
+
+    def finish_novel(self, novel: Dict[str, Any], checkpoint: Optional[GenerationCheckpoint] = None) -> None:
+        """
+        Save a finished novel and run its post-generation steps.
+
+        Stores the book (with its descriptions and back cover), the cover prompt
+        and the series summary, then removes the checkpoint.
+
+        Args:
+            novel: Complete novel data
+            checkpoint: Checkpoint of the run that produced the novel
+        """
+        self._create_completion_stages(novel).run()
+
+        # The book is stored in the database; the checkpoint is no longer needed
+        if checkpoint:
+            checkpoint.clear()
+
+    def _save_completed_novel(self, novel: Dict[str, Any]) -> str:
+        """
+        Save a finished novel to the database and run the enhanced book workflow.
+
+        Args:
+            novel: Complete novel data
+
+        Returns:
+            The database book ID
+        """
         # Generate enhanced descriptions and back cover
         console.print("[bold cyan]Generating enhanced descriptions...[/bold cyan]")
         from src.utils.enhanced_book_workflow import EnhancedBookWorkflow
@@ -2530,10 +2691,163 @@ Strengths: {profile_data.get('strengths', 'Not specified')}
         # Process with enhanced workflow
         workflow.process_completed_book(book_id, novel)
 
-        # Generate cover prompt after novel completion
-        self._generate_cover_prompt_after_completion(novel)
+        return book_id
 
-        return novel
+    def _get_chapter_title(self, chapter_num: int, chapter_outlines: List[str]) -> str:
+        """
+        Get the display title for a chapter from the outline.
+
+        Args:
+            chapter_num: Chapter number
+            chapter_outlines: List of chapter outline entries
+
+        Returns:
+            Chapter title
+        """
+        chapter_title = f"Chapter {chapter_num}"
+        if chapter_num <= len(chapter_outlines):
+            outline = chapter_outlines[chapter_num - 1]
+            if " - " in outline:
+                chapter_title = outline.split(" - ")[0]
+            else:
+                chapter_title = outline
+        return chapter_title
+
+    def _generate_chapters_sequential(self, chapter_outlines: List[str], chapter_count: int,
+                                      progress: Progress, task, start_chapter: int = 1,
+                                      checkpoint: Optional[GenerationCheckpoint] = None) -> List[Dict[str, Any]]:
+        """
+        Generate and enhance chapters one at a time.
+
+        Args:
+            chapter_outlines: List of chapter outline entries
+            chapter_count: Number of chapters to generate
+            progress: Progress display to update
+            task: Progress task ID
+            start_chapter: First chapter to generate
+            checkpoint: Optional checkpoint that records each finished chapter
+
+        Returns:
+            List of enhanced chapter dictionaries
+        """
+        chapters = []
+
+        for chapter_num in range(start_chapter, chapter_count + 1):
+            chapter_title = self._get_chapter_title(chapter_num, chapter_outlines)
+
+            # Generate current chapter
+            console.print(f"[bold blue]Generating Chapter {chapter_num}: {chapter_title}...[/bold blue]")
+            current_chapter_text = self.generate_chapter(chapter_num)
+
+            # Enhance the current chapter
+            console.print(f"[bold blue]Enhancing Chapter {chapter_num}: {chapter_title}...[/bold blue]")
+            enhanced_text = self.enhance_chapter(
+                current_chapter_text,
+                chapter_num,
+                chapter_title
+            )
+
+            # Add enhanced chapter to list
+            chapter = {
+                "number": chapter_num,
+                "title": chapter_title,
+                "content": enhanced_text
+            }
+            chapters.append(chapter)
+
+            if checkpoint:
+                checkpoint.save_chapter(chapter)
+
+            # Update progress
+            progress.update(task, advance=1)
+
+            console.print(f"[bold green]✓[/bold green] Chapter {chapter_num} completed")
+
+        return chapters
+
+    def _generate_chapters_pipelined(self, chapter_outlines: List[str], chapter_count: int,
+                                     progress: Progress, task, start_chapter: int = 1,
+                                     checkpoint: Optional[GenerationCheckpoint] = None) -> List[Dict[str, Any]]:
+        """
+        Generate chapters with the analysis of chapter N overlapping later work.
+
+        Chapter N+1's prompt reads the summaries and narrative tracking of every earlier
+        chapter, so its draft waits until chapter N's analysis has been applied to memory.
+        Chapter N's enhancement only reads memory for chapters before N, so it runs while
+        chapter N's analysis call is in flight. All memory mutations happen
+        on the calling thread, in chapter order.
+
+        Args:
+            chapter_outlines: List of chapter outline entries
+            chapter_count: Number of chapters to generate
+            progress: Progress display to update
+            task: Progress task ID
+            start_chapter: First chapter to generate
+            checkpoint: Optional checkpoint that records each finished chapter once
+                its analysis has been applied to memory
+
+        Returns:
+            List of enhanced chapter dictionaries
+        """
+        max_concurrent = max(2, int(self.generation_options.get('max_concurrent_api_calls', 3)))
+
+        # Concurrent calls would still run one at a time through a single queue worker
+        self.gemini.network_manager.set_queue_workers(max_concurrent)
+
+        chapters = []
+        pending = None  # (chapter_num, word_count, analysis_future)
+
+        def finish_pending():
+            self._apply_chapter_analysis(*pending)
+            if checkpoint:
+                checkpoint.save_chapter(chapters[-1])
+
+        with ThreadPoolExecutor(max_workers=max_concurrent - 1, thread_name_prefix="ChapterAnalysis") as executor:
+            for chapter_num in range(start_chapter, chapter_count + 1):
+                chapter_title = self._get_chapter_title(chapter_num, chapter_outlines)
+
+                # This chapter's prompt needs the previous chapter's summary and tracking
+                if pending:
+                    finish_pending()
+                    pending = None
+
+                console.print(f"[bold blue]Generating Chapter {chapter_num}: {chapter_title}...[/bold blue]")
+                chapter_text, _, word_count = self._draft_chapter(chapter_num)
+
+                analysis_future = executor.submit(
+                    self.memory_manager.analyze_chapter, chapter_text, chapter_num, chapter_title, word_count, self.gemini
+                )
+                pending = (chapter_num, word_count, analysis_future)
+
+                console.print(f"[bold blue]Enhancing Chapter {chapter_num}: {chapter_title}...[/bold blue]")
+                enhanced_text = self.enhance_chapter(chapter_text, chapter_num, chapter_title)
+
+                chapters.append({
+                    "number": chapter_num,
+                    "title": chapter_title,
+                    "content": enhanced_text
+                })
+
+                progress.update(task, advance=1)
+                console.print(f"[bold green]✓[/bold green] Chapter {chapter_num} completed")
+
+            if pending:
+                finish_pending()
+
+        return chapters
+
+    def _apply_chapter_analysis(self, chapter_num: int, word_count: int, analysis_future: Future) -> None:
+        """
+        Wait for a chapter's analysis call and record it in memory.
+
+        Args:
+            chapter_num: Chapter number
+            word_count: Word count of the drafted chapter
+            analysis_future: Future resolving to the (summary, narrative elements) tuple
+        """
+        summary, narrative_elements = analysis_future.result()
+        self.memory_manager.add_chapter_summary(chapter_num, summary, word_count)
+        self.memory_manager.update_narrative_tracking(chapter_num, narrative_elements)
 
     def _generate_cover_prompt_after_completion(self, novel: Dict[str, Any]) -> None:
         """
@@ -6,8 +6,9 @@ that integrates with the NetworkResilienceManager for robust handling of unstabl
 WiFi connections and network issues.
 """
 
-from typing import Dict, List, Optional, Any
-from src.core.gemini_client import GeminiClient
+from typing import Callable, Dict, Iterator, List, Optional, Any
+from src.core.gemini_client import GeminiClient, MODEL
+from src.core.generation_stream import GenerationStream
 from src.utils.network_resilience import (
     get_network_manager,
     NetworkResilienceManager,
@@ -46,9 +47,9 @@ class ResilientGeminiClient:
         self.default_max_retries = 8  # Increased for unstable connections
         self.default_timeout = 120.0  # Increased timeout for slow connections
 
-        # Offline mode capabilities
+        # Offline mode capabilities (responses are cached on disk, shared with GeminiClient)
         self.offline_mode = False
-        self.cached_responses: Dict[str, str] = {}
+        self.response_cache = self.gemini_client.response_cache
 
         # Add status change callback
         self.network_manager.add_status_change_callback(self._on_network_status_change)
@@ -84,24 +85,16 @@ class ResilientGeminiClient:
             self.offline_mode = False
 
     def _create_cache_key(self, prompt: str, temperature: float, max_tokens: int) -> str:
-        """Create a cache key for response caching."""
-        import hashlib
-        content = f"{prompt}_{temperature}_{max_tokens}"
-        return hashlib.md5(content.encode()).hexdigest()
+        """Create a content-addressed key for the persistent response cache."""
+        return self.gemini_client.response_cache_key(prompt, temperature, max_tokens)
 
     def _get_cached_response(self, cache_key: str) -> Optional[str]:
         """Get cached response if available."""
-        return self.cached_responses.get(cache_key)
+        return self.response_cache.get(cache_key)
 
     def _cache_response(self, cache_key: str, response: str):
-        """Cache a response for offline use."""
-        # Limit cache size to prevent memory issues
-        if len(self.cached_responses) > 100:
-            # Remove oldest entries (simple FIFO)
-            oldest_key = next(iter(self.cached_responses))
-            del self.cached_responses[oldest_key]
-
-        self.cached_responses[cache_key] = response
+        """Cache a response on disk for later runs and offline use."""
+        self.response_cache.put(cache_key, response, model=MODEL)
 
     def _handle_offline_request(self, prompt: str, temperature: float, max_tokens: int) -> str:
         """Handle requests when offline."""
@@ -127,7 +120,7 @@ class ResilientGeminiClient:
         priority: RequestPriority = None,
         max_retries: int = None,
         timeout: float = None,
-        use_cache: bool = True
+        use_cache: bool = False
     ) -> str:
         """
         Generate content with network resilience.
@@ -139,7 +132,7 @@ class ResilientGeminiClient:
             priority: Request priority level
             max_retries: Maximum number of retry attempts
             timeout: Maximum time to wait for completion
-            use_cache: Whether to use response caching
+            use_cache: Whether to use response caching (for deterministic prompts only)
 
         Returns:
             Generated content as string
@@ -176,7 +169,8 @@ class ResilientGeminiClient:
                 temperature=temperature,
                 max_tokens=max_tokens,
                 max_retries=1,  # Let resilience manager handle retries
-                initial_retry_delay=1.0
+                initial_retry_delay=1.0,
+                use_cache=False  # Cache lookups and writes happen here
             )
 
         try:
@@ -212,6 +206,130 @@ class ResilientGeminiClient:
                 "You can check network status or try again manually."
             )
 
+    def generate_content_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 16000,
+        max_words: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        on_chunk: Optional[Callable[[str, GenerationStream], None]] = None,
+        use_cache: bool = False
+    ) -> GenerationStream:
+        """
+        Generate content as a stream of chunks with a running word count.
+
+        A stream cannot be replayed by the resilience manager once chunks have
+        been handed out, so retries happen inside the underlying client, which
+        falls back to a blocking request when a stream fails before any text
+        and requests the rest of the reply when it fails part way through.
+
+        Args:
+            prompt: The prompt to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate
+            max_words: Stop once the text reaches this many words
+            max_seconds: Stop once a request has been streaming this long
+            on_chunk: Called with each chunk and the stream
+            use_cache: Whether to use response caching (for deterministic prompts only)
+
+        Returns:
+            GenerationStream; iterate it for chunks or call result() for the full text
+        """
+        def chunk_source(request_prompt: str, request_max_tokens: int) -> Iterator[str]:
+            if self.offline_mode:
+                return iter([self._handle_offline_request(request_prompt, temperature, request_max_tokens)])
+            return self.gemini_client.stream_chunks(request_prompt, temperature, request_max_tokens, use_cache)
+
+        return GenerationStream(chunk_source, prompt, max_tokens, max_words=max_words,
+                                max_seconds=max_seconds, on_chunk=on_chunk)
+
+    async def agenerate_content(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 16000,
+        use_cache: bool = False
+    ) -> str:
+        """
+        Generate content asynchronously, honouring the response cache and offline mode.
+
+        Args:
+            prompt: The prompt to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate
+            use_cache: Whether to use response caching (for deterministic prompts only)
+
+        Returns:
+            Generated content as string
+        """
+        cache_key = None
+        if use_cache:
+            cache_key = self._create_cache_key(prompt, temperature, max_tokens)
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response:
+                return cached_response
+
+        if self.offline_mode:
+            return self._handle_offline_request(prompt, temperature, max_tokens)
+
+        result = await self.gemini_client.async_client.agenerate_content(
+            prompt, temperature=temperature, max_tokens=max_tokens
+        )
+
+        if use_cache and cache_key and result and not result.startswith("Error"):
+            self._cache_response(cache_key, result)
+
+        return result
+
+    async def agenerate_batch(
+        self,
+        prompts: List[str],
+        temperature: float = 0.7,
+        max_tokens: int = 16000,
+        use_cache: bool = False
+    ) -> List[str]:
+        """
+        Generate content for several prompts concurrently.
+
+        Args:
+            prompts: The prompts to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate per prompt
+            use_cache: Whether to use response caching (for deterministic prompts only)
+
+        Returns:
+            Generated content for each prompt, in prompt order
+        """
+        import asyncio
+        return list(await asyncio.gather(*(
+            self.agenerate_content(prompt, temperature, max_tokens, use_cache)
+            for prompt in prompts
+        )))
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        temperature: float = 0.7,
+        max_tokens: int = 16000,
+        use_cache: bool = False
+    ) -> List[str]:
+        """
+        Generate content for several prompts concurrently from synchronous code.
+
+        Args:
+            prompts: The prompts to send to the model
+            temperature: Controls randomness (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate per prompt
+            use_cache: Whether to use response caching (for deterministic prompts only)
+
+        Returns:
+            Generated content for each prompt, in prompt order
+        """
+        return self.gemini_client.async_client.run_sync(
+            self.agenerate_batch(prompts, temperature, max_tokens, use_cache)
+        )
+
     def generate_with_context(
         self,
         prompt: str,
@@ -306,7 +424,7 @@ class ResilientGeminiClient:
                 'circuit_state': network_status['circuit_state'],
                 'is_healthy': self.network_manager.is_healthy(),
                 'offline_mode': self.offline_mode,
-                'cached_responses': len(self.cached_responses)
+                'cached_responses': self.response_cache.get_stats()['entries']
             }
         }
 
@@ -336,14 +454,15 @@ class ResilientGeminiClient:
 
     def clear_cache(self):
         """Clear the response cache."""
-        self.cached_responses.clear()
+        self.response_cache.clear()
         console.print("[bold green]📋 Response cache cleared[/bold green]")
 
     def get_cache_info(self) -> Dict[str, Any]:
         """Get information about the response cache."""
+        stats = self.response_cache.get_stats()
         return {
-            'cached_responses': len(self.cached_responses),
-            'cache_keys': list(self.cached_responses.keys())
+            'cached_responses': stats['entries'],
+            **stats
         }
 
     def cleanup(self):
@@ -351,7 +470,8 @@ class ResilientGeminiClient:
         # Remove status change callback
         self.network_manager.remove_status_change_callback(self._on_network_status_change)
 
-        # Clear cache
-        self.cached_responses.clear()
+        # Release the pooled HTTP connections of the async client
+        if self.gemini_client._async_client is not None:
+            self.gemini_client._async_client.close()
 
         console.print("[bold blue]🧹 Resilient Gemini Client cleaned up[/bold blue]")
@@ -148,7 +148,7 @@ class SeriesGenerator:
             """
 
         # Generate the series plan
-        response = self.novel_generator.gemini.generate_content(prompt, temperature=0.7)
+        response = self.novel_generator.gemini.generate_content(prompt, temperature=0.7, use_cache=True)
 
         # Try to parse the response as JSON
         try:
@@ -3,9 +3,25 @@ Series manager for maintaining context and continuity across multiple books in a
 """
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 from src.utils.file_handler import sanitize_filename
+from src.utils.versioned_timeline import VersionedTimeline
+from src.utils.summary_tree import SummaryTree
+
+# Tracking categories that map each entity to its states by book number
+TIMELINE_CATEGORIES = (
+    "character_arcs", "character_relationships", "character_development", "character_traits",
+    "character_goals", "character_conflicts", "character_growth",
+    "plot_threads", "plot_arcs", "plot_progression",
+)
+
+# Series history in prompts: book summaries roll up into arcs of BOOKS_PER_ARC books;
+# context carries at least RECENT_BOOKS full books, MAX_BOOK_ARCS arc summaries before
+# those, and a synopsis of anything older
+BOOKS_PER_ARC = 3
+RECENT_BOOKS = 2
+MAX_BOOK_ARCS = 2
 
 
 class SeriesManager:
@@ -107,6 +123,13 @@ class SeriesManager:
             "continuity_elements": {},      # Track elements that need continuity
         }
 
+        # Series context per book, valid until series tracking changes
+        self._tracking_generation = 0
+        self._series_context_cache: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+        # Book summaries rolled up into arc summaries and a series synopsis
+        self.summary_tree = SummaryTree(arc_size=BOOKS_PER_ARC)
+
         # Load existing series if available
         self.load_series()
 
@@ -158,8 +181,18 @@ class SeriesManager:
             self.series_arcs = series_data.get("series_arcs", self.series_arcs)
             self.series_tracking = series_data.get("series_tracking", self.series_tracking)
 
+            self._invalidate_series_context()
+
+            # Per-entity book states get a sorted version index
+            for category in TIMELINE_CATEGORIES:
+                entities = self.series_tracking.get(category)
+                if isinstance(entities, dict):
+                    for name, states in entities.items():
+                        entities[name] = VersionedTimeline.from_data(states)
+
             # Scan for existing books that might not be in the metadata
             self.scan_for_existing_books()
+            self._rebuild_summary_tree()
 
             return True
         except Exception as e:
@@ -278,6 +311,7 @@ class SeriesManager:
         # Update book count in metadata
         if self.books:
             self.metadata["book_count"] = len(self.books)
+            self._rebuild_summary_tree()
 
             # Save the updated metadata
             self.save_series()
@@ -312,12 +346,47 @@ class SeriesManager:
 
         # Add book to the series
         self.books.append(book_data)
+        self.summary_tree.set_summary(book_data["book_number"], self._book_summary_text(book_data))
 
         # Save series
         self.save_series()
 
         return book_data["book_number"]
 
+    def set_book_summary(self, book_number: int, summary: str) -> bool:
+        """
+        Record the summary of a finished book and roll it into the series history.
+
+        Args:
+            book_number: Book number in the series
+            summary: Summary or synopsis of the book
+
+        Returns:
+            True if the book was found, False otherwise
+        """
+        book = self.get_book(book_number)
+        if not book:
+            return False
+
+        book["summary"] = summary
+        self.summary_tree.set_summary(book_number, self._book_summary_text(book))
+        self.save_series()
+        return True
+
+    @staticmethod
+    def _book_summary_text(book: Dict[str, Any]) -> str:
+        """Get the text that represents a book in the series summary tree."""
+        summary = book.get("summary") or book.get("description", "")
+        title = book.get("title")
+        return f"{title}: {summary}" if title else summary
+
+    def _rebuild_summary_tree(self) -> None:
+        """Rebuild the series summary tree from the book list."""
+        self.summary_tree.rebuild({
+            book["book_number"]: self._book_summary_text(book)
+            for book in self.books if book.get("book_number")
+        })
+
     def get_book(self, book_number: int) -> Optional[Dict[str, Any]]:
         """
         Get a book from the series by its number.
@@ -374,70 +443,70 @@ class SeriesManager:
         if "character_arcs" in tracking_data:
             for char_name, arc in tracking_data["character_arcs"].items():
                 if char_name not in self.series_tracking["character_arcs"]:
-                    self.series_tracking["character_arcs"][char_name] = {}
+                    self.series_tracking["character_arcs"][char_name] = VersionedTimeline()
                 self.series_tracking["character_arcs"][char_name][book_number] = arc
 
         # Update character relationships
         if "character_relationships" in tracking_data:
             for rel_key, status in tracking_data["character_relationships"].items():
                 if rel_key not in self.series_tracking["character_relationships"]:
-                    self.series_tracking["character_relationships"][rel_key] = {}
+                    self.series_tracking["character_relationships"][rel_key] = VersionedTimeline()
                 self.series_tracking["character_relationships"][rel_key][book_number] = status
 
         # Update character development
         if "character_development" in tracking_data:
             for char_name, development in tracking_data["character_development"].items():
                 if char_name not in self.series_tracking["character_development"]:
-                    self.series_tracking["character_development"][char_name] = {}
+                    self.series_tracking["character_development"][char_name] = VersionedTimeline()
                 self.series_tracking["character_development"][char_name][book_number] = development
 
         # Update character traits
         if "character_traits" in tracking_data:
             for char_name, traits in tracking_data["character_traits"].items():
                 if char_name not in self.series_tracking["character_traits"]:
-                    self.series_tracking["character_traits"][char_name] = {}
+                    self.series_tracking["character_traits"][char_name] = VersionedTimeline()
                 self.series_tracking["character_traits"][char_name][book_number] = traits
 
         # Update character goals
         if "character_goals" in tracking_data:
             for char_name, goals in tracking_data["character_goals"].items():
                 if char_name not in self.series_tracking["character_goals"]:
-                    self.series_tracking["character_goals"][char_name] = {}
+                    self.series_tracking["character_goals"][char_name] = VersionedTimeline()
                 self.series_tracking["character_goals"][char_name][book_number] = goals
 
         # Update character conflicts
         if "character_conflicts" in tracking_data:
             for char_name, conflicts in tracking_data["character_conflicts"].items():
                 if char_name not in self.series_tracking["character_conflicts"]:
-                    self.series_tracking["character_conflicts"][char_name] = {}
+                    self.series_tracking["character_conflicts"][char_name] = VersionedTimeline()
                 self.series_tracking["character_conflicts"][char_name][book_number] = conflicts
 
         # Update character growth
         if "character_growth" in tracking_data:
             for char_name, growth in tracking_data["character_growth"].items():
                 if char_name not in self.series_tracking["character_growth"]:
-                    self.series_tracking["character_growth"][char_name] = {}
+                    self.series_tracking["character_growth"][char_name] = VersionedTimeline()
                 self.series_tracking["character_growth"][char_name][book_number] = growth
 
         # Update plot threads
         if "plot_threads" in tracking_data:
             for thread_name, status in tracking_data["plot_threads"].items():
                 if thread_name not in self.series_tracking["plot_threads"]:
-                    self.series_tracking["plot_threads"][thread_name] = {}
+                    self.series_tracking["plot_threads"][thread_name] = VersionedTimeline()
                 self.series_tracking["plot_threads"][thread_name][book_number] = status
 
         # Update plot arcs
         if "plot_arcs" in tracking_data:
             for arc_name, arc_data in tracking_data["plot_arcs"].items():
                 if arc_name not in self.series_tracking["plot_arcs"]:
-                    self.series_tracking["plot_arcs"][arc_name] = {}
+                    self.series_tracking["plot_arcs"][arc_name] = VersionedTimeline()
                 self.series_tracking["plot_arcs"][arc_name][book_number] = arc_data
 
         # Update plot progression
         if "plot_progression" in tracking_data:
             for arc_name, progression in tracking_data["plot_progression"].items():
                 if arc_name not in self.series_tracking["plot_progression"]:
-                    self.series_tracking["plot_progression"][arc_name] = {}
+                    self.series_tracking["plot_progression"][arc_name] = VersionedTimeline()
                 self.series_tracking["plot_progression"][arc_name][book_number] = progression
 
         # Update plot milestones
@@ -471,9 +540,16 @@ class SeriesManager:
                 connection_id = f"{connection.get('from_event')}_{connection.get('to_event')}"
                 self.series_tracking["timeline_connections"][connection_id] = connection
 
+        self._invalidate_series_context()
+
         # Save the updated series tracking
         self.save_series()
 
+    def _invalidate_series_context(self) -> None:
+        """Start a new tracking generation; call whenever series tracking changes."""
+        self._tracking_generation += 1
+        self._series_context_cache.clear()
+
     def get_context_for_book(self, book_number: int) -> Dict[str, Any]:
         """
         Get the context needed for generating a specific book in the series.
@@ -484,10 +560,12 @@ class SeriesManager:
         Returns:
             Dictionary containing context information
         """
-        # Get previous books
+        # Recent books in full, earlier ones as arc summaries and a series synopsis
+        history = self.summary_tree.get_view(book_number, RECENT_BOOKS, MAX_BOOK_ARCS)
+        recent_books = set(history["recent_units"])
         previous_books = [
             book for book in self.books
-            if book.get("book_number", 0) < book_number
+            if book.get("book_number", 0) in recent_books
         ]
 
         # Get recurring characters
@@ -496,12 +574,19 @@ class SeriesManager:
         # Get series arcs
         relevant_arcs = self.series_arcs
 
-        # Get series tracking information
-        series_context = self._get_series_context_for_book(book_number)
+        # Get series tracking information, assembled once per tracking generation
+        cache_key = (book_number, self._tracking_generation)
+        if cache_key not in self._series_context_cache:
+            self._series_context_cache[cache_key] = self._get_series_context_for_book(book_number)
+        series_context = dict(self._series_context_cache[cache_key])
 
         return {
             "metadata": self.metadata,
             "previous_books": previous_books,
+            "earlier_books": [
+                {"books": arc["units"], "summary": arc["summary"]} for arc in history["arcs"]
+            ],
+            "series_synopsis": history["synopsis"],
             "recurring_characters": relevant_characters,
             "series_arcs": relevant_arcs,
             "book_to_generate": book_number,
@@ -519,85 +604,30 @@ class SeriesManager:
         Returns:
             Dictionary containing series context
         """
-        # Get character arcs for recurring characters
-        character_arcs = {}
-        for char_name, arcs in self.series_tracking["character_arcs"].items():
-            # Get the most recent character arc update
-            char_arc_books = sorted([b for b in arcs.keys() if int(b) < book_number], reverse=True)
-            if char_arc_books:
-                character_arcs[char_name] = arcs[char_arc_books[0]]
-
-        # Get character relationships
-        relationships = {}
-        for rel_key, statuses in self.series_tracking["character_relationships"].items():
-            # Get the most recent relationship update
-            rel_books = sorted([b for b in statuses.keys() if int(b) < book_number], reverse=True)
-            if rel_books:
-                relationships[rel_key] = statuses[rel_books[0]]
-
-        # Get character development
-        character_development = {}
-        for char_name, developments in self.series_tracking["character_development"].items():
-            # Get the most recent development update
-            dev_books = sorted([b for b in developments.keys() if int(b) < book_number], reverse=True)
-            if dev_books:
-                character_development[char_name] = developments[dev_books[0]]
-
-        # Get character traits
-        character_traits = {}
-        for char_name, traits in self.series_tracking["character_traits"].items():
-            # Get the most recent traits update
-            trait_books = sorted([b for b in traits.keys() if int(b) < book_number], reverse=True)
-            if trait_books:
-                character_traits[char_name] = traits[trait_books[0]]
-
-        # Get character goals
-        character_goals = {}
-        for char_name, goals in self.series_tracking["character_goals"].items():
-            # Get the most recent goals update
-            goal_books = sorted([b for b in goals.keys() if int(b) < book_number], reverse=True)
-            if goal_books:
-                character_goals[char_name] = goals[goal_books[0]]
-
-        # Get character conflicts
-        character_conflicts = {}
-        for char_name, conflicts in self.series_tracking["character_conflicts"].items():
-            # Get the most recent conflicts update
-            conflict_books = sorted([b for b in conflicts.keys() if int(b) < book_number], reverse=True)
-            if conflict_books:
-                character_conflicts[char_name] = conflicts[conflict_books[0]]
-
-        # Get character growth
-        character_growth = {}
-        for char_name, growth in self.series_tracking["character_growth"].items():
-            # Get the most recent growth update
-            growth_books = sorted([b for b in growth.keys() if int(b) < book_number], reverse=True)
-            if growth_books:
-                character_growth[char_name] = growth[growth_books[0]]
-
-        # Get plot threads
-        plot_threads = {}
-        for thread_name, statuses in self.series_tracking["plot_threads"].items():
-            # Get the most recent plot thread update
-            thread_books = sorted([b for b in statuses.keys() if int(b) < book_number], reverse=True)
-            if thread_books:
-                plot_threads[thread_name] = statuses[thread_books[0]]
-
-        # Get plot arcs
-        plot_arcs = {}
-        for arc_name, arc_data in self.series_tracking["plot_arcs"].items():
-            # Get the most recent plot arc update
-            arc_books = sorted([b for b in arc_data.keys() if int(b) < book_number], reverse=True)
-            if arc_books:
-                plot_arcs[arc_name] = arc_data[arc_books[0]]
-
-        # Get plot progression
-        plot_progression = {}
-        for arc_name, progression in self.series_tracking["plot_progression"].items():
-            # Get the most recent progression update
-            prog_books = sorted([b for b in progression.keys() if int(b) < book_number], reverse=True)
-            if prog_books:
-                plot_progression[arc_name] = progression[prog_books[0]]
+        def latest_states(category: str) -> Dict[str, Any]:
+            """Most recent state before this book of each entity in a category."""
+            states = {}
+            for name, timeline in self.series_tracking[category].items():
+                if not isinstance(timeline, VersionedTimeline):
+                    timeline = VersionedTimeline.from_data(timeline)
+                latest = timeline.latest_version_before(book_number)
+                if latest is not None:
+                    states[name] = timeline[latest]
+            return states
+
+        # Get the most recent character updates
+        character_arcs = latest_states("character_arcs")
+        relationships = latest_states("character_relationships")
+        character_development = latest_states("character_development")
+        character_traits = latest_states("character_traits")
+        character_goals = latest_states("character_goals")
+        character_conflicts = latest_states("character_conflicts")
+        character_growth = latest_states("character_growth")
+
+        # Get the most recent plot thread, arc and progression updates
+        plot_threads = latest_states("plot_threads")
+        plot_arcs = latest_states("plot_arcs")
+        plot_progression = latest_states("plot_progression")
 
         # Get plot milestones
         plot_milestones = [
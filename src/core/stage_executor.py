@@ -0,0 +1,145 @@
+"""
+Dependency-ordered execution of book generation stages.
+
+Each stage declares the stages whose results it needs. Stages whose inputs are
+ready run concurrently on a bounded thread pool (sized to the API concurrency
+limit), and the executor records how long each stage took so slow steps show
+up in the logs.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from src.utils.logger import log_info
+
+
+@dataclass
+class Stage:
+    """A unit of work and the stages it depends on."""
+
+    name: str
+    func: Callable[..., Any]  # Called with each input stage's result as a keyword argument
+    inputs: Tuple[str, ...] = ()
+
+
+class StageExecutor:
+    """
+    Runs a graph of stages, starting each one as soon as its inputs are done.
+    """
+
+    def __init__(self, max_workers: int = 3, name: str = "stages"):
+        """
+        Initialize an empty stage graph.
+
+        Args:
+            max_workers: Maximum number of stages running at once
+            name: Label used in logs and worker thread names
+        """
+        self.max_workers = max(1, max_workers)
+        self.name = name
+        self.stages: Dict[str, Stage] = {}
+        self.timings: Dict[str, Dict[str, float]] = {}
+
+    def add_stage(self, name: str, func: Callable[..., Any], inputs: Tuple[str, ...] = ()) -> None:
+        """
+        Add a stage to the graph.
+
+        Args:
+            name: Unique stage name; its result is passed to dependents under this name
+            func: Function to run, called with the results of its inputs as keyword arguments
+            inputs: Names of the stages this stage depends on
+        """
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' is already defined")
+        self.stages[name] = Stage(name, func, tuple(inputs))
+
+    def _check_graph(self, done: Dict[str, Any]) -> None:
+        """Reject unknown inputs and dependency cycles before anything runs."""
+        for stage in self.stages.values():
+            for dependency in stage.inputs:
+                if dependency not in self.stages and dependency not in done:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dependency}'")
+
+        # Kahn's algorithm: every stage must become ready at some point
+        resolved = set(done)
+        remaining = [name for name in self.stages if name not in resolved]
+        while remaining:
+            ready = [name for name in remaining if all(d in resolved for d in self.stages[name].inputs)]
+            if not ready:
+                raise ValueError(f"Stages have a dependency cycle: {', '.join(sorted(remaining))}")
+            resolved.update(ready)
+            remaining = [name for name in remaining if name not in resolved]
+
+    def run(self, results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run every stage that does not already have a result.
+
+        If a stage raises, no further stages are started, the running ones are
+        allowed to finish, and the first error is re-raised.
+
+        Args:
+            results: Results already known (e.g. from a checkpoint); those stages are skipped
+
+        Returns:
+            Dictionary of stage name to result, including the ones passed in
+        """
+        results = dict(results or {})
+        self._check_graph(results)
+
+        pending = [name for name in self.stages if name not in results]
+        running = {}
+        error = None
+        started_at = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name) as executor:
+            while pending or running:
+                if error is None:
+                    for name in [n for n in pending if all(d in results for d in self.stages[n].inputs)]:
+                        if len(running) >= self.max_workers:
+                            break
+                        pending.remove(name)
+                        stage = self.stages[name]
+                        kwargs = {dependency: results[dependency] for dependency in stage.inputs}
+                        running[executor.submit(self._run_stage, stage, kwargs)] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        if error is None:
+                            error = e
+
+        log_info(f"Generation {self.name} finished",
+                 total_seconds=round(time.monotonic() - started_at, 2),
+                 stage_seconds={name: timing["seconds"] for name, timing in self.timings.items()})
+
+        if error is not None:
+            raise error
+        return results
+
+    def _run_stage(self, stage: Stage, kwargs: Dict[str, Any]) -> Any:
+        """Run one stage with its inputs and record its timing."""
+        start_time = time.monotonic()
+        try:
+            return stage.func(**kwargs)
+        finally:
+            seconds = time.monotonic() - start_time
+            self.timings[stage.name] = {"start": start_time, "seconds": round(seconds, 3)}
+            log_info("Generation stage finished", stage=stage.name, seconds=round(seconds, 2))
+
+    def get_timings(self) -> List[Dict[str, Any]]:
+        """
+        Get per-stage timings in the order stages started.
+
+        Returns:
+            List of dictionaries with stage name and duration in seconds
+        """
+        ordered = sorted(self.timings.items(), key=lambda item: item[1]["start"])
+        return [{"stage": name, "seconds": timing["seconds"]} for name, timing in ordered]
@@ -0,0 +1,347 @@
+"""
+Online, deduplicated database backups.
+
+Snapshots are taken with SQLite's online backup API, which copies a consistent
+view of the database without blocking writers (in WAL mode the copy is one read
+transaction). The snapshot is cut into fixed-size, page-aligned chunks; each
+chunk is gzip-compressed and stored once under its SHA-256, and a backup is a
+JSON manifest listing its chunks. Since SQLite updates pages in place, a new
+backup only stores the chunks whose pages changed since an earlier one.
+
+Restores rebuild the snapshot from its chunks, verify every chunk and the whole
+file against their checksums, and copy it into the target with the backup API.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime
+from typing import Dict, Any, Optional, List
+from rich.console import Console
+
+console = Console()
+
+# Size of a stored chunk; a multiple of every SQLite page size, so pages never straddle chunks
+CHUNK_SIZE = 1024 * 1024
+
+# Retention: always keep this many of the newest backups...
+RETENTION_KEEP_LAST = 10
+
+# ...plus the newest backup of each of this many most recent days
+RETENTION_KEEP_DAILY = 14
+
+
+class BackupManager:
+    """
+    Content-chunked backup store for one SQLite database.
+    """
+
+    def __init__(self, db_path: str, backup_dir: Optional[str] = None,
+                 keep_last: int = RETENTION_KEEP_LAST, keep_daily: int = RETENTION_KEEP_DAILY):
+        """
+        Initialize the backup manager.
+
+        Args:
+            db_path: Path to the SQLite database file
+            backup_dir: Directory of the backup store (default: "backups" next to the database)
+            keep_last: Number of newest backups retention always keeps
+            keep_daily: Number of recent days whose newest backup retention keeps
+        """
+        self.db_path = db_path
+        self.backup_dir = backup_dir or os.path.join(os.path.dirname(db_path) or ".", "backups")
+        self.chunks_dir = os.path.join(self.backup_dir, "chunks")
+        self.manifests_dir = os.path.join(self.backup_dir, "manifests")
+        self.keep_last = keep_last
+        self.keep_daily = keep_daily
+
+    def _chunk_path(self, checksum: str) -> str:
+        """Get the file a chunk is stored in."""
+        return os.path.join(self.chunks_dir, checksum[:2], f"{checksum}.gz")
+
+    def _manifest_path(self, backup_id: str) -> str:
+        """Get the manifest file of a backup."""
+        return os.path.join(self.manifests_dir, f"{backup_id}.json")
+
+    def _has_tables(self) -> bool:
+        """Check whether the database exists and has any tables worth backing up."""
+        if not os.path.exists(self.db_path):
+            return False
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' LIMIT 1").fetchone() is not None
+        finally:
+            conn.close()
+
+    def create_backup(self, label: str = "manual", apply_retention: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Back up the database.
+
+        Args:
+            label: Short description included in the backup ID
+            apply_retention: Whether to prune old backups afterwards
+
+        Returns:
+            The backup manifest (without the chunk list), or None if there was
+            nothing to back up or the backup failed
+        """
+        if not self._has_tables():
+            return None
+
+        safe_label = re.sub(r"[^A-Za-z0-9_-]+", "_", label).strip("_") or "backup"
+        backup_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{safe_label}"
+        snapshot_path = os.path.join(self.backup_dir, f".{backup_id}.snapshot")
+
+        try:
+            os.makedirs(self.manifests_dir, exist_ok=True)
+
+            # Consistent snapshot in a single step: one read transaction, writers keep going
+            source = sqlite3.connect(self.db_path)
+            target = sqlite3.connect(snapshot_path)
+            try:
+                source.backup(target)
+                page_size = source.execute("PRAGMA page_size").fetchone()[0]
+            finally:
+                target.close()
+                source.close()
+
+            chunks = []
+            new_chunks = 0
+            new_bytes = 0
+            file_digest = hashlib.sha256()
+            size_bytes = 0
+
+            with open(snapshot_path, "rb") as f:
+                while True:
+                    chunk = f.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    file_digest.update(chunk)
+                    size_bytes += len(chunk)
+
+                    checksum = hashlib.sha256(chunk).hexdigest()
+                    chunks.append(checksum)
+                    chunk_path = self._chunk_path(checksum)
+                    if not os.path.exists(chunk_path):
+                        new_bytes += self._write_chunk(chunk_path, chunk)
+                        new_chunks += 1
+
+            manifest = {
+                "backup_id": backup_id,
+                "label": label,
+                "created_date": datetime.now().isoformat(),
+                "source_path": self.db_path,
+                "page_size": page_size,
+                "size_bytes": size_bytes,
+                "sha256": file_digest.hexdigest(),
+                "chunk_size": CHUNK_SIZE,
+                "chunks": chunks,
+                "new_chunks": new_chunks,
+                "new_bytes": new_bytes,
+            }
+
+            # The manifest is written last, so a backup is only listed once all its chunks exist
+            manifest_path = self._manifest_path(backup_id)
+            with open(f"{manifest_path}.tmp", "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(f"{manifest_path}.tmp", manifest_path)
+
+        except Exception as e:
+            console.print(f"[bold red]Failed to create backup: {str(e)}[/bold red]")
+            return None
+        finally:
+            if os.path.exists(snapshot_path):
+                os.remove(snapshot_path)
+
+        if apply_retention:
+            self.apply_retention()
+
+        return self._summarize(manifest, manifest_path)
+
+    def _write_chunk(self, chunk_path: str, chunk: bytes) -> int:
+        """Store a compressed chunk atomically and return its stored size."""
+        os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+        data = gzip.compress(chunk, compresslevel=6)
+        with open(f"{chunk_path}.tmp", "wb") as f:
+            f.write(data)
+        os.replace(f"{chunk_path}.tmp", chunk_path)
+        return len(data)
+
+    def _load_manifest(self, backup_id: str) -> Optional[Dict[str, Any]]:
+        """Load a backup manifest, or None if it does not exist or is unreadable."""
+        try:
+            with open(self._manifest_path(backup_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _summarize(manifest: Dict[str, Any], manifest_path: str) -> Dict[str, Any]:
+        """Get a manifest without its chunk list, plus its path."""
+        summary = {key: value for key, value in manifest.items() if key != "chunks"}
+        summary["path"] = manifest_path
+        return summary
+
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """
+        List backups in the store.
+
+        Returns:
+            Backup manifests (without chunk lists), newest first
+        """
+        if not os.path.exists(self.manifests_dir):
+            return []
+
+        backups = []
+        for filename in os.listdir(self.manifests_dir):
+            if not filename.endswith(".json"):
+                continue
+            manifest = self._load_manifest(filename[:-len(".json")])
+            if manifest:
+                backups.append(self._summarize(manifest, self._manifest_path(manifest["backup_id"])))
+
+        backups.sort(key=lambda backup: backup["backup_id"], reverse=True)
+        return backups
+
+    def restore_from_backup(self, backup_id: str, target_path: Optional[str] = None) -> bool:
+        """
+        Restore a backup after verifying it.
+
+        Every chunk is checked against its SHA-256 and the rebuilt file against
+        the checksum in the manifest before anything in the target is touched.
+
+        Args:
+            backup_id: ID of the backup to restore
+            target_path: Database to restore into (default: the backed-up database)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        manifest = self._load_manifest(backup_id)
+        if not manifest:
+            console.print(f"[bold red]Backup not found: {backup_id}[/bold red]")
+            return False
+
+        target_path = target_path or self.db_path
+        restore_path = os.path.join(self.backup_dir, f".{backup_id}.restore")
+
+        try:
+            file_digest = hashlib.sha256()
+            with open(restore_path, "wb") as f:
+                for checksum in manifest["chunks"]:
+                    with open(self._chunk_path(checksum), "rb") as chunk_file:
+                        chunk = gzip.decompress(chunk_file.read())
+                    if hashlib.sha256(chunk).hexdigest() != checksum:
+                        console.print(f"[bold red]Backup chunk is corrupt: {checksum}[/bold red]")
+                        return False
+                    file_digest.update(chunk)
+                    f.write(chunk)
+
+            if file_digest.hexdigest() != manifest["sha256"]:
+                console.print(f"[bold red]Backup checksum mismatch: {backup_id}[/bold red]")
+                return False
+
+            source = sqlite3.connect(restore_path)
+            try:
+                result = source.execute("PRAGMA quick_check").fetchone()[0]
+                if result != "ok":
+                    console.print(f"[bold red]Restored database failed its integrity check: {result}[/bold red]")
+                    return False
+
+                # Copy into the target as one transaction, so open connections see the restored data
+                target_dir = os.path.dirname(target_path)
+                if target_dir:
+                    os.makedirs(target_dir, exist_ok=True)
+                target = sqlite3.connect(target_path)
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+            finally:
+                source.close()
+
+            return True
+
+        except Exception as e:
+            console.print(f"[bold red]Error restoring backup: {str(e)}[/bold red]")
+            return False
+        finally:
+            if os.path.exists(restore_path):
+                os.remove(restore_path)
+
+    def apply_retention(self) -> int:
+        """
+        Delete backups outside the retention policy and chunks no backup uses.
+
+        The newest keep_last backups are kept, plus the newest backup of each of
+        the keep_daily most recent days that have backups.
+
+        Returns:
+            Number of backups deleted
+        """
+        backups = self.list_backups()
+
+        keep = {backup["backup_id"] for backup in backups[:self.keep_last]}
+        days = []
+        for backup in backups:
+            day = backup["backup_id"][:8]
+            if day not in days:
+                days.append(day)
+                if len(days) <= self.keep_daily:
+                    keep.add(backup["backup_id"])
+
+        deleted = 0
+        for backup in backups:
+            if backup["backup_id"] not in keep:
+                os.remove(backup["path"])
+                deleted += 1
+
+        if deleted:
+            self._delete_unreferenced_chunks()
+        return deleted
+
+    def _delete_unreferenced_chunks(self) -> int:
+        """Delete stored chunks that no remaining manifest lists."""
+        referenced = set()
+        for backup in self.list_backups():
+            manifest = self._load_manifest(backup["backup_id"])
+            if manifest:
+                referenced.update(manifest["chunks"])
+
+        removed = 0
+        for prefix in os.listdir(self.chunks_dir) if os.path.exists(self.chunks_dir) else []:
+            prefix_dir = os.path.join(self.chunks_dir, prefix)
+            for filename in os.listdir(prefix_dir):
+                if filename.endswith(".gz") and filename[:-len(".gz")] not in referenced:
+                    os.remove(os.path.join(prefix_dir, filename))
+                    removed += 1
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get backup store statistics.
+
+        Returns:
+            Dictionary with backup count, total size of all backups, bytes
+            actually stored and chunk count
+        """
+        backups = self.list_backups()
+
+        chunk_count = 0
+        stored_bytes = 0
+        if os.path.exists(self.chunks_dir):
+            for prefix in os.listdir(self.chunks_dir):
+                prefix_dir = os.path.join(self.chunks_dir, prefix)
+                for filename in os.listdir(prefix_dir):
+                    if filename.endswith(".gz"):
+                        chunk_count += 1
+                        stored_bytes += os.path.getsize(os.path.join(prefix_dir, filename))
+
+        return {
+            "backup_count": len(backups),
+            "logical_bytes": sum(backup["size_bytes"] for backup in backups),
+            "stored_bytes": stored_bytes,
+            "chunk_count": chunk_count,
+        }
@@ -0,0 +1,320 @@
+"""
+Content-addressed storage for binary book assets (covers and EPUBs).
+
+Blobs are kept as raw BLOBs in their own table, keyed by the SHA-256 of their
+content. Book rows only hold the 64-character key, so scans of the books table
+stay small and identical files are stored once no matter how many books use them.
+"""
+
+import gzip
+import hashlib
+import sqlite3
+import zlib
+from datetime import datetime
+from typing import Dict, Any, Optional, Callable, Iterator, Iterable
+from rich.console import Console
+
+console = Console()
+
+BLOBS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS blobs (
+        sha256 TEXT PRIMARY KEY,  -- SHA-256 of the uncompressed content
+        data BLOB NOT NULL,  -- Content as stored (see encoding)
+        encoding TEXT DEFAULT 'identity',  -- identity or gzip
+        size_bytes INTEGER NOT NULL,  -- Uncompressed content size
+        stored_size_bytes INTEGER NOT NULL,  -- Size of data as stored
+        created_date TEXT
+    )
+"""
+
+# Columns in the books table that reference blobs by key
+BLOB_REFERENCE_COLUMNS = ("cover_sha256", "epub_sha256")
+
+# Bytes read from the database (and produced by decompression) per step when streaming
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def read_column_chunks(conn: sqlite3.Connection, table: str, column: str, rowid: int,
+                       chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Read a BLOB or TEXT value incrementally instead of loading it whole.
+
+    Uses SQLite's incremental blob I/O where available (Python 3.11+), and
+    otherwise reads the value in substr() slices.
+
+    Args:
+        conn: Connection to read through
+        table: Table holding the value
+        column: Column holding the value
+        rowid: Rowid of the row
+        chunk_size: Maximum bytes per chunk
+
+    Yields:
+        Consecutive chunks of the stored value
+    """
+    if hasattr(conn, "blobopen"):
+        with conn.blobopen(table, column, rowid, readonly=True) as blob:
+            while True:
+                chunk = blob.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    offset = 1
+    while True:
+        row = conn.execute(f"SELECT substr({column}, ?, ?) FROM {table} WHERE rowid = ?",
+                           (offset, chunk_size, rowid)).fetchone()
+        chunk = row[0] if row else None
+        if not chunk:
+            return
+        yield chunk.encode("ascii") if isinstance(chunk, str) else bytes(chunk)
+        offset += chunk_size
+
+
+def gunzip_chunks(chunks: Iterable[bytes], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Decompress a gzip stream chunk by chunk.
+
+    Output is produced at most chunk_size bytes at a time, so a highly
+    compressible input never expands into one large buffer.
+
+    Args:
+        chunks: Chunks of gzip data
+        chunk_size: Maximum bytes per decompressed chunk
+
+    Yields:
+        Decompressed chunks
+
+    Raises:
+        zlib.error: If the data is corrupt or truncated
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        while chunk:
+            data = decompressor.decompress(chunk, chunk_size)
+            chunk = decompressor.unconsumed_tail
+            if data:
+                yield data
+
+    data = decompressor.flush()
+    if data:
+        yield data
+    if not decompressor.eof:
+        raise zlib.error("Compressed data ended before the end-of-stream marker")
+
+
+class BlobStore:
+    """
+    Deduplicating blob table addressed by SHA-256 checksums.
+    """
+
+    def __init__(self, get_connection: Callable[[], sqlite3.Connection]):
+        """
+        Initialize the blob store.
+
+        Args:
+            get_connection: Factory returning a configured connection to the database
+        """
+        self.get_connection = get_connection
+
+    @staticmethod
+    def compute_key(content: bytes) -> str:
+        """
+        Compute the key a blob is stored under.
+
+        Args:
+            content: Uncompressed blob content
+
+        Returns:
+            Hex SHA-256 digest of the content
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    def put(self, content: bytes, compress: bool = False,
+            conn: Optional[sqlite3.Connection] = None) -> str:
+        """
+        Store a blob, reusing the existing copy if the content is already stored.
+
+        Args:
+            content: Uncompressed blob content
+            compress: Whether to gzip the content before storing it
+            conn: Connection to write through (the caller commits); a new one is used if None
+
+        Returns:
+            The blob key (SHA-256 of the content)
+        """
+        key = self.compute_key(content)
+        data = gzip.compress(content) if compress else content
+
+        def insert(connection: sqlite3.Connection) -> None:
+            connection.execute("""
+                INSERT OR IGNORE INTO blobs (sha256, data, encoding, size_bytes, stored_size_bytes, created_date)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (key, sqlite3.Binary(data), "gzip" if compress else "identity",
+                  len(content), len(data), datetime.now().isoformat()))
+
+        if conn is not None:
+            insert(conn)
+        else:
+            with self.get_connection() as connection:
+                insert(connection)
+                connection.commit()
+
+        return key
+
+    def get(self, key: str, verify: bool = True) -> Optional[bytes]:
+        """
+        Get the content of a blob.
+
+        Args:
+            key: Blob key
+            verify: Whether to check the content against its key
+
+        Returns:
+            Uncompressed content, or None if missing or corrupt
+        """
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT data, encoding FROM blobs WHERE sha256 = ?", (key,)).fetchone()
+
+        if not row:
+            return None
+
+        content = bytes(row["data"])
+        if row["encoding"] == "gzip":
+            content = gzip.decompress(content)
+
+        if verify and self.compute_key(content) != key:
+            console.print(f"[bold red]Blob integrity check failed: {key}[/bold red]")
+            return None
+
+        return content
+
+    def iter_content(self, key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Optional[Iterator[bytes]]:
+        """
+        Stream the content of a blob without loading it into memory.
+
+        The content is not verified; callers hash the chunks as they consume them.
+
+        Args:
+            key: Blob key
+            chunk_size: Maximum bytes per chunk
+
+        Returns:
+            Iterator over uncompressed content chunks, or None if the blob is missing
+        """
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT rowid, encoding FROM blobs WHERE sha256 = ?", (key,)).fetchone()
+
+        if not row:
+            return None
+
+        chunks = read_column_chunks(self.get_connection(), "blobs", "data", row["rowid"], chunk_size)
+        if row["encoding"] == "gzip":
+            chunks = gunzip_chunks(chunks, chunk_size)
+        return chunks
+
+    def get_info(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a blob's metadata without loading its content.
+
+        Args:
+            key: Blob key
+
+        Returns:
+            Dictionary with encoding, size_bytes, stored_size_bytes and
+            created_date, or None if missing
+        """
+        with self.get_connection() as conn:
+            row = conn.execute("""
+                SELECT encoding, size_bytes, stored_size_bytes, created_date
+                FROM blobs WHERE sha256 = ?
+            """, (key,)).fetchone()
+        return dict(row) if row else None
+
+    def exists(self, key: str) -> bool:
+        """Check whether a blob is stored."""
+        return self.get_info(key) is not None
+
+    def delete_if_unreferenced(self, key: Optional[str], conn: sqlite3.Connection) -> bool:
+        """
+        Delete one blob if no book references it anymore.
+
+        Run this in the same transaction as the update that dropped the
+        reference, so a concurrent writer that starts using the blob either
+        commits first (and keeps it) or sees it gone and stores it again.
+
+        Args:
+            key: Key of the blob that lost a reference (None is ignored)
+            conn: Connection to delete through (the caller commits)
+
+        Returns:
+            True if the blob was deleted
+        """
+        if key is None:
+            return False
+
+        references = " AND ".join(
+            f"NOT EXISTS (SELECT 1 FROM books WHERE books.{column} = ?)"
+            for column in BLOB_REFERENCE_COLUMNS
+        )
+        cursor = conn.execute(f"DELETE FROM blobs WHERE sha256 = ? AND {references}",
+                              (key,) + (key,) * len(BLOB_REFERENCE_COLUMNS))
+        return cursor.rowcount > 0
+
+    def delete_unreferenced(self, conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Delete blobs that no book references anymore.
+
+        Scans the whole blobs table, so it is meant for cleanup and maintenance;
+        single updates use delete_if_unreferenced.
+
+        Args:
+            conn: Connection to delete through (the caller commits); a new one is used if None
+
+        Returns:
+            Number of blobs deleted
+        """
+        references = " AND ".join(
+            f"NOT EXISTS (SELECT 1 FROM books WHERE books.{column} = blobs.sha256)"
+            for column in BLOB_REFERENCE_COLUMNS
+        )
+        query = f"DELETE FROM blobs WHERE {references}"
+
+        if conn is not None:
+            return conn.execute(query).rowcount
+
+        with self.get_connection() as connection:
+            deleted = connection.execute(query).rowcount
+            connection.commit()
+        return deleted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get blob storage statistics.
+
+        Returns:
+            Dictionary with blob counts, sizes and bytes saved by deduplication
+        """
+        with self.get_connection() as conn:
+            totals = conn.execute("""
+                SELECT COUNT(*) AS blob_count,
+                       COALESCE(SUM(size_bytes), 0) AS content_bytes,
+                       COALESCE(SUM(stored_size_bytes), 0) AS stored_bytes
+                FROM blobs
+            """).fetchone()
+
+            # Bytes that would be stored if every reference had its own copy
+            referenced = conn.execute(" UNION ALL ".join(
+                f"SELECT COALESCE(SUM(b.stored_size_bytes), 0) AS total FROM books "
+                f"JOIN blobs b ON b.sha256 = books.{column}"
+                for column in BLOB_REFERENCE_COLUMNS
+            )).fetchall()
+
+        referenced_bytes = sum(row["total"] for row in referenced)
+
+        return {
+            "blob_count": totals["blob_count"],
+            "content_bytes": totals["content_bytes"],
+            "stored_bytes": totals["stored_bytes"],
+            "deduplicated_bytes": max(referenced_bytes - totals["stored_bytes"], 0)
+        }
@@ -44,8 +44,8 @@ class BookFilterManager:
         if max_books is None:
             max_books = self.default_display_limit
 
-        # Get all completed books
-        all_books = self.db_manager.get_books(status="completed")
+        # Get summaries of all completed books (no blob or JSON columns)
+        all_books = self.db_manager.get_book_summaries(status="completed")
 
         if not all_books:
             return []
@@ -80,7 +80,7 @@ class BookFilterManager:
             max_books = self.default_display_limit
 
         # Get books from target genre
-        target_books = self.db_manager.get_books(genre=target_genre, status="completed")
+        target_books = self.db_manager.get_book_summaries(genres=[target_genre], status="completed")
 
         # If we have enough books from the target genre, return a subset
         if len(target_books) >= max_books:
@@ -91,13 +91,15 @@ class BookFilterManager:
             related_genres = self._get_related_genres(target_genre)
             remaining_slots = max_books - len(target_books)
 
-            # Get books from related genres
+            # Get books from all related genres in one query
+            books_by_genre = self._get_summaries_by_genre(related_genres)
+
             related_books = []
             for genre in related_genres:
                 if remaining_slots <= 0:
                     break
 
-                genre_books = self.db_manager.get_books(genre=genre, status="completed")
+                genre_books = books_by_genre[genre]
                 # Take a few books from each related genre
                 books_to_take = min(2, remaining_slots, len(genre_books))
                 related_books.extend(genre_books[:books_to_take])
@@ -122,7 +124,7 @@ class BookFilterManager:
         if max_books is None:
             max_books = self.default_display_limit
 
-        return self.db_manager.get_books(status="completed", limit=max_books)
+        return self.db_manager.get_book_summaries(status="completed", limit=max_books)
 
     def get_books_for_genre_recommendations(self,
                                           exclude_book_id: str,
@@ -139,18 +141,19 @@ class BookFilterManager:
         Returns:
             List of recommended book dictionaries
         """
-        # Get books from the same genre
+        # Get books from the same genre and up to 2 related genres in one query
+        related_genres = self._get_related_genres(target_genre)[:2]
+        books_by_genre = self._get_summaries_by_genre([target_genre] + related_genres)
+
         same_genre_books = [
-            book for book in self.db_manager.get_books(genre=target_genre, status="completed")
+            book for book in books_by_genre[target_genre]
             if book["book_id"] != exclude_book_id
         ]
 
-        # Get books from related genres
-        related_genres = self._get_related_genres(target_genre)
         related_books = []
-        for genre in related_genres[:2]:  # Limit to 2 related genres
+        for genre in related_genres:
             genre_books = [
-                book for book in self.db_manager.get_books(genre=genre, status="completed")
+                book for book in books_by_genre[genre]
                 if book["book_id"] != exclude_book_id
             ]
             related_books.extend(genre_books[:2])  # Max 2 books per related genre
@@ -169,17 +172,15 @@ class BookFilterManager:
         Returns:
             List of series book dictionaries sorted by book number
         """
-        all_books = self.db_manager.get_books(status="completed")
-
         series_books = []
-        for book in all_books:
-            series_info = book.get("series_info", {})
+        for book in self.db_manager.iter_book_summaries(status="completed"):
+            series_info = book.get("series_info") or {}
             if (series_info.get("is_part_of_series") and
                 series_info.get("series_title") == series_title):
                 series_books.append(book)
 
         # Sort by book number
-        series_books.sort(key=lambda x: x.get("series_info", {}).get("book_number", 0))
+        series_books.sort(key=lambda x: (x.get("series_info") or {}).get("book_number", 0))
 
         return series_books
 
@@ -190,14 +191,23 @@ class BookFilterManager:
         Returns:
             Dictionary mapping genres to book counts
         """
-        all_books = self.db_manager.get_books(status="completed")
+        return self.db_manager.get_genre_counts(status="completed")
 
-        genre_counts = defaultdict(int)
-        for book in all_books:
-            genre = book.get("genre", "Unknown")
-            genre_counts[genre] += 1
+    def _get_summaries_by_genre(self, genres: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get completed book summaries for several genres with a single query.
+
+        Args:
+            genres: Genres to fetch
 
-        return dict(genre_counts)
+        Returns:
+            Dictionary mapping each genre to its summaries, newest first
+        """
+        books_by_genre = defaultdict(list)
+        if genres:
+            for book in self.db_manager.get_book_summaries(genres=genres, status="completed"):
+                books_by_genre[book.get("genre")].append(book)
+        return books_by_genre
 
     def _apply_intelligent_filtering(self,
                                    all_books: List[Dict[str, Any]],
@@ -293,7 +303,7 @@ class BookFilterManager:
                 score += 1
 
             # Boost score for series books (for variety)
-            series_info = book.get("series_info", {})
+            series_info = book.get("series_info") or {}
             if series_info.get("is_part_of_series"):
                 score += 0.5
 
@@ -340,11 +350,10 @@ class BookFilterManager:
         Returns:
             Dictionary containing display summary information
         """
-        all_books = self.db_manager.get_books(status="completed")
         genre_dist = self.get_genre_distribution()
 
         return {
-            "total_books": len(all_books),
+            "total_books": sum(genre_dist.values()),
             "total_genres": len(genre_dist),
             "display_limit": self.default_display_limit,
             "books_per_genre_limit": self.max_books_per_genre,
@@ -4,9 +4,12 @@ Provides a cloud-like experience for accessing books stored in the database.
 """
 
 import os
+import json
 import tempfile
 import shutil
-from typing import Dict, Any, Optional, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from rich.console import Console
 from rich.progress import Progress
@@ -17,6 +20,12 @@ from src.database.cover_database_manager import get_cover_database_manager
 
 console = Console()
 
+# Written last into each exported book directory; marks the export as complete
+EXTRACTION_INFO_FILENAME = "extraction_info.txt"
+
+# Books exported at once; decompression, hashing and file writes release the GIL
+EXPORT_WORKERS = min(8, (os.cpu_count() or 1) + 2)
+
 
 class BookLibraryManager:
     """
@@ -46,8 +55,8 @@ class BookLibraryManager:
             Path to extracted book directory or None if failed
         """
         try:
-            # Get book data
-            book_data = self.db_manager.get_book(book_id)
+            # Get book data (summary columns only; the EPUB and cover are streamed below)
+            book_data = self.db_manager.get_book_summary(book_id)
             if not book_data:
                 console.print(f"[bold red]Book not found: {book_id}[/bold red]")
                 return None
@@ -58,64 +67,14 @@ class BookLibraryManager:
 
             # Create book directory
             book_title = book_data.get("title", "Unknown")
-            safe_title = "".join(c for c in book_title if c.isalnum() or c in " -_").strip()
-            safe_title = safe_title.replace(" ", "_")
-
-            book_dir = os.path.join(output_dir, safe_title)
+            book_dir = os.path.join(output_dir, self._safe_title(book_title))
             os.makedirs(book_dir, exist_ok=True)
 
             console.print(f"[bold cyan]Extracting book: {book_title}[/bold cyan]")
 
-            # Extract EPUB
-            epub_extracted = False
-            if self.epub_db_manager.has_epub(book_id):
-                epub_filename = book_data.get("epub_filename", f"{safe_title}.epub")
-                epub_path = os.path.join(book_dir, epub_filename)
-
-                if self.epub_db_manager.get_epub_as_file(book_id, epub_path):
-                    console.print(f"[bold green]✓[/bold green] EPUB extracted: {epub_filename}")
-                    epub_extracted = True
-                else:
-                    console.print(f"[bold red]✗[/bold red] Failed to extract EPUB")
-
-            # Extract novel data
-            novel_data_extracted = False
-            novel_data = self.epub_db_manager.get_novel_data(book_id)
-            if novel_data:
-                import json
-                novel_data_path = os.path.join(book_dir, "novel_data.json")
-                with open(novel_data_path, 'w', encoding='utf-8') as f:
-                    json.dump(novel_data, f, indent=2, ensure_ascii=False)
-                console.print(f"[bold green]✓[/bold green] Novel data extracted: novel_data.json")
-                novel_data_extracted = True
-
-            # Extract cover
-            cover_extracted = False
-            if include_cover and self.cover_db_manager.has_cover(book_id):
-                cover_filename = book_data.get("cover_filename", "cover.jpg")
-                cover_path = os.path.join(book_dir, cover_filename)
+            extracted = self._write_book_files(book_data, book_dir, include_cover, verbose=True)
 
-                if self.cover_db_manager.get_cover_as_file(book_id, cover_path):
-                    console.print(f"[bold green]✓[/bold green] Cover extracted: {cover_filename}")
-                    cover_extracted = True
-
-            # Create extraction summary
-            summary_path = os.path.join(book_dir, "extraction_info.txt")
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                from src.ui.responsive_separator import title_separator
-                f.write(f"Book Extraction Summary\n")
-                f.write(f"{title_separator('Book Extraction Summary', '=')}\n\n")
-                f.write(f"Book ID: {book_id}\n")
-                f.write(f"Title: {book_title}\n")
-                f.write(f"Author: {book_data.get('author', 'Unknown')}\n")
-                f.write(f"Genre: {book_data.get('genre', 'Unknown')}\n")
-                f.write(f"Extraction Date: {datetime.now().isoformat()}\n\n")
-                f.write(f"Extracted Components:\n")
-                f.write(f"- EPUB: {'✓' if epub_extracted else '✗'}\n")
-                f.write(f"- Novel Data: {'✓' if novel_data_extracted else '✗'}\n")
-                f.write(f"- Cover: {'✓' if cover_extracted else '✗'}\n")
-
-            if epub_extracted or novel_data_extracted:
+            if extracted["epub"] or extracted["novel_data"]:
                 console.print(f"[bold green]✓[/bold green] Book extracted to: [cyan]{book_dir}[/cyan]")
                 return book_dir
             else:
@@ -126,6 +85,82 @@ class BookLibraryManager:
             console.print(f"[bold red]Error extracting book: {str(e)}[/bold red]")
             return None
 
+    @staticmethod
+    def _safe_title(book_title: str) -> str:
+        """Turn a book title into a directory name."""
+        safe_title = "".join(c for c in book_title if c.isalnum() or c in " -_").strip()
+        return safe_title.replace(" ", "_")
+
+    def _write_book_files(self, book_data: Dict[str, Any], book_dir: str,
+                          include_cover: bool, verbose: bool = False) -> Dict[str, bool]:
+        """
+        Write a book's EPUB, novel data, cover and extraction summary into a directory.
+
+        The extraction summary is written last, so its presence marks a complete export.
+
+        Args:
+            book_data: Book summary
+            book_dir: Existing directory to write into
+            include_cover: Whether to extract the cover image
+            verbose: Whether to print a line per extracted component
+
+        Returns:
+            Dictionary of component name to whether it was extracted
+        """
+        book_id = book_data["book_id"]
+        extracted = {"epub": False, "novel_data": False, "cover": False}
+
+        # Extract EPUB
+        if book_data["has_epub"]:
+            epub_filename = book_data.get("epub_filename") or f"{self._safe_title(book_data.get('title', 'Unknown'))}.epub"
+            epub_path = os.path.join(book_dir, epub_filename)
+
+            if self.epub_db_manager.get_epub_as_file(book_id, epub_path):
+                if verbose:
+                    console.print(f"[bold green]✓[/bold green] EPUB extracted: {epub_filename}")
+                extracted["epub"] = True
+            else:
+                console.print(f"[bold red]✗[/bold red] Failed to extract EPUB")
+
+        # Extract novel data
+        novel_data = self.epub_db_manager.get_novel_data(book_id)
+        if novel_data:
+            novel_data_path = os.path.join(book_dir, "novel_data.json")
+            with open(novel_data_path, 'w', encoding='utf-8') as f:
+                json.dump(novel_data, f, indent=2, ensure_ascii=False)
+            if verbose:
+                console.print(f"[bold green]✓[/bold green] Novel data extracted: novel_data.json")
+            extracted["novel_data"] = True
+
+        # Extract cover
+        if include_cover and book_data["has_cover"]:
+            cover_filename = book_data.get("cover_filename") or "cover.jpg"
+            cover_path = os.path.join(book_dir, cover_filename)
+
+            if self.cover_db_manager.get_cover_as_file(book_id, cover_path):
+                if verbose:
+                    console.print(f"[bold green]✓[/bold green] Cover extracted: {cover_filename}")
+                extracted["cover"] = True
+
+        # Create extraction summary
+        summary_path = os.path.join(book_dir, EXTRACTION_INFO_FILENAME)
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            from src.ui.responsive_separator import title_separator
+            f.write(f"Book Extraction Summary\n")
+            f.write(f"{title_separator('Book Extraction Summary', '=')}\n\n")
+            f.write(f"Book ID: {book_id}\n")
+            f.write(f"Title: {book_data.get('title', 'Unknown')}\n")
+            f.write(f"Author: {book_data.get('author', 'Unknown')}\n")
+            f.write(f"Genre: {book_data.get('genre', 'Unknown')}\n")
+            f.write(f"Book Updated: {book_data.get('updated_date') or 'Unknown'}\n")
+            f.write(f"Extraction Date: {datetime.now().isoformat()}\n\n")
+            f.write(f"Extracted Components:\n")
+            f.write(f"- EPUB: {'✓' if extracted['epub'] else '✗'}\n")
+            f.write(f"- Novel Data: {'✓' if extracted['novel_data'] else '✗'}\n")
+            f.write(f"- Cover: {'✓' if extracted['cover'] else '✗'}\n")
+
+        return extracted
+
     def convert_book_format(self, book_id: str, target_format: str,
                           output_path: Optional[str] = None) -> Optional[str]:
         """
@@ -191,47 +226,184 @@ class BookLibraryManager:
             return None
 
     def batch_export_books(self, book_ids: List[str], output_dir: Optional[str] = None,
-                          include_covers: bool = True) -> Dict[str, str]:
+                          include_covers: bool = True, max_workers: Optional[int] = None,
+                          resume: bool = True) -> Dict[str, str]:
         """
         Export multiple books from the database in batch.
 
+        Book rows are read in bulk and books are exported concurrently. Each book
+        is written to a hidden staging directory that is renamed into place when
+        complete, so an interrupted export never leaves a half-written book
+        directory. With resume, books whose directory already holds a complete
+        export of the current version are skipped.
+
         Args:
             book_ids: List of book IDs to export
             output_dir: Directory to export to
             include_covers: Whether to include cover images
+            max_workers: Number of books exported at once (default: EXPORT_WORKERS)
+            resume: Whether to skip books that are already exported and unchanged
 
         Returns:
             Dictionary mapping book_id to export path (or error message)
         """
-        results = {}
-
         if not output_dir:
             output_dir = self.export_dir
+        os.makedirs(output_dir, exist_ok=True)
+
+        return self._export_books(self.db_manager.get_book_summaries_by_id(book_ids), book_ids,
+                                  output_dir, include_covers, max_workers or EXPORT_WORKERS, resume)
+
+    def _export_books(self, summaries: Dict[str, Dict[str, Any]], book_ids: List[str], output_dir: str,
+                      include_covers: bool, max_workers: int, resume: bool) -> Dict[str, str]:
+        """Export books whose summaries are already loaded, in parallel."""
+        book_ids = list(dict.fromkeys(book_ids))
+        results = {}
+        skipped = 0
 
         console.print(f"[bold cyan]Batch exporting {len(book_ids)} books...[/bold cyan]")
 
+        # Resolve directory names up front so books with the same title never share one.
+        # Every book with a shared name is suffixed by its ID, so names do not depend on order.
+        names = {}
+        for book_id in book_ids:
+            book_data = summaries.get(book_id)
+            if not book_data:
+                results[book_id] = "Error: Book not found"
+                continue
+            names[book_id] = self._safe_title(book_data.get("title", "Unknown")) or book_id
+
+        name_counts = Counter(names.values())
+        book_dirs = {
+            book_id: os.path.join(output_dir, f"{name}_{book_id}" if name_counts[name] > 1 else name)
+            for book_id, name in names.items()
+        }
+
         with Progress() as progress:
             task = progress.add_task("Exporting books...", total=len(book_ids))
+            progress.update(task, advance=len(results))  # Books not found
+
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="book_export") as executor:
+                futures = {
+                    executor.submit(self._export_book_atomic, summaries[book_id], book_dir,
+                                    include_covers, resume): book_id
+                    for book_id, book_dir in book_dirs.items()
+                }
+
+                for future in as_completed(futures):
+                    book_id = futures[future]
+                    try:
+                        export_path, was_skipped = future.result()
+                        results[book_id] = export_path or "Export failed"
+                        skipped += was_skipped
+                    except Exception as e:
+                        results[book_id] = f"Error: {str(e)}"
+
+                    progress.update(task, advance=1)
 
-            for book_id in book_ids:
-                try:
-                    export_path = self.get_book_from_library(book_id, output_dir, include_covers)
-                    if export_path:
-                        results[book_id] = export_path
-                    else:
-                        results[book_id] = "Export failed"
-                except Exception as e:
-                    results[book_id] = f"Error: {str(e)}"
+        successful_exports = sum(1 for result in results.values() if not result.startswith("Error") and result != "Export failed")
+        skipped_note = f" ({skipped} already up to date)" if skipped else ""
+        console.print(f"[bold green]Batch export complete: {successful_exports}/{len(book_ids)} books exported{skipped_note}[/bold green]")
 
-                progress.update(task, advance=1)
+        # Keep the caller's order
+        return {book_id: results[book_id] for book_id in book_ids}
 
-        successful_exports = sum(1 for result in results.values() if not result.startswith("Error") and result != "Export failed")
-        console.print(f"[bold green]Batch export complete: {successful_exports}/{len(book_ids)} books exported[/bold green]")
+    def _export_book_atomic(self, book_data: Dict[str, Any], book_dir: str,
+                            include_cover: bool, resume: bool) -> Tuple[Optional[str], bool]:
+        """
+        Export one book into book_dir through a staging directory.
+
+        Only a directory holding an earlier export of the same book is replaced.
+        If book_dir belongs to anything else (another book, or the user's own
+        files), the book is exported next to it under a name with its ID.
 
-        return results
+        Args:
+            book_data: Book summary
+            book_dir: Final directory for the book
+            include_cover: Whether to extract the cover image
+            resume: Whether an up-to-date existing export is kept
+
+        Returns:
+            Tuple of (book directory or None if nothing could be extracted, whether it was skipped)
+        """
+        book_id = book_data["book_id"]
+
+        # Staging directory on the same file system, so the final rename is atomic;
+        # one left by an interrupted run is discarded
+        staging_dir = os.path.join(os.path.dirname(book_dir), f".partial_{book_id}")
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+        book_dir = self._claim_book_dir(book_dir, book_id)
+        if resume and self._is_exported(book_dir, book_data):
+            return book_dir, True
+
+        os.makedirs(staging_dir)
+
+        try:
+            extracted = self._write_book_files(book_data, staging_dir, include_cover)
+            if not (extracted["epub"] or extracted["novel_data"]):
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                return None, False
+
+            if os.path.exists(book_dir):
+                # Safe to remove: _claim_book_dir only returns directories of this book's exports
+                shutil.rmtree(book_dir)
+            os.replace(staging_dir, book_dir)
+            return book_dir, False
+        except Exception:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+    @staticmethod
+    def _read_export_summary(book_dir: str) -> Optional[str]:
+        """Read the extraction summary of an export directory, or None if it has none."""
+        summary_path = os.path.join(book_dir, EXTRACTION_INFO_FILENAME)
+        try:
+            with open(summary_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _claim_book_dir(self, book_dir: str, book_id: str) -> str:
+        """
+        Get a directory the book may be exported into, starting with book_dir.
+
+        A directory qualifies if it does not exist yet or holds an export of
+        this book (its extraction summary names the book ID).
+
+        Args:
+            book_dir: Preferred directory
+            book_id: ID of the book being exported
+
+        Returns:
+            book_dir, or the first free or owned alternative named with the book ID
+        """
+        suffix = "" if book_dir.endswith(f"_{book_id}") else f"_{book_id}"
+        candidates = [book_dir, f"{book_dir}{suffix}"] if suffix else [book_dir]
+
+        attempt = 2
+        while True:
+            for candidate in candidates:
+                if not os.path.exists(candidate):
+                    return candidate
+                summary = self._read_export_summary(candidate)
+                if summary and f"Book ID: {book_id}\n" in summary:
+                    return candidate
+            candidates = [f"{book_dir}{suffix}_{attempt}"]
+            attempt += 1
+
+    @staticmethod
+    def _is_exported(book_dir: str, book_data: Dict[str, Any]) -> bool:
+        """Check whether book_dir holds a complete export of the book's current version."""
+        summary = BookLibraryManager._read_export_summary(book_dir)
+        if summary is None:
+            return False
+        return (f"Book ID: {book_data['book_id']}\n" in summary and
+                f"Book Updated: {book_data.get('updated_date') or 'Unknown'}\n" in summary)
 
     def export_genre_collection(self, genre: str, output_dir: Optional[str] = None,
-                              max_books: Optional[int] = None) -> Dict[str, str]:
+                              max_books: Optional[int] = None, max_workers: Optional[int] = None,
+                              resume: bool = True) -> Dict[str, str]:
         """
         Export all books of a specific genre.
 
@@ -239,12 +411,14 @@ class BookLibraryManager:
             genre: Genre to export
             output_dir: Directory to export to
             max_books: Maximum number of books to export
+            max_workers: Number of books exported at once (default: EXPORT_WORKERS)
+            resume: Whether to skip books that are already exported and unchanged
 
         Returns:
             Dictionary mapping book_id to export path
         """
-        # Get books of the specified genre
-        books = self.db_manager.get_books(genre=genre, status="completed", limit=max_books)
+        # Get books of the specified genre (one summary query, no large columns)
+        books = self.db_manager.get_book_summaries(genres=[genre], status="completed", limit=max_books)
 
         if not books:
             console.print(f"[yellow]No books found for genre: {genre}[/yellow]")
@@ -253,9 +427,11 @@ class BookLibraryManager:
         # Create genre-specific output directory
         if not output_dir:
             output_dir = os.path.join(self.export_dir, f"{genre}_Collection")
+        os.makedirs(output_dir, exist_ok=True)
 
-        book_ids = [book["book_id"] for book in books]
-        return self.batch_export_books(book_ids, output_dir)
+        summaries = {book["book_id"]: book for book in books}
+        return self._export_books(summaries, list(summaries), output_dir, True,
+                                  max_workers or EXPORT_WORKERS, resume)
 
     def get_library_summary(self) -> Dict[str, Any]:
         """
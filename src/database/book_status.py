@@ -0,0 +1,96 @@
+"""
+Materialized completion status of every book.
+
+The book_status table holds one narrow row per book with the flags batch
+completion workflows need (has_cover, has_epub, description_enhanced,
+back_cover_generated). Triggers on the books table keep it current, so the
+status of the whole library is one indexed scan of small rows instead of a
+scan of the books table, whose late-added flag columns sit behind the large
+JSON and base64 columns of each record.
+"""
+
+import sqlite3
+from typing import Tuple
+
+# Completion flags tracked per book
+BOOK_STATUS_FLAGS = ("has_cover", "has_epub", "description_enhanced", "back_cover_generated")
+
+BOOK_STATUS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS book_status (
+        book_id TEXT PRIMARY KEY,
+        title TEXT,
+        genre TEXT,
+        generation_status TEXT,
+        created_date TEXT,
+        has_cover INTEGER NOT NULL DEFAULT 0,
+        has_epub INTEGER NOT NULL DEFAULT 0,
+        description_enhanced INTEGER NOT NULL DEFAULT 0,
+        back_cover_generated INTEGER NOT NULL DEFAULT 0
+    )
+"""
+
+# Status row values computed from a books row named by the given alias (NEW or books)
+_STATUS_VALUES = """
+    {row}.book_id, {row}.title, {row}.genre, {row}.generation_status, {row}.created_date,
+    ({row}.cover_sha256 IS NOT NULL OR {row}.cover_base64 IS NOT NULL),
+    ({row}.epub_sha256 IS NOT NULL OR {row}.epub_base64 IS NOT NULL),
+    COALESCE({row}.description_enhanced, 0) != 0,
+    COALESCE({row}.back_cover_generated, 0) != 0
+"""
+
+_INSERT_STATUS = "INSERT OR REPLACE INTO book_status VALUES ("
+
+BOOK_STATUS_SCHEMA: Tuple[str, ...] = (
+    BOOK_STATUS_TABLE_SQL,
+    # Serves "completed books missing X" filters and the newest-first listing
+    """
+    CREATE INDEX IF NOT EXISTS idx_book_status_flags
+    ON book_status(generation_status, has_cover, has_epub, description_enhanced, back_cover_generated)
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_book_status_created ON book_status(created_date)",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_book_status_insert AFTER INSERT ON books
+    BEGIN
+        {_INSERT_STATUS}{_STATUS_VALUES.format(row="NEW")});
+    END
+    """,
+    # Only changes to tracked columns touch the status row; access counters do not
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_book_status_update
+    AFTER UPDATE OF book_id, title, genre, generation_status, created_date,
+        cover_sha256, cover_base64, epub_sha256, epub_base64,
+        description_enhanced, back_cover_generated ON books
+    BEGIN
+        DELETE FROM book_status WHERE book_id = OLD.book_id;
+        {_INSERT_STATUS}{_STATUS_VALUES.format(row="NEW")});
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_book_status_delete AFTER DELETE ON books
+    BEGIN
+        DELETE FROM book_status WHERE book_id = OLD.book_id;
+    END
+    """,
+)
+
+
+def create_book_status_table(conn: sqlite3.Connection) -> int:
+    """
+    Create the book_status table and its triggers, and fill it from the books table.
+
+    Safe to call again; existing status rows are rebuilt from their books.
+
+    Args:
+        conn: Open connection to a database whose books table has the v2.1 flag columns
+
+    Returns:
+        Number of books whose status was written
+    """
+    for statement in BOOK_STATUS_SCHEMA:
+        conn.execute(statement)
+
+    conn.execute("DELETE FROM book_status WHERE book_id NOT IN (SELECT book_id FROM books)")
+    cursor = conn.execute(
+        f"INSERT OR REPLACE INTO book_status SELECT {_STATUS_VALUES.format(row='books')} FROM books"
+    )
+    return cursor.rowcount
@@ -0,0 +1,171 @@
+"""
+Shared SQLite connection layer for the NovelForge AI databases.
+
+Each thread keeps one open connection per database file instead of opening a new
+one for every query. Connections are put in WAL mode with tuned pragmas, and
+sqlite3's per-connection statement cache means frequently used queries are
+prepared once and reused for the life of the connection.
+"""
+
+import os
+import sqlite3
+import threading
+import weakref
+from typing import Dict, Optional, Tuple, Any, Callable
+
+# Applied to every new connection, in order
+CONNECTION_PRAGMAS = (
+    ("journal_mode", "WAL"),  # Readers don't block the writer and commits append to the log
+    ("synchronous", "NORMAL"),  # Safe with WAL; fsync at checkpoints instead of every commit
+    ("cache_size", "-16000"),  # 16 MB page cache (negative values are KiB)
+    ("mmap_size", "268435456"),  # Read up to 256 MB of the file through memory mapping
+    ("temp_store", "MEMORY"),
+    ("busy_timeout", "30000")  # Wait up to 30s for locks held by other connections
+)
+
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+STATEMENT_CACHE_SIZE = 256
+
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection that remembers which database and process it belongs to."""
+
+    pool_key: str = ""
+    owner_pid: int = 0
+
+
+class ConnectionPool:
+    """
+    Thread-local pool of configured SQLite connections, one per database file.
+    """
+
+    def __init__(self):
+        """Initialize the connection pool."""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Every open connection, so they can be closed from any thread; a
+        # connection is dropped once the thread that owns it is gone
+        self._connections: "weakref.WeakSet[PooledConnection]" = weakref.WeakSet()
+        # Bumped when a database's connections are closed so other threads reopen
+        self._generations: Dict[str, int] = {}
+
+    @staticmethod
+    def _pool_key(db_path: str) -> str:
+        """Normalize a database path so different spellings share a connection."""
+        return os.path.abspath(str(db_path))
+
+    def _thread_connections(self) -> Dict[str, Tuple[sqlite3.Connection, int]]:
+        """Get this thread's connections, dropping any inherited through fork."""
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            self._local.pid = pid
+            self._local.connections = {}
+        return self._local.connections
+
+    def get_connection(self, db_path: str,
+                       row_factory: Optional[Callable[..., Any]] = sqlite3.Row) -> sqlite3.Connection:
+        """
+        Get this thread's connection to a database, opening it on first use.
+
+        The connection stays open; use it as a context manager to commit or roll
+        back a transaction, and don't close it.
+
+        Args:
+            db_path: Path to the SQLite database file
+            row_factory: Row factory to use for queries (sqlite3.Row by default)
+
+        Returns:
+            Configured SQLite connection
+        """
+        key = self._pool_key(db_path)
+        connections = self._thread_connections()
+        generation = self._generations.get(key, 0)
+
+        conn, conn_generation = connections.get(key, (None, None))
+        if conn is None or conn_generation != generation:
+            conn = self._open_connection(key)
+            connections[key] = (conn, generation)
+            with self._lock:
+                self._connections.add(conn)
+
+        conn.row_factory = row_factory
+        return conn
+
+    def _open_connection(self, db_path: str) -> PooledConnection:
+        """
+        Open and configure a new connection.
+
+        Args:
+            db_path: Absolute path to the SQLite database file
+
+        Returns:
+            Configured SQLite connection
+        """
+        # Only this thread uses the connection; check_same_thread is off so
+        # close_connections can close it from another thread
+        conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE, factory=PooledConnection)
+        conn.pool_key = db_path
+        conn.owner_pid = os.getpid()
+        for pragma, value in CONNECTION_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+
+    def checkpoint(self, db_path: str) -> None:
+        """
+        Write the WAL back into the main database file.
+
+        Call this before copying the database file so the copy is complete.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        if os.path.exists(db_path):
+            conn = self.get_connection(db_path)
+            conn.commit()
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close_connections(self, db_path: Optional[str] = None) -> int:
+        """
+        Close pooled connections in all threads.
+
+        Call this before deleting or replacing a database file.
+
+        Args:
+            db_path: Only close connections to this database (all databases if None)
+
+        Returns:
+            Number of connections closed
+        """
+        key = self._pool_key(db_path) if db_path else None
+        pid = os.getpid()
+
+        with self._lock:
+            to_close = [conn for conn in self._connections if key is None or conn.pool_key == key]
+            for conn in to_close:
+                self._connections.discard(conn)
+            for closed_key in {conn.pool_key for conn in to_close}:
+                self._generations[closed_key] = self._generations.get(closed_key, 0) + 1
+
+        closed = 0
+        for conn in to_close:
+            # Connections inherited from a parent process belong to the parent
+            if conn.owner_pid == pid:
+                try:
+                    conn.close()
+                    closed += 1
+                except sqlite3.Error:
+                    pass
+
+        return closed
+
+
+# Global connection pool instance
+_connection_pool = None
+
+def get_connection_pool() -> ConnectionPool:
+    """Get the global connection pool instance."""
+    global _connection_pool
+    if _connection_pool is None:
+        _connection_pool = ConnectionPool()
+    return _connection_pool
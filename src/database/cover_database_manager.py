@@ -1,27 +1,33 @@
 """
-Cover database manager for storing and retrieving book covers as base64 data.
+Cover database manager for storing and retrieving book covers.
+
+Cover images are stored once in the content-addressed blob store; book rows
+reference them by SHA-256. Base64 accessors are kept for existing callers.
 """
 
 import os
 import base64
+import sqlite3
 from typing import Dict, Any, Optional, List
 from PIL import Image
 import io
+from datetime import datetime
 from rich.console import Console
 
-from src.database.database_manager import get_database_manager
+from src.database.database_manager import get_database_manager, BOOK_SUMMARY_SELECT
 
 console = Console()
 
 
 class CoverDatabaseManager:
     """
-    Manages cover images stored in the database as base64 data.
+    Manages cover images stored in the database blob store.
     """
     
     def __init__(self):
         """Initialize the cover database manager."""
         self.db_manager = get_database_manager()
+        self.blob_store = self.db_manager.blob_store
         self.supported_formats = ['.jpg', '.jpeg', '.png', '.webp', '.bmp']
     
     def store_cover_from_file(self, book_id: str, cover_path: str) -> bool:
@@ -45,7 +51,7 @@ class CoverDatabaseManager:
                 console.print(f"[bold red]Unsupported image format: {cover_path}[/bold red]")
                 return False
             
-            # Read and encode the image
+            # Read the image
             with open(cover_path, 'rb') as f:
                 image_data = f.read()
             
@@ -54,24 +60,7 @@ class CoverDatabaseManager:
                 console.print(f"[bold red]Invalid image data: {cover_path}[/bold red]")
                 return False
             
-            # Convert to base64
-            cover_base64 = base64.b64encode(image_data).decode('utf-8')
-            
-            # Get filename for reference
-            cover_filename = os.path.basename(cover_path)
-            
-            # Update book record with cover data
-            success = self.db_manager.update_book(book_id, {
-                "cover_base64": cover_base64,
-                "cover_filename": cover_filename
-            })
-            
-            if success:
-                console.print(f"[bold green]✓[/bold green] Cover stored in database for book: {book_id}")
-                return True
-            else:
-                console.print(f"[bold red]Failed to update book record: {book_id}[/bold red]")
-                return False
+            return self._store_cover_data(book_id, image_data, os.path.basename(cover_path))
                 
         except Exception as e:
             console.print(f"[bold red]Error storing cover: {str(e)}[/bold red]")
@@ -100,23 +89,120 @@ class CoverDatabaseManager:
                 console.print(f"[bold red]Invalid base64 data: {str(e)}[/bold red]")
                 return False
             
-            # Update book record with cover data
-            success = self.db_manager.update_book(book_id, {
-                "cover_base64": cover_base64,
-                "cover_filename": filename
-            })
-            
-            if success:
-                console.print(f"[bold green]✓[/bold green] Cover stored in database for book: {book_id}")
-                return True
-            else:
-                console.print(f"[bold red]Failed to update book record: {book_id}[/bold red]")
-                return False
+            return self._store_cover_data(book_id, image_data, filename)
                 
         except Exception as e:
             console.print(f"[bold red]Error storing cover: {str(e)}[/bold red]")
             return False
     
+    def _store_cover_data(self, book_id: str, image_data: bytes, filename: str) -> bool:
+        """
+        Store validated image bytes in the blob store and point the book at them.
+        
+        Args:
+            book_id: The book ID to associate the cover with
+            image_data: Raw image bytes
+            filename: Original filename for reference
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        with self.db_manager.get_connection() as conn:
+            cover_sha256 = self.blob_store.put(image_data, conn=conn)
+            success = self._replace_cover_reference(conn, book_id, {
+                "cover_sha256": cover_sha256,
+                "cover_base64": None,
+                "cover_filename": filename
+            })
+            conn.commit()
+        
+        if success:
+            console.print(f"[bold green]✓[/bold green] Cover stored in database for book: {book_id}")
+            return True
+        else:
+            console.print(f"[bold red]Failed to update book record: {book_id}[/bold red]")
+            return False
+    
+    def store_covers_bulk(self, covers: Dict[str, str]) -> int:
+        """
+        Store many cover images in the database in a single transaction.
+
+        Args:
+            covers: Mapping of book ID to cover image file path
+
+        Returns:
+            Number of book records updated
+        """
+        updates = []
+        for book_id, cover_path in covers.items():
+            try:
+                if not os.path.exists(cover_path) or not self._is_valid_image_format(cover_path):
+                    console.print(f"[bold red]Skipping invalid cover file: {cover_path}[/bold red]")
+                    continue
+
+                with open(cover_path, 'rb') as f:
+                    image_data = f.read()
+
+                if not self._validate_image_data(image_data):
+                    console.print(f"[bold red]Invalid image data: {cover_path}[/bold red]")
+                    continue
+
+                updates.append((
+                    image_data,
+                    os.path.basename(cover_path),
+                    datetime.now().isoformat(),
+                    book_id
+                ))
+            except Exception as e:
+                console.print(f"[bold red]Error reading cover {cover_path}: {str(e)}[/bold red]")
+
+        if not updates:
+            return 0
+
+        try:
+            with self.db_manager.get_connection() as conn:
+                stored = 0
+                for image_data, filename, updated_date, book_id in updates:
+                    cover_sha256 = self.blob_store.put(image_data, conn=conn)
+                    previous = conn.execute("SELECT cover_sha256 FROM books WHERE book_id = ?", (book_id,)).fetchone()
+                    stored += conn.execute("""
+                        UPDATE books SET cover_sha256 = ?, cover_base64 = NULL, cover_filename = ?, updated_date = ?
+                        WHERE book_id = ?
+                    """, (cover_sha256, filename, updated_date, book_id)).rowcount
+                    if previous and previous["cover_sha256"] != cover_sha256:
+                        self.blob_store.delete_if_unreferenced(previous["cover_sha256"], conn)
+                conn.commit()
+        except Exception as e:
+            console.print(f"[bold red]Error storing covers: {str(e)}[/bold red]")
+            return 0
+
+        console.print(f"[bold green]✓[/bold green] Stored {stored} cover{'s' if stored != 1 else ''} in database")
+        return stored
+
+    def get_cover_data(self, book_id: str) -> Optional[bytes]:
+        """
+        Get the raw image bytes of a book's cover.
+        
+        Args:
+            book_id: The book ID to get the cover for
+            
+        Returns:
+            Image bytes or None if not found
+        """
+        with self.db_manager.get_connection() as conn:
+            row = conn.execute(
+                "SELECT cover_sha256, cover_base64 FROM books WHERE book_id = ?", (book_id,)
+            ).fetchone()
+        
+        if not row:
+            return None
+        if row["cover_sha256"]:
+            return self.blob_store.get(row["cover_sha256"])
+        if row["cover_base64"]:
+            # Row not migrated to the blob store yet
+            return base64.b64decode(row["cover_base64"])
+        return None
+    
     def get_cover_base64(self, book_id: str) -> Optional[str]:
         """
         Get the base64 cover data for a book.
@@ -127,9 +213,9 @@ class CoverDatabaseManager:
         Returns:
             Base64 encoded cover data or None if not found
         """
-        book_data = self.db_manager.get_book(book_id)
-        if book_data and book_data.get("cover_base64"):
-            return book_data["cover_base64"]
+        image_data = self.get_cover_data(book_id)
+        if image_data:
+            return base64.b64encode(image_data).decode('utf-8')
         return None
     
     def get_cover_as_file(self, book_id: str, output_path: str) -> bool:
@@ -144,13 +230,10 @@ class CoverDatabaseManager:
             True if successful, False otherwise
         """
         try:
-            cover_base64 = self.get_cover_base64(book_id)
-            if not cover_base64:
+            image_data = self.get_cover_data(book_id)
+            if not image_data:
                 return False
             
-            # Decode base64 data
-            image_data = base64.b64decode(cover_base64)
-            
             # Ensure output directory exists
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
@@ -190,7 +273,12 @@ class CoverDatabaseManager:
         Returns:
             True if cover exists, False otherwise
         """
-        return self.get_cover_base64(book_id) is not None
+        with self.db_manager.get_connection() as conn:
+            row = conn.execute("""
+                SELECT 1 FROM books
+                WHERE book_id = ? AND (cover_sha256 IS NOT NULL OR cover_base64 IS NOT NULL)
+            """, (book_id,)).fetchone()
+        return row is not None
     
     def remove_cover(self, book_id: str) -> bool:
         """
@@ -202,27 +290,48 @@ class CoverDatabaseManager:
         Returns:
             True if successful, False otherwise
         """
-        return self.db_manager.update_book(book_id, {
-            "cover_base64": None,
-            "cover_filename": None
-        })
+        with self.db_manager.get_connection() as conn:
+            success = self._replace_cover_reference(conn, book_id, {
+                "cover_sha256": None,
+                "cover_base64": None,
+                "cover_filename": None
+            })
+            conn.commit()
+        return success
+    
+    def _replace_cover_reference(self, conn: sqlite3.Connection, book_id: str, updates: Dict[str, Any]) -> bool:
+        """
+        Point a book at a new cover (or none) and drop the previous one if no other book shares it.
+        
+        Args:
+            conn: Connection to write through (the caller commits)
+            book_id: The book ID to update
+            updates: Book fields to update, including cover_sha256
+            
+        Returns:
+            True if the book was updated
+        """
+        row = conn.execute("SELECT cover_sha256 FROM books WHERE book_id = ?", (book_id,)).fetchone()
+        success = self.db_manager.update_book(book_id, updates, conn=conn)
+        if row and row["cover_sha256"] != updates["cover_sha256"]:
+            self.blob_store.delete_if_unreferenced(row["cover_sha256"], conn)
+        return success
     
     def get_books_with_covers(self) -> List[Dict[str, Any]]:
         """
         Get all books that have covers stored in the database.
         
         Returns:
-            List of book dictionaries with covers
+            List of book summaries with covers
         """
         with self.db_manager.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM books 
-                WHERE cover_base64 IS NOT NULL 
+            cursor = conn.execute(BOOK_SUMMARY_SELECT + """
+                WHERE cover_sha256 IS NOT NULL OR cover_base64 IS NOT NULL 
                 ORDER BY updated_date DESC
             """)
             rows = cursor.fetchall()
             
-            return [self.db_manager._row_to_dict(row) for row in rows]
+            return [self.db_manager._row_to_summary(row) for row in rows]
     
     def get_cover_stats(self) -> Dict[str, Any]:
         """
@@ -235,12 +344,16 @@ class CoverDatabaseManager:
             cursor = conn.execute("""
                 SELECT 
                     COUNT(*) as total_covers,
-                    SUM(LENGTH(cover_base64)) as total_size_bytes,
-                    AVG(LENGTH(cover_base64)) as avg_size_bytes,
-                    MIN(LENGTH(cover_base64)) as min_size_bytes,
-                    MAX(LENGTH(cover_base64)) as max_size_bytes
-                FROM books 
-                WHERE cover_base64 IS NOT NULL
+                    SUM(cover_size) as total_size_bytes,
+                    AVG(cover_size) as avg_size_bytes,
+                    MIN(cover_size) as min_size_bytes,
+                    MAX(cover_size) as max_size_bytes
+                FROM (
+                    SELECT COALESCE(blobs.size_bytes, LENGTH(books.cover_base64)) as cover_size
+                    FROM books 
+                    LEFT JOIN blobs ON blobs.sha256 = books.cover_sha256
+                    WHERE books.cover_sha256 IS NOT NULL OR books.cover_base64 IS NOT NULL
+                )
             """)
             stats = cursor.fetchone()
             
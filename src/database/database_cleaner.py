@@ -11,7 +11,9 @@ from datetime import datetime
 from rich.console import Console
 from rich.progress import Progress
 
+from src.database.backup_manager import BackupManager
 from src.database.database_manager import get_database_manager
+from src.database.connection_pool import get_connection_pool
 
 console = Console()
 
@@ -25,7 +27,8 @@ class DatabaseCleaner:
     def __init__(self):
         """Initialize the database cleaner."""
         self.db_manager = get_database_manager()
-        self.backup_dir = "database_backups"
+        self.backup_manager = BackupManager(self.db_manager.db_path)
+        self.backup_dir = "database_backups"  # Full-copy backups from older versions
     
     def get_database_info(self) -> Dict[str, Any]:
         """
@@ -40,10 +43,10 @@ class DatabaseCleaner:
             # Get additional details
             with self.db_manager.get_connection() as conn:
                 # Count records by type
-                cursor = conn.execute("SELECT COUNT(*) FROM books WHERE epub_base64 IS NOT NULL")
+                cursor = conn.execute("SELECT COUNT(*) FROM books WHERE epub_sha256 IS NOT NULL OR epub_base64 IS NOT NULL")
                 books_with_epubs = cursor.fetchone()[0]
                 
-                cursor = conn.execute("SELECT COUNT(*) FROM books WHERE cover_base64 IS NOT NULL")
+                cursor = conn.execute("SELECT COUNT(*) FROM books WHERE cover_sha256 IS NOT NULL OR cover_base64 IS NOT NULL")
                 books_with_covers = cursor.fetchone()[0]
                 
                 cursor = conn.execute("SELECT COUNT(*) FROM books WHERE novel_data_json IS NOT NULL")
@@ -72,28 +75,24 @@ class DatabaseCleaner:
             operation_type: Type of operation for backup naming
             
         Returns:
-            Path to backup file or None if failed
+            Path to the backup manifest or None if failed
         """
-        try:
-            # Ensure backup directory exists
-            os.makedirs(self.backup_dir, exist_ok=True)
-            
-            # Create timestamped backup
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"before_{operation_type}_{timestamp}.db"
-            backup_path = os.path.join(self.backup_dir, backup_filename)
-            
-            # Copy database file
-            shutil.copy2(self.db_manager.db_path, backup_path)
-            
-            backup_size = os.path.getsize(backup_path) / (1024 * 1024)
-            console.print(f"[bold green]✓[/bold green] Backup created: [cyan]{backup_path}[/cyan] ({backup_size:.1f} MB)")
-            
-            return backup_path
-            
-        except Exception as e:
-            console.print(f"[bold red]Failed to create backup: {str(e)}[/bold red]")
+        backup = self.backup_manager.create_backup(f"before_{operation_type}")
+        if not backup:
+            console.print("[bold red]Failed to create backup[/bold red]")
             return None
+        
+        backup_size = backup["size_bytes"] / (1024 * 1024)
+        new_size = backup["new_bytes"] / (1024 * 1024)
+        console.print(f"[bold green]✓[/bold green] Backup created: [cyan]{backup['backup_id']}[/cyan] ({backup_size:.1f} MB, {new_size:.1f} MB new)")
+        
+        return backup["path"]
+    
+    def _remove_wal_files(self) -> None:
+        """Remove the WAL and shared-memory files left next to the database file."""
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(self.db_manager.db_path + suffix):
+                os.remove(self.db_manager.db_path + suffix)
     
     def clear_book_metadata_only(self, create_backup: bool = True) -> bool:
         """
@@ -176,13 +175,14 @@ class DatabaseCleaner:
                            SUM(epub_size_bytes) as total_size,
                            SUM(epub_compressed_size) as compressed_size
                     FROM books 
-                    WHERE epub_base64 IS NOT NULL
+                    WHERE epub_sha256 IS NOT NULL OR epub_base64 IS NOT NULL
                 """)
                 stats = cursor.fetchone()
                 
                 # Clear EPUB storage fields
                 conn.execute("""
                     UPDATE books SET 
+                        epub_sha256 = NULL,
                         epub_base64 = NULL,
                         epub_filename = NULL,
                         epub_size_bytes = 0,
@@ -194,6 +194,7 @@ class DatabaseCleaner:
                         updated_date = ?
                 """, (datetime.now().isoformat(),))
                 
+                self.db_manager.blob_store.delete_unreferenced(conn)
                 conn.commit()
             
             if stats and stats[0] > 0:
@@ -234,20 +235,23 @@ class DatabaseCleaner:
                 # Get cover stats before clearing
                 cursor = conn.execute("""
                     SELECT COUNT(*) as count, 
-                           SUM(LENGTH(cover_base64)) as total_size
+                           SUM(COALESCE(blobs.stored_size_bytes, LENGTH(books.cover_base64))) as total_size
                     FROM books 
-                    WHERE cover_base64 IS NOT NULL
+                    LEFT JOIN blobs ON blobs.sha256 = books.cover_sha256
+                    WHERE books.cover_sha256 IS NOT NULL OR books.cover_base64 IS NOT NULL
                 """)
                 stats = cursor.fetchone()
                 
                 # Clear cover storage fields
                 conn.execute("""
                     UPDATE books SET 
+                        cover_sha256 = NULL,
                         cover_base64 = NULL,
                         cover_filename = NULL,
                         updated_date = ?
                 """, (datetime.now().isoformat(),))
                 
+                self.db_manager.blob_store.delete_unreferenced(conn)
                 conn.commit()
             
             if stats and stats[0] > 0:
@@ -288,8 +292,9 @@ class DatabaseCleaner:
             info = self.get_database_info()
             
             with self.db_manager.get_connection() as conn:
-                # Delete all book records
+                # Delete all book records and their covers and EPUBs
                 conn.execute("DELETE FROM books")
+                conn.execute("DELETE FROM blobs")
                 
                 # Reset any auto-increment counters
                 conn.execute("DELETE FROM sqlite_sequence WHERE name='books'")
@@ -340,11 +345,13 @@ class DatabaseCleaner:
                 self.db_manager._db_manager = None  # Reset singleton
             except:
                 pass
+            get_connection_pool().close_connections(self.db_manager.db_path)
             
-            # Delete the database file
+            # Delete the database file and its WAL files
             if os.path.exists(self.db_manager.db_path):
                 os.remove(self.db_manager.db_path)
                 console.print("[bold green]✓[/bold green] Database file deleted")
+            self._remove_wal_files()
             
             # Reinitialize database with fresh schema
             from src.database.database_manager import DatabaseManager
@@ -392,6 +399,7 @@ class DatabaseCleaner:
                 
                 # Delete books of specified genre
                 conn.execute("DELETE FROM books WHERE genre = ?", (genre,))
+                self.db_manager.blob_store.delete_unreferenced(conn)
                 conn.commit()
                 
                 # Get count after deletion
@@ -448,6 +456,7 @@ class DatabaseCleaner:
                     DELETE FROM books 
                     WHERE created_date < ? OR created_date IS NULL
                 """, (cutoff_date,))
+                self.db_manager.blob_store.delete_unreferenced(conn)
                 conn.commit()
                 
                 # Get count after deletion
@@ -467,27 +476,37 @@ class DatabaseCleaner:
         """
         List all available database backups.
         
+        Includes backups in the backup store and full-copy backups left in
+        backup_dir by older versions.
+        
         Returns:
             List of backup information dictionaries
         """
         backups = []
         
         try:
-            if not os.path.exists(self.backup_dir):
-                return backups
-            
-            for filename in os.listdir(self.backup_dir):
-                if filename.endswith('.db'):
-                    backup_path = os.path.join(self.backup_dir, filename)
-                    stat = os.stat(backup_path)
-                    
-                    backups.append({
-                        "filename": filename,
-                        "path": backup_path,
-                        "size_mb": stat.st_size / (1024 * 1024),
-                        "created_date": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        "modified_date": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                    })
+            for backup in self.backup_manager.list_backups():
+                backups.append({
+                    "filename": backup["backup_id"],
+                    "path": backup["path"],
+                    "size_mb": backup["size_bytes"] / (1024 * 1024),
+                    "created_date": backup["created_date"],
+                    "modified_date": backup["created_date"]
+                })
+            
+            if os.path.exists(self.backup_dir):
+                for filename in os.listdir(self.backup_dir):
+                    if filename.endswith('.db'):
+                        backup_path = os.path.join(self.backup_dir, filename)
+                        stat = os.stat(backup_path)
+                        
+                        backups.append({
+                            "filename": filename,
+                            "path": backup_path,
+                            "size_mb": stat.st_size / (1024 * 1024),
+                            "created_date": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                            "modified_date": datetime.fromtimestamp(stat.st_mtime).isoformat()
+                        })
             
             # Sort by creation date (newest first)
             backups.sort(key=lambda x: x["created_date"], reverse=True)
@@ -499,10 +518,10 @@ class DatabaseCleaner:
     
     def restore_from_backup(self, backup_path: str) -> bool:
         """
-        Restore database from a backup file.
+        Restore database from a backup.
         
         Args:
-            backup_path: Path to backup file to restore
+            backup_path: Path to a backup manifest, or to a full-copy backup file
             
         Returns:
             True if successful, False otherwise
@@ -517,8 +536,17 @@ class DatabaseCleaner:
             # Create backup of current database before restore
             current_backup = self.create_backup_before_clear("before_restore")
             
-            # Copy backup file to database location
-            shutil.copy2(backup_path, self.db_manager.db_path)
+            if os.path.dirname(os.path.abspath(backup_path)) == os.path.abspath(self.backup_manager.manifests_dir):
+                # Verified restore through the backup API; open connections stay valid
+                backup_id = os.path.splitext(os.path.basename(backup_path))[0]
+                if not self.backup_manager.restore_from_backup(backup_id):
+                    return False
+            else:
+                # Copy backup file to database location; closing the connections
+                # checkpoints the WAL so no stale log is applied to the restored file
+                get_connection_pool().close_connections(self.db_manager.db_path)
+                self._remove_wal_files()
+                shutil.copy2(backup_path, self.db_manager.db_path)
             
             # Reset database manager to use restored database
             try:
@@ -7,13 +7,72 @@ import sqlite3
 import os
 import json
 import base64
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Iterator, Callable
 from datetime import datetime
 from pathlib import Path
 from rich.console import Console
 
+from src.database.blob_store import BlobStore, BLOBS_TABLE_SQL
+from src.database.book_status import BOOK_STATUS_FLAGS
+from src.database.connection_pool import get_connection_pool
+
 console = Console()
 
+# Columns needed to list, filter and pick books; everything a menu shows
+BOOK_SUMMARY_COLUMNS = (
+    "book_id", "title", "author", "genre", "target_audience", "description",
+    "series_info", "cover_sha256", "cover_filename", "epub_sha256", "epub_filename",
+    "epub_size_bytes", "generation_status", "word_count", "chapter_count",
+    "file_path", "json_path", "epub_path", "storage_mode", "created_date",
+    "updated_date", "last_accessed", "access_count"
+)
+
+# Large columns that summaries leave out and load on first access
+LAZY_BOOK_FIELDS = ("metadata", "novel_data_json", "cover_base64", "epub_base64")
+
+# Projection used by all summary queries; the NULL checks only read the record header
+BOOK_SUMMARY_SELECT = (
+    "SELECT " + ", ".join(BOOK_SUMMARY_COLUMNS) + ", "
+    "(cover_sha256 IS NOT NULL OR cover_base64 IS NOT NULL) AS has_cover, "
+    "(epub_sha256 IS NOT NULL OR epub_base64 IS NOT NULL) AS has_epub "
+    "FROM books"
+)
+
+# Indexed lookup keys; queries must repeat these expressions exactly for the indexes to apply
+AUTHOR_KEY_SQL = "lower(trim(author))"
+SERIES_TITLE_SQL = "(CASE WHEN json_valid(series_info) THEN json_extract(series_info, '$.series_title') END)"
+SERIES_NUMBER_SQL = "(CASE WHEN json_valid(series_info) THEN json_extract(series_info, '$.book_number') END)"
+
+
+def normalize_author(author: Optional[str]) -> str:
+    """Get the lookup key of an author name, matching AUTHOR_KEY_SQL."""
+    return (author or "").strip().lower()
+
+
+class BookSummary(dict):
+    """
+    Book dictionary holding only the summary columns.
+
+    Heavy fields (see LAZY_BOOK_FIELDS) are fetched from the database the first
+    time they are read, so code written for full book rows keeps working.
+    """
+
+    def __init__(self, data: Dict[str, Any], load_field: Callable[[str, str], Any]):
+        super().__init__(data)
+        self._load_field = load_field
+
+    def __missing__(self, key: str) -> Any:
+        if key not in LAZY_BOOK_FIELDS:
+            raise KeyError(key)
+        value = self._load_field(self["book_id"], key)
+        self[key] = value
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self or key in LAZY_BOOK_FIELDS:
+            return self[key]
+        return default
+
 
 class DatabaseManager:
     """
@@ -28,6 +87,7 @@ class DatabaseManager:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
+        self.blob_store = BlobStore(self.get_connection)
         self.ensure_database_directory()
         self.init_database()
 
@@ -38,10 +98,8 @@ class DatabaseManager:
             os.makedirs(db_dir, exist_ok=True)
 
     def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with proper configuration."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
-        return conn
+        """Get this thread's pooled database connection (WAL mode, dict-like rows)."""
+        return get_connection_pool().get_connection(self.db_path)
 
     def init_database(self) -> None:
         """Initialize the database with required tables."""
@@ -59,9 +117,11 @@ class DatabaseManager:
                     target_audience TEXT,
                     description TEXT,
                     series_info TEXT,  -- JSON string for series information
-                    cover_base64 TEXT,  -- Base64 encoded cover image
+                    cover_base64 TEXT,  -- Legacy: Base64 encoded cover image (moved to blobs)
+                    cover_sha256 TEXT,  -- Key of the cover image in the blobs table
                     cover_filename TEXT,  -- Original filename for reference
-                    epub_base64 TEXT,  -- Base64 encoded EPUB file
+                    epub_base64 TEXT,  -- Legacy: Base64 encoded EPUB file (moved to blobs)
+                    epub_sha256 TEXT,  -- Key of the EPUB file in the blobs table
                     epub_filename TEXT,  -- Original EPUB filename
                     epub_size_bytes INTEGER DEFAULT 0,  -- Original EPUB file size
                     epub_compressed_size INTEGER DEFAULT 0,  -- Compressed size in database
@@ -91,6 +151,47 @@ class DatabaseManager:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_books_storage_mode ON books(storage_mode)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_books_last_accessed ON books(last_accessed)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_books_access_count ON books(access_count)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_books_cover_sha256 ON books(cover_sha256)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_books_epub_sha256 ON books(epub_sha256)")
+            # Matches the ORDER BY of summary queries so keyset pages are index range scans
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_books_status_created
+                ON books(generation_status, COALESCE(created_date, ''), book_id)
+            """)
+
+            # Point lookups of an author's books and of a series' books by number
+            conn.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_books_author_key
+                ON books({AUTHOR_KEY_SQL}, generation_status)
+            """)
+            conn.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_books_series_position
+                ON books({SERIES_TITLE_SQL}, {SERIES_NUMBER_SQL})
+            """)
+
+            # Create content-addressed storage for covers and EPUBs
+            conn.execute(BLOBS_TABLE_SQL)
+
+            # Create per-chapter length history used to size chapter requests
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS chapter_generation_stats (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    genre TEXT NOT NULL,  -- Lowercased genre
+                    writer TEXT DEFAULT '',  -- Author / writer profile name
+                    min_words INTEGER NOT NULL,  -- Minimum accepted chapter length
+                    requested_words INTEGER NOT NULL,  -- Length asked for in the prompt
+                    max_tokens INTEGER NOT NULL,  -- Output token budget of the first draft
+                    produced_words INTEGER NOT NULL,  -- Words in the first draft
+                    output_tokens INTEGER NOT NULL,  -- Estimated tokens in the first draft
+                    extended INTEGER DEFAULT 0,  -- 1 if an extension call was needed
+                    final_words INTEGER NOT NULL,
+                    created_date TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_chapter_stats_genre_writer
+                ON chapter_generation_stats(genre, writer, id)
+            """)
 
             # Create database metadata table
             conn.execute("""
@@ -101,10 +202,19 @@ class DatabaseManager:
                 )
             """)
 
-            # Set database version
-            self.set_metadata("version", "1.0")
-            self.set_metadata("schema_version", "2.0")  # Current enhanced schema
-            self.set_metadata("created_date", datetime.now().isoformat())
+            # Record the version of a new database; the tables above are the
+            # current schema. Existing values are kept, since overwriting
+            # schema_version made every start re-run (and back up for) migrations.
+            from src.database.schema_migrator import SchemaMigrator
+            now = datetime.now().isoformat()
+            conn.executemany("""
+                INSERT OR IGNORE INTO database_metadata (key, value, updated_date)
+                VALUES (?, ?, ?)
+            """, [
+                ("version", "1.0", now),
+                ("schema_version", SchemaMigrator(self.db_path).current_version, now),
+                ("created_date", now, now),
+            ])
 
             conn.commit()
 
@@ -146,47 +256,67 @@ class DatabaseManager:
         Returns:
             The book_id of the added book
         """
-        book_id = book_data.get("book_id") or self.generate_book_id(book_data["title"])
+        return self.add_books_bulk([book_data])[0]
 
-        # Prepare series info as JSON
-        series_info = book_data.get("series_info", {})
-        series_info_json = json.dumps(series_info) if series_info else None
+    def add_books_bulk(self, books: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several books to the database in a single transaction.
 
-        # Prepare additional metadata as JSON
-        metadata = book_data.get("metadata", {})
-        metadata_json = json.dumps(metadata) if metadata else None
+        Args:
+            books: List of dictionaries containing book information
+
+        Returns:
+            The book_ids of the added books, in the same order
+        """
+        book_ids = []
+        rows = []
 
         with self.get_connection() as conn:
-            conn.execute("""
+            for book_data in books:
+                book_id = book_data.get("book_id") or self.generate_book_id(book_data["title"])
+                book_ids.append(book_id)
+
+                # Prepare series info and additional metadata as JSON
+                series_info = book_data.get("series_info", {})
+                metadata = book_data.get("metadata", {})
+
+                # Covers are kept in the blob store; the row only references them
+                cover_sha256 = book_data.get("cover_sha256")
+                if book_data.get("cover_base64"):
+                    cover_sha256 = self.blob_store.put(base64.b64decode(book_data["cover_base64"]), conn=conn)
+
+                rows.append((
+                    book_id,
+                    book_data["title"],
+                    book_data.get("author", ""),
+                    book_data.get("genre", ""),
+                    book_data.get("target_audience", ""),
+                    book_data.get("description", ""),
+                    json.dumps(series_info) if series_info else None,
+                    cover_sha256,
+                    book_data.get("cover_filename"),
+                    book_data.get("generation_status", "planned"),
+                    book_data.get("word_count", 0),
+                    book_data.get("chapter_count", 0),
+                    book_data.get("file_path", ""),
+                    book_data.get("json_path", ""),
+                    book_data.get("epub_path", ""),
+                    book_data.get("created_date", datetime.now().isoformat()),
+                    datetime.now().isoformat(),
+                    json.dumps(metadata) if metadata else None
+                ))
+
+            conn.executemany("""
                 INSERT OR REPLACE INTO books (
                     book_id, title, author, genre, target_audience, description,
-                    series_info, cover_base64, cover_filename, generation_status,
+                    series_info, cover_sha256, cover_filename, generation_status,
                     word_count, chapter_count, file_path, json_path, epub_path,
                     created_date, updated_date, metadata
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                book_id,
-                book_data["title"],
-                book_data.get("author", ""),
-                book_data.get("genre", ""),
-                book_data.get("target_audience", ""),
-                book_data.get("description", ""),
-                series_info_json,
-                book_data.get("cover_base64"),
-                book_data.get("cover_filename"),
-                book_data.get("generation_status", "planned"),
-                book_data.get("word_count", 0),
-                book_data.get("chapter_count", 0),
-                book_data.get("file_path", ""),
-                book_data.get("json_path", ""),
-                book_data.get("epub_path", ""),
-                book_data.get("created_date", datetime.now().isoformat()),
-                datetime.now().isoformat(),
-                metadata_json
-            ))
+            """, rows)
             conn.commit()
 
-        return book_id
+        return book_ids
 
     def get_book(self, book_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -206,6 +336,45 @@ class DatabaseManager:
                 return self._row_to_dict(row)
             return None
 
+    def get_book_summary(self, book_id: str) -> Optional[BookSummary]:
+        """
+        Get a single book's summary without loading its large columns.
+
+        Args:
+            book_id: The book ID to retrieve
+
+        Returns:
+            BookSummary with has_cover and has_epub flags, or None if not found
+        """
+        with self.get_connection() as conn:
+            row = conn.execute(BOOK_SUMMARY_SELECT + " WHERE book_id = ?", (book_id,)).fetchone()
+        return self._row_to_summary(row) if row else None
+
+    def get_book_summaries_by_id(self, book_ids: List[str]) -> Dict[str, BookSummary]:
+        """
+        Get summaries for many books with a few IN queries.
+
+        Args:
+            book_ids: Book IDs to retrieve
+
+        Returns:
+            Dictionary mapping book_id to BookSummary (missing books are left out)
+        """
+        summaries = {}
+        unique_ids = list(dict.fromkeys(book_ids))
+
+        with self.get_connection() as conn:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(unique_ids), 500):
+                batch = unique_ids[start:start + 500]
+                rows = conn.execute(
+                    BOOK_SUMMARY_SELECT + f" WHERE book_id IN ({', '.join('?' for _ in batch)})", batch
+                ).fetchall()
+                for row in rows:
+                    summaries[row["book_id"]] = self._row_to_summary(row)
+
+        return summaries
+
     def get_books(self, genre: Optional[str] = None, status: Optional[str] = None,
                   limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
         """
@@ -243,13 +412,288 @@ class DatabaseManager:
 
             return [self._row_to_dict(row) for row in rows]
 
-    def update_book(self, book_id: str, updates: Dict[str, Any]) -> bool:
+    def get_book_summaries(self, genres: Optional[List[str]] = None, status: Optional[str] = None,
+                           limit: Optional[int] = None,
+                           after: Optional[Tuple[str, str]] = None) -> List[BookSummary]:
+        """
+        Get lightweight book summaries, newest first, without loading large columns.
+
+        Pages are fetched by keyset rather than OFFSET: pass the cursor of the last
+        summary of a page (see summary_cursor) as after to get the next page.
+
+        Args:
+            genres: Only include books from these genres
+            status: Filter by generation status
+            limit: Maximum number of summaries to return
+            after: (created_date, book_id) cursor to continue after
+
+        Returns:
+            List of BookSummary dictionaries with has_cover and has_epub flags
+        """
+        query = BOOK_SUMMARY_SELECT + " WHERE 1=1"
+        params = []
+
+        if genres:
+            query += f" AND genre IN ({', '.join('?' for _ in genres)})"
+            params.extend(genres)
+
+        if status:
+            query += " AND generation_status = ?"
+            params.append(status)
+
+        if after:
+            query += """ AND (COALESCE(created_date, '') < ?
+                         OR (COALESCE(created_date, '') = ? AND book_id < ?))"""
+            params.extend([after[0] or "", after[0] or "", after[1]])
+
+        query += " ORDER BY COALESCE(created_date, '') DESC, book_id DESC"
+
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self.get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [self._row_to_summary(row) for row in rows]
+
+    def iter_book_summaries(self, genres: Optional[List[str]] = None, status: Optional[str] = None,
+                            page_size: int = 200) -> Iterator[BookSummary]:
+        """
+        Iterate over all matching book summaries one page at a time.
+
+        Args:
+            genres: Only include books from these genres
+            status: Filter by generation status
+            page_size: Number of summaries fetched per query
+
+        Yields:
+            BookSummary dictionaries, newest first
+        """
+        after = None
+        while True:
+            page = self.get_book_summaries(genres=genres, status=status, limit=page_size, after=after)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = self.summary_cursor(page[-1])
+
+    @staticmethod
+    def summary_cursor(summary: Dict[str, Any]) -> Tuple[str, str]:
+        """Get the keyset cursor that continues after the given summary."""
+        return (summary.get("created_date") or "", summary["book_id"])
+
+    def get_books_by_author(self, author: str, status: Optional[str] = "completed") -> List[BookSummary]:
+        """
+        Get summaries of an author's books with an index lookup.
+
+        Authors match after trimming and ignoring case (see normalize_author).
+
+        Args:
+            author: Author name
+            status: Filter by generation status (None for any status)
+
+        Returns:
+            List of BookSummary dictionaries, newest first
+        """
+        author_key = normalize_author(author)
+        if not author_key:
+            return []
+
+        query = BOOK_SUMMARY_SELECT + f" WHERE {AUTHOR_KEY_SQL} = ?"
+        params = [author_key]
+
+        if status:
+            query += " AND generation_status = ?"
+            params.append(status)
+
+        query += " ORDER BY created_date DESC"
+
+        with self.get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [self._row_to_summary(row) for row in rows]
+
+    def get_series_books(self, series_title: str, max_book_number: Optional[int] = None,
+                         status: Optional[str] = "completed") -> List[BookSummary]:
+        """
+        Get summaries of the books of a series with an index lookup.
+
+        Args:
+            series_title: Series title as stored in series_info
+            max_book_number: Only include books numbered up to this
+            status: Filter by generation status (None for any status)
+
+        Returns:
+            List of BookSummary dictionaries ordered by book number, newest
+            first among books sharing a number
+        """
+        query = BOOK_SUMMARY_SELECT + f" WHERE {SERIES_TITLE_SQL} = ?"
+        params = [series_title]
+
+        if max_book_number is not None:
+            query += f" AND {SERIES_NUMBER_SQL} <= ?"
+            params.append(max_book_number)
+
+        if status:
+            query += " AND generation_status = ?"
+            params.append(status)
+
+        query += f" ORDER BY {SERIES_NUMBER_SQL}, created_date DESC"
+
+        with self.get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [self._row_to_summary(row) for row in rows]
+
+    def get_book_field(self, book_id: str, field: str) -> Any:
+        """
+        Load a single large column of a book.
+
+        Args:
+            book_id: The book ID
+            field: One of LAZY_BOOK_FIELDS
+
+        Returns:
+            The field value (metadata is parsed from JSON), or None if missing
+        """
+        if field not in LAZY_BOOK_FIELDS:
+            raise ValueError(f"Not a lazily loaded book field: {field}")
+
+        with self.get_connection() as conn:
+            row = conn.execute(f"SELECT {field} FROM books WHERE book_id = ?", (book_id,)).fetchone()
+
+        if not row or row[field] is None:
+            return None
+
+        if field == "metadata":
+            try:
+                return json.loads(row[field])
+            except json.JSONDecodeError:
+                return {}
+        return row[field]
+
+    def count_books(self, genres: Optional[List[str]] = None, status: Optional[str] = None) -> int:
+        """
+        Count books with optional filtering.
+
+        Args:
+            genres: Only count books from these genres
+            status: Filter by generation status
+
+        Returns:
+            Number of matching books
+        """
+        query = "SELECT COUNT(*) FROM books WHERE 1=1"
+        params = []
+
+        if genres:
+            query += f" AND genre IN ({', '.join('?' for _ in genres)})"
+            params.extend(genres)
+
+        if status:
+            query += " AND generation_status = ?"
+            params.append(status)
+
+        with self.get_connection() as conn:
+            return conn.execute(query, params).fetchone()[0]
+
+    def get_genre_counts(self, status: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count books per genre.
+
+        Args:
+            status: Only count books with this generation status
+
+        Returns:
+            Dictionary mapping genres to book counts
+        """
+        query = "SELECT COALESCE(genre, 'Unknown') AS genre, COUNT(*) AS count FROM books"
+        params = []
+
+        if status:
+            query += " WHERE generation_status = ?"
+            params.append(status)
+
+        query += " GROUP BY 1"
+
+        with self.get_connection() as conn:
+            return {row["genre"]: row["count"] for row in conn.execute(query, params).fetchall()}
+
+    def get_completion_status(self, status: Optional[str] = None,
+                              missing: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get the completion flags of every book in one query on the book_status table.
+
+        Args:
+            status: Filter by generation status
+            missing: Only include books lacking at least one of these flags
+                (see BOOK_STATUS_FLAGS)
+
+        Returns:
+            List of dictionaries with book_id, title, genre, generation_status,
+            created_date and boolean has_cover, has_epub, description_enhanced and
+            back_cover_generated flags, newest first
+        """
+        query = "SELECT * FROM book_status WHERE 1=1"
+        params = []
+
+        if status:
+            query += " AND generation_status = ?"
+            params.append(status)
+
+        if missing:
+            unknown = set(missing) - set(BOOK_STATUS_FLAGS)
+            if unknown:
+                raise ValueError(f"Unknown completion flags: {', '.join(sorted(unknown))}")
+            query += " AND (" + " OR ".join(f"{flag} = 0" for flag in missing) + ")"
+
+        query += " ORDER BY COALESCE(created_date, '') DESC, book_id DESC"
+
+        with self.get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        statuses = []
+        for row in rows:
+            book_status = dict(row)
+            for flag in BOOK_STATUS_FLAGS:
+                book_status[flag] = bool(book_status[flag])
+            statuses.append(book_status)
+        return statuses
+
+    def get_completion_counts(self, status: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count books with each completion flag in a single aggregate query.
+
+        Args:
+            status: Only count books with this generation status
+
+        Returns:
+            Dictionary with total_books, a count per flag (see BOOK_STATUS_FLAGS)
+            and complete_books, the number of books having every flag
+        """
+        query = ("SELECT COUNT(*) AS total_books, "
+                 + ", ".join(f"COALESCE(SUM({flag}), 0) AS {flag}" for flag in BOOK_STATUS_FLAGS)
+                 + ", COALESCE(SUM(" + " AND ".join(BOOK_STATUS_FLAGS) + "), 0) AS complete_books"
+                 + " FROM book_status")
+        params = []
+
+        if status:
+            query += " WHERE generation_status = ?"
+            params.append(status)
+
+        with self.get_connection() as conn:
+            return dict(conn.execute(query, params).fetchone())
+
+    def update_book(self, book_id: str, updates: Dict[str, Any],
+                    conn: Optional[sqlite3.Connection] = None) -> bool:
         """
         Update a book's information.
 
         Args:
             book_id: The book ID to update
             updates: Dictionary of fields to update
+            conn: Connection to write through (the caller commits); a new transaction is used if None
 
         Returns:
             True if update was successful, False otherwise
@@ -257,25 +701,62 @@ class DatabaseManager:
         if not updates:
             return False
 
-        # Handle special JSON fields
-        if "series_info" in updates and isinstance(updates["series_info"], dict):
-            updates["series_info"] = json.dumps(updates["series_info"])
+        return self.update_books_bulk({book_id: updates}, conn) > 0
 
-        if "metadata" in updates and isinstance(updates["metadata"], dict):
-            updates["metadata"] = json.dumps(updates["metadata"])
+    def update_books_bulk(self, updates: Dict[str, Dict[str, Any]],
+                          conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Update several books in a single transaction.
 
-        # Add updated_date
-        updates["updated_date"] = datetime.now().isoformat()
+        Books updating the same set of fields share one prepared statement.
 
-        # Build update query
-        set_clause = ", ".join([f"{key} = ?" for key in updates.keys()])
-        query = f"UPDATE books SET {set_clause} WHERE book_id = ?"
-        params = list(updates.values()) + [book_id]
+        Args:
+            updates: Dictionary mapping book IDs to dictionaries of fields to update
+            conn: Connection to write through (the caller commits); a new transaction is used if None
 
-        with self.get_connection() as conn:
-            cursor = conn.execute(query, params)
-            conn.commit()
-            return cursor.rowcount > 0
+        Returns:
+            Number of books updated
+        """
+        statements: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        updated_date = datetime.now().isoformat()
+
+        for book_id, fields in updates.items():
+            if not fields:
+                continue
+
+            fields = dict(fields)
+
+            # Handle special JSON fields
+            if "series_info" in fields and isinstance(fields["series_info"], dict):
+                fields["series_info"] = json.dumps(fields["series_info"])
+
+            if "metadata" in fields and isinstance(fields["metadata"], dict):
+                fields["metadata"] = json.dumps(fields["metadata"])
+
+            # Add updated_date
+            fields["updated_date"] = updated_date
+
+            columns = tuple(fields.keys())
+            statements.setdefault(columns, []).append(list(fields.values()) + [book_id])
+
+        if not statements:
+            return 0
+
+        def execute(connection: sqlite3.Connection) -> int:
+            updated = 0
+            for columns, params in statements.items():
+                set_clause = ", ".join([f"{key} = ?" for key in columns])
+                cursor = connection.executemany(f"UPDATE books SET {set_clause} WHERE book_id = ?", params)
+                updated += cursor.rowcount
+            return updated
+
+        if conn is not None:
+            return execute(conn)
+
+        with self.get_connection() as connection:
+            updated = execute(connection)
+            connection.commit()
+        return updated
 
     def update_book_descriptions(self, book_id: str, descriptions: Dict[str, str]) -> bool:
         """
@@ -332,38 +813,58 @@ class DatabaseManager:
 
         return self.update_book(book_id, updates)
 
-    def get_books_needing_descriptions(self) -> list:
+    def get_books_needing_descriptions(self, limit: Optional[int] = None) -> list:
         """
         Get books that need description generation.
 
+        Args:
+            limit: Maximum number of books to return
+
         Returns:
             List of books that need descriptions generated
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM books
-                WHERE generation_status = 'completed'
-                AND (description_enhanced IS NULL OR description_enhanced = 0)
-                ORDER BY created_date DESC
-            """)
-            rows = cursor.fetchall()
-            return [self._row_to_dict(row) for row in rows]
+        return self._get_completed_books_missing("description_enhanced", limit)
 
-    def get_books_needing_back_covers(self) -> list:
+    def get_books_needing_back_covers(self, limit: Optional[int] = None) -> list:
         """
         Get books that need back cover generation.
 
+        Args:
+            limit: Maximum number of books to return
+
         Returns:
             List of books that need back covers generated
         """
+        return self._get_completed_books_missing("back_cover_generated", limit)
+
+    def _get_completed_books_missing(self, flag: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get full rows of completed books lacking a completion flag, newest first.
+
+        The books are picked on the book_status index, so only the returned rows
+        are read from the books table.
+
+        Args:
+            flag: Completion flag (see BOOK_STATUS_FLAGS)
+            limit: Maximum number of books to return
+
+        Returns:
+            List of book dictionaries
+        """
+        query = f"""
+            SELECT books.* FROM book_status
+            JOIN books ON books.book_id = book_status.book_id
+            WHERE book_status.generation_status = 'completed' AND book_status.{flag} = 0
+            ORDER BY book_status.created_date DESC
+        """
+        params = []
+
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM books
-                WHERE generation_status = 'completed'
-                AND (back_cover_generated IS NULL OR back_cover_generated = 0)
-                ORDER BY created_date DESC
-            """)
-            rows = cursor.fetchall()
+            rows = conn.execute(query, params).fetchall()
             return [self._row_to_dict(row) for row in rows]
 
     def delete_book(self, book_id: str) -> bool:
@@ -377,7 +878,12 @@ class DatabaseManager:
             True if deletion was successful, False otherwise
         """
         with self.get_connection() as conn:
+            row = conn.execute("SELECT cover_sha256, epub_sha256 FROM books WHERE book_id = ?", (book_id,)).fetchone()
             cursor = conn.execute("DELETE FROM books WHERE book_id = ?", (book_id,))
+            if row:
+                # Drop the book's blobs unless another book shares them
+                self.blob_store.delete_if_unreferenced(row["cover_sha256"], conn)
+                self.blob_store.delete_if_unreferenced(row["epub_sha256"], conn)
             conn.commit()
             return cursor.rowcount > 0
 
@@ -427,6 +933,106 @@ class DatabaseManager:
 
         return data
 
+    def _row_to_summary(self, row: sqlite3.Row) -> BookSummary:
+        """
+        Convert a summary row to a BookSummary.
+
+        Args:
+            row: SQLite row selected with BOOK_SUMMARY_SELECT
+
+        Returns:
+            BookSummary with parsed series info and boolean asset flags
+        """
+        data = dict(row)
+
+        if data.get("series_info"):
+            try:
+                data["series_info"] = json.loads(data["series_info"])
+            except json.JSONDecodeError:
+                data["series_info"] = {}
+
+        data["has_cover"] = bool(data.get("has_cover"))
+        data["has_epub"] = bool(data.get("has_epub"))
+
+        return BookSummary(data, self.get_book_field)
+
+    def record_chapter_generation(self, stats: Dict[str, Any]) -> None:
+        """
+        Record the requested and produced length of a drafted chapter.
+
+        Args:
+            stats: Dictionary with genre, writer, min_words, requested_words, max_tokens,
+                   produced_words, output_tokens, extended and final_words
+        """
+        with self.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO chapter_generation_stats (
+                    genre, writer, min_words, requested_words, max_tokens, produced_words,
+                    output_tokens, extended, final_words, created_date
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                stats["genre"].lower(),
+                stats.get("writer") or "",
+                stats["min_words"],
+                stats["requested_words"],
+                stats["max_tokens"],
+                stats["produced_words"],
+                stats["output_tokens"],
+                1 if stats.get("extended") else 0,
+                stats["final_words"],
+                datetime.now().isoformat()
+            ))
+            conn.commit()
+
+    def get_chapter_generation_history(self, genre: str, writer: Optional[str] = None,
+                                       limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        Get the most recent chapter length records for a genre.
+
+        Args:
+            genre: Genre to look up
+            writer: Only return records for this writer (None for all writers)
+            limit: Maximum number of records
+
+        Returns:
+            List of records, newest first
+        """
+        query = "SELECT * FROM chapter_generation_stats WHERE genre = ?"
+        params: List[Any] = [genre.lower()]
+        if writer is not None:
+            query += " AND writer = ?"
+            params.append(writer)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+
+        with self.get_connection() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+    def get_chapter_extension_rates(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get how often drafted chapters needed an extension call, per genre.
+
+        Returns:
+            Dictionary mapping genre to chapter count, extension count and rate
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT genre, COUNT(*) as chapters, SUM(extended) as extensions,
+                       AVG(CAST(produced_words AS REAL) / requested_words) as avg_length_ratio
+                FROM chapter_generation_stats
+                GROUP BY genre
+                ORDER BY genre
+            """)
+            return {
+                row["genre"]: {
+                    "chapters": row["chapters"],
+                    "extensions": row["extensions"] or 0,
+                    "extension_rate": round((row["extensions"] or 0) / row["chapters"], 3),
+                    "avg_length_ratio": round(row["avg_length_ratio"] or 0.0, 3)
+                }
+                for row in cursor.fetchall()
+            }
+
     def get_database_stats(self) -> Dict[str, Any]:
         """
         Get database statistics.
@@ -460,22 +1066,24 @@ class DatabaseManager:
             # Storage usage (covers)
             cursor = conn.execute("""
                 SELECT COUNT(*) as covers_count,
-                       SUM(LENGTH(cover_base64)) as total_cover_size
+                       SUM(COALESCE(blobs.stored_size_bytes, LENGTH(books.cover_base64))) as total_cover_size
                 FROM books
-                WHERE cover_base64 IS NOT NULL
+                LEFT JOIN blobs ON blobs.sha256 = books.cover_sha256
+                WHERE books.cover_sha256 IS NOT NULL OR books.cover_base64 IS NOT NULL
             """)
             cover_stats = cursor.fetchone()
 
             # Storage usage (EPUBs)
             cursor = conn.execute("""
                 SELECT COUNT(*) as epubs_count,
-                       SUM(LENGTH(epub_base64)) as total_epub_size,
+                       SUM(COALESCE(blobs.stored_size_bytes, LENGTH(books.epub_base64))) as total_epub_size,
                        SUM(epub_size_bytes) as total_original_size,
                        AVG(compression_ratio) as avg_compression_ratio,
                        COUNT(CASE WHEN storage_mode = 'database' THEN 1 END) as database_stored,
                        COUNT(CASE WHEN storage_mode = 'filesystem' THEN 1 END) as filesystem_stored
                 FROM books
-                WHERE epub_base64 IS NOT NULL
+                LEFT JOIN blobs ON blobs.sha256 = books.epub_sha256
+                WHERE books.epub_sha256 IS NOT NULL OR books.epub_base64 IS NOT NULL
             """)
             epub_stats = cursor.fetchone()
 
@@ -506,6 +1114,7 @@ class DatabaseManager:
                 "avg_access_count": access_stats["avg_access_count"] or 0,
                 "max_access_count": access_stats["max_access_count"] or 0,
                 "accessed_books_count": access_stats["accessed_books"] or 0,
+                "blob_store": self.blob_store.get_stats(),
                 "database_size_bytes": db_size,
                 "database_path": self.db_path
             }
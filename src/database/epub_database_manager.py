@@ -1,23 +1,42 @@
 """
 EPUB database manager for storing and retrieving complete EPUB files.
 Handles compression, validation, and on-demand extraction.
+
+EPUBs are stored gzip-compressed in the content-addressed blob store, keyed by
+their SHA-256 checksum; book rows only reference them.
 """
 
 import os
 import base64
-import gzip
+import binascii
 import hashlib
+import json
+import sqlite3
 import tempfile
-import shutil
-from typing import Dict, Any, Optional, List, Tuple
+import zlib
+from typing import Dict, Any, Optional, List, Tuple, Iterator, Iterable
 from datetime import datetime
 from rich.console import Console
 
-from src.database.database_manager import get_database_manager
+from src.database.blob_store import read_column_chunks, gunzip_chunks
+from src.database.database_manager import get_database_manager, BOOK_SUMMARY_SELECT
 
 console = Console()
 
 
+def _b64decode_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decode a base64 stream chunk by chunk, carrying partial 4-character groups over."""
+    pending = b""
+    for chunk in chunks:
+        pending += chunk.replace(b"\n", b"").replace(b"\r", b"")
+        usable = len(pending) - len(pending) % 4
+        if usable:
+            yield base64.b64decode(pending[:usable])
+            pending = pending[usable:]
+    if pending:
+        raise binascii.Error("Incomplete base64 data")
+
+
 class EpubDatabaseManager:
     """
     Manages complete EPUB files stored in the database.
@@ -27,6 +46,7 @@ class EpubDatabaseManager:
     def __init__(self):
         """Initialize the EPUB database manager."""
         self.db_manager = get_database_manager()
+        self.blob_store = self.db_manager.blob_store
         self.temp_dir = tempfile.gettempdir()
         self.max_epub_size = 50 * 1024 * 1024  # 50MB limit for safety
     
@@ -62,44 +82,43 @@ class EpubDatabaseManager:
                 console.print(f"[bold red]Invalid EPUB file: {epub_path}[/bold red]")
                 return False
             
-            # Compress the EPUB data
-            compressed_data = gzip.compress(epub_data)
-            compression_ratio = len(compressed_data) / len(epub_data)
-            
-            # Generate checksum for integrity
-            checksum = hashlib.sha256(epub_data).hexdigest()
-            
-            # Convert to base64 for database storage
-            epub_base64 = base64.b64encode(compressed_data).decode('utf-8')
-            
             # Prepare novel data JSON
             novel_data_json = None
             if novel_data:
-                import json
                 novel_data_json = json.dumps(novel_data)
             
             # Get filename
             epub_filename = os.path.basename(epub_path)
             
-            # Update book record
-            updates = {
-                "epub_base64": epub_base64,
-                "epub_filename": epub_filename,
-                "epub_size_bytes": file_size,
-                "epub_compressed_size": len(compressed_data),
-                "compression_ratio": compression_ratio,
-                "checksum": checksum,
-                "storage_mode": "database"
-            }
-            
-            if novel_data_json:
-                updates["novel_data_json"] = novel_data_json
-            
-            success = self.db_manager.update_book(book_id, updates)
+            with self.db_manager.get_connection() as conn:
+                # Store the compressed EPUB once under its checksum
+                checksum = self.blob_store.put(epub_data, compress=True, conn=conn)
+                compressed_size = conn.execute(
+                    "SELECT stored_size_bytes FROM blobs WHERE sha256 = ?", (checksum,)
+                ).fetchone()["stored_size_bytes"]
+                compression_ratio = compressed_size / len(epub_data)
+                
+                # Update book record
+                updates = {
+                    "epub_sha256": checksum,
+                    "epub_base64": None,
+                    "epub_filename": epub_filename,
+                    "epub_size_bytes": file_size,
+                    "epub_compressed_size": compressed_size,
+                    "compression_ratio": compression_ratio,
+                    "checksum": checksum,
+                    "storage_mode": "database"
+                }
+                
+                if novel_data_json:
+                    updates["novel_data_json"] = novel_data_json
+                
+                success = self._replace_epub_reference(conn, book_id, updates)
+                conn.commit()
             
             if success:
                 console.print(f"[bold green]✓[/bold green] EPUB stored in database: {epub_filename}")
-                console.print(f"[dim]Original: {file_size / 1024:.1f}KB, Compressed: {len(compressed_data) / 1024:.1f}KB ({compression_ratio:.1%} ratio)[/dim]")
+                console.print(f"[dim]Original: {file_size / 1024:.1f}KB, Compressed: {compressed_size / 1024:.1f}KB ({compression_ratio:.1%} ratio)[/dim]")
                 return True
             else:
                 console.print(f"[bold red]Failed to update book record: {book_id}[/bold red]")
@@ -113,6 +132,10 @@ class EpubDatabaseManager:
         """
         Extract an EPUB from the database and save it as a file.
         
+        The EPUB is streamed to a temporary file next to output_path one chunk
+        at a time, hashed as it is written, and only moved into place once the
+        checksum matches, so a corrupt EPUB never replaces an existing file.
+        
         Args:
             book_id: The book ID to get the EPUB for
             output_path: Path where to save the EPUB file
@@ -120,29 +143,31 @@ class EpubDatabaseManager:
         Returns:
             True if successful, False otherwise
         """
+        temp_path = f"{output_path}.part"
         try:
-            # Get book data
-            book_data = self.db_manager.get_book(book_id)
-            if not book_data or not book_data.get("epub_base64"):
+            stream = self._open_epub_stream(book_id)
+            if stream is None:
                 return False
+            chunks, expected_checksum = stream
             
-            # Decode and decompress EPUB data
-            compressed_data = base64.b64decode(book_data["epub_base64"])
-            epub_data = gzip.decompress(compressed_data)
+            # Ensure output directory exists
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
             
-            # Verify integrity if checksum exists
-            if book_data.get("checksum"):
-                calculated_checksum = hashlib.sha256(epub_data).hexdigest()
-                if calculated_checksum != book_data["checksum"]:
-                    console.print(f"[bold red]EPUB integrity check failed for book: {book_id}[/bold red]")
-                    return False
+            digest = hashlib.sha256()
+            with open(temp_path, 'wb') as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
             
-            # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            # Verify integrity if checksum exists
+            if expected_checksum and digest.hexdigest() != expected_checksum:
+                console.print(f"[bold red]EPUB integrity check failed for book: {book_id}[/bold red]")
+                os.remove(temp_path)
+                return False
             
-            # Write EPUB file
-            with open(output_path, 'wb') as f:
-                f.write(epub_data)
+            os.replace(temp_path, output_path)
             
             # Update access statistics
             self._update_access_stats(book_id)
@@ -151,8 +176,76 @@ class EpubDatabaseManager:
             
         except Exception as e:
             console.print(f"[bold red]Error extracting EPUB: {str(e)}[/bold red]")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             return False
     
+    def get_epub_data(self, book_id: str) -> Optional[bytes]:
+        """
+        Get the raw bytes of a book's EPUB, verified against its checksum.
+        
+        Prefer get_epub_as_file for writing to disk; it never holds the whole EPUB.
+        
+        Args:
+            book_id: The book ID to get the EPUB for
+            
+        Returns:
+            EPUB bytes or None if not found or corrupt
+        """
+        stream = self._open_epub_stream(book_id)
+        if stream is None:
+            return None
+        chunks, expected_checksum = stream
+        
+        try:
+            epub_data = b"".join(chunks)
+        except (zlib.error, binascii.Error) as e:
+            console.print(f"[bold red]Error reading EPUB for book {book_id}: {str(e)}[/bold red]")
+            return None
+        
+        # Verify integrity if checksum exists
+        if expected_checksum and hashlib.sha256(epub_data).hexdigest() != expected_checksum:
+            console.print(f"[bold red]EPUB integrity check failed for book: {book_id}[/bold red]")
+            return None
+        
+        return epub_data
+    
+    def _open_epub_stream(self, book_id: str) -> Optional[Tuple[Iterator[bytes], Optional[str]]]:
+        """
+        Open a chunked stream over a book's EPUB content.
+        
+        Args:
+            book_id: The book ID to get the EPUB for
+            
+        Returns:
+            Tuple of (iterator over uncompressed chunks, expected SHA-256), or None
+            if the book has no EPUB
+        """
+        with self.db_manager.get_connection() as conn:
+            row = conn.execute("""
+                SELECT rowid, epub_sha256, epub_base64 IS NOT NULL AS has_legacy_epub, checksum
+                FROM books WHERE book_id = ?
+            """, (book_id,)).fetchone()
+        
+        if not row:
+            return None
+        
+        # Blob keys are content checksums, so they verify the content too
+        expected_checksum = row["checksum"] or row["epub_sha256"]
+        
+        if row["epub_sha256"]:
+            chunks = self.blob_store.iter_content(row["epub_sha256"])
+            if chunks is None:
+                return None
+        elif row["has_legacy_epub"]:
+            # Row not migrated to the blob store yet
+            encoded = read_column_chunks(self.db_manager.get_connection(), "books", "epub_base64", row["rowid"])
+            chunks = gunzip_chunks(_b64decode_chunks(encoded))
+        else:
+            return None
+        
+        return chunks, expected_checksum
+    
     def get_epub_as_temp_file(self, book_id: str) -> Optional[str]:
         """
         Extract an EPUB to a temporary file and return the path.
@@ -165,12 +258,12 @@ class EpubDatabaseManager:
         """
         try:
             # Get book data for filename
-            book_data = self.db_manager.get_book(book_id)
+            book_data = self.db_manager.get_book_summary(book_id)
             if not book_data:
                 return None
             
             # Create temporary file with proper extension
-            epub_filename = book_data.get("epub_filename", f"{book_id}.epub")
+            epub_filename = book_data.get("epub_filename") or f"{book_id}.epub"
             temp_path = os.path.join(self.temp_dir, f"temp_{book_id}_{epub_filename}")
             
             if self.get_epub_as_file(book_id, temp_path):
@@ -192,8 +285,12 @@ class EpubDatabaseManager:
         Returns:
             True if EPUB exists, False otherwise
         """
-        book_data = self.db_manager.get_book(book_id)
-        return book_data is not None and book_data.get("epub_base64") is not None
+        with self.db_manager.get_connection() as conn:
+            row = conn.execute("""
+                SELECT 1 FROM books
+                WHERE book_id = ? AND (epub_sha256 IS NOT NULL OR epub_base64 IS NOT NULL)
+            """, (book_id,)).fetchone()
+        return row is not None
     
     def remove_epub(self, book_id: str) -> bool:
         """
@@ -205,15 +302,37 @@ class EpubDatabaseManager:
         Returns:
             True if successful, False otherwise
         """
-        return self.db_manager.update_book(book_id, {
-            "epub_base64": None,
-            "epub_filename": None,
-            "epub_size_bytes": 0,
-            "epub_compressed_size": 0,
-            "compression_ratio": 1.0,
-            "checksum": None,
-            "storage_mode": "filesystem"
-        })
+        with self.db_manager.get_connection() as conn:
+            success = self._replace_epub_reference(conn, book_id, {
+                "epub_sha256": None,
+                "epub_base64": None,
+                "epub_filename": None,
+                "epub_size_bytes": 0,
+                "epub_compressed_size": 0,
+                "compression_ratio": 1.0,
+                "checksum": None,
+                "storage_mode": "filesystem"
+            })
+            conn.commit()
+        return success
+    
+    def _replace_epub_reference(self, conn: sqlite3.Connection, book_id: str, updates: Dict[str, Any]) -> bool:
+        """
+        Point a book at a new EPUB (or none) and drop the previous one if no other book shares it.
+        
+        Args:
+            conn: Connection to write through (the caller commits)
+            book_id: The book ID to update
+            updates: Book fields to update, including epub_sha256
+            
+        Returns:
+            True if the book was updated
+        """
+        row = conn.execute("SELECT epub_sha256 FROM books WHERE book_id = ?", (book_id,)).fetchone()
+        success = self.db_manager.update_book(book_id, updates, conn=conn)
+        if row and row["epub_sha256"] != updates["epub_sha256"]:
+            self.blob_store.delete_if_unreferenced(row["epub_sha256"], conn)
+        return success
     
     def get_novel_data(self, book_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -225,11 +344,10 @@ class EpubDatabaseManager:
         Returns:
             Novel data dictionary or None if not found
         """
-        book_data = self.db_manager.get_book(book_id)
-        if book_data and book_data.get("novel_data_json"):
+        novel_data_json = self.db_manager.get_book_field(book_id, "novel_data_json")
+        if novel_data_json:
             try:
-                import json
-                return json.loads(book_data["novel_data_json"])
+                return json.loads(novel_data_json)
             except json.JSONDecodeError:
                 console.print(f"[yellow]Warning: Invalid novel data JSON for book: {book_id}[/yellow]")
         return None
@@ -239,17 +357,16 @@ class EpubDatabaseManager:
         Get all books that have EPUBs stored in the database.
         
         Returns:
-            List of book dictionaries with EPUBs
+            List of book summaries with EPUBs
         """
         with self.db_manager.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM books 
-                WHERE epub_base64 IS NOT NULL 
+            cursor = conn.execute(BOOK_SUMMARY_SELECT + """
+                WHERE epub_sha256 IS NOT NULL OR epub_base64 IS NOT NULL 
                 ORDER BY last_accessed DESC, updated_date DESC
             """)
             rows = cursor.fetchall()
             
-            return [self.db_manager._row_to_dict(row) for row in rows]
+            return [self.db_manager._row_to_summary(row) for row in rows]
     
     def get_epub_stats(self) -> Dict[str, Any]:
         """
@@ -270,7 +387,7 @@ class EpubDatabaseManager:
                     SUM(access_count) as total_accesses,
                     AVG(access_count) as avg_accesses
                 FROM books 
-                WHERE epub_base64 IS NOT NULL
+                WHERE epub_sha256 IS NOT NULL OR epub_base64 IS NOT NULL
             """)
             stats = cursor.fetchone()
             
@@ -327,16 +444,12 @@ class EpubDatabaseManager:
             book_id: The book ID to update stats for
         """
         try:
-            # Get current access count
-            book_data = self.db_manager.get_book(book_id)
-            if book_data:
-                current_count = book_data.get("access_count", 0)
-                
-                # Update access statistics
-                self.db_manager.update_book(book_id, {
-                    "access_count": current_count + 1,
-                    "last_accessed": datetime.now().isoformat()
-                })
+            with self.db_manager.get_connection() as conn:
+                conn.execute("""
+                    UPDATE books SET access_count = COALESCE(access_count, 0) + 1, last_accessed = ?
+                    WHERE book_id = ?
+                """, (datetime.now().isoformat(), book_id))
+                conn.commit()
         except Exception:
             pass  # Don't fail the main operation if stats update fails
     
@@ -5,7 +5,7 @@ Migration manager for converting existing file-based data to database storage.
 import os
 import json
 import glob
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from pathlib import Path
 from rich.console import Console
 from rich.progress import Progress, TaskID
@@ -127,10 +127,11 @@ class MigrationManager:
 
         with Progress() as progress:
             task = progress.add_task("Migrating individual books...", total=len(book_dirs))
+            book_results = self._migrate_books(book_dirs, dry_run,
+                                               on_book_done=lambda: progress.update(task, advance=1))
 
-            for book_dir in book_dirs:
+            for book_dir, book_result in zip(book_dirs, book_results):
                 try:
-                    book_result = self._migrate_single_book(book_dir, dry_run)
                     if book_result["migrated"]:
                         results["books_migrated"] += 1
                     if book_result["cover_migrated"]:
@@ -150,8 +151,6 @@ class MigrationManager:
                     results["errors"].append(error_msg)
                     console.print(f"[bold red]✗[/bold red] {error_msg}")
 
-                progress.update(task, advance=1)
-
         return results
 
     def migrate_series_books(self, dry_run: bool = False) -> Dict[str, Any]:
@@ -262,83 +261,138 @@ class MigrationManager:
         Returns:
             Dictionary containing migration results for this book
         """
-        result = {
-            "migrated": False,
-            "cover_found": False,
-            "cover_migrated": False,
-            "epub_found": False,
-            "epub_migrated": False,
-            "novel_data_migrated": False,
-            "storage_saved_mb": 0.0,
-            "errors": []
-        }
+        return self._migrate_books([book_dir], dry_run)[0]
 
-        try:
-            # Load novel data
-            json_path = os.path.join(book_dir, "novel_data.json")
-            novel_data = load_novel_json(json_path)
-
-            # Extract book information
-            metadata = novel_data.get("metadata", {})
-
-            # Generate book ID
-            book_id = self.db_manager.generate_book_id(metadata.get("title", "Untitled"))
-
-            # Prepare book data for database
-            book_data = {
-                "book_id": book_id,
-                "title": metadata.get("title", "Untitled"),
-                "author": metadata.get("author", ""),
-                "genre": metadata.get("genre", ""),
-                "target_audience": metadata.get("target_audience", ""),
-                "description": metadata.get("description", ""),
-                "series_info": metadata.get("series", {}),
-                "generation_status": "completed",  # Existing books are completed
-                "word_count": metadata.get("word_count", 0),
-                "chapter_count": len(novel_data.get("chapters", [])),
-                "file_path": book_dir,
-                "json_path": json_path,
-                "epub_path": self._find_epub_file(book_dir),
-                "created_date": metadata.get("created_at", ""),
-                "metadata": novel_data
+    def _migrate_books(self, book_dirs: List[str], dry_run: bool = False,
+                       on_book_done: Optional[Callable[[], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Migrate several books to the database.
+
+        All book rows are inserted in one transaction; EPUBs and covers are then
+        attached book by book.
+
+        Args:
+            book_dirs: Paths to the book directories
+            dry_run: If True, only analyze without making changes
+            on_book_done: Called after each book has been processed
+
+        Returns:
+            List of per-book migration result dictionaries, in the same order
+        """
+        results = []
+        prepared = []  # (result, book_dir, book_data, novel_data)
+
+        for book_dir in book_dirs:
+            result = {
+                "migrated": False,
+                "cover_found": False,
+                "cover_migrated": False,
+                "epub_found": False,
+                "epub_migrated": False,
+                "novel_data_migrated": False,
+                "storage_saved_mb": 0.0,
+                "errors": []
             }
+            results.append(result)
+
+            try:
+                # Load novel data
+                json_path = os.path.join(book_dir, "novel_data.json")
+                novel_data = load_novel_json(json_path)
+
+                # Extract book information
+                metadata = novel_data.get("metadata", {})
+
+                # Generate book ID
+                book_id = self.db_manager.generate_book_id(metadata.get("title", "Untitled"))
+
+                # Prepare book data for database
+                book_data = {
+                    "book_id": book_id,
+                    "title": metadata.get("title", "Untitled"),
+                    "author": metadata.get("author", ""),
+                    "genre": metadata.get("genre", ""),
+                    "target_audience": metadata.get("target_audience", ""),
+                    "description": metadata.get("description", ""),
+                    "series_info": metadata.get("series", {}),
+                    "generation_status": "completed",  # Existing books are completed
+                    "word_count": metadata.get("word_count", 0),
+                    "chapter_count": len(novel_data.get("chapters", [])),
+                    "file_path": book_dir,
+                    "json_path": json_path,
+                    "epub_path": self._find_epub_file(book_dir),
+                    "created_date": metadata.get("created_at", ""),
+                    "metadata": novel_data
+                }
+                prepared.append((result, book_dir, book_data, novel_data))
+
+            except Exception as e:
+                result["errors"].append(str(e))
+                if on_book_done:
+                    on_book_done()
+
+        if not dry_run and prepared:
+            try:
+                # Add all books to the database at once
+                self.db_manager.add_books_bulk([book_data for _, _, book_data, _ in prepared])
+                for result, _, _, _ in prepared:
+                    result["migrated"] = True
+                    result["novel_data_migrated"] = True
+            except Exception as e:
+                for result, _, _, _ in prepared:
+                    result["errors"].append(str(e))
+                prepared = []
+
+        for result, book_dir, book_data, novel_data in prepared:
+            try:
+                self._migrate_book_files(book_data["book_id"], book_dir, novel_data, result, dry_run)
+            except Exception as e:
+                result["errors"].append(str(e))
+            if on_book_done:
+                on_book_done()
 
-            if not dry_run:
-                # Add book to database
-                self.db_manager.add_book(book_data)
-                result["migrated"] = True
-                result["novel_data_migrated"] = True
-
-            # Look for EPUB files
-            epub_path = self._find_epub_file(book_dir)
-            if epub_path:
-                result["epub_found"] = True
-                if not dry_run:
-                    # Store EPUB and novel data in database
-                    if self.epub_db_manager.store_epub_from_file(book_id, epub_path, novel_data):
-                        result["epub_migrated"] = True
-
-                        # Calculate storage savings
-                        original_size = os.path.getsize(epub_path)
-                        book_record = self.db_manager.get_book(book_id)
-                        if book_record:
-                            compressed_size = book_record.get("epub_compressed_size", original_size)
-                            storage_saved = original_size - compressed_size
-                            result["storage_saved_mb"] = storage_saved / (1024 * 1024)
-
-            # Look for cover images
-            cover_path = self._find_cover_image(book_dir)
-            if cover_path:
-                result["cover_found"] = True
-                if not dry_run:
-                    # Store cover in database
-                    if self.cover_db_manager.store_cover_from_file(book_id, cover_path):
-                        result["cover_migrated"] = True
+        return results
 
-        except Exception as e:
-            result["errors"].append(str(e))
+    def _migrate_book_files(self, book_id: str, book_dir: str, novel_data: Dict[str, Any],
+                            result: Dict[str, Any], dry_run: bool) -> None:
+        """
+        Store a migrated book's EPUB and cover in the database.
 
-        return result
+        Args:
+            book_id: ID of the book in the database
+            book_dir: Path to the book directory
+            novel_data: The book's novel data
+            result: Migration result dictionary for this book, updated in place
+            dry_run: If True, only analyze without making changes
+        """
+        # Look for EPUB files
+        epub_path = self._find_epub_file(book_dir)
+        if epub_path:
+            result["epub_found"] = True
+            if not dry_run:
+                # Store EPUB and novel data in database
+                if self.epub_db_manager.store_epub_from_file(book_id, epub_path, novel_data):
+                    result["epub_migrated"] = True
+
+                    # Calculate storage savings
+                    original_size = os.path.getsize(epub_path)
+                    with self.db_manager.get_connection() as conn:
+                        row = conn.execute(
+                            "SELECT epub_compressed_size FROM books WHERE book_id = ?", (book_id,)
+                        ).fetchone()
+                    if row:
+                        compressed_size = row["epub_compressed_size"] or original_size
+                        storage_saved = original_size - compressed_size
+                        result["storage_saved_mb"] = storage_saved / (1024 * 1024)
+
+        # Look for cover images
+        cover_path = self._find_cover_image(book_dir)
+        if cover_path:
+            result["cover_found"] = True
+            if not dry_run:
+                # Store cover in database
+                if self.cover_db_manager.store_cover_from_file(book_id, cover_path):
+                    result["cover_migrated"] = True
 
     def _migrate_single_series(self, series_path: str, dry_run: bool = False) -> Dict[str, Any]:
         """
@@ -373,8 +427,7 @@ class MigrationManager:
             result["books_found"] = len(book_dirs)
 
             # Migrate each book in the series
-            for book_dir in book_dirs:
-                book_result = self._migrate_single_book(book_dir, dry_run)
+            for book_result in self._migrate_books(book_dirs, dry_run):
                 if book_result["migrated"]:
                     result["books_migrated"] += 1
                 if book_result["cover_found"]:
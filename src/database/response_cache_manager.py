@@ -0,0 +1,303 @@
+"""
+Persistent prompt-to-response cache for Gemini API calls.
+
+Responses are stored in SQLite under content-addressed keys (model, prompt and
+generation config), so identical prompts issued by later runs are served from
+disk instead of being paid for again. Lookups only read: hit/miss counters and
+access times are batched in memory and written with the next write, or
+periodically.
+"""
+
+import atexit
+import sqlite3
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, Any, Optional, Tuple
+from rich.console import Console
+
+from src.database.connection_pool import get_connection_pool
+
+console = Console()
+
+# Batched lookup statistics are written after this many lookups or seconds
+STATS_FLUSH_LOOKUPS = 100
+STATS_FLUSH_SECONDS = 60.0
+
+# Lifetime of cached responses unless a caller asks for another
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+
+class ResponseCacheManager:
+    """
+    Manages the on-disk cache of generated responses with LRU eviction.
+    """
+
+    def __init__(self, db_path: str = "data/response_cache.db", max_entries: int = 10000,
+                 max_size_mb: float = 256.0, default_ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the response cache.
+
+        Args:
+            db_path: Path to the SQLite cache file
+            max_entries: Maximum number of cached responses
+            max_size_mb: Maximum total size of cached responses in megabytes
+            default_ttl_seconds: Lifetime of new entries (None keeps them until evicted)
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.default_ttl_seconds = default_ttl_seconds
+
+        # Counters for this process; lifetime totals are kept in cache_stats
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Lookups not yet written to disk: cache_key -> (last access time, hits), and counter deltas
+        self._pending_accesses: Dict[str, Tuple[float, int]] = {}
+        self._pending_counts = {"hits": 0, "misses": 0}
+        self._pending_lookups = 0
+        self._last_flush = time.monotonic()
+
+        self.ensure_database_directory()
+        self.init_database()
+
+    def ensure_database_directory(self) -> None:
+        """Ensure the database directory exists."""
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Get this thread's pooled (WAL mode) connection to the cache database."""
+        return get_connection_pool().get_connection(self.db_path)
+
+    def init_database(self) -> None:
+        """Initialize the cache tables."""
+        with self.get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS response_cache (
+                    cache_key TEXT PRIMARY KEY,  -- sha256 of model, prompt and generation config
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL,
+                    expires_at REAL,  -- NULL means no expiry
+                    hit_count INTEGER DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_response_cache_last_accessed ON response_cache(last_accessed)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_stats (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER DEFAULT 0
+                )
+            """)
+
+    @staticmethod
+    def make_key(model: str, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """
+        Build a content-addressed cache key.
+
+        Args:
+            model: Model name
+            prompt: The full prompt text
+            generation_config: Generation parameters (temperature, max tokens, ...)
+
+        Returns:
+            Hex sha256 digest identifying the request
+        """
+        payload = json.dumps(
+            {"model": model, "prompt": prompt, "config": generation_config},
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _record(self, conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+        """Increment a lifetime counter."""
+        conn.execute("""
+            INSERT INTO cache_stats (name, value) VALUES (?, ?)
+            ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+        """, (name, amount))
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            cache_key: Key from make_key
+
+        Returns:
+            The cached response, or None on a miss or expired entry
+        """
+        now = time.time()
+        try:
+            conn = self.get_connection()
+            row = conn.execute(
+                "SELECT response, expires_at FROM response_cache WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+
+            if row and row["expires_at"] is not None and row["expires_at"] <= now:
+                with conn:
+                    conn.execute("DELETE FROM response_cache WHERE cache_key = ?", (cache_key,))
+                row = None
+
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Warning: Response cache lookup failed: {str(e)}[/yellow]")
+            row = None
+
+        with self._stats_lock:
+            if row:
+                self.hits += 1
+                _, hits = self._pending_accesses.get(cache_key, (now, 0))
+                self._pending_accesses[cache_key] = (now, hits + 1)
+                self._pending_counts["hits"] += 1
+            else:
+                self.misses += 1
+                self._pending_counts["misses"] += 1
+            self._pending_lookups += 1
+            flush_due = (self._pending_lookups >= STATS_FLUSH_LOOKUPS
+                         or time.monotonic() - self._last_flush >= STATS_FLUSH_SECONDS)
+
+        if flush_due:
+            self.flush()
+
+        return row["response"] if row else None
+
+    def flush(self) -> None:
+        """Write batched hit/miss counters and access times to disk."""
+        try:
+            with self.get_connection() as conn:
+                self._flush_pending(conn)
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Warning: Could not save response cache statistics: {str(e)}[/yellow]")
+
+    def _flush_pending(self, conn: sqlite3.Connection) -> None:
+        """Write batched lookup statistics as part of the caller's transaction."""
+        with self._stats_lock:
+            accesses, self._pending_accesses = self._pending_accesses, {}
+            counts, self._pending_counts = self._pending_counts, {"hits": 0, "misses": 0}
+            self._pending_lookups = 0
+            self._last_flush = time.monotonic()
+
+        if accesses:
+            conn.executemany("""
+                UPDATE response_cache SET last_accessed = MAX(last_accessed, ?), hit_count = hit_count + ?
+                WHERE cache_key = ?
+            """, [(accessed, hits, cache_key) for cache_key, (accessed, hits) in accesses.items()])
+        for name, amount in counts.items():
+            if amount:
+                self._record(conn, name, amount)
+
+    def put(self, cache_key: str, response: str, model: Optional[str] = None,
+            ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a response and evict least recently used entries if over budget.
+
+        Args:
+            cache_key: Key from make_key
+            response: The response text to cache
+            model: Model name (stored for inspection)
+            ttl_seconds: Entry lifetime (defaults to default_ttl_seconds)
+        """
+        now = time.time()
+        ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds
+        expires_at = now + ttl if ttl else None
+        size_bytes = len(response.encode("utf-8"))
+
+        try:
+            with self.get_connection() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO response_cache
+                    (cache_key, model, response, size_bytes, created_at, last_accessed, expires_at, hit_count)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+                """, (cache_key, model, response, size_bytes, now, now, expires_at))
+                # Recent lookups decide which entries are least recently used
+                self._flush_pending(conn)
+                self._evict(conn)
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Warning: Could not cache response: {str(e)}[/yellow]")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired entries, then least recently used ones until within limits."""
+        conn.execute("DELETE FROM response_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+
+        row = conn.execute("SELECT COUNT(*) AS entries, COALESCE(SUM(size_bytes), 0) AS total FROM response_cache").fetchone()
+        entries, total = row["entries"], row["total"]
+        if entries <= self.max_entries and total <= self.max_size_bytes:
+            return
+
+        evicted = 0
+        cursor = conn.execute("SELECT cache_key, size_bytes FROM response_cache ORDER BY last_accessed ASC")
+        victims = []
+        for victim in cursor:
+            if entries <= self.max_entries and total <= self.max_size_bytes:
+                break
+            victims.append((victim["cache_key"],))
+            entries -= 1
+            total -= victim["size_bytes"]
+            evicted += 1
+
+        conn.executemany("DELETE FROM response_cache WHERE cache_key = ?", victims)
+        self._record(conn, "evictions", evicted)
+        with self._stats_lock:
+            self.evictions += evicted
+
+    def clear(self) -> int:
+        """
+        Remove every cached response.
+
+        Returns:
+            Number of entries removed
+        """
+        with self.get_connection() as conn:
+            self._flush_pending(conn)
+            removed = conn.execute("DELETE FROM response_cache").rowcount
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache size and hit/miss statistics.
+
+        Returns:
+            Dictionary with current session and lifetime statistics
+        """
+        self.flush()
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT COUNT(*) AS entries, COALESCE(SUM(size_bytes), 0) AS total FROM response_cache").fetchone()
+            lifetime = {r["name"]: r["value"] for r in conn.execute("SELECT name, value FROM cache_stats")}
+
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": row["entries"],
+                "size_mb": round(row["total"] / (1024 * 1024), 2),
+                "max_entries": self.max_entries,
+                "max_size_mb": round(self.max_size_bytes / (1024 * 1024), 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+                "lifetime_hits": lifetime.get("hits", 0),
+                "lifetime_misses": lifetime.get("misses", 0),
+                "lifetime_evictions": lifetime.get("evictions", 0),
+                "database_path": self.db_path
+            }
+
+
+# Global response cache instance
+_response_cache_manager = None
+
+def get_response_cache_manager() -> ResponseCacheManager:
+    """Get the global response cache instance."""
+    global _response_cache_manager
+    if _response_cache_manager is None:
+        _response_cache_manager = ResponseCacheManager()
+        # Keep the lookups made since the last write
+        atexit.register(_response_cache_manager.flush)
+    return _response_cache_manager
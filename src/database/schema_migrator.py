@@ -5,10 +5,17 @@ Handles safe upgrades of existing databases to new schema versions.
 
 import sqlite3
 import os
+import base64
+import gzip
 from typing import Dict, Any, List
 from datetime import datetime
 from rich.console import Console
 
+from src.database.backup_manager import BackupManager
+from src.database.blob_store import BlobStore, BLOBS_TABLE_SQL
+from src.database.book_status import create_book_status_table
+from src.database.connection_pool import get_connection_pool
+
 console = Console()
 
 
@@ -25,18 +32,18 @@ class SchemaMigrator:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
-        self.current_version = "2.1"  # Enhanced schema version with back cover support
+        self.current_version = "2.3"  # Materialized book completion status
         self.migrations = {
             "1.0": self._migrate_to_v1_0,
             "2.0": self._migrate_to_v2_0,
-            "2.1": self._migrate_to_v2_1
+            "2.1": self._migrate_to_v2_1,
+            "2.2": self._migrate_to_v2_2,
+            "2.3": self._migrate_to_v2_3
         }
 
     def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get this thread's pooled database connection."""
+        return get_connection_pool().get_connection(self.db_path)
 
     def get_current_schema_version(self) -> str:
         """
@@ -119,6 +126,18 @@ class SchemaMigrator:
                     return False
                 current_version = "2.1"
 
+            if current_version == "2.1":
+                # Migrate from v2.1 to v2.2
+                if not self._migrate_to_v2_2():
+                    return False
+                current_version = "2.2"
+
+            if current_version == "2.2":
+                # Migrate from v2.2 to v2.3
+                if not self._migrate_to_v2_3():
+                    return False
+                current_version = "2.3"
+
             # Update schema version
             self._set_schema_version(self.current_version)
 
@@ -381,29 +400,135 @@ class SchemaMigrator:
             console.print(f"[bold red]Failed to migrate to v2.1: {str(e)}[/bold red]")
             return False
 
-    def _create_backup(self) -> str:
+    def _migrate_to_v2_2(self) -> bool:
         """
-        Create a backup of the database before migration.
+        Migrate to schema version 2.2 (content-addressed blob storage).
+
+        Moves cover images and EPUBs out of the base64 TEXT columns of the books
+        table into the blobs table as raw BLOBs keyed by SHA-256, leaving only a
+        reference in each book row. Identical files are stored once.
 
         Returns:
-            Path to backup file or empty string if failed
+            True if successful, False otherwise
         """
         try:
-            if not os.path.exists(self.db_path):
-                return ""
+            blob_store = BlobStore(self.get_connection)
+
+            with self.get_connection() as conn:
+                conn.execute(BLOBS_TABLE_SQL)
+
+                # Check which columns already exist
+                cursor = conn.execute("PRAGMA table_info(books)")
+                existing_columns = {row["name"] for row in cursor.fetchall()}
+
+                for column_name in ("cover_sha256", "epub_sha256"):
+                    if column_name not in existing_columns:
+                        conn.execute(f"ALTER TABLE books ADD COLUMN {column_name} TEXT")
+                        console.print(f"[bold green]✓[/bold green] Added column: {column_name}")
+
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_books_cover_sha256 ON books(cover_sha256)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_books_epub_sha256 ON books(epub_sha256)")
+                conn.commit()
+
+                moved_covers = self._move_inline_blobs(conn, blob_store, "cover")
+                moved_epubs = self._move_inline_blobs(conn, blob_store, "epub")
+
+            if moved_covers or moved_epubs:
+                console.print(f"[bold green]✓[/bold green] Moved {moved_covers} covers and {moved_epubs} EPUBs to blob storage")
+
+                # Give the pages freed by the base64 columns back to the file system
+                self.get_connection().execute("VACUUM")
+
+            console.print("[bold green]✓[/bold green] Migrated to schema v2.2 (Blob Storage)")
+            return True
+
+        except Exception as e:
+            console.print(f"[bold red]Failed to migrate to v2.2: {str(e)}[/bold red]")
+            return False
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = f"{self.db_path}.backup_{timestamp}"
+    def _migrate_to_v2_3(self) -> bool:
+        """
+        Migrate to schema version 2.3 (materialized book completion status).
+
+        Creates the book_status table with the triggers that keep it in step
+        with the books table, and fills it from the existing books.
 
-            # Copy database file
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self.get_connection() as conn:
+                books = create_book_status_table(conn)
+                conn.commit()
 
-            return backup_path
+            console.print(f"[bold green]✓[/bold green] Migrated to schema v2.3 (Book Status, {books} books)")
+            return True
 
         except Exception as e:
-            console.print(f"[yellow]Warning: Could not create backup: {str(e)}[/yellow]")
-            return ""
+            console.print(f"[bold red]Failed to migrate to v2.3: {str(e)}[/bold red]")
+            return False
+
+    def _move_inline_blobs(self, conn: sqlite3.Connection, blob_store: BlobStore,
+                           kind: str, batch_size: int = 50) -> int:
+        """
+        Move base64 cover or EPUB data of every book into the blob store.
+
+        Rows are processed one at a time and committed in batches, so memory use
+        stays bounded by a single file and an interrupted migration can resume.
+
+        Args:
+            conn: Open connection to the database
+            blob_store: Blob store writing through the same database
+            kind: "cover" or "epub"
+            batch_size: Number of books per transaction
+
+        Returns:
+            Number of books moved
+        """
+        inline_column = f"{kind}_base64"
+        reference_column = f"{kind}_sha256"
+
+        book_ids = [row["book_id"] for row in conn.execute(
+            f"SELECT book_id FROM books WHERE {inline_column} IS NOT NULL"
+        ).fetchall()]
+
+        moved = 0
+        for book_id in book_ids:
+            row = conn.execute(
+                f"SELECT {inline_column} AS data FROM books WHERE book_id = ?", (book_id,)
+            ).fetchone()
+
+            try:
+                content = base64.b64decode(row["data"])
+                if kind == "epub":
+                    # EPUBs were stored gzip-compressed before base64 encoding
+                    content = gzip.decompress(content)
+            except Exception as e:
+                console.print(f"[yellow]Warning: Leaving unreadable {kind} in place for {book_id}: {str(e)}[/yellow]")
+                continue
+
+            key = blob_store.put(content, compress=(kind == "epub"), conn=conn)
+            conn.execute(
+                f"UPDATE books SET {reference_column} = ?, {inline_column} = NULL WHERE book_id = ?",
+                (key, book_id)
+            )
+
+            moved += 1
+            if moved % batch_size == 0:
+                conn.commit()
+
+        conn.commit()
+        return moved
+
+    def _create_backup(self) -> str:
+        """
+        Create a backup of the database before migration.
+
+        Returns:
+            ID of the backup or empty string if failed (or the database is empty)
+        """
+        backup = BackupManager(self.db_path).create_backup(f"before_v{self.current_version}_migration")
+        return backup["backup_id"] if backup else ""
 
     def _set_schema_version(self, version: str) -> None:
         """
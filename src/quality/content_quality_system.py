@@ -22,6 +22,8 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from src.database.connection_pool import get_connection_pool
+
 console = Console(markup=True)
 
 class QualityMetric(Enum):
@@ -75,9 +77,13 @@ class ContentQualitySystem:
         self.db_path.parent.mkdir(exist_ok=True)
         self._init_database()
 
+    def get_connection(self) -> sqlite3.Connection:
+        """Get this thread's pooled connection to the quality database (plain tuple rows)."""
+        return get_connection_pool().get_connection(self.db_path, row_factory=None)
+
     def _init_database(self):
         """Initialize the SQLite database for quality tracking."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
 
             # Content metadata table
@@ -147,7 +153,7 @@ class ContentQualitySystem:
     def register_content(self, metadata: ContentMetadata) -> str:
         """Register new content for quality tracking."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT OR REPLACE INTO content_metadata
@@ -364,7 +370,7 @@ class ContentQualitySystem:
     def _store_quality_assessment(self, assessment: QualityAssessment):
         """Store quality assessment in the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
 
                 # Store each metric as a separate row
@@ -400,7 +406,7 @@ class ContentQualitySystem:
                 console.print("[red]Rating must be between 1 and 5[/red]")
                 return False
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT INTO user_feedback
@@ -425,7 +431,7 @@ class ContentQualitySystem:
                           days: int = 30) -> Dict[str, Any]:
         """Generate a comprehensive quality report."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
 
                 # Build query conditions
@@ -507,7 +513,7 @@ class ContentQualitySystem:
     def get_author_performance_comparison(self) -> Dict[str, Any]:
         """Compare performance across different fictional authors."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
 
                 # Get average scores by fictional author
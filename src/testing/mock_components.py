@@ -14,11 +14,14 @@ Key Features:
 """
 
 import json
+import re
 import time
 import random
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from src.core.generation_stream import GenerationStream
+
 
 class MockGeminiClient:
     """
@@ -40,7 +43,8 @@ class MockGeminiClient:
             "characters": self._get_mock_characters,
             "chapter": self._get_mock_chapter,
             "enhancement": self._get_mock_enhancement,
-            "series_plan": self._get_mock_series_plan
+            "series_plan": self._get_mock_series_plan,
+            "chapter_analysis": self._get_mock_chapter_analysis
         }
     
     def generate_content(
@@ -49,7 +53,8 @@ class MockGeminiClient:
         temperature: float = 0.7,
         max_tokens: int = 16000,
         max_retries: int = 5,
-        initial_retry_delay: float = 2.0
+        initial_retry_delay: float = 2.0,
+        use_cache: bool = False
     ) -> str:
         """
         Generate mock content based on the prompt.
@@ -60,6 +65,7 @@ class MockGeminiClient:
             max_tokens: Used to determine response length
             max_retries: Ignored in mock
             initial_retry_delay: Ignored in mock
+            use_cache: Ignored in mock
             
         Returns:
             Mock response appropriate for the prompt type
@@ -78,6 +84,25 @@ class MockGeminiClient:
         else:
             return self._get_generic_response(prompt, max_tokens)
     
+    def generate_content_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 16000,
+        max_words: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        on_chunk=None,
+        use_cache: bool = False
+    ) -> GenerationStream:
+        """Stream the mock response for a prompt in small chunks."""
+        def chunk_source(request_prompt: str, request_max_tokens: int):
+            response = self.generate_content(request_prompt, temperature, request_max_tokens)
+            for start in range(0, len(response), 64):
+                yield response[start:start + 64]
+
+        return GenerationStream(chunk_source, prompt, max_tokens, max_words=max_words,
+                                max_seconds=max_seconds, on_chunk=on_chunk)
+
     def generate_with_context(
         self,
         prompt: str,
@@ -108,7 +133,9 @@ class MockGeminiClient:
         """Determine the type of response needed based on prompt content."""
         prompt_lower = prompt.lower()
         
-        if "writer profile" in prompt_lower or "fictional author" in prompt_lower:
+        if "chapter analysis" in prompt_lower:
+            return "chapter_analysis"
+        elif "writer profile" in prompt_lower or "fictional author" in prompt_lower:
             return "writer_profile"
         elif "novel outline" in prompt_lower or "chapter outline" in prompt_lower:
             return "novel_outline"
@@ -316,6 +343,24 @@ class MockGeminiClient:
         """Generate mock enhanced content."""
         return "Enhanced version: " + self._get_medium_chapter()
     
+    def _get_mock_chapter_analysis(self, prompt: str, max_tokens: int) -> str:
+        """Generate a mock combined chapter summary and narrative extraction."""
+        match = re.search(r"Analyze Chapter (\d+)", prompt)
+        chapter_num = int(match.group(1)) if match else 1
+
+        analysis = {
+            "summary": f"In chapter {chapter_num} the protagonist faces a new challenge and learns something important about the mystery.",
+            "character_updates": {
+                "Test Protagonist": {"development": "Grows more determined", "emotions": "anxious but hopeful"}
+            },
+            "plot_updates": {"Main mystery": {"status": "active", "progression": f"New clue found in chapter {chapter_num}"}},
+            "unresolved_questions": [f"What does the clue from chapter {chapter_num} mean?"],
+            "locations": ["The old library"],
+            "time_of_day": "evening",
+            "tone": "suspenseful"
+        }
+        return json.dumps(analysis, indent=2)
+
     def _get_mock_series_plan(self, prompt: str, max_tokens: int) -> str:
         """Generate a mock series plan."""
         plan = {
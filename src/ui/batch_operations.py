@@ -27,6 +27,19 @@ from src.ui.responsive_separator import (
 
 console = Console()
 
+# File names that mark a book directory as having a cover or generated content
+COVER_FILES = {"cover.jpg", "cover.png", "cover.jpeg"}
+CONTENT_FILES = {"outline.txt", "characters.json"}
+
+def list_book_files(book_dir: str) -> Optional[set]:
+    """Get the file names in a book directory with one listing, or None if it does not exist."""
+    if not book_dir:
+        return None
+    try:
+        return set(os.listdir(book_dir))
+    except OSError:
+        return None
+
 class BatchOperationManager:
     """Manager for batch operations with progress tracking and error recovery."""
 
@@ -181,13 +194,14 @@ def get_books_without_covers() -> List[Dict]:
     try:
         from src.ui.book_menu import get_existing_books
         existing_books = get_existing_books()
+        stored_assets = get_stored_asset_flags()
 
         for book in existing_books:
-            book_dir = book.get("directory", "")
-            if book_dir and os.path.exists(book_dir):
-                # Check for cover files
-                cover_files = ["cover.jpg", "cover.png", "cover.jpeg"]
-                has_cover = any(os.path.exists(os.path.join(book_dir, f)) for f in cover_files)
+            book_files = list_book_files(book.get("directory", ""))
+            if book_files is not None:
+                # Check for cover files, then for a cover stored in the database
+                has_cover = bool(book_files & COVER_FILES)
+                has_cover = has_cover or stored_assets.get(book.get("title"), {}).get("has_cover", False)
 
                 if not has_cover:
                     books_without_covers.append(book)
@@ -264,26 +278,89 @@ def execute_batch_cover_generation(books: List[Dict]):
 
     console.print()
 
-    # Process each book
+    from src.utils.file_handler import load_novel_json
+    from src.utils.batch_cover_engine import BatchCoverEngine, build_cover_job
+
+    # Build one cover job per book; covers are saved as cover.jpg in the book directory
+    book_ids = find_book_ids_by_title([book.get("title", "") for book in books])
+    jobs = []
     for book in books:
         title = book.get("title", "Untitled")
 
         try:
-            # Simulate cover generation (replace with actual implementation)
-            batch_manager.update_progress(title, "processing", "Generating cover...")
-            time.sleep(0.5)  # Simulate processing time
-
-            # This would call the actual cover generation function
-            # generate_book_cover(book)
-
-            batch_manager.update_progress(title, "success", "Cover generated successfully")
+            novel_data = load_novel_json(book.get("json_path") or os.path.join(book["directory"], "novel_data.json"))
+            output_path = os.path.join(book["directory"], "cover.jpg")
+            book_id = book.get("book_id") or book_ids.get(title)
+            jobs.append(build_cover_job(novel_data, output_path, book_id=book_id))
 
         except Exception as e:
             batch_manager.update_progress(title, "failed", f"Error: {str(e)}")
 
+    def report_result(result: Dict[str, Any]):
+        """Stream each finished cover into the progress display."""
+        if result["success"]:
+            batch_manager.update_progress(
+                result["title"], "success",
+                f"Cover generated in {result['seconds']:.1f}s: {result['cover_path']}"
+            )
+        else:
+            batch_manager.update_progress(result["title"], "failed", f"Error: {result['error']}")
+
+    # Render covers in parallel across worker processes, then store them in one transaction
+    engine = BatchCoverEngine()
+    console.print(f"    Rendering with {min(engine.max_workers, max(len(jobs), 1))} worker process(es)")
+    console.print()
+    results = engine.generate_covers(jobs, on_result=report_result)
+    engine.store_covers(results)
+
     batch_manager.complete_operation()
     input("\nPress Enter to continue...")
 
+def find_book_ids_by_title(titles: List[str]) -> Dict[str, str]:
+    """Look up database book IDs for the given titles with a few IN queries."""
+    titles = list(dict.fromkeys(title for title in titles if title))
+    if not titles:
+        return {}
+
+    try:
+        from src.database.database_manager import get_database_manager
+        db_manager = get_database_manager()
+
+        book_ids = {}
+        with db_manager.get_connection() as conn:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(titles), 500):
+                batch = titles[start:start + 500]
+                cursor = conn.execute(
+                    f"SELECT book_id, title FROM books WHERE title IN ({', '.join('?' for _ in batch)}) "
+                    "ORDER BY created_date",
+                    batch
+                )
+                # Later rows win, so the newest book with a given title is used
+                book_ids.update((row["title"], row["book_id"]) for row in cursor.fetchall())
+        return book_ids
+
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not look up books in database: {e}[/yellow]")
+        return {}
+
+def get_stored_asset_flags() -> Dict[str, Dict[str, bool]]:
+    """Map book titles to the completion flags of their database books, read in one query."""
+    try:
+        from src.database.book_status import BOOK_STATUS_FLAGS
+        from src.database.database_manager import get_database_manager
+        db_manager = get_database_manager()
+
+        flags = {}
+        # Statuses come newest first, so the newest book with a given title is used
+        for book in db_manager.get_completion_status():
+            flags.setdefault(book["title"], {flag: book[flag] for flag in BOOK_STATUS_FLAGS})
+        return flags
+
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not read stored books from database: {e}[/yellow]")
+        return {}
+
 def batch_epub_generation_menu():
     """Main menu for batch EPUB generation operations."""
     while True:
@@ -415,34 +492,34 @@ def analyze_all_books_completion_status() -> Dict[str, Any]:
         from src.ui.book_menu import get_existing_books
         existing_books = get_existing_books()
 
+        stored_assets = get_stored_asset_flags()
+
         analysis["total_books"] = len(existing_books)
 
         for book in existing_books:
-            book_dir = book.get("directory", "")
-            if not book_dir or not os.path.exists(book_dir):
+            book_files = list_book_files(book.get("directory", ""))
+            if book_files is None:
                 analysis["books_missing_content"].append(book)
                 analysis["incomplete_books"].append(book)
                 continue
 
             missing_components = []
+            stored = stored_assets.get(book.get("title"), {})
 
             # Check for content files
-            content_files = ["outline.txt", "characters.json"]
-            has_content = any(os.path.exists(os.path.join(book_dir, f)) for f in content_files)
+            has_content = bool(book_files & CONTENT_FILES)
             if not has_content:
                 missing_components.append("content")
                 analysis["books_missing_content"].append(book)
 
-            # Check for cover files
-            cover_files = ["cover.jpg", "cover.png", "cover.jpeg"]
-            has_cover = any(os.path.exists(os.path.join(book_dir, f)) for f in cover_files)
+            # Check for cover files, then for a cover stored in the database
+            has_cover = bool(book_files & COVER_FILES) or stored.get("has_cover", False)
             if not has_cover:
                 missing_components.append("cover")
                 analysis["books_missing_covers"].append(book)
 
-            # Check for EPUB files
-            epub_files = [f for f in os.listdir(book_dir) if f.endswith('.epub')]
-            has_epub = len(epub_files) > 0
+            # Check for EPUB files, then for an EPUB stored in the database
+            has_epub = any(f.endswith('.epub') for f in book_files) or stored.get("has_epub", False)
             if not has_epub:
                 missing_components.append("epub")
                 analysis["books_missing_epub"].append(book)
@@ -664,14 +741,16 @@ def get_books_without_epub() -> List[Dict]:
     try:
         from src.ui.book_menu import get_existing_books
         existing_books = get_existing_books()
+        stored_assets = get_stored_asset_flags()
 
         for book in existing_books:
-            book_dir = book.get("directory", "")
-            if book_dir and os.path.exists(book_dir):
-                # Check for EPUB files
-                epub_files = [f for f in os.listdir(book_dir) if f.endswith('.epub')]
+            book_files = list_book_files(book.get("directory", ""))
+            if book_files is not None:
+                # Check for EPUB files, then for an EPUB stored in the database
+                has_epub = any(f.endswith('.epub') for f in book_files)
+                has_epub = has_epub or stored_assets.get(book.get("title"), {}).get("has_epub", False)
 
-                if not epub_files:
+                if not has_epub:
                     books_without_epub.append(book)
 
     except Exception as e:
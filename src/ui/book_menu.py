@@ -11,6 +11,7 @@ import questionary
 
 # Local imports
 from src.core.novel_generator import NovelGenerator
+from src.core.generation_checkpoint import GenerationCheckpoint
 from src.core.ideas_manager import IdeasManager
 from src.formatters.epub_formatter import EpubFormatter
 from src.utils.file_handler import create_output_directory, save_novel_json, load_novel_json, sanitize_filename
@@ -204,6 +205,137 @@ def display_book_info(book_info: Dict[str, Any]) -> None:
 
     console.print()
 
+def ask_resume_generation(title: str) -> Optional[str]:
+    """
+    Offer to resume an interrupted generation of a book with the given title.
+
+    Args:
+        title: Title of the book about to be generated
+
+    Returns:
+        Output directory of the run to resume, or None to start a new run
+    """
+    checkpoint_dirs = GenerationCheckpoint.find(title)
+    if not checkpoint_dirs:
+        return None
+
+    console.print(f"[bold yellow]An interrupted generation of '{title}' was found in {checkpoint_dirs[0]}[/bold yellow]")
+    resume = questionary.confirm(
+        "Resume it from the last completed chapter?",
+        default=True,
+        style=custom_style
+    ).ask()
+
+    return checkpoint_dirs[0] if resume else None
+
+
+def resume_book_generation(novel_info: Dict[str, Any], output_dir: str,
+                           selected_idea: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Resume an interrupted book generation from its checkpoint.
+
+    Args:
+        novel_info: Book information entered for the new run
+        output_dir: Output directory holding the checkpoint
+        selected_idea: Book idea the run was started from, if any
+
+    Returns:
+        Book information dictionary or None if resuming failed
+    """
+    generator = NovelGenerator()
+    generator.initialize_novel(
+        title=novel_info["title"],
+        author=novel_info["author"],
+        description=novel_info["description"],
+        genre=novel_info["genre"],
+        target_audience=novel_info["target_audience"],
+        output_dir=output_dir
+    )
+
+    try:
+        generation_timer.start()
+        # The book is finished here, exactly like a run that was never interrupted
+        novel = generator.resume_novel(finish_book=False)
+        return complete_book(generator, novel, novel_info, output_dir,
+                             GenerationCheckpoint(generator.memory_manager), selected_idea)
+
+    except Exception as e:
+        console.print(f"[bold red]Error while resuming generation: {str(e)}[/bold red]")
+        console.print("[yellow]The checkpoint was kept; you can try resuming again later.[/yellow]")
+        return None
+
+
+def complete_book(generator: NovelGenerator, novel: Dict[str, Any], novel_info: Dict[str, Any], output_dir: str,
+                  checkpoint: GenerationCheckpoint, selected_idea: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Save a freshly generated or resumed book and run its post-generation steps.
+
+    Args:
+        generator: Generator that produced the novel
+        novel: Complete novel data
+        novel_info: Book information entered by the user
+        output_dir: Output directory of the book
+        checkpoint: Checkpoint of the run, removed once the book is saved
+        selected_idea: Book idea the book was created from, if any
+
+    Returns:
+        Book information dictionary
+    """
+    # Save novel as JSON
+    save_novel_json(novel, output_dir)
+
+    saved_path = output_dir
+    if selected_idea:
+        # Use smart cover selection (checks for existing covers first, then fallback)
+        from src.utils.smart_cover_selector import get_smart_cover_for_epub
+        cover_path = get_smart_cover_for_epub(novel, output_dir, auto_mode=False)
+
+        # Format and save as EPUB with writer profile
+        console.print("[bold cyan]Formatting EPUB...[/bold cyan]")
+        writer_profile = novel.get("writer_profile")
+        formatter = EpubFormatter(novel, writer_profile=writer_profile)
+        saved_path = formatter.save_epub(output_dir, cover_path, writer_profile)
+
+    # Save to the database with enhanced descriptions and back cover, then drop the checkpoint
+    generator.finish_novel(novel, checkpoint)
+
+    console.print("[bold green]✓[/bold green] Book generation completed!")
+    if not selected_idea:
+        console.print("[bold yellow]Note:[/bold yellow] EPUB can be generated manually from the Export menu.")
+
+    # Stop timer
+    generation_timer.stop()
+
+    # Display completion
+    console.print()
+    console.print(title_separator("Book Generation Complete", "="))
+    console.print(f"[bold green]Generation time:[/bold green] [bold cyan]{generation_timer.get_elapsed_time()}[/bold cyan]")
+    console.print(f"[bold green]Book saved to:[/bold green] [bold cyan]{saved_path}[/bold cyan]")
+    console.print(f"[bold cyan]Enhanced descriptions generated and saved to database[/bold cyan]")
+    if selected_idea:
+        console.print(f"[bold green]Based on idea:[/bold green] [bold cyan]{selected_idea.get('title', 'Unknown')}[/bold cyan]")
+    console.print()
+    console.print(separator("="))
+
+    # Create book info for return
+    book_info = {
+        "title": novel_info["title"],
+        "author": novel_info["author"],
+        "genre": novel_info["genre"],
+        "target_audience": novel_info["target_audience"],
+        "description": novel_info["description"],
+        "created_at": datetime.now().isoformat(),
+        "word_count": novel["metadata"].get("word_count", 0),
+        "chapter_count": len(novel.get("chapters", [])),
+        "directory": output_dir,
+        "json_path": os.path.join(output_dir, "novel_data.json")
+    }
+    if selected_idea:
+        book_info["source_idea"] = selected_idea  # Store the original idea for reference
+
+    return book_info
+
+
 def create_new_book() -> Optional[Dict[str, Any]]:
     """
     Create a new book with enhanced post-generation options.
@@ -221,6 +353,11 @@ def create_new_book() -> Optional[Dict[str, Any]]:
     if not novel_info:
         return None
 
+    # Pick up an interrupted run of the same book instead of starting over
+    resume_dir = ask_resume_generation(novel_info["title"])
+    if resume_dir:
+        return resume_book_generation(novel_info, resume_dir)
+
     # Create output directory
     output_dir = create_output_directory(novel_info["title"])
     output_dir = output_dir.replace('\\', '/')
@@ -249,14 +386,14 @@ def create_new_book() -> Optional[Dict[str, Any]]:
         profile_manager = WriterProfileManager()
 
         # Get generation options for enhancement
-        generation_options = get_genre_defaults(book_info["genre"])
+        generation_options = get_genre_defaults(novel_info["genre"])
         themes = generation_options.get('themes', []) if generation_options else []
         writing_style = generation_options.get('writing_style') if generation_options else None
         target_length = generation_options.get('target_length') if generation_options else None
 
         # Automatically select and enhance fictional author profile
         writer_profile = profile_manager.get_auto_selected_profile_for_book(
-            genre=book_info["genre"],
+            genre=novel_info["genre"],
             themes=themes,
             writing_style=writing_style,
             target_length=target_length
@@ -275,12 +412,19 @@ def create_new_book() -> Optional[Dict[str, Any]]:
             writer_profile = generator.generate_writer_profile()
             console.print("[bold green]✓[/bold green] Custom writer profile generated")
 
+        # Checkpoint every stage and chapter so an interrupted run can be resumed
+        checkpoint = GenerationCheckpoint(memory_manager)
+        checkpoint.start(generator.generation_options)
+        checkpoint.save_stage("writer_profile", writer_profile)
+
         console.print("[bold cyan]Generating novel outline...[/bold cyan]")
         chapter_outlines, chapter_count = generator.generate_novel_outline(writer_profile)
+        checkpoint.save_stage("outline", {"chapter_outlines": chapter_outlines, "chapter_count": chapter_count})
         console.print(f"[bold green]✓[/bold green] Novel outline generated ({chapter_count} chapters)")
 
         console.print("[bold cyan]Generating characters...[/bold cyan]")
         characters = generator.generate_characters()
+        checkpoint.save_stage("characters", characters)
         console.print(f"[bold green]✓[/bold green] Characters generated ({len(characters)} characters)")
 
         # Generate chapters
@@ -311,6 +455,7 @@ def create_new_book() -> Optional[Dict[str, Any]]:
                 "title": chapter_title,
                 "content": enhanced_text
             })
+            checkpoint.save_chapter(chapters[-1])
 
             console.print(f"[bold green]✓[/bold green] Chapter {chapter_num} completed")
 
@@ -320,59 +465,14 @@ def create_new_book() -> Optional[Dict[str, Any]]:
         novel = {
             "metadata": memory_manager.metadata,
             "writer_profile": writer_profile,
-            "generation_options": get_genre_defaults(book_info["genre"]) or {},
+            "generation_options": get_genre_defaults(novel_info["genre"]) or {},
             "outline": chapter_outlines,
             "characters": characters,
             "chapters": chapters,
             "word_count": memory_manager.structure["current_word_count"]
         }
 
-        # Save novel as JSON
-        save_novel_json(novel, output_dir)
-
-        # Generate enhanced descriptions and back cover
-        console.print("[bold cyan]Generating enhanced descriptions...[/bold cyan]")
-        from src.utils.enhanced_book_workflow import EnhancedBookWorkflow
-        workflow = EnhancedBookWorkflow()
-
-        # Save to database first
-        from src.database.database_manager import get_database_manager
-        db_manager = get_database_manager()
-        book_id = db_manager.save_book(novel)
-
-        # Process with enhanced workflow
-        workflow.process_completed_book(book_id, novel)
-
-        console.print("[bold green]✓[/bold green] Book generation completed!")
-        console.print("[bold yellow]Note:[/bold yellow] EPUB can be generated manually from the Export menu.")
-
-        # Stop timer
-        generation_timer.stop()
-
-        # Display completion
-        console.print()
-        console.print(title_separator("Book Generation Complete", "="))
-        console.print(f"[bold green]Generation time:[/bold green] [bold cyan]{generation_timer.get_elapsed_time()}[/bold cyan]")
-        console.print(f"[bold green]Book saved to:[/bold green] [bold cyan]{output_dir}[/bold cyan]")
-        console.print(f"[bold cyan]Enhanced descriptions generated and saved to database[/bold cyan]")
-        console.print()
-        console.print(separator("="))
-
-        # Create book info for return
-        book_info = {
-            "title": novel_info["title"],
-            "author": novel_info["author"],
-            "genre": novel_info["genre"],
-            "target_audience": novel_info["target_audience"],
-            "description": novel_info["description"],
-            "created_at": datetime.now().isoformat(),
-            "word_count": novel["metadata"].get("word_count", 0),
-            "chapter_count": len(novel.get("chapters", [])),
-            "directory": output_dir,
-            "json_path": os.path.join(output_dir, "novel_data.json")
-        }
-
-        return book_info
+        return complete_book(generator, novel, novel_info, output_dir, checkpoint)
 
     except Exception as e:
         console.print(f"[bold red]Error during generation: {str(e)}[/bold red]")
@@ -472,6 +572,11 @@ def create_book_from_idea() -> Optional[Dict[str, Any]]:
         "target_audience": target_audience
     }
 
+    # Pick up an interrupted run of the same book instead of starting over
+    resume_dir = ask_resume_generation(novel_info["title"])
+    if resume_dir:
+        return resume_book_generation(novel_info, resume_dir, selected_idea)
+
     # Create output directory
     output_dir = create_output_directory(novel_info["title"])
     output_dir = output_dir.replace('\\', '/')
@@ -527,12 +632,19 @@ def create_book_from_idea() -> Optional[Dict[str, Any]]:
             writer_profile = generator.generate_writer_profile()
             console.print("[bold green]✓[/bold green] Custom writer profile generated")
 
+        # Checkpoint every stage and chapter so an interrupted run can be resumed
+        checkpoint = GenerationCheckpoint(memory_manager)
+        checkpoint.start(generator.generation_options)
+        checkpoint.save_stage("writer_profile", writer_profile)
+
         console.print("[bold cyan]Generating novel outline...[/bold cyan]")
         chapter_outlines, chapter_count = generator.generate_novel_outline(writer_profile)
+        checkpoint.save_stage("outline", {"chapter_outlines": chapter_outlines, "chapter_count": chapter_count})
         console.print(f"[bold green]✓[/bold green] Novel outline generated ({chapter_count} chapters)")
 
         console.print("[bold cyan]Generating characters...[/bold cyan]")
         characters = generator.generate_characters()
+        checkpoint.save_stage("characters", characters)
         console.print(f"[bold green]✓[/bold green] Characters generated ({len(characters)} characters)")
 
         # Generate chapters
@@ -563,6 +675,7 @@ def create_book_from_idea() -> Optional[Dict[str, Any]]:
                 "title": chapter_title,
                 "content": enhanced_text
             })
+            checkpoint.save_chapter(chapters[-1])
 
             console.print(f"[bold green]✓[/bold green] Chapter {chapter_num} completed")
 
@@ -579,46 +692,7 @@ def create_book_from_idea() -> Optional[Dict[str, Any]]:
             "word_count": memory_manager.structure["current_word_count"]
         }
 
-        # Save novel as JSON
-        save_novel_json(novel, output_dir)
-
-        # Use smart cover selection (checks for existing covers first, then fallback)
-        from src.utils.smart_cover_selector import get_smart_cover_for_epub
-        cover_path = get_smart_cover_for_epub(novel, output_dir, auto_mode=False)
-
-        # Format and save as EPUB with writer profile
-        console.print("[bold cyan]Formatting EPUB...[/bold cyan]")
-        formatter = EpubFormatter(novel, writer_profile=writer_profile)
-        epub_path = formatter.save_epub(output_dir, cover_path, writer_profile)
-
-        # Stop timer
-        generation_timer.stop()
-
-        # Display completion
-        console.print()
-        console.print(title_separator("Book Generation Complete", "="))
-        console.print(f"[bold green]Generation time:[/bold green] [bold cyan]{generation_timer.get_elapsed_time()}[/bold cyan]")
-        console.print(f"[bold green]Book saved to:[/bold green] [bold cyan]{epub_path}[/bold cyan]")
-        console.print(f"[bold green]Based on idea:[/bold green] [bold cyan]{selected_idea.get('title', 'Unknown')}[/bold cyan]")
-        console.print()
-        console.print(separator("="))
-
-        # Create book info for return
-        book_info = {
-            "title": novel_info["title"],
-            "author": novel_info["author"],
-            "genre": novel_info["genre"],
-            "target_audience": novel_info["target_audience"],
-            "description": novel_info["description"],
-            "created_at": datetime.now().isoformat(),
-            "word_count": novel["metadata"].get("word_count", 0),
-            "chapter_count": len(novel.get("chapters", [])),
-            "directory": output_dir,
-            "json_path": os.path.join(output_dir, "novel_data.json"),
-            "source_idea": selected_idea  # Store the original idea for reference
-        }
-
-        return book_info
+        return complete_book(generator, novel, novel_info, output_dir, checkpoint, selected_idea)
 
     except Exception as e:
         console.print(f"[bold red]Error during generation: {str(e)}[/bold red]")
@@ -891,8 +965,7 @@ def generate_epub_manually(book_info: Dict[str, Any]) -> None:
             author = novel_data.get("metadata", {}).get("author", "")
 
             if title and author:
-                books = db_manager.get_books(status="completed")
-                for book in books:
+                for book in db_manager.iter_book_summaries(status="completed"):
                     if (book.get("title", "").lower() == title.lower() and
                         book.get("author", "").lower() == author.lower()):
 
@@ -16,6 +16,7 @@ from src.database.book_library_manager import get_book_library_manager
 from src.database.migration_manager import get_migration_manager
 from src.database.book_filter_manager import get_book_filter_manager
 from src.database.database_cleaner import get_database_cleaner
+from src.database.connection_pool import get_connection_pool
 from src.ui.terminal_ui import clear_screen, display_title, custom_style
 
 console = Console()
@@ -674,6 +675,7 @@ def create_database_backup() -> None:
         backup_path = f"{db_manager.db_path}.backup_{timestamp}"
 
         console.print(f"[bold cyan]Creating backup...[/bold cyan]")
+        get_connection_pool().checkpoint(db_manager.db_path)
         shutil.copy2(db_manager.db_path, backup_path)
 
         backup_size = os.path.getsize(backup_path) / (1024 * 1024)
@@ -1215,7 +1217,7 @@ def backup_management_menu() -> None:
                 console.print(f"\n[bold red]✗ Manual backup failed![/bold red]")
         elif selected.startswith("Restore: "):
             filename = selected.replace("Restore: ", "")
-            backup_path = os.path.join(cleaner.backup_dir, filename)
+            backup_path = next(backup["path"] for backup in backups if backup["filename"] == filename)
 
             console.print(f"\n[bold yellow]Warning:[/bold yellow] This will replace your current database with the backup")
             confirm = questionary.confirm(
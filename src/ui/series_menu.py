@@ -1194,6 +1194,8 @@ def export_books(series_manager: SeriesManager) -> None:
         # Process existing EPUB files or generate new ones
         files_to_process = epub_files if epub_files else book_dirs
 
+        # Load every book first so covers missing across the series are rendered together
+        books_to_format = []
         for file_path in files_to_process:
             if epub_files:
                 # Processing existing EPUB files
@@ -1204,26 +1206,34 @@ def export_books(series_manager: SeriesManager) -> None:
                 book_dir = file_path
                 book_name = os.path.basename(book_dir)
 
-            console.print(f"[cyan]Processing: {book_name}[/cyan]")
-
             try:
                 # Load novel data from JSON
                 json_path = os.path.join(book_dir, "novel_data.json")
 
                 if not os.path.exists(json_path):
+                    console.print(f"[cyan]Processing: {book_name}[/cyan]")
                     console.print(f"  [red]Error: novel_data.json not found[/red]")
                     failed_count += 1
                     continue
 
-                novel_data = load_novel_json(json_path)
+                books_to_format.append((book_name, book_dir, load_novel_json(json_path)))
+
+            except Exception as e:
+                console.print(f"[cyan]Processing: {book_name}[/cyan]")
+                console.print(f"  [red]Error: {str(e)}[/red]")
+                failed_count += 1
 
+        # Use smart cover selection (checks for existing covers first, then fallback)
+        from src.utils.smart_cover_selector import get_smart_covers_for_epubs
+        cover_paths = get_smart_covers_for_epubs([(novel_data, book_dir) for _, book_dir, novel_data in books_to_format])
+
+        for (book_name, book_dir, novel_data), cover_path in zip(books_to_format, cover_paths):
+            console.print(f"[cyan]Processing: {book_name}[/cyan]")
+
+            try:
                 # Extract writer profile from novel data
                 writer_profile = novel_data.get("writer_profile")
 
-                # Use smart cover selection (checks for existing covers first, then fallback)
-                from src.utils.smart_cover_selector import get_smart_cover_for_epub
-                cover_path = get_smart_cover_for_epub(novel_data, book_dir, auto_mode=True)
-
                 # Regenerate EPUB with proper content and writer profile
                 formatter = EpubFormatter(novel_data, writer_profile=writer_profile)
                 new_epub_path = formatter.save_epub(book_dir, cover_path, writer_profile)
@@ -15,6 +15,7 @@ from rich import box
 import questionary
 from questionary import Style
 from src.utils.cover_generator import CoverGenerator
+from src.utils.batch_cover_engine import GENRE_COVER_STYLES, get_cover_parameters
 
 # Import SeriesManager conditionally to avoid circular imports
 try:
@@ -145,17 +146,18 @@ def display_api_key_status(gemini_client) -> None:
     console.print("\n[bold cyan]Checking API keys...[/bold cyan]")
     api_status = gemini_client.check_api_connection(check_all_keys=True)
 
+    # Get usage statistics
+    usage_stats = gemini_client.get_api_key_usage_stats()
+
     # Display general information using clean typography
     console.print(f"\n{section_separator('API Key Overview', '-', 'simple')}")
     console.print()
     console.print(f"    🔢 Total API Keys: [white]{api_status['active_keys']}[/white]")
     console.print(f"    ✅ Working API Keys: [green]{api_status['working_keys']}[/green]")
     console.print(f"    ⚠️ Rate Limited Keys: [red]{len(gemini_client.rate_limited_keys)}[/red]")
+    console.print(f"    ⏳ Saturated Keys: [yellow]{usage_stats.get('saturated_keys', 0)}[/yellow]")
     console.print(f"    🎯 Current API Key: [cyan]Key {gemini_client.current_key_index + 1}/{len(gemini_client.api_keys)}[/cyan]")
 
-    # Get usage statistics
-    usage_stats = gemini_client.get_api_key_usage_stats()
-
     # Display API key usage using clean typography
     console.print(f"\n{section_separator('API Key Usage Statistics', '-', 'simple')}")
     console.print()
@@ -701,17 +703,8 @@ def generate_cover(novel_data: Dict[str, Any], output_dir: str, auto_mode: bool
             return None
 
     # Extract novel information
-    title = novel_data["metadata"]["title"]
-    author = novel_data["metadata"]["author"]
-    genre = novel_data["metadata"]["genre"]
-
-    # Check if this is part of a series
-    series_info = None
-    if "series_info" in novel_data["metadata"]:
-        series_info = {
-            "series_title": novel_data["metadata"]["series_info"]["series_title"],
-            "book_number": novel_data["metadata"]["series_info"]["book_number"]
-        }
+    cover_params = get_cover_parameters(novel_data)
+    genre = cover_params["genre"]
 
     # Create cover generator
     cover_generator = CoverGenerator(output_dir=output_dir)
@@ -748,97 +741,15 @@ def generate_cover(novel_data: Dict[str, Any], output_dir: str, auto_mode: bool
             design_style = None
     else:
         # In auto mode, select design style based on genre with enhanced styles
-        genre_style_map = {
-            # Fiction genres
-            "thriller": "dramatic",
-            "mystery": "vintage",
-            "mystery/thriller": "bold",
-            "science fiction": "modern",
-            "fantasy": "artistic",
-            "epic fantasy": "dramatic",
-            "romance": "elegant",
-            "paranormal romance": "artistic",
-            "literary fiction": "minimalist",
-            "commercial fiction": "modern",
-            "contemporary fiction": "modern",
-            "historical fiction": "vintage",
-            "alternate history": "vintage",
-            "horror": "dramatic",
-            "young adult": "bold",
-            "middle grade": "geometric",
-            "children's chapter books": "gradient",
-            "urban fantasy": "modern",
-            "dystopian": "dramatic",
-            "speculative fiction": "modern",
-            "novella": "elegant",
-            "graphic novel": "artistic",
-            "short story collection": "minimalist",
-
-            # Non-fiction genres
-            "memoir": "elegant",
-            "biography": "classic",
-            "history": "vintage",
-            "self-help": "modern",
-            "business": "minimalist",
-            "popular science": "geometric",
-            "academic": "minimalist",
-            "travel": "artistic",
-            "cookbook": "gradient",
-            "how-to": "geometric",
-            "essay collection": "elegant",
-            "philosophy": "minimalist",
-            "true crime": "dramatic",
-            "poetry collection": "artistic",
-            "creative non-fiction": "elegant",
-
-            # Test genre
-            "test": "minimalist"
-        }
-
         # Get style based on genre or use random if genre not in map
-        design_style = genre_style_map.get(genre.lower(), None)
+        design_style = GENRE_COVER_STYLES.get(genre.lower(), None)
 
     # Generate cover
     if not auto_mode:
         console.print("[bold cyan]Generating cover...[/bold cyan]")
 
-    # Check if there's a subtitle
-    subtitle = None
-    if "subtitle" in novel_data["metadata"]:
-        subtitle = novel_data["metadata"]["subtitle"]
-
-    # Get description for enhanced cover generation
-    description = novel_data["metadata"].get("description", "")
-
-    # Extract themes from novel data for cover generation
-    themes = []
-
-    # Try to get themes from generation options in novel data
-    if "generation_options" in novel_data:
-        themes = novel_data["generation_options"].get("themes", [])
-
-    # If no themes in generation options, try to get from genre defaults
-    if not themes:
-        from src.utils.genre_defaults import get_genre_defaults
-        genre_defaults = get_genre_defaults(genre)
-        themes = genre_defaults.get("themes", [])
-
-    # If this is part of a series, try to get themes from series metadata
-    if not themes and series_info:
-        # This would require access to series manager, but for now we'll rely on genre defaults
-        pass
-
     # Generate the enhanced cover
-    cover_path = cover_generator.generate_cover(
-        title=title,
-        author=author,
-        genre=genre,
-        subtitle=subtitle,
-        series_info=series_info,
-        design_style=design_style,
-        description=description,
-        themes=themes
-    )
+    cover_path = cover_generator.generate_cover(design_style=design_style, **cover_params)
 
     if not auto_mode:
         console.print(f"[bold green]✓[/bold green] Cover generated successfully: [bold cyan]{cover_path}[/bold cyan]")
@@ -170,10 +170,8 @@ class BackMatterGenerator:
                 author = self.metadata.get("author", "")
 
                 if title and author:
-                    books = self.db_manager.get_books(status="completed")
-                    for book in books:
-                        if (book.get("title", "").lower() == title.lower() and
-                            book.get("author", "").lower() == author.lower()):
+                    for book in self.db_manager.get_books_by_author(author):
+                        if book.get("title", "").lower() == title.lower():
                             description = book.get("description", "")
                             break
             except Exception:
@@ -203,19 +201,12 @@ class BackMatterGenerator:
             HTML content for other books section
         """
         try:
-            # Get all completed books by this author
-            books = self.db_manager.get_books(status="completed")
-            author_books = []
-
+            # Get completed books by this author, excluding the current book
             current_title = self.metadata.get("title", "").lower()
-
-            for book in books:
-                book_author = book.get("author", "").lower()
-                book_title = book.get("title", "").lower()
-
-                # Match by author name and exclude current book
-                if (profile_name.lower() in book_author or book_author in profile_name.lower()) and book_title != current_title:
-                    author_books.append(book)
+            author_books = [
+                book for book in self.db_manager.get_books_by_author(profile_name)
+                if book.get("title", "").lower() != current_title
+            ]
 
             if not author_books:
                 return ""
@@ -240,7 +231,7 @@ class BackMatterGenerator:
 
                 # Get cover image if available
                 cover_html = ""
-                if book_id and self.cover_db_manager.has_cover(book_id):
+                if book_id and book.get("has_cover"):
                     cover_data_url = self.cover_db_manager.get_cover_data_url(book_id)
                     if cover_data_url:
                         cover_html = f"""
@@ -306,7 +297,7 @@ class BackMatterGenerator:
                 score += 15
 
             # 2. Prefer books with covers (more visually appealing)
-            if book.get("cover_base64"):
+            if book.get("cover_sha256") or book.get("cover_base64"):
                 score += 25
 
             # 3. Prefer books from same genre (reader interest alignment)
@@ -571,33 +562,34 @@ class BackMatterGenerator:
         """
         try:
             cover_images = []
+            max_book_number = min(total_books, 5)  # Limit to first 5 books for display
+
+            # Find the series' books in the database with one indexed lookup
+            series_books = {}
+            try:
+                for book in self.db_manager.get_series_books(series_title, max_book_number=max_book_number):
+                    book_number = (book.get("series_info") or {}).get("book_number")
+                    series_books.setdefault(book_number, []).append(book)
+            except Exception as e:
+                pass  # Fall back to the file system for every book
 
             # Check for covers for each book in the series
-            for book_num in range(1, min(total_books + 1, 6)):  # Limit to first 5 books for display
+            for book_num in range(1, max_book_number + 1):
                 cover_found = False
 
                 # Step 1: Check database for covers first
-                try:
-                    # Find books in database with matching series info
-                    all_books = self.db_manager.get_books(status="completed")
-                    for book in all_books:
-                        book_series = book.get("series_info", {})
-                        if (book_series.get("series_title") == series_title and
-                            book_series.get("book_number") == book_num):
-
-                            if self.cover_db_manager.has_cover(book["book_id"]):
-                                # Get cover as base64 data URL
-                                cover_data_url = self.cover_db_manager.get_cover_data_url(book["book_id"])
-                                if cover_data_url:
-                                    cover_images.append({
-                                        'book_number': book_num,
-                                        'base64_data': cover_data_url,
-                                        'filename': f"Book{book_num}_database.jpg"
-                                    })
-                                    cover_found = True
-                                    break
-                except Exception as e:
-                    pass  # Continue to file system check
+                for book in series_books.get(book_num, []):
+                    if book.get("has_cover"):
+                        # Get cover as base64 data URL
+                        cover_data_url = self.cover_db_manager.get_cover_data_url(book["book_id"])
+                        if cover_data_url:
+                            cover_images.append({
+                                'book_number': book_num,
+                                'base64_data': cover_data_url,
+                                'filename': f"Book{book_num}_database.jpg"
+                            })
+                            cover_found = True
+                            break
 
                 # Step 2: If not found in database, check file system
                 if not cover_found:
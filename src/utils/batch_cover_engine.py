@@ -0,0 +1,269 @@
+"""
+Parallel cover generation for batches of books.
+
+Cover rendering is CPU-bound Pillow/NumPy work, so batches are spread across a
+process pool. Each worker builds one CoverGenerator (loading its fonts once)
+and reuses it for every cover it renders; results stream back to the caller as
+they finish and are written to the database in a single transaction.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Callable
+
+import numpy as np
+
+# Cover design style used for each genre when covers are generated automatically
+GENRE_COVER_STYLES = {
+    # Fiction genres
+    "thriller": "dramatic",
+    "mystery": "vintage",
+    "mystery/thriller": "bold",
+    "science fiction": "modern",
+    "fantasy": "artistic",
+    "epic fantasy": "dramatic",
+    "romance": "elegant",
+    "paranormal romance": "artistic",
+    "literary fiction": "minimalist",
+    "commercial fiction": "modern",
+    "contemporary fiction": "modern",
+    "historical fiction": "vintage",
+    "alternate history": "vintage",
+    "horror": "dramatic",
+    "young adult": "bold",
+    "middle grade": "geometric",
+    "children's chapter books": "gradient",
+    "urban fantasy": "modern",
+    "dystopian": "dramatic",
+    "speculative fiction": "modern",
+    "novella": "elegant",
+    "graphic novel": "artistic",
+    "short story collection": "minimalist",
+
+    # Non-fiction genres
+    "memoir": "elegant",
+    "biography": "classic",
+    "history": "vintage",
+    "self-help": "modern",
+    "business": "minimalist",
+    "popular science": "geometric",
+    "academic": "minimalist",
+    "travel": "artistic",
+    "cookbook": "gradient",
+    "how-to": "geometric",
+    "essay collection": "elegant",
+    "philosophy": "minimalist",
+    "true crime": "dramatic",
+    "poetry collection": "artistic",
+    "creative non-fiction": "elegant",
+
+    # Test genre
+    "test": "minimalist"
+}
+
+
+def get_cover_parameters(novel_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract CoverGenerator.generate_cover arguments from novel data.
+
+    Args:
+        novel_data: Dictionary containing novel data
+
+    Returns:
+        Dictionary with title, author, genre, subtitle, series_info,
+        description and themes
+    """
+    metadata = novel_data["metadata"]
+    genre = metadata["genre"]
+
+    # Check if this is part of a series
+    series_info = None
+    if "series_info" in metadata:
+        series_info = {
+            "series_title": metadata["series_info"]["series_title"],
+            "book_number": metadata["series_info"]["book_number"]
+        }
+
+    # Try to get themes from generation options, then from genre defaults
+    themes = []
+    if "generation_options" in novel_data:
+        themes = novel_data["generation_options"].get("themes", [])
+
+    if not themes:
+        from src.utils.genre_defaults import get_genre_defaults
+        themes = get_genre_defaults(genre).get("themes", [])
+
+    return {
+        "title": metadata["title"],
+        "author": metadata["author"],
+        "genre": genre,
+        "subtitle": metadata.get("subtitle"),
+        "series_info": series_info,
+        "description": metadata.get("description", ""),
+        "themes": themes
+    }
+
+
+def build_cover_job(novel_data: Dict[str, Any], output_path: str, book_id: Optional[str] = None,
+                    design_style: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build a picklable cover generation job.
+
+    Args:
+        novel_data: Dictionary containing novel data
+        output_path: Where the cover image will be saved
+        book_id: Database book ID to store the cover under (optional)
+        design_style: Cover design style (defaults to the genre's automatic style)
+
+    Returns:
+        Job dictionary for BatchCoverEngine.generate_covers
+    """
+    params = get_cover_parameters(novel_data)
+    if design_style is None:
+        design_style = GENRE_COVER_STYLES.get(params["genre"].lower())
+
+    params["design_style"] = design_style
+    params["output_path"] = output_path
+
+    return {"book_id": book_id, "cover_args": params}
+
+
+# CoverGenerator owned by the current worker process
+_worker_generator = None
+
+
+def _init_cover_worker(output_dir: str) -> None:
+    """Set up a pool worker: quiet output, fresh NumPy seed and one CoverGenerator."""
+    global _worker_generator
+    from src.utils import cover_generator
+
+    # Workers would interleave their progress messages; results are reported by the parent
+    cover_generator.console.quiet = True
+
+    # Forked workers inherit the parent's NumPy RNG state; without reseeding
+    # every worker would draw the same textures
+    np.random.seed()
+
+    _worker_generator = cover_generator.CoverGenerator(output_dir=output_dir)
+
+
+def _render_cover(job: Dict[str, Any], generator=None) -> Dict[str, Any]:
+    """
+    Render a single cover with the worker's CoverGenerator.
+
+    Args:
+        job: Job dictionary from build_cover_job
+        generator: CoverGenerator to use instead of the worker's (in-process rendering)
+
+    Returns:
+        Result dictionary with book_id, title, output_path, cover_path, success,
+        error and seconds
+    """
+    args = job["cover_args"]
+    start_time = time.time()
+
+    try:
+        cover_path = (generator or _worker_generator).generate_cover(**args)
+        return {
+            "book_id": job.get("book_id"),
+            "title": args["title"],
+            "output_path": args.get("output_path"),
+            "cover_path": cover_path,
+            "success": True,
+            "error": None,
+            "seconds": time.time() - start_time
+        }
+    except Exception as e:
+        return {
+            "book_id": job.get("book_id"),
+            "title": args["title"],
+            "output_path": args.get("output_path"),
+            "cover_path": None,
+            "success": False,
+            "error": str(e),
+            "seconds": time.time() - start_time
+        }
+
+
+class BatchCoverEngine:
+    """
+    Generates many covers in parallel across a process pool.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, output_dir: str = "covers"):
+        """
+        Initialize the batch cover engine.
+
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count)
+            output_dir: Default output directory for workers' CoverGenerator
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.output_dir = output_dir
+
+    def generate_covers(self, jobs: List[Dict[str, Any]],
+                        on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Render covers for all jobs.
+
+        Args:
+            jobs: Jobs from build_cover_job
+            on_result: Called in the parent process with each result as it completes
+
+        Returns:
+            List of result dictionaries in completion order
+        """
+        results = []
+        if not jobs:
+            return results
+
+        workers = min(self.max_workers, len(jobs))
+
+        if workers <= 1:
+            # Not worth starting a pool for a single cover
+            from src.utils.cover_generator import CoverGenerator
+            generator = CoverGenerator(output_dir=self.output_dir)
+            for job in jobs:
+                result = _render_cover(job, generator)
+                results.append(result)
+                if on_result:
+                    on_result(result)
+            return results
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_cover_worker,
+                                 initargs=(self.output_dir,)) as executor:
+            futures = [executor.submit(_render_cover, job) for job in jobs]
+
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if on_result:
+                    on_result(result)
+
+        return results
+
+    def store_covers(self, results: List[Dict[str, Any]], cover_db_manager=None) -> int:
+        """
+        Store successfully generated covers in the database in one transaction.
+
+        Args:
+            results: Results from generate_covers
+            cover_db_manager: CoverDatabaseManager to use (defaults to the global one)
+
+        Returns:
+            Number of covers stored
+        """
+        covers = {
+            result["book_id"]: result["cover_path"]
+            for result in results
+            if result["success"] and result.get("book_id")
+        }
+        if not covers:
+            return 0
+
+        if cover_db_manager is None:
+            from src.database.cover_database_manager import get_cover_database_manager
+            cover_db_manager = get_cover_database_manager()
+
+        return cover_db_manager.store_covers_bulk(covers)
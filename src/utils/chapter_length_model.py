@@ -0,0 +1,173 @@
+"""
+Chapter length model learned from past generations.
+
+Every drafted chapter records the length the prompt asked for, the length the
+first draft came back at, and whether an extension call was needed. From that
+history this module predicts, per genre and writer, how many words to ask for
+so the first draft clears the minimum, and how many output tokens that draft
+needs. Until enough history exists the fixed genre rules are used unchanged.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Any, Tuple
+
+from src.database.database_manager import get_database_manager
+
+# Records needed before a writer's or genre's history is trusted
+MIN_SAMPLES = 5
+
+# Most recent records used for a prediction
+HISTORY_LIMIT = 200
+
+# Share of past drafts that should have reached the minimum at the predicted request
+TARGET_HIT_RATE = 0.8
+
+# Extra output tokens on top of the longest expected draft
+TOKEN_HEADROOM = 1.25
+
+# Never ask for more than this multiple of the minimum
+MAX_REQUEST_MULTIPLIER = 2.0
+
+# Lower bound for a predicted output token budget
+MIN_MAX_TOKENS = 8000
+
+
+@dataclass
+class ChapterLengthPlan:
+    """Requested length and token budget for a chapter draft."""
+
+    requested_words: int
+    max_tokens: int
+    samples: int = 0
+    source: str = "default"  # "writer", "genre" or "default"
+
+    @property
+    def learned(self) -> bool:
+        """Whether the plan comes from recorded history."""
+        return self.source != "default"
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Get the value at a fraction (0-1) of the sorted values, interpolating between neighbours."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class ChapterLengthModel:
+    """
+    Predicts chapter request sizes from the chapter_generation_stats history.
+    """
+
+    def __init__(self, db_manager=None):
+        """
+        Initialize the model.
+
+        Args:
+            db_manager: DatabaseManager to read and write history (defaults to the global one)
+        """
+        self.db_manager = db_manager or get_database_manager()
+
+    def _get_history(self, genre: str, writer: str) -> Tuple[List[Dict[str, Any]], str]:
+        """Get the most specific history with enough records."""
+        if writer:
+            history = self.db_manager.get_chapter_generation_history(genre, writer, HISTORY_LIMIT)
+            if len(history) >= MIN_SAMPLES:
+                return history, "writer"
+
+        history = self.db_manager.get_chapter_generation_history(genre, None, HISTORY_LIMIT)
+        if len(history) >= MIN_SAMPLES:
+            return history, "genre"
+        return [], "default"
+
+    def plan(self, genre: str, writer: str, min_words: int, default_requested_words: int,
+             default_max_tokens: int) -> ChapterLengthPlan:
+        """
+        Predict the request size that reaches min_words in one draft.
+
+        The length ratio (produced / requested words) is taken at the percentile
+        where TARGET_HIT_RATE of past drafts did at least as well, and the request
+        is scaled up by it. The token budget covers the longest expected draft
+        (90th percentile ratio) at the observed tokens per word.
+
+        Args:
+            genre: Novel genre
+            writer: Author / writer profile name
+            min_words: Minimum accepted chapter length
+            default_requested_words: Request size used without history
+            default_max_tokens: Token budget from the fixed genre rules (also the upper bound)
+
+        Returns:
+            ChapterLengthPlan
+        """
+        history, source = self._get_history(genre, writer)
+        if not history:
+            return ChapterLengthPlan(default_requested_words, default_max_tokens)
+
+        ratios = [row["produced_words"] / row["requested_words"] for row in history
+                  if row["requested_words"] > 0 and row["produced_words"] > 0]
+        tokens_per_word = [row["output_tokens"] / row["produced_words"] for row in history
+                           if row["produced_words"] > 0]
+        if len(ratios) < MIN_SAMPLES:
+            return ChapterLengthPlan(default_requested_words, default_max_tokens)
+
+        low_ratio = max(_percentile(ratios, 1 - TARGET_HIT_RATE), 0.05)
+        requested_words = math.ceil(min_words / low_ratio / 100) * 100
+        requested_words = int(min(max(requested_words, min_words), min_words * MAX_REQUEST_MULTIPLIER))
+
+        longest_draft = requested_words * max(_percentile(ratios, 0.9), 1.0)
+        max_tokens = int(longest_draft * _percentile(tokens_per_word, 0.9) * TOKEN_HEADROOM)
+        max_tokens = min(max(max_tokens, MIN_MAX_TOKENS), default_max_tokens)
+
+        return ChapterLengthPlan(requested_words, max_tokens, samples=len(ratios), source=source)
+
+    def record(self, genre: str, writer: str, min_words: int, requested_words: int, max_tokens: int,
+               first_draft: str, produced_words: int, extended: bool, final_words: int) -> None:
+        """
+        Record how a chapter draft came out.
+
+        Args:
+            genre: Novel genre
+            writer: Author / writer profile name
+            min_words: Minimum accepted chapter length
+            requested_words: Length asked for in the prompt
+            max_tokens: Output token budget of the first draft
+            first_draft: Text of the first draft (before any extension)
+            produced_words: Words in the first draft
+            extended: Whether an extension call was needed
+            final_words: Words after any extension
+        """
+        self.db_manager.record_chapter_generation({
+            "genre": genre,
+            "writer": writer,
+            "min_words": min_words,
+            "requested_words": requested_words,
+            "max_tokens": max_tokens,
+            "produced_words": produced_words,
+            "output_tokens": len(first_draft) // 4,  # Same estimate the key scheduler uses
+            "extended": extended,
+            "final_words": final_words,
+        })
+
+    def get_extension_rates(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the share of chapters per genre that needed an extension call.
+
+        Returns:
+            Dictionary mapping genre to chapter count, extension count and rate
+        """
+        return self.db_manager.get_chapter_extension_rates()
+
+
+# Global chapter length model instance
+_chapter_length_model = None
+
+def get_chapter_length_model() -> ChapterLengthModel:
+    """Get the global chapter length model instance."""
+    global _chapter_length_model
+    if _chapter_length_model is None:
+        _chapter_length_model = ChapterLengthModel()
+    return _chapter_length_model
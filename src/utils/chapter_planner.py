@@ -1,10 +1,10 @@
 """
 Utility functions for planning chapters based on genre.
 """
-import os
-import re
 from typing import Dict, Tuple, List
 
+from src.utils.genre_guidelines import get_genre_guideline_index
+
 
 def get_genre_guidelines(genre: str) -> Dict[str, any]:
     """
@@ -24,95 +24,23 @@ def get_genre_guidelines(genre: str) -> Dict[str, any]:
         "notes": "Standard novel format"
     }
 
-    # Try to find the genre in the guidelines file
-    try:
-        guidelines_path = os.path.join("docs", "genere_guideline.md")
-        with open(guidelines_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Extract the table rows - only match complete rows with exactly 5 columns
-        # Split into lines and process each line individually to avoid regex issues
-        lines = content.split('\n')
-        matches = []
-
-        for line in lines:
-            # Skip lines that don't look like table rows
-            if not line.strip().startswith('|') or line.count('|') != 6:
-                continue
-
-            # Extract the 5 columns from the line
-            parts = line.split('|')[1:6]  # Skip first empty part and take 5 columns
-            if len(parts) == 5:
-                matches.append(tuple(part.strip() for part in parts))
-
-        # Search for the genre - prioritize exact matches
-        exact_match = None
-        partial_match = None
-
-        for match in matches:
-            # Skip header rows and section dividers
-            if len(match) != 5:
-                continue
-
-            genre_name = match[0].strip()
-
-            # Skip rows that are headers or section dividers
-            if (genre_name.startswith('**') or
-                genre_name.lower() in ['genre', 'fiction', 'non-fiction', 'hybrid/specialized', 'testing'] or
-                'range' in genre_name.lower()):
-                continue
-
-            # Check for exact match first
-            if genre.lower() == genre_name.lower():
-                exact_match = match
-                break
-            # Check for partial match (genre is contained in genre_name)
-            elif genre.lower() in genre_name.lower() and len(genre) > 3:
-                if partial_match is None:  # Take the first partial match
-                    partial_match = match
-
-        # Use exact match if found, otherwise use partial match
-        selected_match = exact_match or partial_match
-        if selected_match:
-            # Extract chapter range
-            chapter_range_str = selected_match[2].strip()
-            chapter_numbers = re.findall(r'\d+', chapter_range_str)
-            if len(chapter_numbers) >= 2:
-                chapter_min, chapter_max = map(int, chapter_numbers[:2])
-
-                # Extract word count range - look for numbers with commas first
-                word_count_str = selected_match[3].strip()
-                # First try to find numbers with commas (e.g., "50,000-90,000")
-                word_count_with_commas = re.findall(r'\d{1,3}(?:,\d{3})+', word_count_str)
-                if len(word_count_with_commas) >= 2:
-                    word_count_min = int(word_count_with_commas[0].replace(',', ''))
-                    word_count_max = int(word_count_with_commas[1].replace(',', ''))
-                else:
-                    # Fallback to regular number extraction
-                    word_count_numbers = re.findall(r'\d+', word_count_str)
-                    if len(word_count_numbers) >= 2:
-                        word_count_min, word_count_max = map(int, word_count_numbers[:2])
-                    else:
-                        # Use defaults if parsing fails
-                        word_count_min, word_count_max = 70000, 90000
-
-                # Calculate average chapter length
-                avg_min = word_count_min // chapter_max
-                avg_max = word_count_max // chapter_min
-
-                return {
-                    "chapter_range": (chapter_min, chapter_max),
-                    "word_count_range": (word_count_min, word_count_max),
-                    "chapter_length": (avg_min, avg_max),
-                    "notes": selected_match[4].strip()
-                }
-
-        # If genre not found, return default
+    guideline = get_genre_guideline_index().get(genre)
+    if guideline is None or guideline.chapter_range is None:
         return default_guidelines
 
-    except Exception as e:
-        print(f"Error reading genre guidelines: {e}")
-        return default_guidelines
+    chapter_min, chapter_max = guideline.chapter_range
+    word_count_min, word_count_max = guideline.word_count_range
+
+    # Calculate average chapter length
+    avg_min = word_count_min // chapter_max
+    avg_max = word_count_max // chapter_min
+
+    return {
+        "chapter_range": (chapter_min, chapter_max),
+        "word_count_range": (word_count_min, word_count_max),
+        "chapter_length": (avg_min, avg_max),
+        "notes": guideline.notes
+    }
 
 
 def recommend_chapter_count(genre: str, target_length: str = "medium") -> int:
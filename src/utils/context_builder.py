@@ -0,0 +1,344 @@
+"""
+Token-budgeted context builder for chapter prompts.
+
+Chapter prompts used to inline every previous chapter summary, character,
+relationship and tracked element, so prompts grew with every chapter written.
+The builder turns the chapter context into candidate prompt lines, ranks them
+by recency, relevance to the chapter's POV character and outline entry, and
+open plot status, and keeps the best ones that fit a fixed token budget. Recent
+chapter summaries that don't fit are compressed into arc summaries, which share
+a reserved part of the budget with the arc summaries and synopsis that the
+memory manager rolls up for older chapters.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set
+
+# Default prompt budget for the budgeted context sections, in tokens
+DEFAULT_CONTEXT_TOKEN_BUDGET = 6000
+
+# Share of the budget held back for arc summaries of chapters that don't fit
+ARC_RESERVE_SHARE = 0.15
+
+# Chapters covered by one arc summary, and the size cap of each arc summary
+ARC_CHAPTERS = 5
+ARC_SUMMARY_MAX_TOKENS = 120
+
+# Budgeted prompt sections, in prompt order
+CONTEXT_SECTIONS = (
+    "character_info", "previous_chapters", "character_state_info", "relationship_info",
+    "plot_thread_info", "unresolved_info", "setting_info", "thematic_info", "continuity_info",
+)
+
+# Plot thread statuses that mean the thread no longer needs attention
+CLOSED_STATUS_PATTERN = re.compile(r"\b(resolved|completed|concluded|closed|finished)\b", re.IGNORECASE)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a piece of prompt text.
+
+    Uses the same ~4 characters per token approximation as the key scheduler.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Estimated token count
+    """
+    return (len(text) + 3) // 4
+
+
+@dataclass
+class ContextItem:
+    """One candidate line of chapter context."""
+    section: str
+    text: str
+    score: float
+    order: int  # Position within its section in the final prompt
+    pinned: bool = False  # Always included, ahead of ranked items
+    chapter_num: Optional[int] = None  # Set for previous chapter summaries
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+
+@dataclass
+class BudgetedContext:
+    """Prompt sections selected to fit a token budget."""
+    sections: Dict[str, str]
+    token_usage: Dict[str, int]
+    token_budget: int
+    fixed_tokens: int = 0
+    dropped_items: Dict[str, int] = field(default_factory=dict)
+    arc_summaries: List[str] = field(default_factory=list)
+
+    @property
+    def total_tokens(self) -> int:
+        """Tokens used by the budgeted sections plus fixed prompt parts."""
+        return sum(self.token_usage.values()) + self.fixed_tokens
+
+
+class ChapterContextBuilder:
+    """
+    Selects chapter context for a prompt within a token budget.
+    """
+
+    def __init__(self, context: Dict[str, Any], chapter_num: int, pov_name: Optional[str] = None,
+                 token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET, fixed_text: str = ""):
+        """
+        Initialize the builder.
+
+        Args:
+            context: Chapter context from MemoryManager.get_context_for_chapter
+            chapter_num: Chapter being generated
+            pov_name: Name of the chapter's POV character, if known
+            token_budget: Token budget for the context sections
+            fixed_text: Prompt text that is always included (e.g. series information),
+                counted against the budget
+        """
+        self.context = context
+        self.chapter_num = int(chapter_num)
+        self.pov_name = pov_name
+        self.token_budget = token_budget
+        self.fixed_tokens = estimate_tokens(fixed_text) if fixed_text else 0
+        self.narrative_context = context.get("narrative_context", {}) or {}
+        self.focus_names = self._get_focus_names()
+
+    def _get_outline_entry(self) -> str:
+        """Get this chapter's outline entry."""
+        outline = (self.context.get("structure") or {}).get("outline", [])
+        if 0 < self.chapter_num <= len(outline):
+            return str(outline[self.chapter_num - 1])
+        return str(self.context.get("chapter_title", ""))
+
+    def _get_focus_names(self) -> Set[str]:
+        """
+        Get the names this chapter is about: the POV character and any known
+        entity mentioned in the chapter's outline entry.
+
+        Returns:
+            Lowercased entity names
+        """
+        outline_entry = self._get_outline_entry().lower()
+
+        candidates = {char.get("name", "") for char in self.context.get("characters", [])}
+        for category in ("relationships", "plot_threads", "continuity", "objects", "world_building"):
+            for key in (self.narrative_context.get(category) or {}):
+                candidates.add(str(key))
+                # Relationship keys like "Mira-Tobin" name two characters
+                candidates.update(re.split(r"\s*(?:-|&|/|\band\b)\s*", str(key)))
+
+        focus = {name.lower() for name in candidates if len(name) > 2 and name.lower() in outline_entry}
+        if self.pov_name:
+            focus.add(self.pov_name.lower())
+        return focus
+
+    def _mentions_focus(self, text: str) -> bool:
+        """Check whether text mentions the POV character or an outline entity."""
+        lowered = text.lower()
+        return any(name in lowered for name in self.focus_names)
+
+    def _collect_items(self) -> List[ContextItem]:
+        """
+        Turn the chapter context into scored candidate lines.
+
+        Returns:
+            List of context items
+        """
+        items: List[ContextItem] = []
+
+        def add(section: str, text: str, score: float, pinned: bool = False, chapter_num: int = None) -> None:
+            if self._mentions_focus(text):
+                score += 2.0
+            items.append(ContextItem(section, text, score, len(items), pinned, chapter_num))
+
+        # Characters; main characters rank above minor ones
+        for char in self.context.get("characters", []):
+            name = char.get("name", "")
+            role = char.get("role", "")
+            traits = char.get("personality_traits", char.get("personality", ""))
+            is_pov = bool(self.pov_name) and name == self.pov_name
+            main_role = any(word in str(role).lower() for word in ("protagonist", "antagonist", "main"))
+            add("character_info", f"- {name} ({role}): {traits}\n", 3.5 if main_role else 2.5, pinned=is_pov)
+
+        # Previous chapter summaries, most recent first; the last chapter is always kept
+        for prev_chapter in self.context.get("previous_chapters", []):
+            prev_num = prev_chapter.get("chapter_num", 0)
+            distance = max(1, self.chapter_num - int(prev_num or 0))
+            add("previous_chapters", f"- Chapter {prev_num}: {prev_chapter.get('summary', '')}\n",
+                3.0 * (0.8 ** (distance - 1)), pinned=distance == 1, chapter_num=int(prev_num or 0))
+
+        # Character states
+        narrative = self.narrative_context
+        for char_name, emotions in (narrative.get("character_emotions") or {}).items():
+            add("character_state_info", f"- {char_name}'s emotional state: {emotions}\n", 0.75)
+        for char_name, knowledge in (narrative.get("character_knowledge") or {}).items():
+            add("character_state_info", f"- {char_name} knows: {knowledge}\n", 0.75)
+        for char_name, location in (narrative.get("character_locations") or {}).items():
+            add("character_state_info", f"- {char_name}'s current location: {location}\n", 0.75)
+
+        for rel_key, status in (narrative.get("relationships") or {}).items():
+            add("relationship_info", f"- Relationship between {rel_key}: {status}\n", 0.75)
+
+        # Open plot threads and recent questions matter more than settled ones
+        for thread_name, status in (narrative.get("plot_threads") or {}).items():
+            is_open = not CLOSED_STATUS_PATTERN.search(str(status))
+            add("plot_thread_info", f"- Plot thread '{thread_name}': {status}\n", 2.0 if is_open else 0.25)
+
+        questions = list(narrative.get("unresolved_questions") or [])
+        for index, question in enumerate(questions):
+            add("unresolved_info", f"- Unresolved question: {question}\n", 1.5 + index / max(1, len(questions)))
+
+        # Time and weather are a couple of short lines and always kept
+        if narrative.get("time_of_day"):
+            add("setting_info", f"- Current time of day: {narrative['time_of_day']}\n", 0.0, pinned=True)
+        if narrative.get("weather"):
+            add("setting_info", f"- Current weather conditions: {narrative['weather']}\n", 0.0, pinned=True)
+
+        for theme in (narrative.get("themes") or {}):
+            add("thematic_info", f"- Theme '{theme}': Continue developing this theme\n", 0.5)
+        for symbol in (narrative.get("symbols") or {}):
+            add("thematic_info", f"- Symbol '{symbol}': Consider using this symbol again\n", 0.3)
+
+        for element, details in (narrative.get("continuity") or {}).items():
+            add("continuity_info", f"- Continuity element '{element}': {details}\n", 0.5)
+
+        return items
+
+    @staticmethod
+    def _compress_summary(summary: str) -> str:
+        """Reduce a chapter summary to its first sentence."""
+        summary = " ".join(str(summary).split())
+        match = re.match(r"(.+?[.!?])(\s|$)", summary)
+        return match.group(1) if match else summary
+
+    def _build_arc_summaries(self, omitted: List[ContextItem]) -> List[ContextItem]:
+        """
+        Compress omitted chapter summaries into one line per arc of ARC_CHAPTERS chapters.
+
+        Args:
+            omitted: Chapter summary items that didn't fit the budget
+
+        Returns:
+            Arc summary items, oldest first
+        """
+        summaries = {int(c.get("chapter_num", 0)): c.get("summary", "")
+                     for c in self.context.get("previous_chapters", [])}
+
+        arcs: Dict[int, List[int]] = {}
+        for item in omitted:
+            arcs.setdefault((item.chapter_num - 1) // ARC_CHAPTERS, []).append(item.chapter_num)
+
+        arc_items = []
+        max_chars = ARC_SUMMARY_MAX_TOKENS * 4
+        for arc_index in sorted(arcs):
+            chapters = sorted(arcs[arc_index])
+            span = f"Chapter {chapters[0]}" if len(chapters) == 1 else f"Chapters {chapters[0]}-{chapters[-1]}"
+            text = " ".join(self._compress_summary(summaries.get(n, "")) for n in chapters)
+            if len(text) > max_chars:
+                text = text[:max_chars - 3].rstrip() + "..."
+            arc_items.append(ContextItem("previous_chapters", f"- {span} (summary): {text}\n",
+                                         0.0, order=-len(arcs) + len(arc_items), chapter_num=chapters[0]))
+        return arc_items
+
+    def _get_history_items(self) -> List[ContextItem]:
+        """
+        Get the rolled-up chapter history the memory manager provides for
+        chapters before the recent ones: a synopsis and arc summaries.
+
+        Returns:
+            History items, oldest first
+        """
+        history = []
+        synopsis = self.context.get("book_synopsis")
+        if synopsis:
+            history.append(ContextItem("previous_chapters", f"- Earlier chapters (synopsis): {synopsis}\n",
+                                       0.0, order=-10000))
+
+        arcs = self.context.get("arc_summaries") or []
+        for index, arc in enumerate(arcs):
+            start, end = arc.get("chapters", [0, 0])
+            history.append(ContextItem("previous_chapters", f"- Chapters {start}-{end} (summary): {arc.get('summary', '')}\n",
+                                       0.0, order=-1000 - len(arcs) + index, chapter_num=start))
+        return history
+
+    def build(self) -> BudgetedContext:
+        """
+        Select context lines that fit the token budget.
+
+        Returns:
+            BudgetedContext with the prompt text and token usage of each section
+        """
+        items = self._collect_items()
+        available = max(0, self.token_budget - self.fixed_tokens)
+        arc_reserve = int(available * ARC_RESERVE_SHARE)
+
+        selected: List[ContextItem] = []
+        used = 0
+
+        def take(candidates: List[ContextItem], limit: int) -> List[ContextItem]:
+            nonlocal used
+            skipped = []
+            for item in candidates:
+                if item.pinned or used + item.tokens <= limit:
+                    selected.append(item)
+                    used += item.tokens
+                else:
+                    skipped.append(item)
+            return skipped
+
+        pinned = [item for item in items if item.pinned]
+        ranked = sorted((item for item in items if not item.pinned), key=lambda item: (-item.score, item.order))
+
+        take(pinned, available)
+        skipped = take(ranked, available - arc_reserve)
+
+        # Recent chapters that didn't make it are compressed into arcs; these and the
+        # rolled-up history of older chapters fill the reserve, newest first
+        omitted_chapters = [item for item in skipped if item.chapter_num is not None]
+        arc_items = self._get_history_items() + self._build_arc_summaries(omitted_chapters)
+        dropped_arcs = take(sorted(arc_items, key=lambda item: -item.order), available)
+
+        # Whatever is left of the budget goes to the remaining ranked items
+        skipped = take([item for item in skipped if item.chapter_num is None], available)
+
+        sections = {}
+        token_usage = {}
+        for section in CONTEXT_SECTIONS:
+            section_items = sorted((item for item in selected if item.section == section), key=lambda item: item.order)
+            sections[section] = "".join(item.text for item in section_items)
+            token_usage[section] = sum(item.tokens for item in section_items)
+
+        dropped_items: Dict[str, int] = {}
+        for item in skipped + dropped_arcs:
+            dropped_items[item.section] = dropped_items.get(item.section, 0) + 1
+
+        return BudgetedContext(
+            sections=sections,
+            token_usage=token_usage,
+            token_budget=self.token_budget,
+            fixed_tokens=self.fixed_tokens,
+            dropped_items=dropped_items,
+            arc_summaries=[item.text for item in arc_items if item in selected]
+        )
+
+
+def build_chapter_context(context: Dict[str, Any], chapter_num: int, pov_name: Optional[str] = None,
+                          token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET, fixed_text: str = "") -> BudgetedContext:
+    """
+    Select chapter context for a prompt within a token budget.
+
+    Args:
+        context: Chapter context from MemoryManager.get_context_for_chapter
+        chapter_num: Chapter being generated
+        pov_name: Name of the chapter's POV character, if known
+        token_budget: Token budget for the context sections
+        fixed_text: Prompt text that is always included, counted against the budget
+
+    Returns:
+        BudgetedContext with the prompt text and token usage of each section
+    """
+    return ChapterContextBuilder(context, chapter_num, pov_name, token_budget, fixed_text).build()
@@ -645,86 +645,68 @@ class CoverGenerator:
     def _create_advanced_gradient(self, width: int, height: int, colors: List[Tuple[int, int, int]],
                                   style: str = "linear") -> Image.Image:
         """Create sophisticated gradient backgrounds."""
+        # Pixel coordinate grids (broadcast as a column and a row)
+        ys = np.arange(height)[:, np.newaxis]
+        xs = np.arange(width)[np.newaxis, :]
+        palette = np.array(colors, dtype=np.float64)
+
         if style == "radial":
             # Create radial gradient with multiple color stops
             center_x, center_y = width // 2, height // 2
             max_radius = math.sqrt(center_x ** 2 + center_y ** 2)
 
-            gradient = np.zeros((height, width, 3), dtype=np.uint8)
-
-            for y in range(height):
-                for x in range(width):
-                    distance = math.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
-                    ratio = min(distance / max_radius, 1.0)
-
-                    # Interpolate between colors
-                    if len(colors) >= 3:
-                        if ratio < 0.5:
-                            t = ratio * 2
-                            r = int(colors[0][0] * (1 - t) + colors[1][0] * t)
-                            g = int(colors[0][1] * (1 - t) + colors[1][1] * t)
-                            b = int(colors[0][2] * (1 - t) + colors[1][2] * t)
-                        else:
-                            t = (ratio - 0.5) * 2
-                            r = int(colors[1][0] * (1 - t) + colors[2][0] * t)
-                            g = int(colors[1][1] * (1 - t) + colors[2][1] * t)
-                            b = int(colors[1][2] * (1 - t) + colors[2][2] * t)
-                    else:
-                        r = int(colors[0][0] * (1 - ratio) + colors[1][0] * ratio)
-                        g = int(colors[0][1] * (1 - ratio) + colors[1][1] * ratio)
-                        b = int(colors[0][2] * (1 - ratio) + colors[1][2] * ratio)
-
-                    gradient[y, x] = [r, g, b]
-
-            return Image.fromarray(gradient, 'RGB')
+            distance = np.sqrt((xs - center_x) ** 2 + (ys - center_y) ** 2)
+            ratio = np.minimum(distance / max_radius, 1.0)[..., np.newaxis]
+
+            # Interpolate between colors
+            if len(colors) >= 3:
+                inner_t = ratio * 2
+                outer_t = (ratio - 0.5) * 2
+                rgb = np.where(
+                    ratio < 0.5,
+                    palette[0] * (1 - inner_t) + palette[1] * inner_t,
+                    palette[1] * (1 - outer_t) + palette[2] * outer_t
+                )
+            else:
+                rgb = palette[0] * (1 - ratio) + palette[1] * ratio
+
+            return Image.fromarray(rgb.astype(np.uint8), 'RGB')
 
         elif style == "angular":
             # Create angular/diamond gradient
-            gradient = np.zeros((height, width, 3), dtype=np.uint8)
             center_x, center_y = width // 2, height // 2
 
-            for y in range(height):
-                for x in range(width):
-                    # Calculate angular distance
-                    dx = abs(x - center_x) / (width / 2)
-                    dy = abs(y - center_y) / (height / 2)
-                    ratio = min(max(dx, dy), 1.0)
+            # Calculate angular distance
+            dx = np.abs(xs - center_x) / (width / 2)
+            dy = np.abs(ys - center_y) / (height / 2)
+            ratio = np.minimum(np.maximum(dx, dy), 1.0)[..., np.newaxis]
 
-                    r = int(colors[0][0] * (1 - ratio) + colors[1][0] * ratio)
-                    g = int(colors[0][1] * (1 - ratio) + colors[1][1] * ratio)
-                    b = int(colors[0][2] * (1 - ratio) + colors[1][2] * ratio)
+            rgb = palette[0] * (1 - ratio) + palette[1] * ratio
 
-                    gradient[y, x] = [r, g, b]
-
-            return Image.fromarray(gradient, 'RGB')
+            return Image.fromarray(rgb.astype(np.uint8), 'RGB')
 
         elif style == "conic":
             # Create conic/spiral gradient
-            gradient = np.zeros((height, width, 3), dtype=np.uint8)
             center_x, center_y = width // 2, height // 2
 
-            for y in range(height):
-                for x in range(width):
-                    angle = math.atan2(y - center_y, x - center_x)
-                    ratio = (angle + math.pi) / (2 * math.pi)  # Normalize to 0-1
-
-                    # Create smooth color transitions
-                    color_index = ratio * (len(colors) - 1)
-                    idx = int(color_index)
-                    t = color_index - idx
-
-                    if idx >= len(colors) - 1:
-                        color = colors[-1]
-                    else:
-                        color1, color2 = colors[idx], colors[idx + 1]
-                        r = int(color1[0] * (1 - t) + color2[0] * t)
-                        g = int(color1[1] * (1 - t) + color2[1] * t)
-                        b = int(color1[2] * (1 - t) + color2[2] * t)
-                        color = (r, g, b)
-
-                    gradient[y, x] = color
+            angle = np.arctan2(ys - center_y, xs - center_x)
+            ratio = (angle + math.pi) / (2 * math.pi)  # Normalize to 0-1
+
+            # Create smooth color transitions
+            color_index = ratio * (len(colors) - 1)
+            idx = color_index.astype(np.int64)
+            t = (color_index - idx)[..., np.newaxis]
+
+            last = len(colors) - 1
+            color1 = palette[np.minimum(idx, last)]
+            color2 = palette[np.minimum(idx + 1, last)]
+            rgb = np.where(
+                (idx >= last)[..., np.newaxis],
+                palette[-1],
+                color1 * (1 - t) + color2 * t
+            )
 
-            return Image.fromarray(gradient, 'RGB')
+            return Image.fromarray(rgb.astype(np.uint8), 'RGB')
 
         else:  # linear gradient (default)
             gradient = np.linspace(0, 1, max(width, height))
@@ -738,10 +720,10 @@ class CoverGenerator:
                 g = np.interp(gradient, [0, 1], [colors[0][1], colors[1][1]])
                 b = np.interp(gradient, [0, 1], [colors[0][2], colors[1][2]])
 
+            # Sample one gradient entry per row and repeat it across the width
+            row_idx = (np.arange(height) * len(gradient) / height).astype(np.int64)
             gradient_img = np.zeros((height, width, 3), dtype=np.uint8)
-            for i in range(height):
-                idx = int(i * len(gradient) / height)
-                gradient_img[i, :] = [r[idx], g[idx], b[idx]]
+            gradient_img[:] = np.stack([r[row_idx], g[row_idx], b[row_idx]], axis=-1)[:, np.newaxis, :]
 
             return Image.fromarray(gradient_img, 'RGB')
 
@@ -863,14 +845,16 @@ class CoverGenerator:
             noise = np.random.rand(height, width) * 0.4 + 0.8
             paper_texture = (noise * 255).astype(np.uint8)
 
-            # Add paper grain pattern
+            # Add paper grain pattern: darken a sparse random subset of grain-sized tiles.
+            # One random() draw per tile in row-major order keeps seeded output stable.
             grain_size = 3
-            for y in range(0, height, grain_size):
-                for x in range(0, width, grain_size):
-                    if random.random() < 0.1:  # Sparse grain
-                        end_y = min(y + grain_size, height)
-                        end_x = min(x + grain_size, width)
-                        paper_texture[y:end_y, x:end_x] = (paper_texture[y:end_y, x:end_x] * 0.9).astype(np.uint8)
+            tiles_y = -(-height // grain_size)
+            tiles_x = -(-width // grain_size)
+            draws = np.fromiter((random.random() for _ in range(tiles_y * tiles_x)),
+                                dtype=np.float64, count=tiles_y * tiles_x)
+            grain_tiles = (draws < 0.1).reshape(tiles_y, tiles_x)  # Sparse grain
+            grain_mask = np.repeat(np.repeat(grain_tiles, grain_size, axis=0), grain_size, axis=1)[:height, :width]
+            paper_texture = np.where(grain_mask, (paper_texture * 0.9).astype(np.uint8), paper_texture)
 
             texture_img = Image.fromarray(paper_texture, 'L')
             texture_img = texture_img.convert('RGB')
@@ -883,12 +867,11 @@ class CoverGenerator:
             # Create canvas texture
             canvas = np.ones((height, width), dtype=np.float32)
 
-            # Add canvas weave pattern
+            # Add canvas weave pattern (checkerboard of weave-sized tiles)
             weave_size = 4
-            for y in range(0, height, weave_size):
-                for x in range(0, width, weave_size):
-                    if (x // weave_size + y // weave_size) % 2:
-                        canvas[y:y + weave_size, x:x + weave_size] *= 0.95
+            weave_mask = (np.arange(height)[:, np.newaxis] // weave_size +
+                          np.arange(width)[np.newaxis, :] // weave_size) % 2 == 1
+            canvas[weave_mask] *= 0.95
 
             # Add random variations
             canvas += np.random.normal(0, 0.02, (height, width))
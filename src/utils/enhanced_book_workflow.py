@@ -93,9 +93,8 @@ class EnhancedBookWorkflow:
         try:
             print(f"🔄 Starting batch processing (max {max_books} books)")
 
-            # Get books needing descriptions
-            books_needing_descriptions = self.db_manager.get_books_needing_descriptions()
-            books_to_process = books_needing_descriptions[:max_books]
+            # Get books needing descriptions; only the rows to process are loaded
+            books_to_process = self.db_manager.get_books_needing_descriptions(limit=max_books)
 
             if not books_to_process:
                 print("✅ No books need description processing")
@@ -270,12 +269,11 @@ class EnhancedBookWorkflow:
             Dictionary with processing status information
         """
         try:
-            books_needing_descriptions = len(self.db_manager.get_books_needing_descriptions())
-            books_needing_back_covers = len(self.db_manager.get_books_needing_back_covers())
-
-            # Get total completed books
-            completed_books = self.db_manager.get_books(status="completed")
-            total_completed = len(completed_books)
+            # Count completed books and their flags in one aggregate query
+            counts = self.db_manager.get_completion_counts(status="completed")
+            total_completed = counts["total_books"]
+            books_needing_descriptions = total_completed - counts["description_enhanced"]
+            books_needing_back_covers = total_completed - counts["back_cover_generated"]
 
             # Calculate completion rates
             description_completion = 0
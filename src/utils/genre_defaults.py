@@ -43,9 +43,10 @@ Chapter Parameters:
 - chapter_length: Average words per chapter
 - min_chapter_length: Minimum words per chapter to avoid excessive chapter splitting
 """
-import re
 from typing import Dict, Any, List, Optional, Tuple
 
+from src.utils.genre_guidelines import get_genre_guideline_index, parse_guidelines
+
 
 def get_genre_defaults(genre: str) -> Dict[str, Any]:
     """
@@ -617,140 +618,62 @@ def extract_from_guidelines(genre: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary with default options or None if not found
     """
-    try:
-        import os
-        guidelines_path = os.path.join("docs", "genere_guideline.md")
-        with open(guidelines_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Extract the table rows - only match complete rows with exactly 5 columns
-        # Split into lines and process each line individually to avoid regex issues
-        lines = content.split('\n')
-        matches = []
-
-        for line in lines:
-            # Skip lines that don't look like table rows
-            if not line.strip().startswith('|') or line.count('|') != 6:
-                continue
-
-            # Extract the 5 columns from the line
-            parts = line.split('|')[1:6]  # Skip first empty part and take 5 columns
-            if len(parts) == 5:
-                matches.append(tuple(part.strip() for part in parts))
-
-        # Search for the genre - prioritize exact matches
-        exact_match = None
-        partial_match = None
-
-        for match in matches:
-            # Skip header rows and section dividers
-            if len(match) != 5:
-                continue
-
-            genre_name = match[0].strip()
-
-            # Skip rows that are headers or section dividers
-            if (genre_name.startswith('**') or
-                genre_name.lower() in ['genre', 'fiction', 'non-fiction', 'hybrid/specialized', 'testing'] or
-                'range' in genre_name.lower()):
-                continue
-
-            # Check for exact match first
-            if genre.lower() == genre_name.lower():
-                exact_match = match
-                break
-            # Check for partial match (genre is contained in genre_name)
-            elif genre.lower() in genre_name.lower() and len(genre) > 3:
-                if partial_match is None:  # Take the first partial match
-                    partial_match = match
-
-        # Use exact match if found, otherwise use partial match
-        selected_match = exact_match or partial_match
-        if selected_match:
-            # Extract chapter range
-            chapter_range_str = selected_match[2].strip()
-            chapter_numbers = re.findall(r'\d+', chapter_range_str)
-            if len(chapter_numbers) >= 2:
-                chapter_min, chapter_max = map(int, chapter_numbers[:2])
-                chapter_count = (chapter_min + chapter_max) // 2
-
-                # Extract word count range - look for numbers with commas first
-                word_count_str = selected_match[3].strip()
-                # First try to find numbers with commas (e.g., "50,000-90,000")
-                word_count_with_commas = re.findall(r'\d{1,3}(?:,\d{3})+', word_count_str)
-                if len(word_count_with_commas) >= 2:
-                    word_count_min = int(word_count_with_commas[0].replace(',', ''))
-                    word_count_max = int(word_count_with_commas[1].replace(',', ''))
-                else:
-                    # Fallback to regular number extraction
-                    word_count_numbers = re.findall(r'\d+', word_count_str)
-                    if len(word_count_numbers) >= 2:
-                        word_count_min, word_count_max = map(int, word_count_numbers[:2])
-                    else:
-                        # Use defaults if parsing fails
-                        word_count_min, word_count_max = 70000, 90000
-
-                target_word_count = (word_count_min + word_count_max) // 2
-
-                # Calculate chapter length
-                chapter_length = target_word_count // chapter_count
-
-                # Determine target length
-                if target_word_count < 60000:
-                    target_length = "short"
-                elif target_word_count > 100000:
-                    target_length = "long"
-                else:
-                    target_length = "medium"
-
-                # Determine POV and writing style from additional sections
-                pov = determine_pov_from_guidelines(genre, content)
-                writing_style = determine_writing_style_from_genre(genre)
-                themes = determine_themes_from_genre(genre)
-
-                return {
-                    "target_length": target_length,
-                    "writing_style": writing_style,
-                    "pov": pov,
-                    "themes": themes,
-                    "chapter_count": chapter_count,
-                    "target_word_count": target_word_count,
-                    "chapter_length": chapter_length,
-                }
-
+    guideline = get_genre_guideline_index().get(genre)
+    if guideline is None or guideline.chapter_range is None:
         return None
 
-    except Exception as e:
-        print(f"Error extracting from guidelines: {e}")
-        return None
+    chapter_min, chapter_max = guideline.chapter_range
+    chapter_count = (chapter_min + chapter_max) // 2
+    word_count_min, word_count_max = guideline.word_count_range
+    target_word_count = (word_count_min + word_count_max) // 2
+
+    # Calculate chapter length
+    chapter_length = target_word_count // chapter_count
 
+    # Determine target length
+    if target_word_count < 60000:
+        target_length = "short"
+    elif target_word_count > 100000:
+        target_length = "long"
+    else:
+        target_length = "medium"
 
-def determine_pov_from_guidelines(genre: str, content: str) -> str:
+    return {
+        "target_length": target_length,
+        "writing_style": determine_writing_style_from_genre(genre),
+        "pov": determine_pov_from_guidelines(genre),
+        "themes": determine_themes_from_genre(genre),
+        "chapter_count": chapter_count,
+        "target_word_count": target_word_count,
+        "chapter_length": chapter_length,
+    }
+
+
+def determine_pov_from_guidelines(genre: str, content: Optional[str] = None) -> str:
     """
     Determine POV from guidelines content.
 
     Args:
         genre: The genre to look for
-        content: The content of the guidelines file
+        content: Guidelines text to search (defaults to the indexed guidelines file)
 
     Returns:
         Recommended POV
     """
-    # Look for POV patterns section
-    pov_section_match = re.search(r"### POV Patterns by Genre(.*?)###", content, re.DOTALL)
-
-    if pov_section_match:
-        pov_section = pov_section_match.group(1)
-
-        # Check for genre-specific POV
-        for line in pov_section.split('\n'):
-            if genre.lower() in line.lower():
-                if "first person" in line.lower():
-                    return "First person"
-                elif "multiple" in line.lower():
-                    return "Multiple POVs"
-                elif "third" in line.lower():
-                    return "Third person limited"
+    if content is None:
+        pov_lines = get_genre_guideline_index().get_pov_patterns(genre)
+    else:
+        _, pov_lines = parse_guidelines(content)
+        pov_lines = [line.lower() for line in pov_lines if genre.lower() in line.lower()]
+
+    # Check for genre-specific POV
+    for line in pov_lines:
+        if "first person" in line:
+            return "First person"
+        elif "multiple" in line:
+            return "Multiple POVs"
+        elif "third" in line:
+            return "Third person limited"
 
     # Default POVs by genre type
     if any(g in genre.lower() for g in ["mystery", "thriller", "horror", "young adult"]):
@@ -0,0 +1,265 @@
+"""
+Compiled index of the genre guidelines in docs/genere_guideline.md.
+
+The guideline table is parsed once into records keyed by normalized genre
+name, and resolved lookups (including partial matches such as "Mystery" for
+"Mystery/Thriller") are memoized. The index is rebuilt only when the file's
+modification time changes, and can optionally be serialized to a JSON cache
+file so a fresh process skips parsing as well.
+"""
+
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+
+GUIDELINES_PATH = os.path.join("docs", "genere_guideline.md")
+
+# Version of the serialized cache layout
+CACHE_VERSION = 1
+
+# First-column values that are table headers or section dividers, not genres
+_NON_GENRE_ROWS = {"genre", "fiction", "non-fiction", "hybrid/specialized", "testing"}
+
+# Word count range used when a row's range cannot be parsed
+_DEFAULT_WORD_COUNT_RANGE = (70000, 90000)
+
+
+@dataclass
+class GenreGuideline:
+    """One row of the genre guideline table."""
+
+    name: str
+    type: str
+    chapter_range: Optional[Tuple[int, int]]  # None if the row's range cannot be parsed
+    word_count_range: Tuple[int, int]
+    notes: str
+
+
+def normalize_genre(genre: str) -> str:
+    """Normalize a genre name for lookups (case and whitespace insensitive)."""
+    return " ".join(str(genre).lower().split())
+
+
+def _parse_row(parts: List[str]) -> GenreGuideline:
+    """Parse the five columns of a guideline table row."""
+    name, row_type, chapter_range_str, word_count_str, notes = parts
+
+    chapter_numbers = re.findall(r'\d+', chapter_range_str)
+    chapter_range = tuple(map(int, chapter_numbers[:2])) if len(chapter_numbers) >= 2 else None
+
+    # Look for numbers with commas first (e.g. "50,000-90,000")
+    word_count_with_commas = re.findall(r'\d{1,3}(?:,\d{3})+', word_count_str)
+    word_count_numbers = re.findall(r'\d+', word_count_str)
+    if len(word_count_with_commas) >= 2:
+        word_count_range = tuple(int(n.replace(',', '')) for n in word_count_with_commas[:2])
+    elif len(word_count_numbers) >= 2:
+        word_count_range = tuple(map(int, word_count_numbers[:2]))
+    else:
+        word_count_range = _DEFAULT_WORD_COUNT_RANGE
+
+    return GenreGuideline(name, row_type, chapter_range, word_count_range, notes)
+
+
+def parse_guidelines(content: str) -> Tuple[List[GenreGuideline], List[str]]:
+    """
+    Parse guideline markdown into genre rows and POV pattern lines.
+
+    Args:
+        content: Contents of the guidelines file
+
+    Returns:
+        Tuple of (genre rows in file order, lines of the POV Patterns section)
+    """
+    guidelines = []
+    for line in content.split('\n'):
+        # Only complete table rows with exactly 5 columns
+        if not line.strip().startswith('|') or line.count('|') != 6:
+            continue
+
+        parts = [part.strip() for part in line.split('|')[1:6]]
+        name = parts[0]
+        if (name.startswith('**') or name.startswith('-') or
+                name.lower() in _NON_GENRE_ROWS or 'range' in name.lower()):
+            continue
+        guidelines.append(_parse_row(parts))
+
+    pov_lines = []
+    pov_section_match = re.search(r"### POV Patterns by Genre(.*?)###", content, re.DOTALL)
+    if pov_section_match:
+        pov_lines = [line.strip() for line in pov_section_match.group(1).split('\n') if line.strip()]
+
+    return guidelines, pov_lines
+
+
+class GenreGuidelineIndex:
+    """
+    Genre guidelines indexed by normalized name, rebuilt when the file changes.
+    """
+
+    def __init__(self, path: str = GUIDELINES_PATH, cache_path: Optional[str] = None):
+        """
+        Initialize the index. Nothing is read until the first lookup.
+
+        Args:
+            path: Path to the guidelines markdown file
+            cache_path: Optional JSON file to load the compiled index from and save it to
+        """
+        self.path = path
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._loaded = False
+        self._guidelines: List[GenreGuideline] = []
+        self._by_name: Dict[str, GenreGuideline] = {}
+        self._pov_lines: List[str] = []
+        self._resolved: Dict[str, Optional[GenreGuideline]] = {}
+        self.builds = 0  # Number of times the markdown was parsed
+
+    def _ensure_current(self) -> None:
+        """Load or rebuild the index if the guidelines file changed."""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            mtime = None
+
+        if self._loaded and mtime == self._mtime:
+            return
+
+        with self._lock:
+            if self._loaded and mtime == self._mtime:
+                return
+
+            if mtime is None:
+                print(f"Error reading genre guidelines: {self.path} not found")
+                self._set_index([], [])
+            elif not self._load_cache(mtime):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        guidelines, pov_lines = parse_guidelines(f.read())
+                    self.builds += 1
+                    self._set_index(guidelines, pov_lines)
+                    self._save_cache(mtime)
+                except OSError as e:
+                    print(f"Error reading genre guidelines: {e}")
+                    self._set_index([], [])
+
+            self._mtime = mtime
+            self._loaded = True
+
+    def _set_index(self, guidelines: List[GenreGuideline], pov_lines: List[str]) -> None:
+        """Replace the indexed rows and clear memoized lookups."""
+        by_name = {}
+        for guideline in guidelines:
+            by_name.setdefault(normalize_genre(guideline.name), guideline)
+        self._guidelines = guidelines
+        self._by_name = by_name
+        self._pov_lines = pov_lines
+        self._resolved = {}
+
+    def _load_cache(self, mtime: float) -> bool:
+        """Load the compiled index from the cache file if it matches the guidelines file."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("version") != CACHE_VERSION or cached.get("source_mtime") != mtime:
+                return False
+            guidelines = [
+                GenreGuideline(
+                    name=row["name"],
+                    type=row["type"],
+                    chapter_range=tuple(row["chapter_range"]) if row["chapter_range"] else None,
+                    word_count_range=tuple(row["word_count_range"]),
+                    notes=row["notes"],
+                )
+                for row in cached["genres"]
+            ]
+            self._set_index(guidelines, cached.get("pov_lines", []))
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+    def _save_cache(self, mtime: float) -> None:
+        """Write the compiled index to the cache file, if one is configured."""
+        if not self.cache_path:
+            return
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            temp_path = f"{self.cache_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": CACHE_VERSION,
+                    "source": self.path,
+                    "source_mtime": mtime,
+                    "genres": [asdict(guideline) for guideline in self._guidelines],
+                    "pov_lines": self._pov_lines,
+                }, f, indent=2)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Could not write genre guideline cache: {e}")
+
+    def get(self, genre: str) -> Optional[GenreGuideline]:
+        """
+        Get the guideline row for a genre.
+
+        An exact (normalized) name match wins; otherwise the first row whose
+        name contains the genre is used, for genres longer than three characters.
+
+        Args:
+            genre: Genre name
+
+        Returns:
+            GenreGuideline or None if no row matches
+        """
+        self._ensure_current()
+        key = normalize_genre(genre)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        guideline = self._by_name.get(key)
+        if guideline is None and len(key) > 3:
+            guideline = next((g for g in self._guidelines if key in g.name.lower()), None)
+
+        self._resolved[key] = guideline
+        return guideline
+
+    def get_pov_patterns(self, genre: str) -> List[str]:
+        """
+        Get the POV Patterns lines that mention a genre.
+
+        Args:
+            genre: Genre name
+
+        Returns:
+            Matching lines, lowercased
+        """
+        self._ensure_current()
+        key = normalize_genre(genre)
+        return [line.lower() for line in self._pov_lines if key in line.lower()]
+
+    def get_genres(self) -> List[str]:
+        """
+        Get the names of all genres in the guidelines, in file order.
+
+        Returns:
+            List of genre names
+        """
+        self._ensure_current()
+        return [guideline.name for guideline in self._guidelines]
+
+
+# Global genre guideline index instance
+_genre_guideline_index = None
+
+def get_genre_guideline_index() -> GenreGuidelineIndex:
+    """Get the global genre guideline index instance."""
+    global _genre_guideline_index
+    if _genre_guideline_index is None:
+        _genre_guideline_index = GenreGuidelineIndex()
+    return _genre_guideline_index
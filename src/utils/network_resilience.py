@@ -114,6 +114,8 @@ class NetworkResilienceManager:
         # Threading
         self.monitoring_thread: Optional[threading.Thread] = None
         self.queue_processor_thread: Optional[threading.Thread] = None
+        self.extra_queue_processor_threads: List[threading.Thread] = []
+        self.queue_workers = max(1, int(self.config.get('queue_workers', 1)))
         self.shutdown_event = threading.Event()
 
         # Callbacks
@@ -145,6 +147,39 @@ class NetworkResilienceManager:
             )
             self.queue_processor_thread.start()
 
+        self._start_extra_queue_workers()
+
+    def _start_extra_queue_workers(self):
+        """Start additional queue processor threads up to the configured worker count."""
+        self.extra_queue_processor_threads = [
+            thread for thread in self.extra_queue_processor_threads if thread.is_alive()
+        ]
+
+        while len(self.extra_queue_processor_threads) < self.queue_workers - 1:
+            worker = threading.Thread(
+                target=self._process_queue,
+                daemon=True,
+                name=f"QueueProcessor-{len(self.extra_queue_processor_threads) + 2}"
+            )
+            worker.start()
+            self.extra_queue_processor_threads.append(worker)
+
+    def set_queue_workers(self, count: int):
+        """
+        Ensure at least `count` threads are draining the request queue.
+
+        With a single worker every queued request runs serially, so callers that
+        issue concurrent API calls (e.g. pipelined chapter generation) raise this
+        to match their concurrency limit. The worker count never shrinks.
+
+        Args:
+            count: Minimum number of queue processor threads
+        """
+        if count > self.queue_workers:
+            self.queue_workers = count
+            if not self.shutdown_event.is_set():
+                self._start_extra_queue_workers()
+
     def stop_monitoring(self):
         """Stop background monitoring threads."""
         self.shutdown_event.set()
@@ -152,6 +187,9 @@ class NetworkResilienceManager:
             self.monitoring_thread.join(timeout=5)
         if self.queue_processor_thread and self.queue_processor_thread.is_alive():
             self.queue_processor_thread.join(timeout=5)
+        for worker in self.extra_queue_processor_threads:
+            if worker.is_alive():
+                worker.join(timeout=5)
 
     def check_connectivity(self, timeout: float = 5.0) -> Tuple[bool, float]:
         """
@@ -563,7 +601,8 @@ class NetworkResilienceManager:
             },
             'queue': {
                 'active_requests': len(self.active_requests),
-                'queue_size': self.request_queue.qsize()
+                'queue_size': self.request_queue.qsize(),
+                'workers': self.queue_workers
             },
             'last_check': self.metrics.last_connection_check.isoformat() if self.metrics.last_connection_check else None
         }
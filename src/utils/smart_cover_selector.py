@@ -4,13 +4,14 @@ Checks for existing covers first, falls back to programmatic generation.
 """
 
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from rich.console import Console
 
 from src.utils.cover_folder_manager import CoverFolderManager
 from src.database.cover_database_manager import get_cover_database_manager
 from src.database.database_manager import get_database_manager
 from src.ui.terminal_ui import generate_cover
+from src.utils.batch_cover_engine import BatchCoverEngine, build_cover_job
 
 console = Console()
 
@@ -40,6 +41,74 @@ class SmartCoverSelector:
         Returns:
             Path to cover image or None if no cover available
         """
+        # Steps 1 and 2: database cover, then existing covers/ folder
+        stored_cover = self._find_stored_cover(novel_data, output_dir)
+        if stored_cover:
+            return stored_cover
+
+        # Step 3: Fall back to programmatic cover generation
+        console.print("[dim]No existing cover found, generating programmatic cover...[/dim]")
+        return self._generate_programmatic_cover(novel_data, output_dir, auto_mode)
+
+    def get_covers_for_epubs(self, novels: List[Tuple[Dict[str, Any], str]],
+                             max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """
+        Get covers for several books, generating missing ones in parallel.
+
+        Existing covers are used exactly as in get_cover_for_epub; books without
+        one get an automatic programmatic cover rendered by a process pool.
+
+        Args:
+            novels: List of (novel_data, output_dir) pairs
+            max_workers: Worker processes for cover rendering (defaults to the CPU count)
+
+        Returns:
+            Cover paths in the same order as novels (None where generation failed)
+        """
+        cover_paths: List[Optional[str]] = [None] * len(novels)
+        jobs = []
+        job_indexes = {}
+
+        for i, (novel_data, output_dir) in enumerate(novels):
+            stored_cover = self._find_stored_cover(novel_data, output_dir)
+            if stored_cover:
+                cover_paths[i] = stored_cover
+                continue
+
+            try:
+                # Same file name CoverGenerator picks when no output path is given
+                title = novel_data["metadata"]["title"]
+                sanitized_title = title.lower().replace(' ', '_').replace("'", "").replace('"', '')
+                output_path = os.path.join(output_dir, f"{sanitized_title}_cover.jpg")
+                os.makedirs(output_dir, exist_ok=True)
+
+                jobs.append(build_cover_job(novel_data, output_path))
+                job_indexes[output_path] = i
+            except Exception as e:
+                console.print(f"[bold red]Error preparing programmatic cover: {str(e)}[/bold red]")
+
+        if jobs:
+            console.print(f"[dim]Generating {len(jobs)} programmatic cover{'s' if len(jobs) != 1 else ''}...[/dim]")
+            engine = BatchCoverEngine(max_workers=max_workers)
+            for result in engine.generate_covers(jobs):
+                if result["success"]:
+                    cover_paths[job_indexes[result["output_path"]]] = result["cover_path"]
+                else:
+                    console.print(f"[bold red]Error generating programmatic cover for {result['title']}: {result['error']}[/bold red]")
+
+        return cover_paths
+
+    def _find_stored_cover(self, novel_data: Dict[str, Any], output_dir: str) -> Optional[str]:
+        """
+        Find a cover in the database or the covers/ folder.
+
+        Args:
+            novel_data: Novel data containing metadata
+            output_dir: Output directory for the book
+
+        Returns:
+            Path to the cover or None if the book has none yet
+        """
         metadata = novel_data.get("metadata", {})
         title = metadata.get("title", "Untitled")
 
@@ -60,9 +129,7 @@ class SmartCoverSelector:
             console.print(f"[bold green]✓[/bold green] Using existing cover: [bold cyan]{os.path.basename(existing_cover)}[/bold cyan]")
             return existing_cover
 
-        # Step 3: Fall back to programmatic cover generation
-        console.print("[dim]No existing cover found, generating programmatic cover...[/dim]")
-        return self._generate_programmatic_cover(novel_data, output_dir, auto_mode)
+        return None
 
     def _find_database_cover(self, title: str, series_info: Optional[Dict[str, Any]] = None, output_dir: str = "temp") -> Optional[str]:
         """
@@ -79,23 +146,21 @@ class SmartCoverSelector:
             # Try to find a book in the database that matches this title/series
             if series_info and series_info.get("is_part_of_series"):
                 # For series books, look for books with matching series info
-                all_books = self.db_manager.get_books(status="completed")
-                for book in all_books:
-                    book_series = book.get("series_info", {})
+                for book in self.db_manager.iter_book_summaries(status="completed"):
+                    book_series = book.get("series_info") or {}
                     if (book_series.get("series_title") == series_info.get("series_title") and
                         book_series.get("book_number") == series_info.get("book_number")):
 
-                        if self.cover_db_manager.has_cover(book["book_id"]):
+                        if book["has_cover"]:
                             # Extract cover to temporary file
                             temp_cover_path = os.path.join(output_dir, f"temp_cover_{book['book_id']}.jpg")
                             if self.cover_db_manager.get_cover_as_file(book["book_id"], temp_cover_path):
                                 return temp_cover_path
             else:
                 # For standalone books, look for exact title match
-                all_books = self.db_manager.get_books(status="completed")
-                for book in all_books:
+                for book in self.db_manager.iter_book_summaries(status="completed"):
                     if book.get("title") == title:
-                        if self.cover_db_manager.has_cover(book["book_id"]):
+                        if book["has_cover"]:
                             # Extract cover to temporary file
                             temp_cover_path = os.path.join(output_dir, f"temp_cover_{book['book_id']}.jpg")
                             if self.cover_db_manager.get_cover_as_file(book["book_id"], temp_cover_path):
@@ -201,3 +266,17 @@ def get_smart_cover_for_epub(novel_data: Dict[str, Any], output_dir: str,
     """
     selector = SmartCoverSelector()
     return selector.get_cover_for_epub(novel_data, output_dir, auto_mode)
+
+
+def get_smart_covers_for_epubs(novels: List[Tuple[Dict[str, Any], str]]) -> List[Optional[str]]:
+    """
+    Convenience function to get smart covers for several books at once.
+
+    Args:
+        novels: List of (novel_data, output_dir) pairs
+
+    Returns:
+        Cover paths in the same order as novels (None where no cover is available)
+    """
+    selector = SmartCoverSelector()
+    return selector.get_covers_for_epubs(novels)
@@ -0,0 +1,162 @@
+"""
+Hierarchical rolling summaries for chapters in a book or books in a series.
+
+Unit summaries (one per chapter or book) roll up into arc summaries every
+`arc_size` units, and arc summaries roll up into a synopsis. The tree is
+updated incrementally as units finish, and `get_view` returns a bounded,
+multi-resolution history for prompts: full summaries of the most recent units,
+arc summaries before those, and a synopsis of everything older.
+
+Rollups are extractive (leading sentences, shared out evenly so every unit is
+represented), so maintaining the tree costs no API calls.
+"""
+
+import re
+from typing import Dict, List, Any, Optional
+
+# Size caps for rolled-up summaries, in characters
+ARC_SUMMARY_MAX_CHARS = 600
+SYNOPSIS_MAX_CHARS = 1500
+
+
+def roll_up(summaries: List[str], max_chars: int) -> str:
+    """
+    Combine summaries into one bounded summary.
+
+    Each summary contributes its leading sentences up to an equal share of
+    max_chars, so later entries are not crowded out by earlier ones.
+
+    Args:
+        summaries: Summaries in order
+        max_chars: Maximum length of the result
+
+    Returns:
+        Combined summary
+    """
+    summaries = [" ".join(str(summary).split()) for summary in summaries if summary]
+    if not summaries:
+        return ""
+
+    share = max(40, max_chars // len(summaries))
+    parts = []
+    for summary in summaries:
+        if len(summary) <= share:
+            parts.append(summary)
+            continue
+        # Keep whole sentences where possible, otherwise cut at a word boundary
+        excerpt = ""
+        for sentence in re.split(r"(?<=[.!?])\s+", summary):
+            if len(excerpt) + len(sentence) + 1 > share:
+                break
+            excerpt = f"{excerpt} {sentence}".strip()
+        if not excerpt:
+            excerpt = summary[:share - 3].rsplit(" ", 1)[0] + "..."
+        parts.append(excerpt)
+
+    return " ".join(parts)[:max_chars]
+
+
+class SummaryTree:
+    """
+    Unit summaries rolled up into arcs and a synopsis.
+    """
+
+    def __init__(self, arc_size: int = 5, arc_max_chars: int = ARC_SUMMARY_MAX_CHARS,
+                 synopsis_max_chars: int = SYNOPSIS_MAX_CHARS):
+        """
+        Initialize an empty tree.
+
+        Args:
+            arc_size: Number of units (chapters or books) per arc
+            arc_max_chars: Maximum length of an arc summary
+            synopsis_max_chars: Maximum length of the synopsis
+        """
+        self.arc_size = max(1, arc_size)
+        self.arc_max_chars = arc_max_chars
+        self.synopsis_max_chars = synopsis_max_chars
+        self.units: Dict[int, str] = {}
+        self.arcs: Dict[int, str] = {}
+        self.synopsis = ""
+
+    def arc_index(self, unit: int) -> int:
+        """Get the arc a unit belongs to."""
+        return (int(unit) - 1) // self.arc_size
+
+    def arc_span(self, arc_index: int) -> List[int]:
+        """Get the first and last unit numbers of an arc."""
+        start = arc_index * self.arc_size + 1
+        return [start, start + self.arc_size - 1]
+
+    def set_summary(self, unit: int, summary: str) -> None:
+        """
+        Add or replace a unit's summary and update the arc and synopsis above it.
+
+        Args:
+            unit: Chapter or book number (1-based)
+            summary: Summary text
+        """
+        unit = int(unit)
+        self.units[unit] = summary
+
+        arc_index = self.arc_index(unit)
+        start, end = self.arc_span(arc_index)
+        self.arcs[arc_index] = roll_up(
+            [self.units[n] for n in range(start, end + 1) if n in self.units], self.arc_max_chars
+        )
+        self.synopsis = roll_up([self.arcs[a] for a in sorted(self.arcs)], self.synopsis_max_chars)
+
+    def rebuild(self, summaries: Dict[int, str]) -> None:
+        """
+        Replace the whole tree.
+
+        Args:
+            summaries: Mapping of unit number to summary
+        """
+        self.units = {}
+        self.arcs = {}
+        self.synopsis = ""
+        for unit in sorted(summaries):
+            self.units[int(unit)] = summaries[unit]
+
+        for arc_index in sorted({self.arc_index(unit) for unit in self.units}):
+            start, end = self.arc_span(arc_index)
+            self.arcs[arc_index] = roll_up(
+                [self.units[n] for n in range(start, end + 1) if n in self.units], self.arc_max_chars
+            )
+        self.synopsis = roll_up([self.arcs[a] for a in sorted(self.arcs)], self.synopsis_max_chars)
+
+    def get_view(self, before: int, recent_units: int = 5, max_arcs: int = 4) -> Dict[str, Any]:
+        """
+        Get a bounded history of everything before a unit.
+
+        The most recent units are returned in full, starting at the beginning of
+        the arc that contains the unit `recent_units` back, so older history is
+        made of whole arcs. The last `max_arcs` of those arcs are returned as arc
+        summaries and any earlier ones are rolled into a synopsis.
+
+        Args:
+            before: Unit being generated; only earlier units are included
+            recent_units: Minimum number of recent units to return in full
+            max_arcs: Maximum number of arc summaries to return
+
+        Returns:
+            Dictionary with "synopsis" (str), "arcs" (list of {"units": [start, end],
+            "summary"}) and "recent_units" (list of unit numbers)
+        """
+        before = int(before)
+        earlier = sorted(unit for unit in self.units if unit < before)
+        if not earlier:
+            return {"synopsis": "", "arcs": [], "recent_units": []}
+
+        window_start = self.arc_span(self.arc_index(max(1, before - recent_units)))[0]
+        recent = [unit for unit in earlier if unit >= window_start]
+
+        older_arcs = sorted({self.arc_index(unit) for unit in earlier if unit < window_start})
+        shown_arcs = older_arcs[-max_arcs:] if max_arcs > 0 else []
+        folded_arcs = older_arcs[:len(older_arcs) - len(shown_arcs)]
+
+        return {
+            "synopsis": roll_up([self.arcs[a] for a in folded_arcs], self.synopsis_max_chars),
+            "arcs": [{"units": self.arc_span(a), "summary": self.arcs[a]} for a in shown_arcs],
+            "recent_units": recent,
+        }
@@ -164,7 +164,7 @@ class TelegramContentPlanner:
         if word_count > 10000:  # Substantial books get bonus
             score += 0.1
         
-        if book.get('cover_base64'):  # Books with covers get bonus
+        if book.get('cover_sha256') or book.get('cover_base64'):  # Books with covers get bonus
             score += 0.05
         
         # Calendar alignment (10%)
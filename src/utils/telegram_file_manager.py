@@ -13,7 +13,6 @@ import zipfile
 import json
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
-import base64
 from datetime import datetime
 
 class TelegramFileManager:
@@ -122,9 +121,11 @@ class TelegramFileManager:
         """Get EPUB file information."""
         try:
             # Try database first
-            epub_base64 = book_data.get('epub_base64')
-            if epub_base64:
-                epub_data = base64.b64decode(epub_base64)
+            epub_data = None
+            if book_data.get('epub_sha256') or book_data.get('epub_base64'):
+                from src.database.epub_database_manager import get_epub_database_manager
+                epub_data = get_epub_database_manager().get_epub_data(book_data.get('book_id', ''))
+            if epub_data:
                 return {
                     'format': 'epub',
                     'size': len(epub_data),
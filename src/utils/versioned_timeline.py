@@ -0,0 +1,159 @@
+"""
+Versioned timeline for chapter- or book-keyed narrative tracking.
+
+Narrative tracking stores, for every entity (a character, relationship, plot
+thread, ...), the state recorded at each chapter. Context building needs "the
+state of X as of chapter N", which used to mean sorting every entity's keys on
+every lookup. VersionedTimeline keeps the versions in a sorted int array next to
+the values so those lookups are a binary search.
+"""
+
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+
+class VersionedTimeline(dict):
+    """
+    Dictionary of states keyed by version number, with O(log n) "latest before" lookups.
+
+    Keys are stored as strings ("3"), exactly as they appear in memory and series
+    JSON files, so a timeline serializes like the plain dictionary it replaces.
+    Integer and string keys are accepted interchangeably.
+    """
+
+    def __init__(self, entries: Optional[Union[Dict[Any, Any], Iterable[Tuple[Any, Any]]]] = None):
+        """
+        Initialize the timeline.
+
+        Args:
+            entries: Optional mapping or (version, value) pairs to start with
+        """
+        super().__init__()
+        self._versions: List[int] = []
+        if entries:
+            self.update(entries)
+
+    @staticmethod
+    def _key(version: Union[int, str]) -> str:
+        """Normalize a version to its string key."""
+        return str(int(version))
+
+    def __setitem__(self, version: Union[int, str], value: Any) -> None:
+        key = self._key(version)
+        if not super().__contains__(key):
+            insort(self._versions, int(key))
+        super().__setitem__(key, value)
+
+    def __getitem__(self, version: Union[int, str]) -> Any:
+        try:
+            key = self._key(version)
+        except (TypeError, ValueError):
+            raise KeyError(version) from None
+        return super().__getitem__(key)
+
+    def __delitem__(self, version: Union[int, str]) -> None:
+        key = self._key(version)
+        super().__delitem__(key)
+        del self._versions[bisect_left(self._versions, int(key))]
+
+    def __contains__(self, version: Any) -> bool:
+        try:
+            return super().__contains__(self._key(version))
+        except (TypeError, ValueError):
+            return False
+
+    def get(self, version: Union[int, str], default: Any = None) -> Any:
+        return self[version] if version in self else default
+
+    def update(self, entries: Union[Dict[Any, Any], Iterable[Tuple[Any, Any]]] = (), **kwargs) -> None:
+        items = entries.items() if hasattr(entries, "items") else entries
+        for version, value in items:
+            self[version] = value
+        for version, value in kwargs.items():
+            self[version] = value
+
+    def setdefault(self, version: Union[int, str], default: Any = None) -> Any:
+        if version not in self:
+            self[version] = default
+        return self[version]
+
+    def pop(self, version: Union[int, str], *default: Any) -> Any:
+        if version in self:
+            value = self[version]
+            del self[version]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(version)
+
+    def clear(self) -> None:
+        super().clear()
+        self._versions = []
+
+    def __reduce__(self):
+        # Rebuild through __init__ so copies and pickles get a consistent version index
+        return (self.__class__, (dict(self),))
+
+    def latest_version_before(self, version: int) -> Optional[int]:
+        """
+        Get the newest recorded version strictly before the given one.
+
+        Args:
+            version: Chapter or book number
+
+        Returns:
+            The version number, or None if nothing was recorded earlier
+        """
+        index = bisect_left(self._versions, int(version))
+        return self._versions[index - 1] if index else None
+
+    def latest_before(self, version: int, default: Any = None) -> Any:
+        """
+        Get the state as of the given version, i.e. the newest value recorded before it.
+
+        Args:
+            version: Chapter or book number
+            default: Value to return if nothing was recorded earlier
+
+        Returns:
+            The most recent earlier value, or default
+        """
+        latest = self.latest_version_before(version)
+        return default if latest is None else super().__getitem__(str(latest))
+
+    def values_before(self, version: int) -> List[Any]:
+        """
+        Get every value recorded before the given version, oldest first.
+
+        Args:
+            version: Chapter or book number
+
+        Returns:
+            List of values in version order
+        """
+        index = bisect_left(self._versions, int(version))
+        return [super(VersionedTimeline, self).__getitem__(str(v)) for v in self._versions[:index]]
+
+    def versions(self) -> List[int]:
+        """Get the recorded versions in ascending order."""
+        return list(self._versions)
+
+    @classmethod
+    def from_data(cls, data: Any) -> "VersionedTimeline":
+        """
+        Build a timeline from loaded JSON data.
+
+        Args:
+            data: Mapping of version to value (keys may be strings or ints)
+
+        Returns:
+            VersionedTimeline; entries with non-numeric keys are dropped
+        """
+        timeline = cls()
+        if isinstance(data, dict):
+            for version, value in data.items():
+                try:
+                    timeline[version] = value
+                except (TypeError, ValueError):
+                    continue
+        return timeline
@@ -35,3 +35,38 @@ def estimate_reading_time(word_count: int, words_per_minute: int = 250) -> int:
         Estimated reading time in minutes
     """
     return round(word_count / words_per_minute)
+
+
+class IncrementalWordCounter:
+    """
+    Running word count for text that arrives in chunks.
+
+    Counts the same way as count_words on the joined text, including words
+    that are split across chunk boundaries, without rescanning earlier chunks.
+    """
+
+    def __init__(self):
+        """Initialize an empty counter."""
+        self.count = 0
+        self._in_word = False
+
+    def feed(self, chunk: str) -> int:
+        """
+        Add a chunk of text.
+
+        Args:
+            chunk: The next piece of text
+
+        Returns:
+            The running word count
+        """
+        if not chunk:
+            return self.count
+
+        words = len(chunk.split())
+        # A word continued from the previous chunk was already counted
+        if words and self._in_word and not chunk[0].isspace():
+            words -= 1
+        self.count += words
+        self._in_word = not chunk[-1].isspace()
+        return self.count
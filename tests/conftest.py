@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for tests that need a temporary book database.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database import database_manager
+from src.database.connection_pool import get_connection_pool
+from src.database.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def library(tmp_path):
+    """
+    Factory for temporary book databases.
+
+    Calling the factory with a list of book dictionaries creates a database in
+    the test's temporary directory, adds the books in one transaction and
+    installs the database as the global database manager, so components that
+    call get_database_manager() use it. The global manager is restored and the
+    pooled connections are closed when the test ends.
+
+    Returns:
+        Function taking an optional list of books and returning the DatabaseManager
+    """
+    original_db_manager = database_manager._db_manager
+    db_paths = []
+
+    def make_library(books=()) -> DatabaseManager:
+        db_path = str(tmp_path / f"library_{len(db_paths)}.db")
+        db_paths.append(db_path)
+
+        db_manager = DatabaseManager(db_path=db_path)
+        if books:
+            db_manager.add_books_bulk(list(books))
+        database_manager._db_manager = db_manager
+        return db_manager
+
+    try:
+        yield make_library
+    finally:
+        database_manager._db_manager = original_db_manager
+        for db_path in db_paths:
+            get_connection_pool().close_connections(db_path)
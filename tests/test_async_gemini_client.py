@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Test script for the async Gemini client.
+
+This script tests against a local stub of the generateContent endpoint:
+1. Batches run concurrently but never exceed the configured concurrency limits
+2. Rate-limited keys are rotated out and the request succeeds on another key
+3. The synchronous wrapper returns results in prompt order
+4. Retry backoff frees the concurrency slots and settles token reservations
+5. Conversation context is sent ahead of the prompt
+6. Streamed replies arrive chunk by chunk through the synchronous wrapper
+"""
+
+import os
+import sys
+import asyncio
+import gc
+import json
+import threading
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.async_gemini_client import AsyncGeminiClient
+from src.core.key_scheduler import APIKeyScheduler
+
+
+class _StubGeminiServer:
+    """Minimal local stand-in for the Gemini generateContent endpoint."""
+
+    def __init__(self, rate_limited_keys=None, delay=0.05, drop_once=None):
+        self.rate_limited_keys = set(rate_limited_keys or [])
+        self.drop_once = set(drop_once or [])  # Prompts whose first request loses its connection
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.in_flight_by_key = {}
+        self.max_in_flight_by_key = {}
+        self.requests_by_key = {}
+        self.runner = None
+        self.base_url = None
+
+    async def handle(self, request):
+        key = request.headers.get("x-goog-api-key")
+        self.requests_by_key[key] = self.requests_by_key.get(key, 0) + 1
+
+        if key in self.rate_limited_keys:
+            return web.json_response(
+                {"error": {"code": 429, "status": "RESOURCE_EXHAUSTED", "message": "Quota exceeded"}},
+                status=429
+            )
+
+        self.in_flight += 1
+        self.in_flight_by_key[key] = self.in_flight_by_key.get(key, 0) + 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.max_in_flight_by_key[key] = max(self.max_in_flight_by_key.get(key, 0), self.in_flight_by_key[key])
+        try:
+            await asyncio.sleep(self.delay)
+            body = await request.json()
+            prompt = body["contents"][0]["parts"][0]["text"]
+            if prompt in self.drop_once:
+                self.drop_once.discard(prompt)
+                request.transport.close()
+            if request.path.endswith(":streamGenerateContent"):
+                return await self.stream(request, f"echo: {prompt}")
+            return web.json_response({
+                "candidates": [{"content": {"parts": [{"text": f"echo: {prompt}"}]}}]
+            })
+        finally:
+            self.in_flight -= 1
+            self.in_flight_by_key[key] -= 1
+
+    async def stream(self, request, reply):
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for word in reply.split(" "):
+            event = {"candidates": [{"content": {"parts": [{"text": word + " "}]}}]}
+            await response.write(f"data: {json.dumps(event)}\r\n\r\n".encode())
+        # A closing event without text, like the API's usage summary
+        await response.write(b'data: {"usageMetadata": {"totalTokenCount": 12}}\r\n\r\n')
+        await response.write_eof()
+        return response
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/v1beta/models/{model}", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}/v1beta"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+def test_batch_respects_concurrency_limits():
+    """Test that a batch overlaps requests within the global and per-key limits."""
+    print("Testing async batch concurrency limits...")
+
+    async def run():
+        server = _StubGeminiServer()
+        await server.start()
+        client = AsyncGeminiClient(
+            api_keys=["key-a", "key-b"],
+            max_concurrency=4,
+            per_key_concurrency=2,
+            api_base_url=server.base_url
+        )
+        try:
+            prompts = [f"prompt {i}" for i in range(12)]
+            results = await client.agenerate_batch(prompts)
+            return server, results
+        finally:
+            await client.aclose()
+            await server.stop()
+
+    server, results = asyncio.run(run())
+
+    assert results == [f"echo: prompt {i}" for i in range(12)]
+    assert 1 < server.max_in_flight <= 4, f"max in flight was {server.max_in_flight}"
+    assert all(count <= 2 for count in server.max_in_flight_by_key.values())
+
+    print("✓ Async batch concurrency test passed")
+
+
+def test_rate_limited_key_is_rotated_out():
+    """Test that a 429 marks the key as rate limited and retries on another key."""
+    print("Testing async rate limit rotation...")
+
+    async def run():
+        server = _StubGeminiServer(rate_limited_keys=["key-a"])
+        await server.start()
+        client = AsyncGeminiClient(api_keys=["key-a", "key-b"], api_base_url=server.base_url)
+        try:
+            results = await client.agenerate_batch(["first", "second", "third"])
+            return server, client, results
+        finally:
+            await client.aclose()
+            await server.stop()
+
+    server, client, results = asyncio.run(run())
+
+    assert results == ["echo: first", "echo: second", "echo: third"]
+    assert "key-a" in client.rate_limited_keys
+    assert server.requests_by_key.get("key-b", 0) == 3
+
+    print("✓ Async rate limit rotation test passed")
+
+
+def test_backoff_frees_slots_and_settles_reservations():
+    """Test that a request backing off neither holds a concurrency slot nor keeps its reservations."""
+    print("Testing retry backoff...")
+
+    scheduler = APIKeyScheduler(["key-a"], requests_per_minute=100, tokens_per_minute=1000000)
+    finished = []
+
+    async def generate(client, prompt):
+        result = await client.agenerate_content(prompt, max_tokens=100000, initial_retry_delay=0.5)
+        finished.append(prompt)
+        return result
+
+    async def run():
+        server = _StubGeminiServer(delay=0.01, drop_once=["flaky"])
+        await server.start()
+        client = AsyncGeminiClient(api_keys=["key-a"], max_concurrency=1,
+                                   api_base_url=server.base_url, key_scheduler=scheduler)
+        try:
+            flaky = asyncio.create_task(generate(client, "flaky"))
+            await asyncio.sleep(0.1)  # The first attempt has failed and is backing off
+            steady = await generate(client, "steady")
+            return steady, await flaky
+        finally:
+            await client.aclose()
+            await server.stop()
+
+    assert asyncio.run(run()) == ("echo: steady", "echo: flaky")
+    # The steady request ran while the flaky one was waiting to retry
+    assert finished == ["steady", "flaky"]
+    # Three 100,000 token reservations were made; all but the few tokens used were refunded
+    assert list(scheduler.get_status()["keys"].values())[0]["tokens_available"] > 990000
+
+    print("✓ Retry backoff test passed")
+
+
+def test_context_precedes_prompt():
+    """Test that chat history in either message format is sent before the prompt."""
+    print("Testing conversation context...")
+
+    client = AsyncGeminiClient(api_keys=["key-a"])
+    body = client._build_request_body("And then?", 0.7, 100, context=[
+        {"role": "user", "content": "Tell me a story."},
+        {"role": "model", "parts": ["Once upon a time."]},
+    ])
+
+    assert body["contents"] == [
+        {"role": "user", "parts": [{"text": "Tell me a story."}]},
+        {"role": "model", "parts": [{"text": "Once upon a time."}]},
+        {"role": "user", "parts": [{"text": "And then?"}]},
+    ]
+
+    print("✓ Conversation context test passed")
+
+
+def test_stream_yields_chunks_and_settles_reservation():
+    """Test that a streamed reply arrives in chunks and an early close releases the key."""
+    print("Testing streaming...")
+
+    server = _StubGeminiServer(delay=0.01)
+    server_loop = asyncio.new_event_loop()
+
+    thread = threading.Thread(target=server_loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), server_loop).result()
+
+    scheduler = APIKeyScheduler(["key-a"], requests_per_minute=100, tokens_per_minute=1000000)
+    client = AsyncGeminiClient(api_keys=["key-a"], max_concurrency=1,
+                               api_base_url=server.base_url, key_scheduler=scheduler)
+    try:
+        chunks = list(client.stream_content("the storm broke", max_tokens=100000))
+        assert chunks == ["echo: ", "the ", "storm ", "broke "]
+
+        # Closing a stream early frees its concurrency slot for the next request
+        stream = client.stream_content("cut short", max_tokens=100000)
+        assert next(stream) == "echo: "
+        stream.close()
+        assert client.generate_content("after") == "echo: after"
+    finally:
+        client.close()
+        asyncio.run_coroutine_threadsafe(server.stop(), server_loop).result()
+        server_loop.call_soon_threadsafe(server_loop.stop)
+        thread.join(timeout=5)
+        server_loop.close()
+
+    assert list(scheduler.get_status()["keys"].values())[0]["tokens_available"] > 990000
+
+    print("✓ Streaming test passed")
+
+
+def test_sync_wrapper_preserves_order():
+    """Test that generate_batch can be called from synchronous code."""
+    print("Testing sync wrapper...")
+
+    server = _StubGeminiServer(delay=0.01)
+    server_loop = asyncio.new_event_loop()
+
+    thread = threading.Thread(target=server_loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), server_loop).result()
+
+    client = AsyncGeminiClient(api_keys=["key-a"], api_base_url=server.base_url)
+    try:
+        assert client.generate_batch(["one", "two"]) == ["echo: one", "echo: two"]
+        assert client.generate_content("three") == "echo: three"
+    finally:
+        client.close()
+        asyncio.run_coroutine_threadsafe(server.stop(), server_loop).result()
+        server_loop.call_soon_threadsafe(server_loop.stop)
+        thread.join(timeout=5)
+        server_loop.close()
+
+    print("✓ Sync wrapper test passed")
+
+
+def test_sessions_close_with_their_loop():
+    """Test that each asyncio.run loop's session is closed and its resources dropped."""
+    print("Testing per-loop session cleanup...")
+
+    client = AsyncGeminiClient(api_keys=["key-a"], max_concurrency=2)
+    sessions = []
+
+    async def run():
+        server = _StubGeminiServer(delay=0.01)
+        await server.start()
+        client.api_base_url = server.base_url
+        try:
+            result = await client.agenerate_content("ping")
+            sessions.append((await client._get_loop_resources()).session)
+            return result
+        finally:
+            await server.stop()
+
+    assert asyncio.run(run()) == "echo: ping"
+    assert asyncio.run(run()) == "echo: ping"
+    gc.collect()
+
+    assert len(sessions) == 2 and sessions[0] is not sessions[1]
+    assert all(session.closed for session in sessions)
+    assert len(client._loop_resources) == 0
+
+    print("✓ Per-loop session cleanup test passed")
+
+
+if __name__ == "__main__":
+    test_batch_respects_concurrency_limits()
+    test_rate_limited_key_is_rotated_out()
+    test_backoff_frees_slots_and_settles_reservations()
+    test_context_precedes_prompt()
+    test_stream_yields_chunks_and_settles_reservation()
+    test_sync_wrapper_preserves_order()
+    test_sessions_close_with_their_loop()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test indexed back-matter lookups: books by normalized author, series books by
+number, the query plans that serve them, and the back matter built from them.
+"""
+
+import base64
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.cover_database_manager import CoverDatabaseManager
+from src.database.database_manager import DatabaseManager, AUTHOR_KEY_SQL, SERIES_TITLE_SQL, SERIES_NUMBER_SQL
+from src.utils.back_matter_generator import BackMatterGenerator
+
+
+@pytest.fixture
+def db_manager(library) -> DatabaseManager:
+    """Database with a three-book series, a standalone book and an unrelated author."""
+    cover_base64 = base64.b64encode(b"cover image").decode('utf-8')
+
+    books = [
+        {"book_id": f"series_{number}", "title": f"Tide Book {number}", "author": "Ada Lane",
+         "generation_status": "completed", "created_date": f"2025-02-0{number}",
+         "series_info": {"series_title": "Tides", "book_number": number, "is_part_of_series": True},
+         "cover_base64": cover_base64 if number != 2 else None}
+        for number in range(1, 4)
+    ]
+    books += [
+        {"book_id": "standalone", "title": "Standalone", "author": "  ADA LANE ",
+         "generation_status": "completed", "description": "A lighthouse keeper's last winter.",
+         "created_date": "2025-03-01", "cover_base64": cover_base64},
+        {"book_id": "unfinished", "title": "Unfinished", "author": "Ada Lane", "generation_status": "generating"},
+        {"book_id": "other_author", "title": "Elsewhere", "author": "Ada Lanester", "generation_status": "completed"},
+    ]
+    db_manager = library(books)
+
+    # Rows with unparseable series info are still written and simply not indexed as series books
+    with db_manager.get_connection() as conn:
+        conn.execute("UPDATE books SET series_info = 'not json' WHERE book_id = 'other_author'")
+        conn.commit()
+    return db_manager
+
+
+def make_generator(db_manager: DatabaseManager, metadata: dict) -> BackMatterGenerator:
+    """Back matter generator bound to the test database."""
+    generator = BackMatterGenerator.__new__(BackMatterGenerator)
+    generator.db_manager = db_manager
+    generator.cover_db_manager = CoverDatabaseManager()
+    generator.metadata = metadata
+    return generator
+
+
+def test_author_and_series_lookups(db_manager):
+    """Lookups return the right summaries and are served by the expression indexes."""
+    by_author = [book["book_id"] for book in db_manager.get_books_by_author("ada lane")]
+    print(f"Books by Ada Lane: {by_author}")
+    assert by_author == ["standalone", "series_3", "series_2", "series_1"]
+    assert "unfinished" in [book["book_id"] for book in db_manager.get_books_by_author("Ada Lane", status=None)]
+    assert db_manager.get_books_by_author("   ") == []
+
+    series = db_manager.get_series_books("Tides", max_book_number=2)
+    assert [book["book_id"] for book in series] == ["series_1", "series_2"]
+    assert [book["has_cover"] for book in series] == [True, False]
+    assert series[0]["series_info"]["book_number"] == 1
+
+    with db_manager.get_connection() as conn:
+        author_plan = " ".join(row["detail"] for row in conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT book_id FROM books WHERE {AUTHOR_KEY_SQL} = ? "
+            "AND generation_status = ?", ("ada lane", "completed")))
+        series_plan = " ".join(row["detail"] for row in conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT book_id FROM books WHERE {SERIES_TITLE_SQL} = ? "
+            f"AND {SERIES_NUMBER_SQL} <= ?", ("Tides", 5)))
+    print(f"Plans: {author_plan} | {series_plan}")
+    assert "idx_books_author_key" in author_plan
+    assert "idx_books_series_position" in series_plan
+
+
+def test_back_matter_uses_lookups(db_manager):
+    """Other books, the current description and series covers come from the point queries."""
+    generator = make_generator(db_manager, {"title": "Tide Book 3", "author": "Ada Lane", "genre": "Mystery"})
+
+    other_books = generator._get_other_books_by_author("Ada Lane")
+    assert "Another Book by the Same Author" in other_books
+    assert "Tide Book 3" not in other_books and "Elsewhere" not in other_books
+    assert "data:image/jpeg;base64," in other_books
+
+    covers = generator._get_series_cover_images("Tides", 1)
+    assert "Book 1 Cover" in covers and "Book 2 Cover" not in covers
+
+    generator.metadata = {"title": "standalone", "author": "Ada Lane"}
+    assert "lighthouse keeper" in generator._get_current_book_description()
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main([__file__, "-q"])
+    if exit_code == 0:
+        print("✅ Back matter lookup tests passed")
+    sys.exit(exit_code)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test online database backups: deduplicated chunk storage, backups during an
+open write transaction, verified restores, retention, and that opening a
+database no longer re-runs migrations.
+"""
+
+import gzip
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.backup_manager import BackupManager
+from src.database.connection_pool import get_connection_pool
+from src.database.database_manager import DatabaseManager
+from src.database.schema_migrator import SchemaMigrator
+
+
+def make_database(temp_dir: str) -> DatabaseManager:
+    """Database with a few books and about 3 MB of incompressible blob data."""
+    db_manager = DatabaseManager(db_path=os.path.join(temp_dir, "data", "library.db"))
+    rng = random.Random(11)
+    for index in range(3):
+        book_id = db_manager.add_book({"title": f"Book {index}", "book_id": f"book_{index}"})
+        key = db_manager.blob_store.put(rng.randbytes(1024 * 1024))
+        db_manager.update_book(book_id, {"cover_sha256": key})
+    return db_manager
+
+
+def count_books(db_path: str) -> int:
+    """Number of books in a database file."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_incremental_backups_store_changed_chunks():
+    """A second backup after a small change stores only a few new chunks."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = make_database(temp_dir)
+        try:
+            backups = BackupManager(db_manager.db_path)
+            first = backups.create_backup("first")
+            db_manager.update_book("book_1", {"description": "A small change"})
+            second = backups.create_backup("second")
+
+            stats = backups.get_stats()
+            print(f"First: {first['new_chunks']} chunks, second: {second['new_chunks']} new, stats {stats}")
+            assert first["new_chunks"] >= 3
+            assert 1 <= second["new_chunks"] < first["new_chunks"]
+            assert stats["backup_count"] == 2
+            assert stats["stored_bytes"] < stats["logical_bytes"]
+            assert backups.backup_dir == os.path.join(temp_dir, "data", "backups")
+            assert [b["backup_id"] for b in backups.list_backups()] == [second["backup_id"], first["backup_id"]]
+        finally:
+            get_connection_pool().close_connections(db_manager.db_path)
+
+
+def test_backup_does_not_wait_for_writers():
+    """A backup taken during an open write transaction holds the last committed state."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = make_database(temp_dir)
+        writer = sqlite3.connect(db_manager.db_path, timeout=0.1)
+        try:
+            writer.execute("BEGIN IMMEDIATE")
+            writer.execute("INSERT INTO books (book_id, title) VALUES ('uncommitted', 'Uncommitted')")
+
+            backups = BackupManager(db_manager.db_path)
+            backup = backups.create_backup("during_write")
+            writer.commit()
+            assert backup is not None
+
+            restored_path = os.path.join(temp_dir, "restored.db")
+            assert backups.restore_from_backup(backup["backup_id"], restored_path)
+            assert count_books(restored_path) == 3
+            assert count_books(db_manager.db_path) == 4
+        finally:
+            writer.close()
+            get_connection_pool().close_connections(db_manager.db_path)
+
+
+def test_restore_verifies_before_replacing():
+    """A restore brings back deleted books; a corrupt chunk leaves the database untouched."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = make_database(temp_dir)
+        try:
+            backups = BackupManager(db_manager.db_path)
+            backup = backups.create_backup("before_delete")
+
+            db_manager.delete_book("book_0")
+            assert backups.restore_from_backup(backup["backup_id"])
+            assert db_manager.get_book("book_0")["title"] == "Book 0"
+
+            # Corrupt one chunk of the backup
+            db_manager.delete_book("book_2")
+            chunks_dir = backups.chunks_dir
+            prefix = sorted(os.listdir(chunks_dir))[0]
+            chunk_file = os.path.join(chunks_dir, prefix, sorted(os.listdir(os.path.join(chunks_dir, prefix)))[0])
+            with open(chunk_file, "wb") as f:
+                f.write(gzip.compress(b"not the original pages"))
+
+            assert not backups.restore_from_backup(backup["backup_id"])
+            assert db_manager.get_book("book_2") is None
+            assert not backups.restore_from_backup("missing_backup")
+        finally:
+            get_connection_pool().close_connections(db_manager.db_path)
+
+
+def test_retention_prunes_backups_and_chunks():
+    """Old backups beyond the policy are removed along with chunks only they used."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = make_database(temp_dir)
+        try:
+            backups = BackupManager(db_manager.db_path, keep_last=2, keep_daily=1)
+            first = backups.create_backup("first")
+            for index in range(3):
+                db_manager.blob_store.put(random.Random(index).randbytes(256 * 1024))
+                backups.create_backup(f"change_{index}")
+
+            remaining = backups.list_backups()
+            print(f"Remaining backups: {[b['backup_id'] for b in remaining]}")
+            assert len(remaining) == 2
+            assert first["backup_id"] not in [b["backup_id"] for b in remaining]
+            for backup in remaining:
+                assert backups.restore_from_backup(backup["backup_id"], os.path.join(temp_dir, "check.db"))
+        finally:
+            get_connection_pool().close_connections(db_manager.db_path)
+
+
+def test_reopening_database_keeps_schema_version():
+    """Opening an up-to-date database again neither migrates nor backs up."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "fresh.db")
+        try:
+            DatabaseManager(db_path=db_path)
+            get_connection_pool().close_connections(db_path)
+            db_manager = DatabaseManager(db_path=db_path)
+
+            assert db_manager.get_metadata("schema_version") == SchemaMigrator(db_path).current_version
+            assert BackupManager(db_path).list_backups() == []
+            assert not any(".backup_" in name for name in os.listdir(temp_dir))
+        finally:
+            get_connection_pool().close_connections(db_path)
+
+
+if __name__ == "__main__":
+    test_incremental_backups_store_changed_chunks()
+    test_backup_does_not_wait_for_writers()
+    test_restore_verifies_before_replacing()
+    test_retention_prunes_backups_and_chunks()
+    test_reopening_database_keeps_schema_version()
+    print("✅ Backup manager tests passed")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test parallel batch cover generation, bulk cover storage, batch cover
+selection for EPUB exports and the title lookup used by batch operations.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database import database_manager
+from src.database.database_manager import DatabaseManager
+from src.database.cover_database_manager import CoverDatabaseManager
+from src.ui.batch_operations import find_book_ids_by_title
+from src.utils.batch_cover_engine import BatchCoverEngine, build_cover_job
+from src.utils.smart_cover_selector import SmartCoverSelector
+
+
+def make_novel_data(title: str) -> dict:
+    """Minimal novel data accepted by the cover pipeline."""
+    return {
+        "metadata": {
+            "title": title,
+            "author": "Test Author",
+            "genre": "test",
+            "description": "A short test book"
+        },
+        "generation_options": {"themes": ["test"]}
+    }
+
+
+def test_batch_covers_render_in_parallel_and_store_in_bulk():
+    """Covers render across worker processes, stream results and store in one pass."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(db_path=os.path.join(temp_dir, "test.db"))
+
+        # Point the cover manager at the temporary database
+        original_db_manager = database_manager._db_manager
+        database_manager._db_manager = db_manager
+        try:
+            cover_db_manager = CoverDatabaseManager()
+        finally:
+            database_manager._db_manager = original_db_manager
+
+        titles = ["First Test Book", "Second Test Book", "Third Test Book"]
+        jobs = []
+        for title in titles:
+            book_id = db_manager.add_book({"title": title, "author": "Test Author", "genre": "test"})
+            output_path = os.path.join(temp_dir, f"{book_id}.jpg")
+            jobs.append(build_cover_job(make_novel_data(title), output_path, book_id=book_id))
+
+        streamed = []
+        engine = BatchCoverEngine(max_workers=2, output_dir=temp_dir)
+        results = engine.generate_covers(jobs, on_result=streamed.append)
+
+        print(f"Rendered {len(results)} covers: {[round(r['seconds'], 2) for r in results]}")
+        assert len(results) == 3
+        assert streamed == results
+        assert all(result["success"] for result in results), [r["error"] for r in results]
+        assert sorted(r["title"] for r in results) == sorted(titles)
+
+        for result in results:
+            assert os.path.exists(result["cover_path"])
+            assert result["cover_path"] == result["output_path"]
+
+        stored = engine.store_covers(results, cover_db_manager=cover_db_manager)
+        assert stored == 3
+        for job in jobs:
+            assert cover_db_manager.has_cover(job["book_id"])
+
+
+def test_failed_cover_is_reported_not_raised():
+    """A failing job comes back as a failed result instead of aborting the batch."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        job = build_cover_job(make_novel_data("Broken Book"), os.path.join(temp_dir, "missing", "cover.jpg"))
+
+        results = BatchCoverEngine(max_workers=1, output_dir=temp_dir).generate_covers([job])
+
+        print(f"Failure reported: {results[0]['error']}")
+        assert len(results) == 1
+        assert not results[0]["success"]
+        assert results[0]["cover_path"] is None
+        assert BatchCoverEngine().store_covers(results) == 0
+
+
+def test_epub_covers_keep_stored_covers_and_render_the_rest():
+    """Books with a stored cover keep it; the others get covers rendered in one batch."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        stored_cover = os.path.join(temp_dir, "stored.jpg")
+        selector = SmartCoverSelector.__new__(SmartCoverSelector)
+        selector._find_stored_cover = lambda novel_data, output_dir: (
+            stored_cover if novel_data["metadata"]["title"] == "Covered Book" else None)
+
+        novels = [(make_novel_data(title), os.path.join(temp_dir, f"book_{index:02d}"))
+                  for index, title in enumerate(["First Book", "Covered Book", "Third Book"], start=1)]
+        cover_paths = selector.get_covers_for_epubs(novels, max_workers=2)
+
+        print(f"EPUB covers: {cover_paths}")
+        assert cover_paths[1] == stored_cover
+        assert cover_paths[0] == os.path.join(temp_dir, "book_01", "first_book_cover.jpg")
+        assert cover_paths[2] == os.path.join(temp_dir, "book_03", "third_book_cover.jpg")
+        assert os.path.exists(cover_paths[0]) and os.path.exists(cover_paths[2])
+
+
+def test_title_lookup_is_chunked_and_prefers_the_newest_book():
+    """More titles than one IN query can bind are looked up, newest book per title."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(db_path=os.path.join(temp_dir, "test.db"))
+        db_manager.add_books_bulk([
+            {"book_id": f"book_{index}", "title": f"Title {index}", "created_date": "2025-01-01"}
+            for index in range(1200)
+        ] + [{"book_id": "book_1100_v2", "title": "Title 1100", "created_date": "2025-02-01"}])
+
+        original_db_manager = database_manager._db_manager
+        database_manager._db_manager = db_manager
+        try:
+            titles = [f"Title {index}" for index in range(1200)] + ["Title 5", "", "Missing"]
+            book_ids = find_book_ids_by_title(titles)
+        finally:
+            database_manager._db_manager = original_db_manager
+
+        print(f"Found {len(book_ids)} of {len(titles)} titles")
+        assert len(book_ids) == 1200
+        assert book_ids["Title 0"] == "book_0" and book_ids["Title 1199"] == "book_1199"
+        assert book_ids["Title 1100"] == "book_1100_v2"
+
+
+if __name__ == "__main__":
+    test_batch_covers_render_in_parallel_and_store_in_bulk()
+    test_failed_cover_is_reported_not_raised()
+    test_epub_covers_keep_stored_covers_and_render_the_rest()
+    test_title_lookup_is_chunked_and_prefers_the_newest_book()
+    print("✅ Batch cover engine tests passed")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test content-addressed blob storage for covers and EPUBs, including migration
+of base64 columns from older databases.
+"""
+
+import base64
+import gzip
+import io
+import os
+import sys
+import tempfile
+import zipfile
+
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database import database_manager
+from src.database.database_manager import DatabaseManager
+from src.database.cover_database_manager import CoverDatabaseManager
+from src.database.epub_database_manager import EpubDatabaseManager
+from src.database.schema_migrator import SchemaMigrator
+
+
+def make_image_bytes(color=(200, 30, 30)) -> bytes:
+    """Small JPEG image."""
+    output = io.BytesIO()
+    Image.new('RGB', (40, 60), color).save(output, format='JPEG')
+    return output.getvalue()
+
+
+def make_epub_bytes() -> bytes:
+    """Minimal ZIP archive that passes EPUB validation."""
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, 'w') as epub:
+        epub.writestr("mimetype", "application/epub+zip")
+        epub.writestr("content.xhtml", "<p>" + "Once upon a time. " * 200 + "</p>")
+    return output.getvalue()
+
+
+def make_managers(db_path: str):
+    """Create cover and EPUB managers bound to a temporary database."""
+    db_manager = DatabaseManager(db_path=db_path)
+
+    original_db_manager = database_manager._db_manager
+    database_manager._db_manager = db_manager
+    try:
+        return db_manager, CoverDatabaseManager(), EpubDatabaseManager()
+    finally:
+        database_manager._db_manager = original_db_manager
+
+
+def count_blobs(db_manager) -> int:
+    with db_manager.get_connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+
+
+def test_identical_covers_are_stored_once():
+    """Two books with the same cover share one blob until both drop it."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager, covers, epubs = make_managers(os.path.join(temp_dir, "test.db"))
+
+        cover_path = os.path.join(temp_dir, "cover.jpg")
+        with open(cover_path, 'wb') as f:
+            f.write(make_image_bytes())
+
+        first = db_manager.add_book({"title": "First Book"})
+        second = db_manager.add_book({"title": "Second Book", "book_id": "second_book"})
+        assert covers.store_cover_from_file(first, cover_path)
+        assert covers.store_cover_from_file(second, cover_path)
+
+        print(f"Blobs after storing the same cover twice: {count_blobs(db_manager)}")
+        assert count_blobs(db_manager) == 1
+        assert covers.get_cover_data(second) == make_image_bytes()
+        assert db_manager.get_book(first)["cover_base64"] is None
+
+        # Removing one reference keeps the shared blob
+        covers.remove_cover(first)
+        assert not covers.has_cover(first)
+        assert covers.has_cover(second)
+        assert count_blobs(db_manager) == 1
+
+        db_manager.delete_book(second)
+        assert count_blobs(db_manager) == 0
+
+
+def test_epub_round_trip_through_blob_store():
+    """EPUBs are stored compressed under their checksum and read back intact."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager, covers, epubs = make_managers(os.path.join(temp_dir, "test.db"))
+
+        epub_path = os.path.join(temp_dir, "book.epub")
+        with open(epub_path, 'wb') as f:
+            f.write(make_epub_bytes())
+
+        book_id = db_manager.add_book({"title": "Epub Book"})
+        assert epubs.store_epub_from_file(book_id, epub_path)
+
+        book = db_manager.get_book(book_id)
+        print(f"EPUB reference: {book['epub_sha256'][:12]}..., compressed {book['epub_compressed_size']} bytes")
+        assert book["epub_sha256"] == book["checksum"]
+        assert book["epub_base64"] is None
+        assert epubs.has_epub(book_id)
+        assert epubs.get_epub_data(book_id) == make_epub_bytes()
+
+        stats = db_manager.get_database_stats()
+        assert stats["epubs_stored"] == 1
+        assert stats["blob_store"]["blob_count"] == 1
+
+
+def test_replacing_a_blob_deletes_only_the_replaced_one():
+    """Writes drop the blob they replaced; blobs they don't own are left for the maintenance sweep."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager, covers, epubs = make_managers(os.path.join(temp_dir, "test.db"))
+
+        book_id = db_manager.add_book({"title": "Replaced Book"})
+        old_cover = base64.b64encode(make_image_bytes((10, 10, 200))).decode('utf-8')
+        assert covers.store_cover_from_base64(book_id, old_cover)
+
+        epub_path = os.path.join(temp_dir, "book.epub")
+        with open(epub_path, 'wb') as f:
+            f.write(make_epub_bytes())
+        assert epubs.store_epub_from_file(book_id, epub_path)
+
+        # Stored by another writer that has not referenced it yet
+        pending = db_manager.blob_store.put(b"not referenced yet")
+
+        new_cover = base64.b64encode(make_image_bytes((10, 200, 10))).decode('utf-8')
+        assert covers.store_cover_from_base64(book_id, new_cover)
+        assert epubs.remove_epub(book_id)
+
+        print(f"Blobs after replacing the cover and removing the EPUB: {count_blobs(db_manager)}")
+        assert count_blobs(db_manager) == 2
+        assert db_manager.blob_store.exists(pending)
+        assert covers.get_cover_base64(book_id) == new_cover
+
+        # The maintenance sweep still collects anything left unreferenced
+        assert db_manager.blob_store.delete_unreferenced() == 1
+        assert count_blobs(db_manager) == 1
+
+
+def test_migration_moves_base64_columns_to_blobs():
+    """Upgrading from v2.1 moves inline base64 data into deduplicated blobs."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "legacy.db")
+        db_manager, covers, epubs = make_managers(db_path)
+
+        cover_base64 = base64.b64encode(make_image_bytes()).decode('utf-8')
+        epub_base64 = base64.b64encode(gzip.compress(make_epub_bytes())).decode('utf-8')
+
+        # Recreate the pre-blob layout: data inline in the books table
+        with db_manager.get_connection() as conn:
+            for book_id in ("legacy_one", "legacy_two"):
+                conn.execute("""
+                    INSERT INTO books (book_id, title, cover_base64, epub_base64)
+                    VALUES (?, ?, ?, ?)
+                """, (book_id, book_id, cover_base64, epub_base64))
+            conn.execute("UPDATE database_metadata SET value = '2.1' WHERE key = 'schema_version'")
+            conn.commit()
+
+        assert SchemaMigrator(db_path).migrate_database()
+
+        with db_manager.get_connection() as conn:
+            inline = conn.execute("""
+                SELECT COUNT(*) FROM books WHERE cover_base64 IS NOT NULL OR epub_base64 IS NOT NULL
+            """).fetchone()[0]
+
+        print(f"Blobs after migration: {count_blobs(db_manager)}, inline rows left: {inline}")
+        assert inline == 0
+        assert count_blobs(db_manager) == 2  # One cover and one EPUB, each shared by both books
+        for book_id in ("legacy_one", "legacy_two"):
+            assert covers.get_cover_base64(book_id) == cover_base64
+            assert epubs.get_epub_data(book_id) == make_epub_bytes()
+
+
+if __name__ == "__main__":
+    test_identical_covers_are_stored_once()
+    test_epub_round_trip_through_blob_store()
+    test_replacing_a_blob_deletes_only_the_replaced_one()
+    test_migration_moves_base64_columns_to_blobs()
+    print("✅ Blob store tests passed")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test the materialized book status table: trigger maintenance on insert, update
+and delete, single-query completion flags and counts, the v2.3 backfill of
+existing databases, and the batch workflows built on it.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.database_manager import DatabaseManager
+from src.ui.batch_operations import get_stored_asset_flags
+from src.utils.enhanced_book_workflow import EnhancedBookWorkflow
+
+
+@pytest.fixture
+def db_manager(library) -> DatabaseManager:
+    """Database with four completed books in different stages and one draft."""
+    db_manager = library([
+        {"book_id": f"book_{index}", "title": f"Book {index}", "genre": "Mystery",
+         "generation_status": "completed", "created_date": f"2025-01-0{index + 1}"}
+        for index in range(4)
+    ] + [{"book_id": "draft", "title": "Draft", "created_date": "2025-01-09"}])
+
+    cover_key = db_manager.blob_store.put(b"cover image")
+    epub_key = db_manager.blob_store.put(b"epub file")
+    db_manager.update_book("book_0", {"cover_sha256": cover_key, "epub_sha256": epub_key})
+    db_manager.update_book_descriptions("book_0", {"short_description": "Short"})
+    db_manager.mark_back_cover_generated("book_0")
+    db_manager.update_book("book_1", {"cover_sha256": cover_key})
+    db_manager.update_book_descriptions("book_2", {"short_description": "Short"})
+    return db_manager
+
+
+def test_triggers_keep_status_current(db_manager):
+    """Inserts, updates and deletes of books are reflected in the status table."""
+    statuses = {book["book_id"]: book for book in db_manager.get_completion_status()}
+    print(f"Statuses: {statuses['book_0']}")
+    assert list(statuses) == ["draft", "book_3", "book_2", "book_1", "book_0"]
+    assert statuses["book_0"]["has_cover"] and statuses["book_0"]["back_cover_generated"]
+    assert statuses["book_1"]["has_cover"] and not statuses["book_1"]["has_epub"]
+    assert statuses["book_2"]["description_enhanced"] and not statuses["book_2"]["has_cover"]
+
+    db_manager.update_book("book_3", {"title": "Renamed", "generation_status": "failed"})
+    db_manager.delete_book("draft")
+    statuses = {book["book_id"]: book for book in db_manager.get_completion_status()}
+    assert "draft" not in statuses
+    assert statuses["book_3"]["title"] == "Renamed"
+    assert statuses["book_3"]["generation_status"] == "failed"
+
+    # Replacing a book rewrites its status rather than duplicating it
+    db_manager.add_book({"book_id": "book_0", "title": "Book 0", "generation_status": "completed"})
+    book_0 = [book for book in db_manager.get_completion_status() if book["book_id"] == "book_0"]
+    assert len(book_0) == 1 and not book_0[0]["has_cover"]
+
+
+def test_completion_queries(db_manager):
+    """Counts and missing-flag filters come from single queries on the status table."""
+    counts = db_manager.get_completion_counts(status="completed")
+    print(f"Completed book counts: {counts}")
+    assert counts == {"total_books": 4, "has_cover": 2, "has_epub": 1, "description_enhanced": 2,
+                      "back_cover_generated": 1, "complete_books": 1}
+    assert db_manager.get_completion_counts()["total_books"] == 5
+
+    missing_epub = db_manager.get_completion_status(status="completed", missing=["has_epub"])
+    assert [book["book_id"] for book in missing_epub] == ["book_3", "book_2", "book_1"]
+    with pytest.raises(ValueError):
+        db_manager.get_completion_status(missing=["has_cover; DROP TABLE books"])
+
+    needing = db_manager.get_books_needing_descriptions()
+    assert [book["book_id"] for book in needing] == ["book_3", "book_1"]
+    assert [book["book_id"] for book in db_manager.get_books_needing_back_covers(limit=2)] == ["book_3", "book_2"]
+    assert needing[0]["title"] == "Book 3" and "novel_data_json" in needing[0]
+
+
+def test_existing_database_is_backfilled(db_manager):
+    """Opening a v2.2 database builds the status table from its books."""
+    # Turn the database back into v2.2: no status table or triggers
+    with db_manager.get_connection() as conn:
+        for trigger in ("insert", "update", "delete"):
+            conn.execute(f"DROP TRIGGER trg_book_status_{trigger}")
+        conn.execute("DROP TABLE book_status")
+        conn.commit()
+    db_manager.set_metadata("schema_version", "2.2")
+    db_manager.update_book("book_3", {"epub_sha256": db_manager.blob_store.put(b"late epub")})
+
+    db_manager = DatabaseManager(db_path=db_manager.db_path)
+    counts = db_manager.get_completion_counts(status="completed")
+    assert db_manager.get_metadata("schema_version") == "2.3"
+    assert counts["total_books"] == 4 and counts["has_epub"] == 2
+
+
+def test_workflows_use_status_table(db_manager):
+    """Processing status and stored asset flags are read from the status table."""
+    workflow = EnhancedBookWorkflow.__new__(EnhancedBookWorkflow)
+    workflow.db_manager = db_manager
+    status = workflow.get_processing_status()
+    print(f"Processing status: {status}")
+    assert status["total_completed_books"] == 4
+    assert status["books_needing_descriptions"] == 2
+    assert status["books_needing_back_covers"] == 3
+    assert status["description_completion_rate"] == 50.0
+
+    flags = get_stored_asset_flags()
+    assert flags["Book 0"] == {"has_cover": True, "has_epub": True,
+                               "description_enhanced": True, "back_cover_generated": True}
+    assert flags["Book 1"]["has_cover"] and not flags["Book 1"]["has_epub"]
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main([__file__, "-q"])
+    if exit_code == 0:
+        print("✅ Book status tests passed")
+    sys.exit(exit_code)
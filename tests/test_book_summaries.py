@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test projection-only book summary queries, keyset pagination and lazy loading
+of large book fields.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.database_manager import DatabaseManager, LAZY_BOOK_FIELDS
+from src.database.book_filter_manager import BookFilterManager
+
+
+def add_books(db_manager: DatabaseManager, count: int = 25) -> DatabaseManager:
+    """Add completed books across a few genres with large stored contents."""
+    genres = ["Fantasy", "Science Fiction", "Mystery"]
+
+    with db_manager.get_connection() as conn:
+        for i in range(count):
+            conn.execute("""
+                INSERT INTO books (book_id, title, genre, generation_status, created_date,
+                                   novel_data_json, epub_base64, metadata)
+                VALUES (?, ?, ?, 'completed', ?, ?, ?, ?)
+            """, (f"book_{i:03d}", f"Book {i}", genres[i % len(genres)],
+                  # Pairs of books share a timestamp so the book_id tie-break is exercised
+                  f"2024-01-{i // 2 + 1:02d}T00:00:00",
+                  json.dumps({"chapters": ["x" * 5000]}), "A" * 20000,
+                  json.dumps({"index": i})))
+        conn.commit()
+
+    return db_manager
+
+
+def test_summaries_skip_heavy_columns(library):
+    """Summaries carry listing columns only and load large fields on demand."""
+    db_manager = add_books(library(), count=3)
+
+    summary = db_manager.get_book_summaries(status="completed", limit=1)[0]
+    print(f"Summary keys: {sorted(summary.keys())}")
+
+    for field in LAZY_BOOK_FIELDS:
+        assert field not in dict(summary)
+    assert summary["book_id"] == "book_002"
+    assert summary["has_epub"] is True
+    assert summary["has_cover"] is False
+
+    # Heavy fields are fetched on first access and then cached
+    assert summary.get("metadata") == {"index": 2}
+    assert len(summary["epub_base64"]) == 20000
+    assert "epub_base64" in dict(summary)
+    assert summary.get("not_a_column", "default") == "default"
+
+
+def test_keyset_pagination_visits_every_book_once(library):
+    """Paging with cursors returns the same order as one unpaged query."""
+    db_manager = add_books(library())
+
+    all_ids = [book["book_id"] for book in db_manager.get_book_summaries()]
+
+    paged_ids = []
+    after = None
+    while True:
+        page = db_manager.get_book_summaries(limit=4, after=after)
+        if not page:
+            break
+        paged_ids.extend(book["book_id"] for book in page)
+        after = db_manager.summary_cursor(page[-1])
+
+    iterated_ids = [book["book_id"] for book in db_manager.iter_book_summaries(page_size=7)]
+
+    print(f"Books: {len(all_ids)}, paged: {len(paged_ids)}, iterated: {len(iterated_ids)}")
+    assert len(all_ids) == 25
+    assert paged_ids == all_ids
+    assert iterated_ids == all_ids
+
+    assert db_manager.count_books(genres=["Fantasy", "Mystery"], status="completed") == 17
+    assert db_manager.get_genre_counts(status="completed") == {
+        "Fantasy": 9, "Science Fiction": 8, "Mystery": 8
+    }
+
+
+def test_filter_manager_uses_summaries(library):
+    """Book menus are served from summaries without loading book contents."""
+    add_books(library())
+    filter_manager = BookFilterManager()
+
+    display_books = filter_manager.get_filtered_books_for_display(current_genre="Fantasy", max_books=6)
+    genre_books = filter_manager.get_books_by_genre_smart("Mystery", max_books=12)
+    summary = filter_manager.get_display_summary()
+
+    print(f"Display: {len(display_books)}, Mystery and related: {len(genre_books)}")
+    assert len(display_books) == 6
+    assert all("epub_base64" not in dict(book) for book in display_books + genre_books)
+
+    # 8 Mystery books, then up to 2 from the related Thriller/Crime/Suspense genres (none exist)
+    assert len(genre_books) == 8
+    assert summary["total_books"] == 25
+    assert summary["most_common_genre"] == "Fantasy"
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main([__file__, "-q"])
+    if exit_code == 0:
+        print("✅ Book summary tests passed")
+    sys.exit(exit_code)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test the combined chapter analysis call: schema validation, the retry on a bad
+reply, and one model call per chapter for both the summary and the tracking data.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.chapter_analysis import (
+    analyze_chapter, parse_chapter_analysis, validate_chapter_analysis
+)
+from src.core.exceptions import GenerationError
+from src.core.memory_manager import MemoryManager
+
+GOOD_REPLY = json.dumps({
+    "summary": "Mira finds the hidden ledger and confronts Tobin about the missing shipments.",
+    "character_updates": {"Mira": {"emotions": "furious", "location": "the counting house", "mood": "ignored"}},
+    "relationship_updates": {"Mira-Tobin": {"status": "strained"}, "Mira-Sela": {"development": "no status"}},
+    "plot_updates": {"Missing shipments": "active"},
+    "unresolved_questions": "Who forged the ledger?",
+    "locations": ["Counting house", ""],
+    "time_of_day": "night",
+    "weather": 12,
+    "unknown_key": "dropped",
+})
+
+
+class StubClient:
+    """Returns canned replies in order and counts calls."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.prompts = []
+
+    def generate_content(self, prompt, temperature=0.7, max_tokens=16000, use_cache=False):
+        self.prompts.append(prompt)
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+def test_validation_coerces_and_drops_bad_fields():
+    """Replies are coerced to the tracked shapes and malformed entries are dropped."""
+    analysis, problems = validate_chapter_analysis(parse_chapter_analysis(f"Here you go:\n{GOOD_REPLY}\n"), 3)
+
+    print(f"Analysis keys: {sorted(analysis)}, problems: {problems}")
+    assert analysis["character_updates"] == {"Mira": {"emotions": "furious", "location": "the counting house"}}
+    assert analysis["relationship_updates"] == {"Mira-Tobin": {"status": "strained"}}
+    assert analysis["plot_updates"] == {"Missing shipments": {"status": "active"}}
+    assert analysis["unresolved_questions"] == ["Who forged the ledger?"]
+    assert analysis["locations"] == ["Counting house"]
+    assert analysis["weather"] == "12"
+    assert "unknown_key" not in analysis
+    assert problems == ["relationship_updates.Mira-Sela is missing status"]
+
+    # A summary that only repeats the heading is rejected
+    analysis, problems = validate_chapter_analysis({"summary": "Chapter 3"}, 3)
+    assert "summary" not in analysis and problems
+
+    try:
+        parse_chapter_analysis("no json here")
+        assert False, "Expected GenerationError"
+    except GenerationError:
+        pass
+
+
+def test_bad_reply_is_retried_once():
+    """An unparseable reply is retried with a stricter prompt; two failures raise."""
+    client = StubClient(["not json at all", GOOD_REPLY])
+    analysis = analyze_chapter(client, "Some chapter text.", 3, "The Ledger")
+    assert len(client.prompts) == 2
+    assert "could not be parsed" in client.prompts[1]
+    assert analysis["summary"].startswith("Mira finds the hidden ledger")
+
+    client = StubClient(["{}", '{"summary": "Chapter 3"}'])
+    try:
+        analyze_chapter(client, "Some chapter text.", 3, "The Ledger")
+        assert False, "Expected GenerationError"
+    except GenerationError:
+        pass
+
+
+def test_memory_manager_makes_one_call_per_chapter():
+    """The summary and the tracking data come from a single call, with a fallback on failure."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory_manager = MemoryManager("Analysis Test", output_dir=temp_dir)
+        memory_manager.add_character({"name": "Mira", "role": "protagonist"})
+
+        client = StubClient([GOOD_REPLY])
+        summary, elements = memory_manager.analyze_chapter("Mira reads the ledger.", 3, "The Ledger", 2500, client)
+        print(f"Calls: {len(client.prompts)}, summary: {summary}")
+        assert len(client.prompts) == 1
+        assert summary.startswith("Mira finds the hidden ledger")
+        assert "summary" not in elements
+
+        memory_manager.add_chapter_summary(3, summary, 2500)
+        memory_manager.update_narrative_tracking(3, elements)
+        context = memory_manager.get_context_for_chapter(4)
+        assert context["narrative_context"]["plot_threads"]["Missing shipments"] == "active"
+
+        # API errors fall back to a placeholder summary and local extraction
+        summary, elements = memory_manager.analyze_chapter(
+            "Mira waits.", 4, "The Wait", 1200, StubClient([RuntimeError("quota"), RuntimeError("quota")])
+        )
+        assert summary == "Chapter 4 continues the story with 1200 words of content."
+        assert "Mira" in elements["character_updates"]
+
+        summary, elements = memory_manager.analyze_chapter("Mira waits.", 5, "The Wait", 900)
+        assert summary.startswith("Chapter 5 continues")
+
+
+if __name__ == "__main__":
+    test_validation_coerces_and_drops_bad_fields()
+    test_bad_reply_is_retried_once()
+    test_memory_manager_makes_one_call_per_chapter()
+    print("✅ Chapter analysis tests passed")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test the chapter length model: request sizes and token budgets predicted from
+recorded chapter lengths, per-writer history, and extension rates per genre.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.utils.chapter_length_model as chapter_length_model
+from src.core.memory_manager import MemoryManager
+from src.core.novel_generator import NovelGenerator
+from src.database.connection_pool import get_connection_pool
+from src.database.database_manager import DatabaseManager
+from src.testing.mock_components import MockGeminiClient
+from src.utils.chapter_length_model import ChapterLengthModel, MIN_SAMPLES
+
+
+def record_drafts(model, genre, writer, count, requested, produced, min_words=3500):
+    """Record drafts that came back at a fixed length (about 6 characters per word)."""
+    for _ in range(count):
+        model.record(genre, writer, min_words, requested, 25000, "x" * produced * 6,
+                     produced, produced < min_words - 500, max(produced, min_words))
+
+
+def test_plan_scales_request_from_history():
+    """A genre whose drafts run short gets a larger request and a fitted token budget."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "lengths.db")
+        model = ChapterLengthModel(DatabaseManager(db_path=db_path))
+
+        try:
+            # Not enough history: the fixed rules are used unchanged
+            plan = model.plan("Fantasy", "Ann Writer", 3500, 3500, 25000)
+            assert not plan.learned and plan.requested_words == 3500 and plan.max_tokens == 25000
+
+            # Fantasy drafts come back at 70% of the requested length
+            record_drafts(model, "Fantasy", "Ann Writer", 3, 3500, 2450)
+            record_drafts(model, "Fantasy", "Bo Writer", MIN_SAMPLES, 3500, 2450)
+            plan = model.plan("Fantasy", "Ann Writer", 3500, 3500, 25000)
+
+            print(f"Genre plan: {plan}")
+            assert plan.source == "genre" and plan.samples == 3 + MIN_SAMPLES
+            assert plan.requested_words == 5000
+            # 5000 words * 1.5 tokens per word * headroom, well under the fixed 25,000
+            assert 8000 <= plan.max_tokens < 25000
+
+            # A writer with enough history of their own overrides the genre
+            record_drafts(model, "Fantasy", "Cy Writer", MIN_SAMPLES, 3500, 4000)
+            plan = model.plan("Fantasy", "Cy Writer", 3500, 3500, 25000)
+            assert plan.source == "writer" and plan.requested_words == 3500
+
+            rates = model.get_extension_rates()
+            print(f"Extension rates: {rates}")
+            assert rates["fantasy"]["chapters"] == 3 + 2 * MIN_SAMPLES
+            assert rates["fantasy"]["extensions"] == 3 + MIN_SAMPLES
+        finally:
+            get_connection_pool().close_connections(db_path)
+
+
+def test_draft_records_length_and_uses_plan():
+    """Drafting a chapter records its length and later drafts use the learned plan."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "lengths.db")
+        model = ChapterLengthModel(DatabaseManager(db_path=db_path))
+        original_model = chapter_length_model._chapter_length_model
+        chapter_length_model._chapter_length_model = model
+
+        try:
+            generator = NovelGenerator.__new__(NovelGenerator)
+            generator.gemini = MockGeminiClient()
+            generator.gemini.response_delay = 0
+            generator.series_prompt_manager = None
+            generator.generation_options = {"min_chapter_length": 10}
+            generator.memory_manager = MemoryManager("Length Test", output_dir=temp_dir)
+            generator.memory_manager.update_metadata(genre="Fantasy", author="Ann Writer",
+                                                     target_audience="Adult", description="Test")
+            generator.memory_manager.set_novel_structure(1, 1000, ["Chapter 1 - The storm"])
+
+            generator._draft_chapter(1)
+            history = model.db_manager.get_chapter_generation_history("Fantasy", "Ann Writer")
+            assert len(history) == 1
+            assert history[0]["requested_words"] == 3500 and history[0]["extended"] == 0
+
+            # With enough history the prompt asks for the learned length
+            record_drafts(model, "Fantasy", "Ann Writer", MIN_SAMPLES, 1000, 500, min_words=10)
+            prompts = []
+            original_generate = generator.gemini.generate_content
+            generator.gemini.generate_content = lambda prompt, *args, **kwargs: (
+                prompts.append(prompt) or original_generate(prompt, *args, **kwargs))
+            generator._draft_chapter(1)
+            assert "approximately 20-1,020 words" in prompts[0]
+        finally:
+            chapter_length_model._chapter_length_model = original_model
+            get_connection_pool().close_connections(db_path)
+
+
+if __name__ == "__main__":
+    test_plan_scales_request_from_history()
+    test_draft_records_length_and_uses_plan()
+    print("✅ Chapter length model tests passed")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test the pooled WAL-mode connection layer and the bulk book write APIs.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.connection_pool import ConnectionPool, get_connection_pool
+from src.database.database_manager import DatabaseManager
+
+
+def test_connections_are_pooled_per_thread():
+    """Each thread reuses one configured connection per database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "pool.db")
+        pool = ConnectionPool()
+
+        conn = pool.get_connection(db_path)
+        assert pool.get_connection(db_path) is conn
+        assert pool.get_connection(os.path.join(temp_dir, ".", "pool.db")) is conn
+
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        print(f"journal_mode={journal_mode}, synchronous={synchronous}")
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+        other_thread = []
+        thread = threading.Thread(target=lambda: other_thread.append(pool.get_connection(db_path)))
+        thread.start()
+        thread.join()
+        assert other_thread[0] is not conn
+
+        # Closing hands out fresh connections afterwards
+        assert pool.close_connections(db_path) == 2
+        reopened = pool.get_connection(db_path)
+        assert reopened is not conn
+        assert reopened.execute("SELECT 1").fetchone()[0] == 1
+        pool.close_connections()
+
+
+def test_bulk_add_and_update_books():
+    """Bulk APIs write many rows through one transaction."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(db_path=os.path.join(temp_dir, "test.db"))
+
+        books = [
+            {"book_id": f"bulk_{i}", "title": f"Bulk Book {i}", "genre": "Fantasy",
+             "series_info": {"is_part_of_series": True, "book_number": i}}
+            for i in range(50)
+        ]
+
+        conn = db_manager.get_connection()
+        changes_before = conn.total_changes
+        book_ids = db_manager.add_books_bulk(books)
+        print(f"Inserted {len(book_ids)} books, {conn.total_changes - changes_before} row changes")
+
+        assert book_ids == [book["book_id"] for book in books]
+        assert db_manager.count_books() == 50
+        assert db_manager.get_book("bulk_7")["series_info"]["book_number"] == 7
+
+        updated = db_manager.update_books_bulk({
+            **{f"bulk_{i}": {"generation_status": "completed"} for i in range(0, 50, 2)},
+            "bulk_1": {"generation_status": "failed", "word_count": 1200},
+            "missing_book": {"generation_status": "completed"}
+        })
+
+        print(f"Updated {updated} books")
+        assert updated == 26
+        assert db_manager.count_books(status="completed") == 25
+        assert db_manager.get_book("bulk_1")["word_count"] == 1200
+
+        # Single-row APIs share the bulk code path
+        assert db_manager.update_book("bulk_3", {"genre": "Mystery"})
+        assert not db_manager.update_book("missing_book", {"genre": "Mystery"})
+
+        get_connection_pool().close_connections(db_manager.db_path)
+
+
+if __name__ == "__main__":
+    test_connections_are_pooled_per_thread()
+    test_bulk_add_and_update_books()
+    print("✅ Connection pool tests passed")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test the token-budgeted chapter context builder: ranking, arc summaries for
+older chapters and flat prompt size as a book grows.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.memory_manager import MemoryManager
+from src.utils.context_builder import build_chapter_context, estimate_tokens
+
+CHARACTERS = ["Mira", "Tobin", "Sela", "Corvin", "Aldric", "Wren"]
+
+
+def make_memory(temp_dir: str, chapters: int) -> MemoryManager:
+    """Create a memory with the given number of written chapters."""
+    memory_manager = MemoryManager("Budget Test", output_dir=temp_dir)
+    outline = [f"Chapter {n} - {CHARACTERS[n % len(CHARACTERS)]} searches the archive" for n in range(1, 61)]
+    memory_manager.set_novel_structure(60, 200000, outline)
+    for name in CHARACTERS:
+        memory_manager.add_character({"name": name, "role": "protagonist" if name == "Mira" else "supporting",
+                                      "personality_traits": "curious, stubborn and loyal to a fault"})
+
+    for n in range(1, chapters + 1):
+        memory_manager.add_chapter_summary(
+            n, f"In chapter {n} the crew crosses the marsh. Mira argues with Tobin about the map. " * 3, 3000)
+        memory_manager.update_narrative_tracking(n, {
+            "character_updates": {name: {"emotions": f"uneasy after chapter {n}", "location": f"camp {n}"}
+                                  for name in CHARACTERS},
+            "plot_updates": {f"Thread {n}": {"status": "resolved" if n % 3 == 0 else "active"}},
+            "unresolved_questions": [f"Who left the note in chapter {n}?"],
+            "continuity": {f"Lantern {n}": "cracked glass"},
+        })
+    return memory_manager
+
+
+def test_prompt_context_stays_within_budget():
+    """Context tokens stop growing once a book outgrows the budget."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        usage = {}
+        for chapters in (25, 50):
+            memory_manager = make_memory(os.path.join(temp_dir, str(chapters)), chapters)
+            context = memory_manager.get_context_for_chapter(chapters + 1)
+            budgeted = build_chapter_context(context, chapters + 1, pov_name="Mira", token_budget=2000)
+            usage[chapters] = budgeted.total_tokens
+
+            print(f"Chapter {chapters + 1}: {budgeted.total_tokens} tokens, sections {budgeted.token_usage}")
+            assert budgeted.total_tokens <= 2000
+            assert f"- Chapter {chapters}:" in budgeted.sections["previous_chapters"]
+            assert budgeted.sections["character_info"].count("\n") == len(CHARACTERS)
+
+        # Older chapters are folded into arc summaries instead of being listed one by one
+        assert budgeted.arc_summaries
+        assert "(summary):" in budgeted.sections["previous_chapters"]
+        assert budgeted.dropped_items
+        assert abs(usage[50] - usage[25]) <= 2000 * 0.1
+
+
+def test_ranking_prefers_focus_entities_and_open_threads():
+    """Lines about the POV character, outline entities and open threads win."""
+    context = {
+        "structure": {"outline": ["Chapter 1 - Wren steals the lantern"]},
+        "characters": [{"name": name, "role": "supporting"} for name in CHARACTERS],
+        "previous_chapters": [],
+        "narrative_context": {
+            "character_emotions": {name: "calm" for name in CHARACTERS},
+            "plot_threads": {"Old feud": "resolved", "The lantern": "active"},
+            "continuity": {"The lantern": "cracked glass"},
+        },
+    }
+    full = build_chapter_context(context, 1, pov_name="Mira", token_budget=10000)
+    tight_budget = full.total_tokens - estimate_tokens("- Aldric's emotional state: calm\n") * 4
+    budgeted = build_chapter_context(context, 1, pov_name="Mira", token_budget=tight_budget)
+
+    print(f"Dropped: {budgeted.dropped_items}")
+    assert "Mira's emotional state" in budgeted.sections["character_state_info"]
+    assert "Wren's emotional state" in budgeted.sections["character_state_info"]
+    assert "'The lantern': active" in budgeted.sections["plot_thread_info"]
+    assert "Old feud" not in budgeted.sections["plot_thread_info"]
+    # Kept lines stay in their original order
+    kept = budgeted.sections["character_state_info"]
+    assert kept.index("Mira") < kept.index("Wren")
+
+
+if __name__ == "__main__":
+    test_prompt_context_stays_within_budget()
+    test_ranking_prefers_focus_entities_and_open_threads()
+    print("✅ Context builder tests passed")
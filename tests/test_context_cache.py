@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test memoized chapter and series context: repeated lookups reuse the assembled
+context until memory or series tracking changes.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.memory_manager import MemoryManager
+from src.core.series_manager import SeriesManager
+
+
+def count_calls(obj, method_name: str) -> list:
+    """Wrap a method on an instance and record each call."""
+    calls = []
+    original = getattr(obj, method_name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    setattr(obj, method_name, wrapper)
+    return calls
+
+
+def test_chapter_context_is_memoized_until_memory_changes():
+    """Generate and enhance share one context build per chapter."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory_manager = MemoryManager("Cache Test", output_dir=temp_dir)
+        memory_manager.add_character({"name": "Mira"})
+        memory_manager.update_narrative_tracking(1, {"character_updates": {"Mira": {"development": "arc 1"}}})
+
+        builds = count_calls(memory_manager, "_build_context_for_chapter")
+
+        first = memory_manager.get_context_for_chapter(2)
+        first["extra"] = "added by caller"
+        second = memory_manager.get_context_for_chapter("2")
+        memory_manager.get_context_for_chapter(3)
+
+        print(f"Builds after three lookups: {len(builds)}")
+        assert len(builds) == 2
+        assert "extra" not in second
+        assert second["narrative_context"]["character_arcs"] == {"Mira": "arc 1"}
+
+        # Any recorded change starts a new generation
+        memory_manager.add_chapter_summary(1, "Summary 1", 1000)
+        third = memory_manager.get_context_for_chapter(2)
+        assert len(builds) == 3
+        assert [c["chapter_num"] for c in third["previous_chapters"]] == [1]
+
+        memory_manager.update_narrative_tracking(1, {"character_updates": {"Mira": {"development": "arc 1b"}}})
+        assert memory_manager.get_context_for_chapter(2)["narrative_context"]["character_arcs"] == {"Mira": "arc 1b"}
+        assert len(builds) == 4
+
+
+def test_series_context_is_invalidated_by_tracking_updates():
+    """Series tracking context is rebuilt only after update_series_tracking."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        series_manager = SeriesManager("Cache Test Series", output_dir=os.path.join(temp_dir, "series"))
+        series_manager.update_series_tracking(1, {"character_arcs": {"Mira": "book 1"}})
+
+        memory_manager = MemoryManager("Cache Test Book", output_dir=temp_dir,
+                                       series_manager=series_manager, book_number=2)
+        builds = count_calls(series_manager, "_get_series_context_for_book")
+
+        for chapter_num in (1, 1, 2):
+            context = memory_manager.get_context_for_chapter(chapter_num)
+
+        print(f"Series context builds after three chapter lookups: {len(builds)}")
+        assert len(builds) == 1
+        assert context["series_context"]["series_context"]["character_arcs"] == {"Mira": "book 1"}
+
+        # Other series changes are still picked up, tracking context is reused
+        series_manager.add_book({"title": "Book One"})
+        context = memory_manager.get_context_for_chapter(2)
+        assert len(builds) == 1
+        assert len(context["series_context"]["previous_books"]) == 1
+
+        series_manager.update_series_tracking(1, {"character_arcs": {"Mira": "book 1 revised"}})
+        context = memory_manager.get_context_for_chapter(2)
+        assert len(builds) == 2
+        assert context["series_context"]["series_context"]["character_arcs"] == {"Mira": "book 1 revised"}
+
+
+if __name__ == "__main__":
+    test_chapter_context_is_memoized_until_memory_changes()
+    test_series_context_is_invalidated_by_tracking_updates()
+    print("✅ Context cache tests passed")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test that the vectorized cover gradients and textures render exactly the same
+pixels as the original per-pixel loops for a fixed seed.
+"""
+
+import math
+import os
+import random
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image, ImageChops
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.cover_generator import CoverGenerator
+
+WIDTH, HEIGHT = 61, 47  # Odd sizes exercise partial grain and weave tiles
+COLORS = [(20, 40, 90), (200, 120, 30), (250, 240, 220)]
+
+
+def reference_gradient(width, height, colors, style):
+    """Per-pixel gradient as rendered before vectorization."""
+    gradient = np.zeros((height, width, 3), dtype=np.uint8)
+    center_x, center_y = width // 2, height // 2
+    max_radius = math.sqrt(center_x ** 2 + center_y ** 2)
+
+    for y in range(height):
+        for x in range(width):
+            if style == "radial":
+                ratio = min(math.sqrt((x - center_x) ** 2 + (y - center_y) ** 2) / max_radius, 1.0)
+                if len(colors) >= 3:
+                    if ratio < 0.5:
+                        t, c1, c2 = ratio * 2, colors[0], colors[1]
+                    else:
+                        t, c1, c2 = (ratio - 0.5) * 2, colors[1], colors[2]
+                else:
+                    t, c1, c2 = ratio, colors[0], colors[1]
+                color = [int(c1[i] * (1 - t) + c2[i] * t) for i in range(3)]
+            elif style == "angular":
+                dx = abs(x - center_x) / (width / 2)
+                dy = abs(y - center_y) / (height / 2)
+                t = min(max(dx, dy), 1.0)
+                color = [int(colors[0][i] * (1 - t) + colors[1][i] * t) for i in range(3)]
+            else:  # conic
+                ratio = (math.atan2(y - center_y, x - center_x) + math.pi) / (2 * math.pi)
+                color_index = ratio * (len(colors) - 1)
+                idx = int(color_index)
+                t = color_index - idx
+                if idx >= len(colors) - 1:
+                    color = colors[-1]
+                else:
+                    color = [int(colors[idx][i] * (1 - t) + colors[idx + 1][i] * t) for i in range(3)]
+            gradient[y, x] = color
+
+    return Image.fromarray(gradient, 'RGB')
+
+
+def reference_texture(img, texture_type):
+    """Tile-by-tile paper and canvas textures as rendered before vectorization."""
+    width, height = img.size
+
+    if texture_type == "paper":
+        paper_texture = ((np.random.rand(height, width) * 0.4 + 0.8) * 255).astype(np.uint8)
+        for y in range(0, height, 3):
+            for x in range(0, width, 3):
+                if random.random() < 0.1:
+                    paper_texture[y:y + 3, x:x + 3] = (paper_texture[y:y + 3, x:x + 3] * 0.9).astype(np.uint8)
+        blended = ImageChops.multiply(img, Image.fromarray(paper_texture, 'L').convert('RGB'))
+        return Image.blend(img, blended, 0.3)
+
+    canvas = np.ones((height, width), dtype=np.float32)
+    for y in range(0, height, 4):
+        for x in range(0, width, 4):
+            if (x // 4 + y // 4) % 2:
+                canvas[y:y + 4, x:x + 4] *= 0.95
+    canvas += np.random.normal(0, 0.02, (height, width))
+    canvas = np.clip(canvas, 0.8, 1.0)
+    blended = ImageChops.multiply(img, Image.fromarray((canvas * 255).astype(np.uint8), 'L').convert('RGB'))
+    return Image.blend(img, blended, 0.4)
+
+
+def test_gradients_match_reference():
+    """Radial, angular and conic gradients are pixel-identical to the loops."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generator = CoverGenerator(output_dir=temp_dir)
+
+        for style in ("radial", "angular", "conic"):
+            for colors in (COLORS, COLORS[:2]):
+                expected = np.asarray(reference_gradient(WIDTH, HEIGHT, colors, style))
+                actual = np.asarray(generator._create_advanced_gradient(WIDTH, HEIGHT, colors, style))
+                print(f"{style} with {len(colors)} colors: {actual.shape}")
+                assert np.array_equal(actual, expected), f"{style} gradient differs"
+
+
+def test_textures_match_reference_for_fixed_seed():
+    """Paper and canvas textures are pixel-identical to the loops for a fixed seed."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generator = CoverGenerator(output_dir=temp_dir)
+        base = generator._create_advanced_gradient(WIDTH, HEIGHT, COLORS, "radial")
+
+        for texture_type in ("paper", "canvas"):
+            random.seed(42)
+            np.random.seed(42)
+            expected = np.asarray(reference_texture(base, texture_type))
+            expected_next_draw = random.random()
+
+            random.seed(42)
+            np.random.seed(42)
+            actual = np.asarray(generator._add_sophisticated_texture(base, texture_type))
+
+            print(f"{texture_type} texture: {actual.shape}")
+            assert np.array_equal(actual, expected), f"{texture_type} texture differs"
+            # The same number of random() draws must have been consumed
+            assert random.random() == expected_next_draw
+
+
+if __name__ == "__main__":
+    test_gradients_match_reference()
+    test_textures_match_reference_for_fixed_seed()
+    print("✅ Vectorized cover rendering matches the reference loops")
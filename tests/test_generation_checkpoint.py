@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Test script for chapter checkpointing and resume.
+
+This script tests:
+1. Finished chapters are checkpointed as they complete
+2. A crashed run resumes from the first missing chapter
+3. Memory and generation options are restored so summaries are not duplicated or lost
+4. A torn final journal record is discarded
+5. An existing checkpoint is found by title and never silently replaced
+6. Fresh and resumed books are finished by the same completion routine
+"""
+
+import json
+import os
+import sys
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.generation_checkpoint import GenerationCheckpoint
+from src.core.memory_manager import MemoryManager
+from src.core.novel_generator import NovelGenerator
+from src.testing.mock_components import MockGeminiClient
+
+
+TITLE = "Checkpoint Test"
+CHAPTER_COUNT = 4
+
+
+def _create_generator(temp_dir: str) -> NovelGenerator:
+    """Create a NovelGenerator wired to the mock Gemini client."""
+    generator = NovelGenerator.__new__(NovelGenerator)
+    generator.gemini = MockGeminiClient()
+    generator.gemini.response_delay = 0
+    generator.series_prompt_manager = None
+    generator.generation_options = {"min_chapter_length": 10}
+    generator.memory_manager = MemoryManager(TITLE, output_dir=temp_dir)
+
+    # Skip database and cover side effects
+    generator._save_completed_novel = lambda novel: "test-book-id"
+    generator._generate_cover_prompt_after_completion = lambda novel: None
+    return generator
+
+
+def test_resume_after_crash():
+    """Test that resume continues from the first chapter that was not checkpointed."""
+    print("Testing checkpoint resume...")
+
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        # First run crashes while enhancing chapter 3
+        generator = _create_generator(temp_dir)
+        memory_manager = generator.memory_manager
+        memory_manager.update_metadata(genre="Test", target_audience="Adult", description="Test")
+        outline = [f"Chapter {i} - Event {i}" for i in range(1, CHAPTER_COUNT + 1)]
+        memory_manager.set_novel_structure(CHAPTER_COUNT, 1000, outline)
+
+        checkpoint = GenerationCheckpoint(memory_manager)
+        checkpoint.start({"min_chapter_length": 10, "writing_style": "Sparse"})
+        with open(checkpoint.memory_snapshot_file, 'rb') as f:
+            memory_snapshot = f.read()
+        checkpoint.save_stage("writer_profile", {"name": "Test Author"})
+        checkpoint.save_stage("outline", {"chapter_outlines": outline, "chapter_count": CHAPTER_COUNT})
+        checkpoint.save_stage("characters", [])
+
+        original_enhance = generator.enhance_chapter
+
+        def crashing_enhance(chapter_text, chapter_num, chapter_title):
+            if chapter_num == 3:
+                raise ConnectionError("network blip")
+            return original_enhance(chapter_text, chapter_num, chapter_title)
+
+        generator.enhance_chapter = crashing_enhance
+
+        try:
+            generator._complete_novel({"name": "Test Author"}, outline, CHAPTER_COUNT, [], [], checkpoint)
+            assert False, "first run should have crashed"
+        except ConnectionError:
+            pass
+
+        first_run_chapters = GenerationCheckpoint(memory_manager).load()["chapters"]
+        assert [c["number"] for c in first_run_chapters] == [1, 2]
+
+        # Memory is written once; each chapter record carries only its own changes
+        with open(checkpoint.memory_snapshot_file, 'rb') as f:
+            assert f.read() == memory_snapshot
+        with open(checkpoint.journal_file, 'r', encoding='utf-8') as f:
+            chapter_records = [json.loads(line) for line in f if '"type": "chapter"' in line]
+        assert [{c["op"] for c in r["memory_changes"]} for r in chapter_records] == [
+            {"add_chapter_summary", "update_narrative_tracking"}] * 2
+
+        # Second run resumes in a fresh generator
+        resumed = _create_generator(temp_dir)
+        resumed.generation_options = {}
+        drafted = []
+        original_draft = resumed._draft_chapter
+
+        def recording_draft(chapter_num):
+            drafted.append(chapter_num)
+            return original_draft(chapter_num)
+
+        resumed._draft_chapter = recording_draft
+        novel = resumed.resume_novel()
+
+        assert drafted == [3, 4]
+        assert resumed.generation_options == {"min_chapter_length": 10, "writing_style": "Sparse"}
+        assert [c["number"] for c in novel["chapters"]] == [1, 2, 3, 4]
+        assert novel["chapters"][:2] == first_run_chapters
+        assert [s["chapter_num"] for s in resumed.memory_manager.chapter_summaries] == [1, 2, 3, 4]
+        assert not GenerationCheckpoint(resumed.memory_manager).exists()
+
+        print("✓ Checkpoint resume test passed")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_torn_record_is_discarded():
+    """Test that a partially written final record does not break later appends."""
+    print("Testing torn checkpoint record...")
+
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        memory_manager = MemoryManager(TITLE, output_dir=temp_dir)
+        checkpoint = GenerationCheckpoint(memory_manager)
+        checkpoint.start()
+        checkpoint.save_chapter({"number": 1, "title": "One", "content": "Text"})
+
+        with open(checkpoint.journal_file, 'a', encoding='utf-8') as f:
+            f.write('{"type": "chapter", "chapter": {"numb')
+
+        state = checkpoint.load()
+        assert [c["number"] for c in state["chapters"]] == [1]
+
+        checkpoint.save_chapter({"number": 2, "title": "Two", "content": "Text"})
+        state = GenerationCheckpoint(memory_manager).load()
+        assert [c["number"] for c in state["chapters"]] == [1, 2]
+
+        print("✓ Torn record test passed")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_existing_checkpoint_is_offered_for_resume():
+    """Test that an interrupted run is found by title and not wiped by a new start."""
+    print("Testing checkpoint discovery...")
+
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        older_dir = os.path.join(temp_dir, "Checkpoint Test_1")
+        newer_dir = os.path.join(temp_dir, "series", "book_01_Checkpoint Test")
+        for output_dir in (older_dir, newer_dir):
+            GenerationCheckpoint(MemoryManager(TITLE, output_dir=output_dir)).start()
+        os.utime(GenerationCheckpoint(MemoryManager(TITLE, output_dir=older_dir)).journal_file, (0, 0))
+
+        found = GenerationCheckpoint.find(TITLE, search_dir=temp_dir)
+        assert found == [newer_dir.replace('\\', '/'), older_dir.replace('\\', '/')]
+        assert GenerationCheckpoint.find("Another Book", search_dir=temp_dir) == []
+
+        # Starting again must not discard the chapters of the interrupted run
+        checkpoint = GenerationCheckpoint(MemoryManager(TITLE, output_dir=newer_dir))
+        checkpoint.save_chapter({"number": 1, "title": "One", "content": "Text"})
+        try:
+            GenerationCheckpoint(MemoryManager(TITLE, output_dir=newer_dir)).start()
+            assert False, "start should refuse to replace an existing checkpoint"
+        except FileExistsError:
+            pass
+        assert [c["number"] for c in checkpoint.load()["chapters"]] == [1]
+
+        # The generation menu offers the newest run and returns nothing when declined
+        from src.ui import book_menu
+        original_find = GenerationCheckpoint.find
+        original_confirm = book_menu.questionary.confirm
+        answers = []
+
+        class Answer:
+            def __init__(self, value):
+                self.value = value
+
+            def ask(self):
+                return self.value
+
+        try:
+            GenerationCheckpoint.find = staticmethod(lambda title: original_find(title, search_dir=temp_dir))
+            book_menu.questionary.confirm = lambda *args, **kwargs: Answer(answers.pop(0))
+
+            answers.append(True)
+            assert book_menu.ask_resume_generation(TITLE) == newer_dir.replace('\\', '/')
+            answers.append(False)
+            assert book_menu.ask_resume_generation(TITLE) is None
+            assert book_menu.ask_resume_generation("Another Book") is None
+        finally:
+            GenerationCheckpoint.find = original_find
+            book_menu.questionary.confirm = original_confirm
+
+        print("✓ Checkpoint discovery test passed")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_resumed_book_is_completed_like_a_fresh_one():
+    """Test that the menu's completion routine saves, formats and finishes a book."""
+    print("Testing book completion...")
+
+    temp_dir = tempfile.mkdtemp()
+
+    from src.ui import book_menu
+    from src.utils import smart_cover_selector
+
+    class FinishingGenerator:
+        finished = []
+
+        def finish_novel(self, novel, checkpoint=None):
+            self.finished.append(novel["metadata"]["title"])
+            checkpoint.clear()
+
+    class RecordingFormatter:
+        saved = []
+
+        def __init__(self, novel, writer_profile=None):
+            self.novel = novel
+
+        def save_epub(self, output_dir, cover_path, writer_profile=None):
+            self.saved.append((cover_path, writer_profile))
+            return os.path.join(output_dir, "book.epub")
+
+    original_formatter = book_menu.EpubFormatter
+    original_cover = smart_cover_selector.get_smart_cover_for_epub
+    try:
+        book_menu.EpubFormatter = RecordingFormatter
+        smart_cover_selector.get_smart_cover_for_epub = lambda novel, output_dir, auto_mode=True: "cover.jpg"
+
+        memory_manager = MemoryManager(TITLE, output_dir=temp_dir)
+        novel = {"metadata": {"title": TITLE}, "writer_profile": {"name": "Test Author"},
+                 "chapters": [{"number": 1, "title": "One", "content": "Text"}]}
+        novel_info = {"title": TITLE, "author": "Tester", "genre": "Test",
+                      "target_audience": "Adult", "description": "Test"}
+
+        for selected_idea in (None, {"title": "Idea"}):
+            checkpoint = GenerationCheckpoint(memory_manager)
+            checkpoint.start()
+            book_menu.generation_timer.start()
+            book_info = book_menu.complete_book(FinishingGenerator(), novel, novel_info, temp_dir,
+                                                checkpoint, selected_idea)
+
+            assert os.path.exists(os.path.join(temp_dir, "novel_data.json"))
+            assert not checkpoint.exists()
+            assert book_info["chapter_count"] == 1
+            assert book_info.get("source_idea") == selected_idea
+
+        # Both books were saved with their descriptions; the one from an idea also got its EPUB
+        assert FinishingGenerator.finished == [TITLE, TITLE]
+        assert RecordingFormatter.saved == [("cover.jpg", {"name": "Test Author"})]
+
+        print("✓ Book completion test passed")
+
+    finally:
+        book_menu.EpubFormatter = original_formatter
+        smart_cover_selector.get_smart_cover_for_epub = original_cover
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_resume_after_crash()
+    test_torn_record_is_discarded()
+    test_existing_checkpoint_is_offered_for_resume()
+    test_resumed_book_is_completed_like_a_fresh_one()
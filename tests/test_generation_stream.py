@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Test streaming generation: the incremental word counter, time-to-first-token,
+early cut-off, continuations that send only the follow-up prompt, and streams
+that break off part way through.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.gemini_client import GeminiClient
+from src.core.generation_stream import GenerationStream
+from src.core.key_scheduler import APIKeyScheduler
+from src.core.memory_manager import MemoryManager
+from src.core.novel_generator import NovelGenerator
+from src.testing.mock_components import MockGeminiClient
+from src.utils.word_counter import IncrementalWordCounter, count_words
+
+DRAFT = "The storm broke over the harbour as Mira ran for the lighthouse. " * 20
+EXTENSION = "She climbed the last stair and lit the lamp at last. " * 10
+
+
+class StreamingStub:
+    """Streams canned replies in small chunks after a short first-token delay."""
+
+    def __init__(self, replies, chunk_size=7, first_token_delay=0.02):
+        self.replies = list(replies)
+        self.chunk_size = chunk_size
+        self.first_token_delay = first_token_delay
+        self.prompts = []
+        self.closed = 0
+
+    def __call__(self, prompt, max_tokens):
+        self.prompts.append(prompt)
+        return self._chunks(self.replies.pop(0))
+
+    def _chunks(self, reply):
+        time.sleep(self.first_token_delay)
+        try:
+            for start in range(0, len(reply), self.chunk_size):
+                yield reply[start:start + self.chunk_size]
+        finally:
+            self.closed += 1
+
+
+class BreakingTransport:
+    """Streams part of a reply and then drops the connection; blocking requests return the rest."""
+
+    def __init__(self, continuation):
+        self.continuation = continuation
+        self.prompts = []
+
+    async def post(self, session, key, body):
+        self.prompts.append(body["contents"][-1]["parts"][0]["text"])
+        if isinstance(self.continuation, Exception):
+            raise self.continuation
+        return self.continuation
+
+    async def post_stream(self, session, key, body):
+        self.prompts.append(body["contents"][-1]["parts"][0]["text"])
+        for chunk in ("The storm broke ", "over the harbour "):
+            yield chunk
+        raise ConnectionResetError("stream reset by peer")
+
+
+def make_streaming_client(transport):
+    """GeminiClient whose only key is served by the given transport."""
+    client = GeminiClient.__new__(GeminiClient)
+    client.api_keys = ["key-1"]
+    client.current_key_index = 0
+    client.key_usage_count = {"key-1": 0}
+    client.rate_limited_keys = set()
+    client.key_scheduler = APIKeyScheduler(client.api_keys, requests_per_minute=100, tokens_per_minute=1000000)
+    client._async_client = None
+    client.async_client._post = transport.post
+    client.async_client._post_stream = transport.post_stream
+    return client
+
+
+def test_incremental_counter_matches_count_words():
+    """Words split across chunk boundaries are counted once."""
+    counter = IncrementalWordCounter()
+    for chunk in ["Hel", "lo  wor", "ld\n", "\nagain", " ", "", "and again"]:
+        counter.feed(chunk)
+    assert counter.count == count_words("Hello  world\n\nagain and again") == 5
+
+
+def test_stream_reports_chunks_and_time_to_first_token():
+    """Chunks arrive incrementally with a running count and TTFT."""
+    stub = StreamingStub([DRAFT])
+    seen_counts = []
+    stream = GenerationStream(stub, "Write the storm scene", 4000,
+                              on_chunk=lambda chunk, s: seen_counts.append(s.word_count))
+
+    chunks = list(stream)
+    print(f"{len(chunks)} chunks, {stream.word_count} words, TTFT {stream.time_to_first_token:.3f}s")
+    assert len(chunks) > 10
+    assert stream.text == DRAFT
+    assert stream.word_count == count_words(DRAFT)
+    assert seen_counts == sorted(seen_counts) and seen_counts[-1] == stream.word_count
+    assert stream.time_to_first_token >= 0.02
+    assert not stream.stopped
+
+
+def test_word_ceiling_cuts_stream_off():
+    """A word ceiling stops the stream and closes the source early."""
+    stub = StreamingStub([DRAFT])
+    stream = GenerationStream(stub, "Write the storm scene", 4000, max_words=30)
+    text = stream.result()
+
+    assert stream.stop_reason == "max_words"
+    assert 30 <= stream.word_count < count_words(DRAFT)
+    assert len(text) < len(DRAFT)
+    assert stub.closed == 1
+
+
+def test_continuation_sends_only_the_follow_up_prompt():
+    """A continuation appends to the same text and count without resending the prompt."""
+    original_prompt = "LONG ORIGINAL PROMPT " * 100
+    stub = StreamingStub([DRAFT, EXTENSION])
+    stream = GenerationStream(stub, original_prompt, 4000)
+    stream.result()
+
+    stream.continue_with(f"Continue from here:\n{stream.tail(200)}", max_tokens=1000)
+    text = stream.result()
+
+    assert len(stub.prompts) == 2
+    assert "LONG ORIGINAL PROMPT" not in stub.prompts[1]
+    assert text == DRAFT + "\n\n" + EXTENSION
+    assert stream.word_count == count_words(text)
+    assert len(stream.segments) == 2 and stream.segments[1]["words"] == count_words(EXTENSION)
+
+
+def test_short_chapter_is_extended_on_the_same_stream():
+    """A short streamed draft is extended through the mock client's stream."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generator = NovelGenerator.__new__(NovelGenerator)
+        generator.gemini = MockGeminiClient()
+        generator.gemini.response_delay = 0
+        generator.series_prompt_manager = None
+        generator.generation_options = {"min_chapter_length": 5000}
+        generator.memory_manager = MemoryManager("Stream Test", output_dir=temp_dir)
+        generator.memory_manager.update_metadata(genre="Test", target_audience="Adult", description="Test")
+        generator.memory_manager.set_novel_structure(1, 1000, ["Chapter 1 - The storm"])
+
+        chunks = []
+        generator.chapter_chunk_callback = lambda chapter_num, chunk, stream: chunks.append(chapter_num)
+        chapter_text, _, word_count = generator._draft_chapter(1)
+
+        print(f"Draft: {word_count} words from {len(chunks)} chunks, {generator.gemini.call_count} calls")
+        assert generator.gemini.call_count == 2
+        assert word_count == count_words(chapter_text)
+        assert chunks and set(chunks) == {1}
+
+
+def test_broken_stream_is_continued_from_its_tail():
+    """A stream that fails after the first chunk is finished by a continuation request."""
+    transport = BreakingTransport("as Mira ran for the lighthouse.")
+    client = make_streaming_client(transport)
+
+    try:
+        text = client.generate_content_stream("Write the storm scene", max_tokens=1000, use_cache=False).result()
+    finally:
+        client.async_client.close()
+    print(f"Continued text: {text!r}")
+    assert text == "The storm broke over the harbour as Mira ran for the lighthouse."
+    assert len(transport.prompts) == 2
+    assert "Write the storm scene" in transport.prompts[1] and "over the harbour" in transport.prompts[1]
+    # The interrupted stream's reservation was settled
+    assert list(client.key_scheduler.get_status()["keys"].values())[0]["tokens_available"] > 999000
+
+
+def test_broken_stream_raises_when_it_cannot_be_continued():
+    """A partial reply is never returned as if it were complete."""
+    client = make_streaming_client(BreakingTransport(ValueError("continuation refused")))
+    try:
+        client.generate_content_stream("Write the storm scene", max_tokens=1000, use_cache=False).result()
+        assert False, "Expected the broken stream to raise"
+    except RuntimeError as e:
+        assert "could not be continued" in str(e)
+    finally:
+        client.async_client.close()
+
+
+if __name__ == "__main__":
+    test_incremental_counter_matches_count_words()
+    test_stream_reports_chunks_and_time_to_first_token()
+    test_word_ceiling_cuts_stream_off()
+    test_continuation_sends_only_the_follow_up_prompt()
+    test_short_chapter_is_extended_on_the_same_stream()
+    test_broken_stream_is_continued_from_its_tail()
+    test_broken_stream_raises_when_it_cannot_be_continued()
+    print("✅ Generation stream tests passed")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test the genre guideline index: lookups by normalized and partial genre name,
+rebuilds when the guidelines file changes, and the serialized cache file.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.chapter_planner import get_genre_guidelines
+from src.utils.genre_defaults import extract_from_guidelines, determine_pov_from_guidelines
+from src.utils.genre_guidelines import GenreGuidelineIndex, get_genre_guideline_index
+
+GUIDELINES = """# Genre Guidelines
+
+| Genre            | Type      | Chapter Range | Word Count Range | Additional Notes    |
+| ---------------- | --------- | ------------- | ---------------- | ------------------- |
+| **Fiction**      |
+| Mystery/Thriller | Narrative | 30-50         | 70,000-90,000    | Short chapters      |
+| Romance          | Narrative | 20-30         | 50,000-90,000    | Dual POV common     |
+
+### POV Patterns by Genre
+
+- **Thriller**: Limited POV, often first person or close third
+
+### Structural Elements by Genre
+"""
+
+
+def write_guidelines(path, content, mtime):
+    """Write a guidelines file with a fixed modification time."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.utime(path, (mtime, mtime))
+
+
+def test_lookup_and_rebuild_on_change():
+    """Lookups are served from one parse until the file's mtime changes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "guidelines.md")
+        write_guidelines(path, GUIDELINES, 1000)
+        index = GenreGuidelineIndex(path)
+
+        assert index.get("  ROMANCE ").chapter_range == (20, 30)
+        assert index.get("Mystery").name == "Mystery/Thriller"  # Partial match
+        assert index.get("Fiction") is None  # Section divider, not a genre
+        assert index.get("Rom") is None  # Too short for a partial match
+        assert index.get_pov_patterns("Thriller") == ["- **thriller**: limited pov, often first person or close third"]
+        for _ in range(100):
+            index.get("Romance")
+        assert index.builds == 1
+
+        write_guidelines(path, GUIDELINES.replace("20-30", "22-28"), 2000)
+        assert index.get("Romance").chapter_range == (22, 28)
+        assert index.builds == 2
+        print(f"Genres: {index.get_genres()}, builds: {index.builds}")
+
+
+def test_cache_file_skips_parsing():
+    """A fresh index loads a matching cache file instead of parsing the markdown."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "guidelines.md")
+        cache_path = os.path.join(temp_dir, "cache", "genre_index.json")
+        write_guidelines(path, GUIDELINES, 1000)
+
+        first = GenreGuidelineIndex(path, cache_path=cache_path)
+        assert first.get("Romance").word_count_range == (50000, 90000)
+        assert first.builds == 1 and os.path.exists(cache_path)
+
+        second = GenreGuidelineIndex(path, cache_path=cache_path)
+        assert second.get("Romance").word_count_range == (50000, 90000)
+        assert second.get_pov_patterns("Thriller")
+        assert second.builds == 0
+
+        # A changed file invalidates the cache
+        write_guidelines(path, GUIDELINES, 2000)
+        third = GenreGuidelineIndex(path, cache_path=cache_path)
+        third.get("Romance")
+        assert third.builds == 1
+
+
+def test_callers_share_the_index():
+    """The chapter planner and genre defaults read the same indexed guidelines."""
+    index = get_genre_guideline_index()
+    assert len(index.get_genres()) >= 30
+
+    guidelines = get_genre_guidelines("Epic Fantasy")
+    assert guidelines["chapter_range"] == (40, 60)
+    assert guidelines["word_count_range"] == (120000, 250000)
+    assert get_genre_guidelines("Not A Genre")["notes"] == "Standard novel format"
+
+    defaults = extract_from_guidelines("Epic Fantasy")
+    assert defaults["chapter_count"] == 50 and defaults["target_length"] == "long"
+    assert determine_pov_from_guidelines("Epic Fantasy") == "Multiple POVs"
+    assert determine_pov_from_guidelines("YA", "### POV Patterns by Genre\n- **YA**: first person\n###") == "First person"
+
+
+if __name__ == "__main__":
+    test_lookup_and_rebuild_on_change()
+    test_cache_file_skips_parsing()
+    test_callers_share_the_index()
+    print("✅ Genre guideline index tests passed")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-key token bucket scheduler.
+
+This script tests:
+1. Requests are spread across keys by remaining headroom
+2. Saturated keys are reported and further requests wait instead of failing
+3. Rate-limited keys are benched until their cooldown expires
+4. Concurrent GeminiClient requests are sent on the key reserved for them
+5. Connection checks pinned to a key neither reserve nor refund quota
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.key_scheduler import APIKeyScheduler
+from src.core.gemini_client import GeminiClient
+
+
+KEYS = ["key-aaaa-0001", "key-bbbb-0002", "key-cccc-0003"]
+
+
+def test_requests_spread_by_headroom():
+    """Test that consecutive requests go to the least used key."""
+    print("Testing headroom-based routing...")
+
+    scheduler = APIKeyScheduler(KEYS, requests_per_minute=10, tokens_per_minute=100000)
+    chosen = [scheduler.acquire(100) for _ in range(9)]
+
+    assert sorted(chosen.count(key) for key in KEYS) == [3, 3, 3], chosen
+    assert scheduler.get_status()["saturated_keys"] == 0
+
+    print("✓ Headroom routing test passed")
+
+
+def test_saturated_keys_wait():
+    """Test that exhausting every bucket reports saturation and blocks new requests."""
+    print("Testing saturation reporting...")
+
+    scheduler = APIKeyScheduler(KEYS, requests_per_minute=2, tokens_per_minute=100000)
+    for _ in range(len(KEYS) * 2):
+        scheduler.acquire(10)
+
+    status = scheduler.get_status()
+    assert status["saturated_keys"] == len(KEYS)
+
+    try:
+        scheduler.acquire(10, timeout=0.05)
+        assert False, "acquire should have timed out while every key is saturated"
+    except TimeoutError:
+        pass
+
+    print("✓ Saturation test passed")
+
+
+def test_token_budget_and_rate_limit_cooldown():
+    """Test that TPM reservations and 429 cooldowns both steer traffic away from a key."""
+    print("Testing token budget and cooldown...")
+
+    scheduler = APIKeyScheduler(KEYS[:2], requests_per_minute=100, tokens_per_minute=1000)
+
+    # A large reservation drains one key's token bucket, so the next request uses the other key
+    first = scheduler.acquire(1000)
+    second = scheduler.acquire(500)
+    assert first != second
+
+    # Unused tokens are refunded, making the first key eligible again
+    scheduler.release(first, 1000, 100)
+    scheduler.report_rate_limited(second)
+    assert scheduler.acquire(500) == first
+
+    status = scheduler.get_status()
+    assert status["cooling_down_keys"] == 1
+
+    print("✓ Token budget and cooldown test passed")
+
+
+def make_client(rate_limited_keys=()):
+    """GeminiClient whose requests are answered by a fake per-key transport, with no network or cache access."""
+    client = GeminiClient.__new__(GeminiClient)
+    client.api_keys = list(KEYS)
+    client.current_key_index = 0
+    client.key_usage_count = {key: 0 for key in KEYS}
+    client.rate_limited_keys = set()
+    client.key_scheduler = APIKeyScheduler(KEYS, requests_per_minute=100, tokens_per_minute=1000000)
+    client._async_client = None
+    client.sent = []
+
+    async def fake_post(session, key, body):
+        prompt = body["contents"][-1]["parts"][0]["text"]
+        await asyncio.sleep(0.01)  # Let concurrent requests interleave
+        client.sent.append((prompt, key))
+        if key in rate_limited_keys:
+            raise RuntimeError("429 RESOURCE_EXHAUSTED: Rate limit: quota exceeded")
+        return f"{prompt} via {key}"
+
+    client.async_client._post = fake_post
+    return client
+
+
+def test_concurrent_requests_use_their_reserved_key():
+    """Test that each request goes out on its own key and rate limits bench the right key."""
+    print("Testing per-request key binding...")
+
+    client = make_client(rate_limited_keys={KEYS[1]})
+    reserved = []
+    acquire_key = client.async_client._acquire_key
+
+    async def tracking_acquire(reserved_tokens, pinned_key=None):
+        key = await acquire_key(reserved_tokens, pinned_key)
+        reserved.append(key)
+        return key
+
+    client.async_client._acquire_key = tracking_acquire
+    results = {}
+
+    def worker(index):
+        prompt = f"prompt-{index}"
+        results[prompt] = client._generate_content_uncached(prompt, max_tokens=100, max_retries=0)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(12)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        client.async_client.close()
+
+    # Every reservation was sent exactly once, and each reply came from the last key its prompt was sent on
+    assert sorted(reserved) == sorted(key for _, key in client.sent)
+    for prompt in results:
+        last_key = [key for p, key in client.sent if p == prompt][-1]
+        assert results[prompt] == f"{prompt} via {last_key}" and last_key != KEYS[1], results[prompt]
+
+    status = client.key_scheduler.get_status()
+    assert status["cooling_down_keys"] == 1
+    assert list(status["keys"].values())[1]["rate_limit_hits"] >= 1
+
+    print("✓ Per-request key binding test passed")
+
+
+def test_pinned_key_checks_bypass_the_scheduler():
+    """Test that checking each key sends on that key only and leaves the token buckets alone."""
+    print("Testing pinned connection checks...")
+
+    client = make_client(rate_limited_keys={KEYS[0]})
+    scheduler_calls = []
+
+    async def tracking_aacquire(*args):
+        scheduler_calls.append(("aacquire", args))
+
+    client.key_scheduler.aacquire = tracking_aacquire
+    client.key_scheduler.release = lambda *args: scheduler_calls.append(("release", args))
+
+    try:
+        result = client.check_api_connection(check_all_keys=True)
+    finally:
+        client.async_client.close()
+
+    # The rate-limited first key fails without being rotated away from; the second key works
+    assert [key for _, key in client.sent] == KEYS[:2]
+    assert result["working_keys"] == 1
+    assert scheduler_calls == []
+
+    print("✓ Pinned connection check test passed")
+
+
+if __name__ == "__main__":
+    test_requests_spread_by_headroom()
+    test_saturated_keys_wait()
+    test_token_budget_and_rate_limit_cooldown()
+    test_concurrent_requests_use_their_reserved_key()
+    test_pinned_key_checks_bypass_the_scheduler()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test journaled MemoryManager persistence: append-only change records, replay
+on load and compaction into the snapshot file.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.memory_manager import MemoryManager
+
+TITLE = "Journal Test"
+
+
+def chapter_data(chapter_num: int) -> dict:
+    """Extracted narrative elements for one chapter."""
+    return {
+        "character_updates": {
+            "Mira": {"development": f"grows in chapter {chapter_num}", "location": "harbor"}
+        },
+        "relationship_updates": {"Mira-Tobin": {"status": f"allies since {chapter_num}"}},
+        "plot_updates": {"The Heist": {"status": "active", "progression": f"step {chapter_num}"}},
+        "unresolved_questions": [f"Who sent letter {chapter_num}?"],
+        "timeline_events": [f"Event {chapter_num}"],
+        "tone": "tense"
+    }
+
+
+def write_chapters(memory_manager: MemoryManager, first: int, last: int) -> None:
+    for chapter_num in range(first, last + 1):
+        memory_manager.add_chapter_summary(chapter_num, f"Summary {chapter_num}", 1000)
+        memory_manager.update_narrative_tracking(chapter_num, chapter_data(chapter_num))
+
+
+def comparable_state(memory_manager: MemoryManager) -> dict:
+    state = memory_manager.get_memory_data()
+    state["metadata"] = {k: v for k, v in state["metadata"].items() if k != "last_updated"}
+    return state
+
+
+def test_changes_are_journaled_and_replayed():
+    """Mutations append small records that a fresh manager replays."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory_manager = MemoryManager(TITLE, output_dir=temp_dir)
+        memory_manager.update_metadata(genre="Fantasy", author="A. Writer")
+        memory_manager.add_character({"name": "Mira", "role": "protagonist"})
+        snapshot_size = os.path.getsize(memory_manager.memory_file)
+
+        write_chapters(memory_manager, 1, 5)
+        sizes = []
+        for chapter_num in (14, 41):
+            before = os.path.getsize(memory_manager.journal_file)
+            memory_manager.update_narrative_tracking(chapter_num, chapter_data(chapter_num))
+            sizes.append(os.path.getsize(memory_manager.journal_file) - before)
+
+        print(f"Snapshot: {snapshot_size} bytes, journal record sizes: {sizes}")
+        assert os.path.getsize(memory_manager.memory_file) == snapshot_size
+        assert sizes[0] == sizes[1]  # Constant-size appends however much is tracked
+
+        reloaded = MemoryManager(TITLE, output_dir=temp_dir)
+        assert comparable_state(reloaded) == comparable_state(memory_manager)
+        assert reloaded.structure["current_word_count"] == 5000
+        assert reloaded.narrative_tracking["character_arcs"]["Mira"]["41"] == "grows in chapter 41"
+
+
+def test_journal_compacts_into_snapshot():
+    """A large journal is folded into the snapshot with an atomic rename."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory_manager = MemoryManager(TITLE, output_dir=temp_dir)
+        memory_manager.JOURNAL_MIN_COMPACTION_BYTES = 2048
+        memory_manager.add_character({"name": "Mira"})
+
+        write_chapters(memory_manager, 1, 30)
+
+        with open(memory_manager.memory_file, 'r', encoding='utf-8') as f:
+            snapshot_seq = json.load(f)["journal_seq"]
+        journal_size = os.path.getsize(memory_manager.journal_file)
+
+        print(f"Snapshot covers {snapshot_seq} changes, journal holds {journal_size} bytes")
+        assert snapshot_seq > 1
+        assert journal_size < max(os.path.getsize(memory_manager.memory_file), 2048)
+        assert not os.path.exists(f"{memory_manager.memory_file}.tmp")
+
+        reloaded = MemoryManager(TITLE, output_dir=temp_dir)
+        assert comparable_state(reloaded) == comparable_state(memory_manager)
+
+
+def test_replay_skips_compacted_and_torn_records():
+    """Records already in the snapshot and a torn final line are not applied."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory_manager = MemoryManager(TITLE, output_dir=temp_dir)
+        memory_manager.add_character({"name": "Mira"})
+        write_chapters(memory_manager, 1, 2)
+
+        with open(memory_manager.journal_file, 'r', encoding='utf-8') as f:
+            journal = f.read()
+
+        # Crash after the snapshot was renamed but before the journal was emptied
+        memory_manager.save_memory()
+        with open(memory_manager.journal_file, 'w', encoding='utf-8') as f:
+            f.write(journal + '{"seq": 99, "op": "add_char')
+
+        reloaded = MemoryManager(TITLE, output_dir=temp_dir)
+        print(f"Chapters after reload: {len(reloaded.chapter_summaries)}")
+        assert len(reloaded.chapter_summaries) == 2
+        assert reloaded.structure["current_word_count"] == 2000
+        assert len(reloaded.characters) == 1
+
+
+if __name__ == "__main__":
+    test_changes_are_journaled_and_replayed()
+    test_journal_compacts_into_snapshot()
+    test_replay_skips_compacted_and_torn_records()
+    print("✅ Memory journal tests passed")
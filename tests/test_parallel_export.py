@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test parallel book export: bulk summary reads, per-book staging directories
+renamed into place, resuming a partial export, and genre collections.
+"""
+
+import io
+import os
+import sys
+import tempfile
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database import database_manager
+from src.database.book_library_manager import BookLibraryManager, EXTRACTION_INFO_FILENAME
+from src.database.connection_pool import get_connection_pool
+from src.database.cover_database_manager import CoverDatabaseManager
+from src.database.database_manager import DatabaseManager
+from src.database.epub_database_manager import EpubDatabaseManager
+
+
+def make_epub_bytes(title: str) -> bytes:
+    """Minimal ZIP archive that passes EPUB validation; the same title always gives the same bytes."""
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, 'w') as epub:
+        # Fixed timestamps, so archives built at different times compare equal
+        epub.writestr(zipfile.ZipInfo("mimetype", date_time=(2025, 1, 1, 0, 0, 0)), "application/epub+zip")
+        epub.writestr(zipfile.ZipInfo("content.xhtml", date_time=(2025, 1, 1, 0, 0, 0)),
+                      f"<h1>{title}</h1>" + "<p>It was a dark night.</p>" * 500)
+    return output.getvalue()
+
+
+def make_library(temp_dir: str):
+    """Create a library manager bound to a temporary database with six books."""
+    db_manager = DatabaseManager(db_path=os.path.join(temp_dir, "library.db"))
+
+    original_db_manager = database_manager._db_manager
+    database_manager._db_manager = db_manager
+    try:
+        library = BookLibraryManager.__new__(BookLibraryManager)
+        library.db_manager = db_manager
+        library.epub_db_manager = EpubDatabaseManager()
+        library.cover_db_manager = CoverDatabaseManager()
+        library.temp_dir = temp_dir
+        library.export_dir = os.path.join(temp_dir, "exports")
+    finally:
+        database_manager._db_manager = original_db_manager
+
+    book_ids = []
+    for index in range(6):
+        # Two books share a title, to check they get separate directories
+        title = "Shared Title" if index < 2 else f"Book {index}"
+        book_id = db_manager.add_book({"title": title, "book_id": f"book_{index}", "genre": "Mystery",
+                                       "generation_status": "completed"})
+        epub_path = os.path.join(temp_dir, f"{book_id}.epub")
+        with open(epub_path, 'wb') as f:
+            f.write(make_epub_bytes(book_id))
+        assert library.epub_db_manager.store_epub_from_file(book_id, epub_path, {"title": title})
+        book_ids.append(book_id)
+
+    return library, db_manager, book_ids
+
+
+def list_exports(output_dir: str):
+    """Names in an export directory."""
+    return sorted(os.listdir(output_dir))
+
+
+def test_parallel_export_writes_complete_directories():
+    """Every book is exported once, with same-title books kept apart and no staging left over."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        library, db_manager, book_ids = make_library(temp_dir)
+        try:
+            output_dir = os.path.join(temp_dir, "batch")
+            results = library.batch_export_books(book_ids + ["missing_book"], output_dir, max_workers=3)
+
+            print(f"Exported: {list_exports(output_dir)}")
+            assert list(results) == book_ids + ["missing_book"]
+            assert results["missing_book"].startswith("Error")
+            assert results["book_0"] != results["book_1"]
+            assert os.path.basename(results["book_0"]) == "Shared_Title_book_0"
+            assert not any(name.startswith(".partial_") for name in list_exports(output_dir))
+
+            for book_id in book_ids:
+                book_dir = results[book_id]
+                assert os.path.exists(os.path.join(book_dir, EXTRACTION_INFO_FILENAME))
+                assert os.path.exists(os.path.join(book_dir, "novel_data.json"))
+                with open(os.path.join(book_dir, f"{book_id}.epub"), 'rb') as f:
+                    assert f.read() == make_epub_bytes(book_id)
+        finally:
+            get_connection_pool().close_connections(db_manager.db_path)
+
+
+def test_resume_skips_finished_books():
+    """A rerun exports only changed books and books left unfinished."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        library, db_manager, book_ids = make_library(temp_dir)
+        try:
+            output_dir = os.path.join(temp_dir, "batch")
+            results = library.batch_export_books(book_ids, output_dir, max_workers=3)
+
+            # Simulate an interrupted run: one export is of an older version, one staging dir remains
+            summary_path = os.path.join(results["book_2"], EXTRACTION_INFO_FILENAME)
+            with open(summary_path, encoding='utf-8') as f:
+                summary = f.read()
+            with open(summary_path, 'w', encoding='utf-8') as f:
+                f.write(summary.replace("Book Updated: ", "Book Updated: 1999-"))
+            os.makedirs(os.path.join(output_dir, ".partial_book_3"))
+            db_manager.update_book("book_4", {"description": "Revised"})
+
+            def access_counts():
+                return {book_id: db_manager.get_book(book_id)["access_count"] for book_id in book_ids}
+
+            before = access_counts()
+            library.batch_export_books(book_ids, output_dir, max_workers=3)
+            after = access_counts()
+
+            reexported = sorted(book_id for book_id in book_ids if after[book_id] > before[book_id])
+            print(f"Re-exported on resume: {reexported}")
+            assert reexported == ["book_2", "book_4"]
+            assert os.path.exists(os.path.join(results["book_2"], EXTRACTION_INFO_FILENAME))
+            assert not os.path.exists(os.path.join(output_dir, ".partial_book_3"))
+
+            # Without resume everything is written again
+            library.batch_export_books(book_ids, output_dir, max_workers=3, resume=False)
+            assert all(access_counts()[book_id] > after[book_id] for book_id in book_ids)
+        finally:
+            get_connection_pool().close_connections(db_manager.db_path)
+
+
+def test_export_never_replaces_foreign_directories():
+    """Directories that are not an export of the same book are left alone."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        library, db_manager, book_ids = make_library(temp_dir)
+        try:
+            output_dir = os.path.join(temp_dir, "batch")
+
+            # A user folder that happens to have a book's directory name
+            user_dir = os.path.join(output_dir, "Book_2")
+            os.makedirs(user_dir)
+            with open(os.path.join(user_dir, "notes.txt"), 'w') as f:
+                f.write("my notes")
+
+            first = library.batch_export_books(["book_1", "book_0", "book_2"], output_dir, resume=False)
+            second = library.batch_export_books(["book_0", "book_1", "book_2"], output_dir, resume=False)
+            print(f"Exports: {list_exports(output_dir)}")
+
+            # Same-title directories do not depend on input order
+            assert first == {book_id: second[book_id] for book_id in first}
+            assert os.path.basename(first["book_2"]) == "Book_2_book_2"
+            with open(os.path.join(user_dir, "notes.txt")) as f:
+                assert f.read() == "my notes"
+
+            # A later export of Book 3 alone must not take over another book's directory
+            os.rename(first["book_0"], os.path.join(output_dir, "Book_3"))
+            third = library.batch_export_books(["book_3"], output_dir, resume=False)
+            assert os.path.basename(third["book_3"]) == "Book_3_book_3"
+            with open(os.path.join(output_dir, "Book_3", EXTRACTION_INFO_FILENAME)) as f:
+                assert "Book ID: book_0" in f.read()
+        finally:
+            get_connection_pool().close_connections(db_manager.db_path)
+
+
+def test_genre_collection_export():
+    """A genre collection exports its completed books into the collection directory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        library, db_manager, book_ids = make_library(temp_dir)
+        try:
+            db_manager.update_book("book_5", {"generation_status": "generating"})
+            results = library.export_genre_collection("Mystery", max_workers=2)
+
+            assert sorted(results) == book_ids[:5]
+            collection_dir = os.path.join(library.export_dir, "Mystery_Collection")
+            assert all(path.startswith(collection_dir) for path in results.values())
+        finally:
+            get_connection_pool().close_connections(db_manager.db_path)
+
+
+if __name__ == "__main__":
+    test_parallel_export_writes_complete_directories()
+    test_resume_skips_finished_books()
+    test_export_never_replaces_foreign_directories()
+    test_genre_collection_export()
+    print("✅ Parallel export tests passed")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for pipelined chapter generation.
+
+This script tests:
+1. Pipelined generation produces every chapter in order
+2. Each chapter is drafted only after the previous chapter's memory updates
+3. Summaries and narrative tracking end up identical in shape to sequential mode
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+from rich.progress import Progress
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.memory_manager import MemoryManager
+from src.core.novel_generator import NovelGenerator
+from src.testing.mock_components import MockGeminiClient
+
+
+class _StubNetworkManager:
+    """Records the queue worker count requested by the pipeline."""
+
+    def __init__(self):
+        self.queue_workers = 1
+
+    def set_queue_workers(self, count: int):
+        self.queue_workers = max(self.queue_workers, count)
+
+
+def _create_generator(temp_dir: str, chapter_count: int) -> NovelGenerator:
+    """Create a NovelGenerator wired to the mock Gemini client."""
+    generator = NovelGenerator.__new__(NovelGenerator)
+    generator.gemini = MockGeminiClient()
+    generator.gemini.response_delay = 0.01
+    generator.gemini.network_manager = _StubNetworkManager()
+    generator.series_prompt_manager = None
+    generator.generation_options = {
+        "pipelined_generation": True,
+        "max_concurrent_api_calls": 3,
+        "min_chapter_length": 10,
+    }
+
+    generator.memory_manager = MemoryManager("Pipeline Test", output_dir=temp_dir)
+    generator.memory_manager.update_metadata(genre="Test", target_audience="Adult", description="Test")
+    outline = [f"Chapter {i} - Event {i}" for i in range(1, chapter_count + 1)]
+    generator.memory_manager.set_novel_structure(chapter_count, 1000, outline)
+    return generator
+
+
+def test_pipelined_generation_respects_memory_dependencies():
+    """Test that each draft sees every earlier chapter's summary."""
+    print("Testing pipelined chapter generation...")
+
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        chapter_count = 4
+        generator = _create_generator(temp_dir, chapter_count)
+        memory_manager = generator.memory_manager
+
+        summaries_seen_at_draft = {}
+        original_draft = generator._draft_chapter
+
+        def recording_draft(chapter_num):
+            summaries_seen_at_draft[chapter_num] = [
+                summary["chapter_num"] for summary in memory_manager.chapter_summaries
+            ]
+            return original_draft(chapter_num)
+
+        generator._draft_chapter = recording_draft
+
+        outline = memory_manager.structure["outline"]
+        with Progress(disable=True) as progress:
+            task = progress.add_task("chapters", total=chapter_count)
+            chapters = generator._generate_chapters_pipelined(outline, chapter_count, progress, task)
+
+        assert [chapter["number"] for chapter in chapters] == list(range(1, chapter_count + 1))
+        assert all(chapter["content"] for chapter in chapters)
+
+        for chapter_num in range(1, chapter_count + 1):
+            assert summaries_seen_at_draft[chapter_num] == list(range(1, chapter_num)), \
+                f"Chapter {chapter_num} drafted with summaries {summaries_seen_at_draft[chapter_num]}"
+
+        assert [s["chapter_num"] for s in memory_manager.chapter_summaries] == list(range(1, chapter_count + 1))
+        assert generator.gemini.network_manager.queue_workers >= 3
+
+        print("✓ Pipelined generation test passed")
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_pipelined_generation_respects_memory_dependencies()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent response cache.
+
+This script tests:
+1. Keys are content-addressed over model, prompt and generation config
+2. Cached responses survive a new cache instance (process restart)
+3. Least recently used entries are evicted first, and expired entries are dropped
+4. Hit/miss statistics are tracked
+5. Lookups don't write; their statistics are written in batches
+6. Only prompts that ask for the cache are cached, and entries expire by default
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.connection_pool import get_connection_pool
+from src.core.gemini_client import GeminiClient
+from src.database.response_cache_manager import ResponseCacheManager, DEFAULT_TTL_SECONDS, STATS_FLUSH_LOOKUPS
+
+
+CONFIG = {"temperature": 0.7, "max_output_tokens": 1000, "top_p": 0.95, "top_k": 40}
+
+
+def test_content_addressed_keys_and_persistence():
+    """Test key derivation and that entries persist across instances."""
+    print("Testing content-addressed keys and persistence...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(temp_dir, "cache.db")
+        cache = ResponseCacheManager(db_path=db_path)
+
+        key = cache.make_key("gemini-2.0-flash", "Write an outline", CONFIG)
+        assert key == cache.make_key("gemini-2.0-flash", "Write an outline", dict(reversed(list(CONFIG.items()))))
+        assert key != cache.make_key("gemini-2.0-flash", "Write an outline", {**CONFIG, "temperature": 0.2})
+        assert key != cache.make_key("other-model", "Write an outline", CONFIG)
+
+        assert cache.get(key) is None
+        cache.put(key, "An outline", model="gemini-2.0-flash")
+
+        reopened = ResponseCacheManager(db_path=db_path)
+        assert reopened.get(key) == "An outline"
+
+        stats = reopened.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 0
+        assert stats["lifetime_hits"] == 1 and stats["lifetime_misses"] == 1
+
+        print("✓ Key and persistence test passed")
+    finally:
+        get_connection_pool().close_connections(os.path.join(temp_dir, "cache.db"))
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_lru_eviction_and_ttl():
+    """Test that eviction removes the least recently used entry and TTL expires entries."""
+    print("Testing LRU eviction and TTL...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache = ResponseCacheManager(db_path=os.path.join(temp_dir, "cache.db"), max_entries=3)
+
+        for name in ("a", "b", "c"):
+            cache.put(name, f"response {name}")
+            time.sleep(0.01)
+
+        # Touch "a" so "b" becomes the least recently used entry
+        assert cache.get("a") == "response a"
+        time.sleep(0.01)
+        cache.put("d", "response d")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "response a"
+        assert cache.get_stats()["entries"] == 3
+        assert cache.get_stats()["evictions"] == 1
+
+        cache.put("short-lived", "gone soon", ttl_seconds=0.05)
+        assert cache.get("short-lived") == "gone soon"
+        time.sleep(0.1)
+        assert cache.get("short-lived") is None
+
+        print("✓ LRU eviction and TTL test passed")
+    finally:
+        get_connection_pool().close_connections(os.path.join(temp_dir, "cache.db"))
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_lookups_batch_their_statistics():
+    """Test that lookups only read and their counters reach disk in batches."""
+    print("Testing batched lookup statistics...")
+
+    temp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(temp_dir, "cache.db")
+    try:
+        cache = ResponseCacheManager(db_path=db_path)
+        cache.put("a", "response a")
+        conn = cache.get_connection()
+
+        changes = conn.total_changes
+        for _ in range(STATS_FLUSH_LOOKUPS - 1):
+            assert cache.get("a") == "response a"
+        assert cache.get("missing") is None
+        # The last lookup reached the batch size; everything before it was read-only
+        assert conn.total_changes > changes
+
+        row = conn.execute("SELECT hit_count FROM response_cache WHERE cache_key = 'a'").fetchone()
+        assert row["hit_count"] == STATS_FLUSH_LOOKUPS - 1
+
+        changes = conn.total_changes
+        cache.get("a")
+        assert conn.total_changes == changes
+
+        stats = ResponseCacheManager(db_path=db_path).get_stats()
+        assert stats["lifetime_hits"] == STATS_FLUSH_LOOKUPS - 1 and stats["lifetime_misses"] == 1
+
+        cache.flush()
+        assert ResponseCacheManager(db_path=db_path).get_stats()["lifetime_hits"] == STATS_FLUSH_LOOKUPS
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        print("✓ Batched lookup statistics test passed")
+    finally:
+        get_connection_pool().close_connections(db_path)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_only_requested_prompts_are_cached():
+    """Test that creative prompts are regenerated while cached ones expire after the default TTL."""
+    print("Testing opt-in caching...")
+
+    temp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(temp_dir, "cache.db")
+    try:
+        client = GeminiClient.__new__(GeminiClient)
+        client.response_cache = ResponseCacheManager(db_path=db_path)
+        calls = []
+
+        def generate_uncached(prompt, *args, **kwargs):
+            calls.append(prompt)
+            return f"reply {len(calls)}"
+
+        client._generate_content_uncached = generate_uncached
+
+        # A chapter regenerated with the same prompt gets a new draft
+        assert client.generate_content("Write chapter 1") == "reply 1"
+        assert client.generate_content("Write chapter 1") == "reply 2"
+
+        assert client.generate_content("Write the outline", use_cache=True) == "reply 3"
+        assert client.generate_content("Write the outline", use_cache=True) == "reply 3"
+
+        conn = client.response_cache.get_connection()
+        rows = conn.execute("SELECT created_at, expires_at FROM response_cache").fetchall()
+        assert len(rows) == 1
+        assert abs(rows[0]["expires_at"] - rows[0]["created_at"] - DEFAULT_TTL_SECONDS) < 1
+
+        print("✓ Opt-in caching test passed")
+    finally:
+        get_connection_pool().close_connections(db_path)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_content_addressed_keys_and_persistence()
+    test_lru_eviction_and_ttl()
+    test_lookups_batch_their_statistics()
+    test_only_requested_prompts_are_cached()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test the generation stage executor: dependency order, concurrent independent
+stages, skipped stages with known results, timings and error handling.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.memory_manager import MemoryManager
+from src.core.novel_generator import NovelGenerator
+from src.core.stage_executor import StageExecutor
+from src.testing.mock_components import MockGeminiClient
+
+
+def test_independent_stages_run_concurrently():
+    """Stages start as soon as their inputs are ready and receive those results."""
+    stages = StageExecutor(max_workers=3, name="test")
+    stages.add_stage("profile", lambda: time.sleep(0.1) or "profile")
+    stages.add_stage("cover", lambda: time.sleep(0.1) or "cover")
+    stages.add_stage("outline", lambda profile: f"outline for {profile}", inputs=("profile",))
+    stages.add_stage("book", lambda outline, cover: (outline, cover), inputs=("outline", "cover"))
+
+    start = time.monotonic()
+    results = stages.run()
+    elapsed = time.monotonic() - start
+
+    print(f"Ran in {elapsed:.2f}s, timings {stages.get_timings()}")
+    assert results["book"] == ("outline for profile", "cover")
+    assert elapsed < 0.18  # profile and cover overlapped
+    assert [t["stage"] for t in stages.get_timings()][-1] == "book"
+    assert stages.timings["profile"]["seconds"] >= 0.1
+
+
+def test_known_results_are_skipped_and_workers_bounded():
+    """Stages with known results do not run, and no more than max_workers run at once."""
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def tracked(value):
+        def stage(**kwargs):
+            with lock:
+                active.append(value)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(value)
+            return value
+        return stage
+
+    stages = StageExecutor(max_workers=2)
+    for name in ("a", "b", "c", "d"):
+        stages.add_stage(name, tracked(name))
+    stages.add_stage("e", tracked("e"), inputs=("a", "b", "c", "d"))
+
+    results = stages.run({"a": "from checkpoint"})
+    assert results["a"] == "from checkpoint"
+    assert "a" not in stages.timings
+    assert max(peak) <= 2
+
+
+def test_errors_and_bad_graphs():
+    """A failing stage stops its dependents; cycles and unknown inputs are rejected up front."""
+    ran = []
+    stages = StageExecutor(max_workers=2)
+    stages.add_stage("fails", lambda: 1 / 0)
+    stages.add_stage("after", lambda fails: ran.append("after"), inputs=("fails",))
+    try:
+        stages.run()
+        assert False, "Expected ZeroDivisionError"
+    except ZeroDivisionError:
+        pass
+    assert ran == []
+
+    cyclic = StageExecutor()
+    cyclic.add_stage("x", lambda y: y, inputs=("y",))
+    cyclic.add_stage("y", lambda x: x, inputs=("x",))
+    try:
+        cyclic.run()
+        assert False, "Expected ValueError"
+    except ValueError as e:
+        assert "cycle" in str(e)
+
+    unknown = StageExecutor()
+    unknown.add_stage("x", lambda missing: missing, inputs=("missing",))
+    try:
+        unknown.run()
+        assert False, "Expected ValueError"
+    except ValueError as e:
+        assert "unknown stage" in str(e)
+
+
+def test_completion_stages_overlap():
+    """Saving the book and generating the cover prompt run at the same time."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generator = NovelGenerator.__new__(NovelGenerator)
+        generator.gemini = MockGeminiClient()
+        generator.generation_options = {"max_concurrent_api_calls": 3}
+        generator.memory_manager = MemoryManager("Stage Test", output_dir=temp_dir)
+
+        running = set()
+        overlapped = []
+
+        def slow_stage(name):
+            running.add(name)
+            time.sleep(0.05)
+            overlapped.append(len(running) > 1)
+            running.discard(name)
+            return f"{name}-done"
+
+        generator._save_completed_novel = lambda novel: slow_stage("save")
+        generator._generate_cover_prompt_after_completion = lambda novel: slow_stage("cover")
+
+        results = generator._create_completion_stages({"chapters": []}).run()
+        assert results["save_book"] == "save-done"
+        assert any(overlapped)
+
+
+if __name__ == "__main__":
+    test_independent_stages_run_concurrently()
+    test_known_results_are_skipped_and_workers_bounded()
+    test_errors_and_bad_graphs()
+    test_completion_stages_overlap()
+    print("✅ Stage executor tests passed")
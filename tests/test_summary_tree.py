@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test hierarchical rolling summaries: chapter summaries rolled into arcs and a
+synopsis, and the bounded chapter and series history built from them.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.memory_manager import MemoryManager
+from src.core.series_manager import SeriesManager
+from src.utils.summary_tree import SummaryTree, roll_up
+
+
+def chapter_summary(n: int) -> str:
+    return f"Event {n} happens at the docks. The crew argues about it for a long while afterwards."
+
+
+def test_tree_rolls_up_incrementally():
+    """Arcs and the synopsis follow each new unit and stay within their caps."""
+    tree = SummaryTree(arc_size=3, arc_max_chars=200, synopsis_max_chars=300)
+    for n in range(1, 8):
+        tree.set_summary(n, chapter_summary(n))
+
+    print(f"Arcs: {sorted(tree.arcs)}, synopsis: {len(tree.synopsis)} chars")
+    assert sorted(tree.arcs) == [0, 1, 2]
+    assert "Event 7" in tree.arcs[2]
+    assert all(len(summary) <= 200 for summary in tree.arcs.values())
+    assert len(tree.synopsis) <= 300
+    # Every arc is represented in the synopsis, not just the earliest
+    assert "Event 1" in tree.synopsis and "Event 7" in tree.synopsis
+
+    # Replacing a unit only changes its own arc
+    tree.set_summary(2, "A new event two.")
+    assert "A new event two." in tree.arcs[0]
+
+    rebuilt = SummaryTree(arc_size=3, arc_max_chars=200, synopsis_max_chars=300)
+    rebuilt.rebuild(tree.units)
+    assert rebuilt.arcs == tree.arcs and rebuilt.synopsis == tree.synopsis
+
+    view = tree.get_view(8, recent_units=2, max_arcs=1)
+    assert view["recent_units"] == [4, 5, 6, 7]
+    assert [arc["units"] for arc in view["arcs"]] == [[1, 3]]
+    assert view["synopsis"] == ""
+
+    assert roll_up([], 100) == ""
+
+
+def test_chapter_history_is_bounded():
+    """Context for a late chapter carries a bounded multi-resolution history."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory_manager = MemoryManager("Summary Tree Test", output_dir=temp_dir)
+        for n in range(1, 41):
+            memory_manager.add_chapter_summary(n, chapter_summary(n), 1000)
+
+        context = memory_manager.get_context_for_chapter(41)
+        recent = [c["chapter_num"] for c in context["previous_chapters"]]
+        arcs = [arc["chapters"] for arc in context["arc_summaries"]]
+
+        print(f"Recent: {recent}, arcs: {arcs}, synopsis: {len(context['book_synopsis'])} chars")
+        assert recent == list(range(36, 41))
+        assert arcs == [[16, 20], [21, 25], [26, 30], [31, 35]]
+        assert "Event 1 " in context["book_synopsis"] and "Event 15" in context["book_synopsis"]
+        assert "Event 1 " in memory_manager.get_book_synopsis()
+
+        # An early chapter only sees its own past
+        early = memory_manager.get_context_for_chapter(4)
+        assert [c["chapter_num"] for c in early["previous_chapters"]] == [1, 2, 3]
+        assert early["arc_summaries"] == [] and early["book_synopsis"] == ""
+
+        # The tree is rebuilt from the snapshot and journal on load
+        reloaded = MemoryManager("Summary Tree Test", output_dir=temp_dir)
+        reloaded_context = reloaded.get_context_for_chapter(41)
+        assert reloaded_context["arc_summaries"] == context["arc_summaries"]
+        assert reloaded_context["book_synopsis"] == context["book_synopsis"]
+
+
+def test_series_history_is_bounded():
+    """Later books in a series get recent books in full and older ones rolled up."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        series_manager = SeriesManager("Summary Tree Series", output_dir=temp_dir)
+        for n in range(1, 15):
+            series_manager.add_book({"title": f"Book {n}", "description": f"Quest {n} begins."})
+            series_manager.set_book_summary(n, f"Quest {n} ends in victory. Loose ends remain.")
+
+        # Book 7 sees books 4-6 in full and books 1-3 as one arc
+        context = series_manager.get_context_for_book(7)
+        assert [book["book_number"] for book in context["previous_books"]] == [4, 5, 6]
+        assert [arc["books"] for arc in context["earlier_books"]] == [[1, 3]]
+        assert "Quest 1 ends" in context["earlier_books"][0]["summary"]
+
+        context = series_manager.get_context_for_book(15)
+        print(f"Previous books: {[b['book_number'] for b in context['previous_books']]}, "
+              f"earlier: {[arc['books'] for arc in context['earlier_books']]}")
+
+        assert [book["book_number"] for book in context["previous_books"]] == [13, 14]
+        assert [arc["books"] for arc in context["earlier_books"]] == [[7, 9], [10, 12]]
+        assert "Quest 1 ends" in context["series_synopsis"] and "Quest 6 ends" in context["series_synopsis"]
+
+        reloaded = SeriesManager("Summary Tree Series", output_dir=temp_dir)
+        assert reloaded.get_context_for_book(15)["earlier_books"] == context["earlier_books"]
+
+
+if __name__ == "__main__":
+    test_tree_rolls_up_incrementally()
+    test_chapter_history_is_bounded()
+    test_series_history_is_bounded()
+    print("✅ Summary tree tests passed")
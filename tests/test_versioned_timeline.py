@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test chapter-keyed narrative tracking backed by VersionedTimeline: ordered
+"latest before chapter N" lookups in MemoryManager and SeriesManager.
+"""
+
+import copy
+import json
+import os
+import pickle
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.memory_manager import MemoryManager
+from src.core.series_manager import SeriesManager
+from src.utils.versioned_timeline import VersionedTimeline
+
+
+def test_timeline_lookups():
+    """Versions are ordered numerically and serialize as string keys."""
+    timeline = VersionedTimeline({"10": "ten", 2: "two", "9": "nine"})
+    timeline[1] = "one"
+
+    print(f"Versions: {timeline.versions()}")
+    assert timeline.versions() == [1, 2, 9, 10]
+    assert timeline.latest_before(10) == "nine"  # "10" sorts before "9" as a string
+    assert timeline.latest_before(11) == "ten"
+    assert timeline.latest_before(1, "none") == "none"
+    assert timeline.values_before(10) == ["one", "two", "nine"]
+    assert timeline[9] == timeline["9"] == "nine"
+    assert 2 in timeline and "2" in timeline and "x" not in timeline
+
+    del timeline["2"]
+    assert timeline.pop(9) == "nine"
+    assert timeline.versions() == [1, 10]
+
+    assert json.loads(json.dumps(timeline)) == {"10": "ten", "1": "one"}
+    for clone in (copy.deepcopy(timeline), pickle.loads(pickle.dumps(timeline))):
+        assert clone.versions() == [1, 10]
+
+    assert VersionedTimeline.from_data({"3": "a", "notes": "b"}).versions() == [3]
+
+
+def comparable_context(context: dict) -> dict:
+    """Drop the list-valued entries, which are LimitedList objects without equality."""
+    return {k: v for k, v in context.items() if k not in ("unresolved_questions", "foreshadowing", "callbacks")}
+
+
+def test_chapter_context_uses_latest_state():
+    """Context for a late chapter reports each entity's newest earlier state."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory_manager = MemoryManager("Timeline Test", output_dir=temp_dir)
+        memory_manager.add_character({"name": "Mira", "role": "protagonist"})
+
+        for chapter_num in range(1, 13):
+            memory_manager.update_narrative_tracking(chapter_num, {
+                "character_updates": {"Mira": {"development": f"arc {chapter_num}",
+                                               "emotions": f"mood {chapter_num}"}},
+                "relationship_updates": {"Mira-Tobin": {"status": f"bond {chapter_num}"}},
+                "themes": {"Trust": f"theme {chapter_num}"},
+                "pov": "Mira",
+                "tone": f"tone {chapter_num}",
+                "locations": [f"place {chapter_num}"],
+            })
+
+        context = memory_manager._get_narrative_context_for_chapter(11)
+        print(f"Chapter 11 context: arc={context['character_arcs']}, tone={context['tone']}")
+
+        assert context["character_arcs"] == {"Mira": "arc 10"}
+        assert context["character_emotions"] == {"Mira": "mood 10"}
+        assert context["relationships"] == {"Mira-Tobin": "bond 10"}
+        assert context["themes"]["Trust"] == [f"theme {n}" for n in range(1, 11)]
+        assert context["pov_character"] == "Mira"
+        assert context["tone"] == "tone 10"
+        assert context["locations_visited"] == ["place 10"]
+
+        # Reloaded tracking (snapshot plus journal) answers the same way
+        reloaded = MemoryManager("Timeline Test", output_dir=temp_dir)
+        assert comparable_context(reloaded._get_narrative_context_for_chapter(11)) == comparable_context(context)
+
+        memory_manager.save_memory()
+        reloaded = MemoryManager("Timeline Test", output_dir=temp_dir)
+        assert isinstance(reloaded.narrative_tracking["character_arcs"]["Mira"], VersionedTimeline)
+        assert comparable_context(reloaded._get_narrative_context_for_chapter(11)) == comparable_context(context)
+
+
+def test_series_context_mixes_loaded_and_new_books():
+    """Series lookups order books numerically across saved and in-memory keys."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        series_manager = SeriesManager("Timeline Test Series", output_dir=temp_dir)
+        for book_number in range(1, 11):
+            series_manager.update_series_tracking(book_number, {
+                "character_arcs": {"Mira": f"book {book_number}"},
+                "plot_threads": {"The Crown": f"thread {book_number}"},
+            })
+
+        reloaded = SeriesManager("Timeline Test Series", output_dir=temp_dir)
+        reloaded.update_series_tracking(11, {"character_arcs": {"Mira": "book 11"}})
+
+        context = reloaded._get_series_context_for_book(12)
+        print(f"Series context for book 12: {context['character_arcs']}, {context['plot_threads']}")
+        assert context["character_arcs"] == {"Mira": "book 11"}
+        assert context["plot_threads"] == {"The Crown": "thread 10"}
+        assert reloaded._get_series_context_for_book(10)["character_arcs"] == {"Mira": "book 9"}
+
+
+if __name__ == "__main__":
+    test_timeline_lookups()
+    test_chapter_context_uses_latest_state()
+    test_series_context_mixes_loaded_and_new_books()
+    print("✅ Versioned timeline tests passed")